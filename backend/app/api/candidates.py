@@ -0,0 +1,97 @@
+"""
+Candidate search API endpoints
+Finds the best stored resumes for a job description (local vector index)
+All endpoints require the X-API-Key header (CANDIDATES_API_KEY)
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from app.core.ai_config import ai_config
+from app.core.auth import require_candidates_api_key
+from app.core.serialization import negotiated_response
+from app.services.resume_search import get_resume_search
+from app.types import CandidateSearchRequest
+
+router = APIRouter(
+    prefix="/api/candidates",
+    tags=["candidates"],
+    dependencies=[Depends(require_candidates_api_key)],
+)
+
+
+@router.post("/search")
+async def search_candidates(
+    search_request: CandidateSearchRequest, request: Request
+) -> Response:
+    """
+    Top stored resumes for a job description
+
+    Args:
+        search_request: Job description and number of resumes to return
+        request: Incoming request (Accept: application/msgpack selects MessagePack)
+
+    Returns:
+        Resumes ranked by semantic match with the chunks that matched
+    """
+    if len(search_request.job_description.strip()) < 50:
+        raise HTTPException(
+            status_code=400,
+            detail="Job description is too short. Please provide a detailed job description (at least 50 characters).",
+        )
+
+    model = ai_config.get_embeddings_model()
+    if model is None:
+        raise HTTPException(
+            status_code=503, detail="Embeddings model not available for search"
+        )
+
+    try:
+        results = await run_in_threadpool(
+            get_resume_search().search,
+            model,
+            search_request.job_description,
+            search_request.top_k,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error during search: {e!s}")
+
+    return negotiated_response(
+        request,
+        {
+            "success": True,
+            "data": {"candidates": results, "total": len(results)},
+            "message": "Candidate search completed successfully",
+        },
+    )
+
+
+@router.get("/stats")
+async def get_index_stats() -> dict:
+    """
+    Size and layout of the local resume index
+    """
+    return await run_in_threadpool(get_resume_search().stats)
+
+
+@router.get("/{document_id}")
+async def get_candidate(document_id: str) -> dict:
+    """
+    Stored metadata and chunks of one resume
+    """
+    document = await run_in_threadpool(get_resume_search().get, document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return {"success": True, "data": document}
+
+
+@router.delete("/{document_id}")
+async def delete_candidate(document_id: str) -> dict:
+    """
+    Remove a stored resume from the index
+    """
+    removed = await run_in_threadpool(get_resume_search().remove, document_id)
+    if not removed:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return {"success": True, "message": "Resume removed from the index"}
@@ -0,0 +1,89 @@
+"""
+Document API endpoints
+Upload a resume once, parse it once and reference it by document_id from
+the analysis endpoints
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+
+from app.helpers.resume_upload import read_upload
+from app.services.document_store import document_store
+
+router = APIRouter(prefix="/api/documents", tags=["documents"])
+
+
+def _document_summary(document_id: str, document: dict[str, Any]) -> dict[str, Any]:
+    parsed_resume = document["parsed_resume"]
+    return {
+        "document_id": document_id,
+        "filename": document["filename"],
+        "file_size": document["file_size"],
+        "file_type": parsed_resume.get("file_type"),
+        "word_count": parsed_resume.get("word_count", 0),
+        "formatting_analysis": parsed_resume.get("formatting_analysis"),
+        "expires_at": document["created_at"] + document_store.ttl_s,
+    }
+
+
+@router.post("")
+async def upload_document(file: UploadFile = File(...)) -> dict:
+    """
+    Store and parse a resume for use by the analysis endpoints
+
+    Args:
+        file: Resume file (PDF, DOCX, or TXT)
+
+    Returns:
+        document_id to send instead of the file to /api/upload/analyze,
+        /quick-analyze, /rank and /extract-experience
+    """
+    try:
+        parsed_resume, filename, file_size = await read_upload(file)
+        document_id = document_store.save(parsed_resume, filename, file_size)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing document: {e!s}")
+
+    document = document_store.get(document_id)
+    if document is None:
+        # Evicted at once by concurrent uploads over the store's budget
+        raise HTTPException(
+            status_code=503, detail="Document store is full, try again shortly"
+        )
+    return {
+        "success": True,
+        "data": _document_summary(document_id, document),
+        "message": "Document stored successfully",
+    }
+
+
+@router.get("/stats")
+async def get_document_stats() -> dict:
+    """
+    Number and size of stored documents
+    """
+    return document_store.stats()
+
+
+@router.get("/{document_id}")
+async def get_document(document_id: str) -> dict:
+    """
+    Metadata of a stored document
+    """
+    document = document_store.get(document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found or expired")
+    return {"success": True, "data": _document_summary(document_id, document)}
+
+
+@router.delete("/{document_id}")
+async def delete_document(document_id: str) -> dict:
+    """
+    Remove a stored document
+    """
+    if not document_store.delete(document_id):
+        raise HTTPException(status_code=404, detail="Document not found or expired")
+    return {"success": True, "message": "Document deleted"}
@@ -3,22 +3,53 @@ File upload API endpoints
 Enhanced with job description comparison and semantic matching
 """
 
+import json
 import os
 import sys
-from typing import Any
-
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from typing import TYPE_CHECKING, Any
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+)
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 # Add the parent directory to the path so we can import our utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.services.ats_analyzer import get_ats_analyzer
+from app.core.deadline import (
+    DEADLINE_HEADER,
+    TIER_FULL,
+    Deadline,
+    choose_tier,
+    stage_budget_ms,
+)
+from app.core.serialization import negotiated_response
+from app.helpers.field_selection import (
+    is_selected,
+    merge_sections,
+    parse_fields,
+    select_fields,
+)
+from app.helpers.resume_upload import resolve_resume
+from app.services.analysis_store import analysis_store
+from app.services.ats_analyzer import EXTRACTION_MODES, get_ats_analyzer
 from app.services.job_description_generator import JobDescriptionGenerator
 from app.services.job_detector import job_detector
 from app.services.resume_improver import ResumeImprover
-from app.types import ImprovementPlanRequest
+from app.services.resume_search import index_analyzed_resume, is_indexing_enabled
+from app.types import ImprovementPlanRequest, ReanalyzeRequest, TextEdit
 from app.utils.file_parser import file_parser
 
+if TYPE_CHECKING:
+    from app.types.common_types import ATSAnalysisResult
+
 # Initialize services
 resume_improver = ResumeImprover()
 
@@ -27,46 +58,87 @@ resume_improver = ResumeImprover()
 router = APIRouter(prefix="/api/upload", tags=["upload"])
 
 
+def _schedule_resume_indexing(
+    background_tasks: BackgroundTasks,
+    parsed_resume: dict[str, Any],
+    filename: str,
+    analysis_result: dict[str, Any],
+    consent: bool,
+) -> None:
+    """
+    Store the analyzed resume for candidate search after responding
+
+    Only when the server allows indexing and the uploader consented.
+    """
+    if not (consent and is_indexing_enabled()):
+        return
+    background_tasks.add_task(
+        index_analyzed_resume,
+        parsed_resume.get("text", ""),
+        {
+            "filename": filename,
+            "detected_job_type": analysis_result.get("detected_job_type"),
+            "ats_score": analysis_result.get("ats_score"),
+            "word_count": parsed_resume.get("word_count", 0),
+        },
+    )
+
+
+def _validate_extraction_mode(mode: str | None) -> None:
+    """Reject an unknown structured experience extraction mode"""
+    if mode is not None and mode not in EXTRACTION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid mode. Use one of: {', '.join(EXTRACTION_MODES)}",
+        )
+
+
 @router.post("/quick-analyze")
-async def quick_analyze_resume(file: UploadFile = File(...)) -> dict[str, Any]:
+async def quick_analyze_resume(
+    *,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile | None = File(None),
+    document_id: str | None = Form(None),
+    fields: str | None = Form(None),
+    include: str | None = Form(None),
+    mode: str | None = Form(None),
+    index_consent: bool = Form(False),
+) -> Response:
     """
     Quick ATS analysis: Parse resume, detect job type, generate job description, and analyze
     Uses AI to generate specific job description based on detected role
 
     Args:
+        request: Incoming request (Accept: application/msgpack selects MessagePack,
+            X-Request-Deadline-Ms sets the time budget)
+        background_tasks: Stores the resume for candidate search after responding
         file: Resume file (PDF, DOCX, or TXT)
+        document_id: Stored document from POST /api/documents (instead of file)
+        fields: Optional comma-separated response fields (dotted paths allowed),
+            e.g. "ats_score,missing_keywords". Unrequested sections are skipped.
+        include: Alias for fields
+        mode: Structured experience extraction mode: "fast" (local, no AI),
+            "ai" or "hybrid" (AI only for low-confidence sections)
+        index_consent: Store the resume for candidate search (also requires
+            RESUME_INDEX_ENABLED)
 
     Returns:
         Comprehensive ATS analysis with AI-generated job description
     """
+    deadline = Deadline.from_header(request.headers.get(DEADLINE_HEADER))
     try:
         # Validate inputs
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="No file provided")
+        _validate_extraction_mode(mode)
 
-        # Check file type
-        file_extension = file.filename.lower().split(".")[-1]
-        if file_extension not in ["pdf", "docx", "doc", "txt"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Unsupported file type. Please upload PDF, DOCX, or TXT files.",
-            )
-
-        # Read and parse file
-        file_content = await file.read()
-
-        # Check file size
-        if len(file_content) > 10 * 1024 * 1024:
-            raise HTTPException(
-                status_code=400, detail="File too large. Maximum size is 10MB."
-            )
-
-        # Parse the resume
-        parsed_resume = file_parser.parse_file(file_content, file.filename)
+        # Parse the resume (or reuse a stored document)
+        parsed_resume, filename, file_size = await resolve_resume(file, document_id)
 
         # Detect job type using AI
-        job_title, confidence = job_detector.detect_job_type(
-            parsed_resume.get("text", "")
+        job_title, confidence = await run_in_threadpool(
+            job_detector.detect_job_type,
+            parsed_resume.get("text", ""),
+            stage_budget_ms(deadline, "job_detection", job_detector.latency_budget_ms),
         )
 
         if not job_title:
@@ -85,19 +157,39 @@ async def quick_analyze_resume(file: UploadFile = File(...)) -> dict[str, Any]:
         elif "junior" in job_title.lower() or "entry" in job_title.lower():
             experience_level = "entry-level"
 
-        generated_job_description = jd_generator.generate_job_description(
-            job_title, experience_level
-        )
+        if choose_tier(deadline, "jd_generation") == TIER_FULL:
+            generated_job_description = await run_in_threadpool(
+                jd_generator.generate_job_description,
+                job_title,
+                experience_level,
+                deadline,
+            )
+        else:
+            generated_job_description = jd_generator.fallback_job_description(
+                job_title, experience_level
+            )
 
-        # Extract structured experience data
+        # Extract structured experience data (only if requested)
+        selected_fields = parse_fields(fields, include)
         ats_analyzer = get_ats_analyzer()
-        structured_experience = ats_analyzer.extract_structured_experience(
-            parsed_resume.get("text", "")
-        )
+        structured_experience = None
+        if is_selected(selected_fields, "structured_experience"):
+            structured_experience = await run_in_threadpool(
+                ats_analyzer.extract_structured_experience,
+                parsed_resume.get("text", ""),
+                deadline,
+                mode,
+            )
 
         # Perform comprehensive ATS analysis with generated job description
-        analysis_result = ats_analyzer.analyze_resume_with_job_description(
-            parsed_resume, generated_job_description
+        analysis_context: dict[str, Any] = {}
+        analysis_result = await run_in_threadpool(
+            ats_analyzer.analyze_resume_with_job_description,
+            parsed_resume,
+            generated_job_description,
+            selected_fields,
+            deadline,
+            analysis_context,
         )
 
         # Add job detection results and generated job description
@@ -106,18 +198,37 @@ async def quick_analyze_resume(file: UploadFile = File(...)) -> dict[str, Any]:
                 "detected_job_type": job_title,
                 "job_detection_confidence": confidence,
                 "structured_experience": structured_experience,
-                "filename": file.filename,
-                "file_size": len(file_content),
+                "filename": filename,
+                "file_size": file_size,
                 "jd_length": len(generated_job_description),
                 "job_description": generated_job_description,  # Include the AI-generated job description
             }
         )
+        # Store every computed section, not just the selected fields, for
+        # /improvement-plan and /reanalyze
+        full_result = merge_sections(
+            analysis_context.pop("full_result"), analysis_result
+        )
+        _schedule_resume_indexing(
+            background_tasks, parsed_resume, filename, full_result, index_consent
+        )
+        analysis_id = analysis_store.save(
+            full_result,
+            parsed_resume.get("text", ""),
+            generated_job_description,
+            analysis_context,
+        )
 
-        return {
-            "success": True,
-            "data": analysis_result,
-            "message": "Quick analysis completed successfully with AI-generated job description",
-        }
+        return negotiated_response(
+            request,
+            {
+                "success": True,
+                "analysis_id": analysis_id,
+                "data": select_fields(analysis_result, selected_fields),
+                "message": "Quick analysis completed successfully with AI-generated job description",
+                "degradation": deadline.to_dict(),
+            },
+        )
 
     except HTTPException:
         raise
@@ -129,23 +240,43 @@ async def quick_analyze_resume(file: UploadFile = File(...)) -> dict[str, Any]:
 
 @router.post("/analyze")
 async def analyze_resume_with_jd(
-    file: UploadFile = File(...), job_description: str = Form(...)
-) -> dict[str, Any]:
+    *,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile | None = File(None),
+    document_id: str | None = Form(None),
+    job_description: str = Form(...),
+    fields: str | None = Form(None),
+    include: str | None = Form(None),
+    mode: str | None = Form(None),
+    index_consent: bool = Form(False),
+) -> Response:
     """
     Complete ATS analysis: Parse resume and compare with job description
     Uses semantic embeddings for concept matching
 
     Args:
+        request: Incoming request (Accept: application/msgpack selects MessagePack,
+            X-Request-Deadline-Ms sets the time budget)
+        background_tasks: Stores the resume for candidate search after responding
         file: Resume file (PDF, DOCX, or TXT)
+        document_id: Stored document from POST /api/documents (instead of file)
         job_description: Job description text
+        fields: Optional comma-separated response fields (dotted paths allowed),
+            e.g. "ats_score,missing_keywords". Unrequested sections are skipped.
+        include: Alias for fields
+        mode: Structured experience extraction mode: "fast" (local, no AI),
+            "ai" or "hybrid" (AI only for low-confidence sections)
+        index_consent: Store the resume for candidate search (also requires
+            RESUME_INDEX_ENABLED)
 
     Returns:
         Comprehensive ATS analysis with scores and recommendations
     """
+    deadline = Deadline.from_header(request.headers.get(DEADLINE_HEADER))
     try:
         # Validate inputs
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="No file provided")
+        _validate_extraction_mode(mode)
 
         if not job_description or len(job_description.strip()) < 50:
             raise HTTPException(
@@ -153,52 +284,66 @@ async def analyze_resume_with_jd(
                 detail="Job description is too short. Please provide a detailed job description (at least 50 characters).",
             )
 
-        # Check file type
-        file_extension = file.filename.lower().split(".")[-1]
-        if file_extension not in ["pdf", "docx", "doc", "txt"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Unsupported file type. Please upload PDF, DOCX, or TXT files.",
-            )
-
-        # Read and parse file
-        file_content = await file.read()
-
-        # Check file size
-        if len(file_content) > 10 * 1024 * 1024:
-            raise HTTPException(
-                status_code=400, detail="File too large. Maximum size is 10MB."
-            )
-
-        # Parse the resume
-        parsed_resume = file_parser.parse_file(file_content, file.filename)
+        # Parse the resume (or reuse a stored document)
+        parsed_resume, filename, file_size = await resolve_resume(file, document_id)
 
-        # Extract structured experience data
+        # Extract structured experience data (only if requested)
+        selected_fields = parse_fields(fields, include)
         ats_analyzer = get_ats_analyzer()
-        structured_experience = ats_analyzer.extract_structured_experience(
-            parsed_resume.get("text", "")
-        )
+        structured_experience = None
+        if is_selected(selected_fields, "structured_experience"):
+            structured_experience = await run_in_threadpool(
+                ats_analyzer.extract_structured_experience,
+                parsed_resume.get("text", ""),
+                deadline,
+                mode,
+            )
 
         # Perform comprehensive ATS analysis with job description
-        analysis_result = ats_analyzer.analyze_resume_with_job_description(
-            parsed_resume, job_description
+        analysis_context: dict[str, Any] = {}
+        analysis_result = await run_in_threadpool(
+            ats_analyzer.analyze_resume_with_job_description,
+            parsed_resume,
+            job_description,
+            selected_fields,
+            deadline,
+            analysis_context,
         )
 
         # Add structured experience and metadata
         analysis_result.update(
             {
                 "structured_experience": structured_experience,
-                "filename": file.filename,
-                "file_size": len(file_content),
+                "filename": filename,
+                "file_size": file_size,
                 "jd_length": len(job_description),
             }
         )
+        # Store every computed section, not just the selected fields, for
+        # /improvement-plan and /reanalyze
+        full_result = merge_sections(
+            analysis_context.pop("full_result"), analysis_result
+        )
+        _schedule_resume_indexing(
+            background_tasks, parsed_resume, filename, full_result, index_consent
+        )
+        analysis_id = analysis_store.save(
+            full_result,
+            parsed_resume.get("text", ""),
+            job_description,
+            analysis_context,
+        )
 
-        return {
-            "success": True,
-            "data": analysis_result,
-            "message": "ATS analysis completed successfully",
-        }
+        return negotiated_response(
+            request,
+            {
+                "success": True,
+                "analysis_id": analysis_id,
+                "data": select_fields(analysis_result, selected_fields),
+                "message": "ATS analysis completed successfully",
+                "degradation": deadline.to_dict(),
+            },
+        )
 
     except HTTPException:
         raise
@@ -206,63 +351,176 @@ async def analyze_resume_with_jd(
         raise HTTPException(status_code=500, detail=f"Error during analysis: {e!s}")
 
 
+# Maximum job descriptions accepted by /rank in one call
+MAX_RANK_JOB_DESCRIPTIONS = int(os.getenv("MAX_RANK_JOB_DESCRIPTIONS", "50"))
+
+
+def _parse_job_descriptions(raw: str) -> list[dict[str, str]]:
+    """
+    Parse the job_descriptions form field of /rank
+
+    Accepts a JSON array of strings or of {"id", "title", "description"}
+    objects; strings get their position as id.
+    """
+    try:
+        items = json.loads(raw)
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=400, detail="job_descriptions must be a JSON array."
+        )
+
+    if not isinstance(items, list) or not items:
+        raise HTTPException(
+            status_code=400,
+            detail="job_descriptions must be a non-empty JSON array.",
+        )
+    if len(items) > MAX_RANK_JOB_DESCRIPTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many job descriptions. Maximum is {MAX_RANK_JOB_DESCRIPTIONS}.",
+        )
+
+    job_descriptions = []
+    for position, item in enumerate(items):
+        if isinstance(item, str):
+            item = {"description": item}
+        if not isinstance(item, dict) or not isinstance(item.get("description"), str):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Job description {position} needs a description string.",
+            )
+        if len(item["description"].strip()) < 50:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Job description {position} is too short (at least 50 characters).",
+            )
+        job_descriptions.append(
+            {
+                "id": str(item.get("id", position)),
+                "title": item.get("title"),
+                "description": item["description"],
+            }
+        )
+    return job_descriptions
+
+
+@router.post("/rank")
+async def rank_resume_against_job_descriptions(
+    request: Request,
+    file: UploadFile | None = File(None),
+    document_id: str | None = Form(None),
+    job_descriptions: str = Form(...),
+) -> Response:
+    """
+    Rank saved job postings by how well one resume fits them
+
+    The resume is parsed, indexed and embedded once, then scored against
+    every job description with a single similarity matrix.
+
+    Args:
+        request: Incoming request (Accept: application/msgpack selects MessagePack,
+            X-Request-Deadline-Ms sets the time budget)
+        file: Resume file (PDF, DOCX, or TXT)
+        document_id: Stored document from POST /api/documents (instead of file)
+        job_descriptions: JSON array of job description strings or
+            {"id", "title", "description"} objects
+
+    Returns:
+        Job descriptions ranked by ATS score with per-JD score breakdowns
+    """
+    deadline = Deadline.from_header(request.headers.get(DEADLINE_HEADER))
+    try:
+        # Validate inputs
+        parsed_job_descriptions = _parse_job_descriptions(job_descriptions)
+
+        # Parse the resume once for all job descriptions (or use a stored one)
+        parsed_resume, filename, file_size = await resolve_resume(file, document_id)
+
+        rankings = await run_in_threadpool(
+            get_ats_analyzer().rank_resume_against_job_descriptions,
+            parsed_resume,
+            parsed_job_descriptions,
+            deadline,
+        )
+
+        return negotiated_response(
+            request,
+            {
+                "success": True,
+                "data": {
+                    "rankings": rankings,
+                    "total_job_descriptions": len(rankings),
+                    "filename": filename,
+                    "file_size": file_size,
+                },
+                "message": "Job descriptions ranked successfully",
+                "degradation": deadline.to_dict(),
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error during ranking: {e!s}")
+
+
 @router.post("/extract-experience")
-async def extract_structured_experience(file: UploadFile = File(...)) -> dict[str, Any]:
+async def extract_structured_experience(
+    request: Request,
+    file: UploadFile | None = File(None),
+    document_id: str | None = Form(None),
+    mode: str | None = Form(None),
+) -> Response:
     """
     Extract structured work experience with proper project association
     Uses AI to distinguish between job responsibilities and project descriptions
 
     Args:
+        request: Incoming request (Accept: application/msgpack selects MessagePack,
+            X-Request-Deadline-Ms sets the time budget)
         file: Resume file (PDF, DOCX, or TXT)
+        document_id: Stored document from POST /api/documents (instead of file)
+        mode: Structured experience extraction mode: "fast" (local, no AI),
+            "ai" or "hybrid" (AI only for low-confidence sections)
 
     Returns:
         Structured experience data with projects properly associated with jobs
     """
+    deadline = Deadline.from_header(request.headers.get(DEADLINE_HEADER))
     try:
         # Validate inputs
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="No file provided")
-
-        # Check file type
-        file_extension = file.filename.lower().split(".")[-1]
-        if file_extension not in ["pdf", "docx", "doc", "txt"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Unsupported file type. Please upload PDF, DOCX, or TXT files.",
-            )
-
-        # Read and parse file
-        file_content = await file.read()
-
-        # Check file size
-        if len(file_content) > 10 * 1024 * 1024:
-            raise HTTPException(
-                status_code=400, detail="File too large. Maximum size is 10MB."
-            )
+        _validate_extraction_mode(mode)
 
-        # Parse the resume
-        parsed_resume = file_parser.parse_file(file_content, file.filename)
+        # Parse the resume (or reuse a stored document)
+        parsed_resume, filename, file_size = await resolve_resume(file, document_id)
 
         # Extract structured experience
         ats_analyzer = get_ats_analyzer()
-        structured_experience = ats_analyzer.extract_structured_experience(
-            parsed_resume.get("text", "")
+        structured_experience = await run_in_threadpool(
+            ats_analyzer.extract_structured_experience,
+            parsed_resume.get("text", ""),
+            deadline,
+            mode,
         )
 
-        return {
-            "success": True,
-            "data": {
-                "structured_experience": structured_experience,
-                "filename": file.filename,
-                "file_size": len(file_content),
-                "raw_text": (
-                    parsed_resume.get("text", "")[:500] + "..."
-                    if len(parsed_resume.get("text", "")) > 500
-                    else parsed_resume.get("text", "")
-                ),
+        return negotiated_response(
+            request,
+            {
+                "success": True,
+                "data": {
+                    "structured_experience": structured_experience,
+                    "filename": filename,
+                    "file_size": file_size,
+                    "raw_text": (
+                        parsed_resume.get("text", "")[:500] + "..."
+                        if len(parsed_resume.get("text", "")) > 500
+                        else parsed_resume.get("text", "")
+                    ),
+                },
+                "message": "Structured experience extracted successfully",
+                "degradation": deadline.to_dict(),
             },
-            "message": "Structured experience extracted successfully",
-        }
+        )
 
     except HTTPException:
         raise
@@ -273,35 +531,202 @@ async def extract_structured_experience(file: UploadFile = File(...)) -> dict[st
 
 
 @router.post("/improvement-plan")
-async def get_improvement_plan(request: ImprovementPlanRequest) -> dict[str, Any]:
+async def get_improvement_plan(
+    request: ImprovementPlanRequest, http_request: Request
+) -> Response:
     """
     Generate personalized improvement plan based on ATS analysis
 
     Args:
-        request: ImprovementPlanRequest with analysis_result, extracted_data, and optional job_description
+        request: ImprovementPlanRequest with an analysis_id returned by /analyze
+            or /quick-analyze (other fields override the stored analysis), or
+            the full analysis_result and extracted_data
+        http_request: Incoming request (Accept: application/msgpack selects MessagePack,
+            X-Request-Deadline-Ms sets the time budget)
 
     Returns:
         Improvement plan with actionable suggestions, priorities, and score impacts
     """
+    deadline = Deadline.from_header(http_request.headers.get(DEADLINE_HEADER))
     try:
-        plan = resume_improver.generate_improvement_plan(
-            analysis_result=request.analysis_result,
-            extracted_data=request.extracted_data,
-            job_description=request.job_description,
+        if request.analysis_id:
+            stored = analysis_store.get(request.analysis_id)
+            if stored is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Analysis not found or expired. Please analyze the resume again.",
+                )
+            extracted_data = await run_in_threadpool(
+                get_ats_analyzer().categorize_resume, stored["resume_text"]
+            )
+            analysis_result: ATSAnalysisResult = {
+                **stored["analysis_result"],
+                **(request.analysis_result or {}),
+            }
+            # The AI checks read the resume text from extraction_details
+            analysis_result["extraction_details"] = {
+                **(analysis_result.get("extraction_details") or {}),
+                "full_resume_text": stored["resume_text"],
+            }
+            extracted_data = {**extracted_data, **(request.extracted_data or {})}
+            job_description = request.job_description or stored["job_description"]
+        elif request.analysis_result and request.extracted_data:
+            analysis_result = request.analysis_result
+            extracted_data = resume_improver.with_document_extraction(
+                analysis_result, request.extracted_data
+            )
+            job_description = request.job_description
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail="Provide an analysis_id, or analysis_result and extracted_data.",
+            )
+
+        plan = await run_in_threadpool(
+            resume_improver.generate_improvement_plan,
+            analysis_result=analysis_result,
+            extracted_data=extracted_data,
+            job_description=job_description,
+            deadline=deadline,
         )
 
-        return {
-            "success": True,
-            "data": plan,
-            "message": "Improvement plan generated successfully",
-        }
+        return negotiated_response(
+            http_request,
+            {
+                "success": True,
+                "data": plan,
+                "message": "Improvement plan generated successfully",
+                "degradation": deadline.to_dict(),
+            },
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error generating improvement plan: {e!s}"
         )
 
 
+def _apply_edits(text: str, edits: list[TextEdit]) -> str:
+    """
+    Apply offset-based edits to a text
+
+    Offsets refer to the original text; edits must not overlap.
+
+    Raises:
+        HTTPException: 400 if an edit is out of range or overlaps another
+    """
+    result = text
+    last_start = len(text) + 1
+    for edit in sorted(edits, key=lambda e: e.start, reverse=True):
+        if edit.start > edit.end or edit.end > min(len(text), last_start):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid edit range {edit.start}-{edit.end}",
+            )
+        result = result[: edit.start] + edit.text + result[edit.end :]
+        last_start = edit.start
+    return result
+
+
+@router.post("/reanalyze")
+async def reanalyze_resume(
+    request: ReanalyzeRequest, http_request: Request
+) -> Response:
+    """
+    Incremental re-analysis of an edited resume
+
+    Reuses the job detection and job description artifacts of the referenced
+    analysis and only re-encodes resume chunks whose text changed.
+
+    Args:
+        request: ReanalyzeRequest with the analysis_id of /analyze, /quick-analyze
+            or an earlier /reanalyze, and the edited text or offset edits
+        http_request: Incoming request (Accept: application/msgpack selects MessagePack,
+            X-Request-Deadline-Ms sets the time budget)
+
+    Returns:
+        New score, the sub-scores that moved, the changed sections and a new
+        analysis_id for the edited version
+    """
+    deadline = Deadline.from_header(http_request.headers.get(DEADLINE_HEADER))
+    try:
+        stored = analysis_store.get(request.analysis_id)
+        if stored is None or not stored.get("context"):
+            raise HTTPException(
+                status_code=404,
+                detail="Analysis not found or expired. Please analyze the resume again.",
+            )
+        if request.text is not None:
+            text = request.text
+        elif request.edits is not None:
+            text = _apply_edits(stored["resume_text"], request.edits)
+        else:
+            raise HTTPException(
+                status_code=400, detail="Provide the edited text or a list of edits."
+            )
+        if len(text.split()) < 50:
+            raise HTTPException(
+                status_code=400, detail="Edited resume is too short to analyze."
+            )
+
+        context = stored["context"]
+        parsed_resume = {
+            **context["parsed_resume"],
+            "text": text,
+            "word_count": len(text.split()),
+            "character_count": len(text),
+        }
+        result = await run_in_threadpool(
+            get_ats_analyzer().reanalyze_resume,
+            parsed_resume,
+            stored["resume_text"],
+            context,
+            deadline,
+        )
+
+        previous_result = stored["analysis_result"]
+        analysis_result = {
+            **previous_result,
+            **result,
+            "extraction_details": {
+                **(previous_result.get("extraction_details") or {}),
+                **result["extraction_details"],
+            },
+        }
+        analysis_id = analysis_store.save(
+            analysis_result,
+            text,
+            stored["job_description"],
+            {
+                **context,
+                "parsed_resume": {
+                    key: value for key, value in parsed_resume.items() if key != "text"
+                },
+                "detailed_scores": result["detailed_scores"],
+                "ats_score": result["ats_score"],
+            },
+        )
+
+        return negotiated_response(
+            http_request,
+            {
+                "success": True,
+                "analysis_id": analysis_id,
+                "base_analysis_id": request.analysis_id,
+                "data": result,
+                "message": "Resume re-analyzed successfully",
+                "degradation": deadline.to_dict(),
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error during re-analysis: {e!s}")
+
+
 @router.get("/supported-formats")
 async def get_supported_formats() -> dict[str, Any]:
     """
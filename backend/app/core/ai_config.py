@@ -3,6 +3,7 @@ Centralized AI Configuration and Utilities
 Eliminates duplication across all AI services
 """
 
+import inspect
 import os
 
 # Try to import Google Gemini
@@ -13,13 +14,27 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
-# Try to import sentence-transformers
-try:
-    from sentence_transformers import SentenceTransformer
-
-    EMBEDDINGS_AVAILABLE = True
-except ImportError:
-    EMBEDDINGS_AVAILABLE = False
+# Per-call request options (timeouts) need google-generativeai >= 0.4
+GEMINI_REQUEST_OPTIONS_SUPPORTED = (
+    GEMINI_AVAILABLE
+    and "request_options"
+    in inspect.signature(genai.GenerativeModel.generate_content).parameters
+)
+# Schema-constrained JSON output needs a newer SDK as well
+GEMINI_RESPONSE_SCHEMA_SUPPORTED = (
+    GEMINI_AVAILABLE
+    and "response_schema" in inspect.signature(genai.types.GenerationConfig).parameters
+)
+
+# Embedding backends (PyTorch or quantized ONNX Runtime)
+from app.core.embedding_batcher import create_embedding_batcher, is_batching_enabled
+from app.core.embeddings import (
+    create_embedding_model,
+    get_embeddings_backend_name,
+    is_backend_available,
+)
+
+EMBEDDINGS_AVAILABLE = is_backend_available(get_embeddings_backend_name())
 
 
 class AIConfig:
@@ -38,7 +53,9 @@ class AIConfig:
             Tuple[bool, bool]: (gemini_available, embeddings_available)
         """
         if self._initialized:
-            return GEMINI_AVAILABLE, EMBEDDINGS_AVAILABLE
+            return GEMINI_AVAILABLE, (
+                EMBEDDINGS_AVAILABLE and self.embeddings_model is not None
+            )
 
         # Initialize Gemini
         gemini_available = self._initialize_gemini()
@@ -73,16 +90,22 @@ class AIConfig:
             return False
 
     def _initialize_embeddings(self) -> bool:
-        """Initialize sentence-transformers model"""
+        """Initialize embeddings model using the configured backend"""
+        backend = get_embeddings_backend_name()
         if not EMBEDDINGS_AVAILABLE:
             print(
-                "⚠️  sentence-transformers not available. Install for AI-powered analysis"
+                f"⚠️  Embeddings backend '{backend}' not available. Install for AI-powered analysis"
             )
             return False
 
         try:
-            self.embeddings_model = SentenceTransformer("all-MiniLM-L6-v2")
-            print("✅ Embeddings model loaded successfully")
+            self.embeddings_model = create_embedding_model(backend)
+            print(f"✅ Embeddings model loaded successfully ({backend} backend)")
+
+            # Share forward passes between concurrent analyses
+            if is_batching_enabled():
+                self.embeddings_model = create_embedding_batcher(self.embeddings_model)
+                print("✅ Embeddings micro-batching enabled")
             return True
 
         except Exception as e:
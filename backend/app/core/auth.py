@@ -0,0 +1,40 @@
+"""
+API Key Authentication
+Protects endpoints that expose or change stored data (e.g. candidate search)
+"""
+
+import os
+import secrets
+
+from fastapi import HTTPException, Security
+from fastapi.security import APIKeyHeader
+
+API_KEY_HEADER = "X-API-Key"
+
+_api_key_header = APIKeyHeader(name=API_KEY_HEADER, auto_error=False)
+
+
+def require_candidates_api_key(
+    api_key: str | None = Security(_api_key_header),
+) -> None:
+    """
+    Require the CANDIDATES_API_KEY in the X-API-Key header
+
+    The candidate endpoints stay closed (503) until a key is configured.
+
+    Raises:
+        HTTPException: 503 if no key is configured, 401 if the key is wrong
+    """
+    expected = os.getenv("CANDIDATES_API_KEY", "")
+    if not expected:
+        raise HTTPException(
+            status_code=503, detail="Candidate search is not configured"
+        )
+    if not api_key or not secrets.compare_digest(
+        api_key.encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing API key",
+            headers={"WWW-Authenticate": API_KEY_HEADER},
+        )
@@ -0,0 +1,167 @@
+"""
+Request Deadlines
+A per-request time budget created at the API edge and passed down through
+service calls, so every stage can pick its AI or local path from the time
+that is left and the response can report which stages degraded
+"""
+
+import os
+import threading
+import time
+from typing import Any
+
+from app.core.ai_config import GEMINI_REQUEST_OPTIONS_SUPPORTED
+from app.core.metrics import metrics
+
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+DEFAULT_DEADLINE_MS = float(os.getenv("REQUEST_DEADLINE_MS", "25000"))
+MAX_DEADLINE_MS = float(os.getenv("REQUEST_DEADLINE_MAX_MS", "120000"))
+
+# Remaining budget needed for each degradation tier
+AI_STAGE_MIN_MS = float(os.getenv("DEADLINE_AI_STAGE_MIN_MS", "4000"))
+LOCAL_STAGE_MIN_MS = float(os.getenv("DEADLINE_LOCAL_STAGE_MIN_MS", "300"))
+
+# Degradation tiers, best first
+TIER_FULL = "full"  # AI paths allowed
+TIER_LOCAL = "local"  # rule-based / local-model paths only
+TIER_MINIMAL = "minimal"  # optional work skipped
+
+
+class Deadline:
+    """
+    Time budget of one request
+
+    Thread-safe: stages running in worker threads record their decisions
+    on the same instance.
+    """
+
+    def __init__(self, budget_ms: float = DEFAULT_DEADLINE_MS):
+        self.budget_ms = budget_ms
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages: dict[str, str] = {}
+        self.degraded: list[dict[str, Any]] = []
+
+    @classmethod
+    def from_header(cls, value: str | None) -> "Deadline":
+        """Deadline from the X-Request-Deadline-Ms header (clamped)"""
+        try:
+            budget_ms = float(value) if value else DEFAULT_DEADLINE_MS
+        except ValueError:
+            budget_ms = DEFAULT_DEADLINE_MS
+        return cls(min(max(budget_ms, 0.0), MAX_DEADLINE_MS))
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+
+    @property
+    def remaining_ms(self) -> float:
+        return max(self.budget_ms - self.elapsed_ms, 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining_ms <= 0
+
+    def tier(self, ai_min_ms: float = AI_STAGE_MIN_MS) -> str:
+        """Best tier the remaining budget still affords"""
+        remaining = self.remaining_ms
+        if remaining >= ai_min_ms:
+            return TIER_FULL
+        if remaining >= LOCAL_STAGE_MIN_MS:
+            return TIER_LOCAL
+        return TIER_MINIMAL
+
+    def timeout_s(self) -> float:
+        """Remaining budget in seconds (for client timeouts)"""
+        return self.remaining_ms / 1000
+
+    def budget_for(self, stage_budget_ms: float) -> float:
+        """A stage's own budget, capped by what is left of the request"""
+        return min(stage_budget_ms, self.remaining_ms)
+
+    def record(self, stage: str, path: str) -> None:
+        """Record the path a stage took (e.g. "full", "local", "skipped")"""
+        with self._lock:
+            self.stages[stage] = path
+
+    def degrade(self, stage: str, path: str, reason: str) -> None:
+        """Record that a stage fell back to a cheaper path"""
+        with self._lock:
+            self.stages[stage] = path
+            self.degraded.append(
+                {
+                    "stage": stage,
+                    "path": path,
+                    "reason": reason,
+                    "remaining_ms": round(self.remaining_ms),
+                }
+            )
+        metrics.increment(f"deadline.degraded.{stage}")
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "budget_ms": round(self.budget_ms),
+                "elapsed_ms": round(self.elapsed_ms),
+                "stages": dict(self.stages),
+                "degraded_stages": list(self.degraded),
+            }
+
+
+def choose_tier(
+    deadline: Deadline | None, stage: str, ai_min_ms: float = AI_STAGE_MIN_MS
+) -> str:
+    """
+    Pick a stage's tier and record degradation
+
+    Args:
+        deadline: Request deadline (None = no deadline, always full tier)
+        stage: Stage name reported in the response
+        ai_min_ms: Remaining budget this stage's AI path needs
+
+    Returns:
+        TIER_FULL, TIER_LOCAL or TIER_MINIMAL
+    """
+    if deadline is None:
+        return TIER_FULL
+    tier = deadline.tier(ai_min_ms)
+    if tier == TIER_FULL:
+        deadline.record(stage, TIER_FULL)
+    else:
+        deadline.degrade(
+            stage,
+            "local" if tier == TIER_LOCAL else "skipped",
+            "insufficient_budget",
+        )
+    return tier
+
+
+def stage_budget_ms(
+    deadline: Deadline | None,
+    stage: str,
+    budget_ms: float,
+    ai_min_ms: float = AI_STAGE_MIN_MS,
+) -> float | None:
+    """
+    Latency budget for a stage whose own budget bounds an optional AI step
+
+    Returns:
+        None without a deadline (stage default), 0 when only the local path
+        fits, otherwise the stage budget capped by the remaining time
+    """
+    if deadline is None:
+        return None
+    if choose_tier(deadline, stage, ai_min_ms) != TIER_FULL:
+        return 0.0
+    return deadline.budget_for(budget_ms)
+
+
+def gemini_call_options(deadline: Deadline | None) -> dict[str, Any]:
+    """
+    generate_content keyword arguments bounding the call by the remaining
+    budget (empty without a deadline or on SDKs without request_options)
+    """
+    if deadline is None or not GEMINI_REQUEST_OPTIONS_SUPPORTED:
+        return {}
+    return {"request_options": {"timeout": max(deadline.timeout_s(), 1.0)}}
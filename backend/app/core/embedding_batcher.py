@@ -0,0 +1,231 @@
+"""
+Dynamic Micro-Batching for Embeddings
+Collects encode() calls from concurrent analyses over a short window and runs
+them through the model as a single batch
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import numpy as np
+
+from app.core.metrics import metrics
+
+# Longest a caller waits for its batch when it passes no timeout of its own
+EMBEDDINGS_BATCH_TIMEOUT_S = float(os.getenv("EMBEDDINGS_BATCH_TIMEOUT_S", "30"))
+# How often a waiting caller checks that the batch worker is still running
+WORKER_CHECK_S = 1.0
+
+
+class _EncodeRequest:
+    """One caller's sentences waiting to be batched"""
+
+    __slots__ = ("enqueued_at", "future", "texts")
+
+    def __init__(self, texts: list[str]):
+        self.texts = texts
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class EmbeddingBatcher:
+    """
+    In-process embedding scheduler
+    Exposes the same encode() interface as the wrapped backend, so services
+    keep calling model.encode() and transparently share forward passes
+    """
+
+    def __init__(
+        self,
+        model,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        timeout_s: float = EMBEDDINGS_BATCH_TIMEOUT_S,
+    ):
+        """
+        Args:
+            model: Embedding backend exposing encode()
+            max_batch_size: Flush once this many sentences are queued
+            max_wait_ms: Maximum time the first request waits for company
+            timeout_s: Default time a caller waits for its embeddings
+        """
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.timeout_s = timeout_s
+
+        self._queue: queue.Queue[_EncodeRequest] = queue.Queue()
+        self._lock = threading.Lock()
+        self._inflight: list[_EncodeRequest] = []
+        self._worker = self._start_worker()
+
+    def _start_worker(self) -> threading.Thread:
+        worker = threading.Thread(
+            target=self._run, name="embedding-batcher", daemon=True
+        )
+        worker.start()
+        return worker
+
+    def _ensure_worker(self) -> None:
+        """
+        Restart the batch worker if it died, failing the batch it was running
+        (queued requests are picked up by the new worker)
+        """
+        with self._lock:
+            if self._worker.is_alive():
+                return
+            lost, self._inflight = self._inflight, []
+            for request in lost:
+                if not request.future.done():
+                    request.future.set_exception(
+                        RuntimeError("Embedding batch worker stopped")
+                    )
+            self._worker = self._start_worker()
+        metrics.increment("embeddings.worker_restarts")
+
+    @property
+    def backend_name(self) -> str:
+        return getattr(self.model, "backend_name", "unknown")
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = True,
+        timeout_s: float | None = None,
+    ) -> np.ndarray:
+        """
+        Encode sentences, sharing the forward pass with concurrent callers
+
+        Args:
+            sentences: One sentence or a list of sentences
+            batch_size: Ignored when batched (the batcher sets the batch size)
+            normalize_embeddings: Only normalized embeddings are batched
+            timeout_s: Longest wait for the batch (e.g. the request deadline's
+                remaining time); defaults to the batcher's timeout_s
+
+        Returns:
+            1-D array for a single string, 2-D array (n, dim) for a list
+
+        Raises:
+            TimeoutError: The embeddings were not ready within the timeout
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+
+        # Nothing to share (or non-default options): go straight to the model
+        if not texts or not normalize_embeddings:
+            return self.model.encode(
+                sentences,
+                batch_size=batch_size,
+                normalize_embeddings=normalize_embeddings,
+            )
+
+        request = _EncodeRequest(texts)
+        self._ensure_worker()
+        self._queue.put(request)
+        embeddings = self._wait(
+            request, self.timeout_s if timeout_s is None else timeout_s
+        )
+        return embeddings[0] if single else embeddings
+
+    def _wait(self, request: _EncodeRequest, timeout_s: float) -> np.ndarray:
+        """Wait for a request's embeddings, checking the worker is alive"""
+        wait_until = time.monotonic() + max(timeout_s, 0.0)
+        while True:
+            remaining = wait_until - time.monotonic()
+            try:
+                return request.future.result(
+                    timeout=max(min(remaining, WORKER_CHECK_S), 0.0)
+                )
+            except FutureTimeoutError:
+                if remaining <= WORKER_CHECK_S:
+                    metrics.increment("embeddings.timeouts")
+                    raise TimeoutError(
+                        f"Embeddings not ready within {timeout_s:g}s"
+                    ) from None
+                self._ensure_worker()
+
+    def _run(self) -> None:
+        """Worker loop: gather a batch, run it, route results back"""
+        while True:
+            batch = [self._queue.get()]
+            size = len(batch[0].texts)
+            flush_at = time.monotonic() + self.max_wait
+
+            while size < self.max_batch_size:
+                remaining = flush_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            # Left in place if the thread dies, so _ensure_worker fails them
+            with self._lock:
+                self._inflight = batch
+            try:
+                self._execute(batch)
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+            with self._lock:
+                self._inflight = []
+
+    def _execute(self, batch: list[_EncodeRequest]) -> None:
+        """Encode all queued sentences in one call and split the result"""
+        started = time.monotonic()
+        texts = [text for request in batch for text in request.texts]
+
+        try:
+            embeddings = self.model.encode(texts, batch_size=self.max_batch_size)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            metrics.increment("embeddings.batch_errors")
+            return
+
+        offset = 0
+        for request in batch:
+            count = len(request.texts)
+            request.future.set_result(embeddings[offset : offset + count])
+            offset += count
+
+        metrics.increment("embeddings.batches")
+        metrics.increment("embeddings.requests", len(batch))
+        metrics.increment("embeddings.sentences", len(texts))
+        metrics.observe("embeddings.batch_sentences", len(texts))
+        metrics.observe("embeddings.batch_requests", len(batch))
+        metrics.observe(
+            "embeddings.queue_wait_ms",
+            (started - min(r.enqueued_at for r in batch)) * 1000,
+            buckets=(1, 2, 5, 10, 20, 50, 100),
+        )
+
+
+def is_batching_enabled() -> bool:
+    """Check whether micro-batching is enabled (EMBEDDINGS_BATCHING)"""
+    return os.getenv("EMBEDDINGS_BATCHING", "true").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def create_embedding_batcher(model) -> EmbeddingBatcher:
+    """Wrap a backend in a batcher configured from environment variables"""
+    return EmbeddingBatcher(
+        model,
+        max_batch_size=int(os.getenv("EMBEDDINGS_BATCH_MAX_SIZE", "64")),
+        max_wait_ms=float(os.getenv("EMBEDDINGS_BATCH_MAX_WAIT_MS", "5")),
+        timeout_s=EMBEDDINGS_BATCH_TIMEOUT_S,
+    )
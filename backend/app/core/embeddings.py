@@ -0,0 +1,212 @@
+"""
+Embedding Backends
+Runs all-MiniLM-L6-v2 through either PyTorch (sentence-transformers) or an
+exported, int8-quantized ONNX graph behind the same encode() interface
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Try to import sentence-transformers (PyTorch backend)
+try:
+    from sentence_transformers import SentenceTransformer
+
+    TORCH_BACKEND_AVAILABLE = True
+except ImportError:
+    TORCH_BACKEND_AVAILABLE = False
+
+# Try to import ONNX Runtime + tokenizers (ONNX backend)
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+
+    ONNX_BACKEND_AVAILABLE = True
+except ImportError:
+    ONNX_BACKEND_AVAILABLE = False
+
+
+EMBEDDING_MODEL_NAME = os.getenv("SENTENCE_TRANSFORMER_MODEL", "all-MiniLM-L6-v2")
+DEFAULT_ONNX_MODEL_DIR = str(
+    Path(__file__).resolve().parent.parent.parent / "models" / "all-MiniLM-L6-v2-onnx"
+)
+ONNX_MODEL_FILE = "model_quantized.onnx"
+ONNX_MAX_SEQ_LENGTH = 256  # Same limit sentence-transformers uses for MiniLM
+
+
+def get_embeddings_backend_name() -> str:
+    """Get configured embeddings backend ("torch" or "onnx")"""
+    return os.getenv("EMBEDDINGS_BACKEND", "torch").strip().lower()
+
+
+def is_backend_available(backend: str) -> bool:
+    """Check whether the libraries for a backend are installed"""
+    if backend == "onnx":
+        return ONNX_BACKEND_AVAILABLE
+    return TORCH_BACKEND_AVAILABLE
+
+
+class TorchEmbeddingBackend:
+    """sentence-transformers model running on PyTorch"""
+
+    backend_name = "torch"
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL_NAME):
+        self.model_name = model_name
+        self._model = SentenceTransformer(model_name)
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = True,
+    ) -> np.ndarray:
+        """
+        Encode sentences into embeddings
+
+        Returns:
+            1-D array for a single string, 2-D array (n, dim) for a list
+        """
+        return self._model.encode(
+            sentences,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=normalize_embeddings,
+            show_progress_bar=False,
+        )
+
+
+class OnnxEmbeddingBackend:
+    """
+    Int8-quantized ONNX export of the same model running on ONNX Runtime
+    Reproduces the sentence-transformers pipeline: tokenize -> transformer ->
+    mean pooling -> L2 normalize
+    """
+
+    backend_name = "onnx"
+
+    def __init__(self, model_dir: str | None = None):
+        directory = Path(
+            model_dir or os.getenv("EMBEDDINGS_ONNX_DIR") or DEFAULT_ONNX_MODEL_DIR
+        )
+        model_path = directory / os.getenv("EMBEDDINGS_ONNX_FILE", ONNX_MODEL_FILE)
+        tokenizer_path = directory / "tokenizer.json"
+
+        if not model_path.exists() or not tokenizer_path.exists():
+            raise FileNotFoundError(
+                f"ONNX embedding model not found in {directory}. "
+                "Run: python scripts/export_onnx_embeddings.py"
+            )
+
+        self.model_name = str(model_path)
+
+        self._tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self._tokenizer.enable_truncation(max_length=ONNX_MAX_SEQ_LENGTH)
+        self._tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        threads = int(os.getenv("EMBEDDINGS_ONNX_THREADS", "0"))
+        if threads > 0:
+            options.intra_op_num_threads = threads
+
+        self._session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = True,
+    ) -> np.ndarray:
+        """
+        Encode sentences into embeddings
+
+        Returns:
+            1-D array for a single string, 2-D array (n, dim) for a list
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+
+        batches = [
+            self._encode_batch(texts[start : start + batch_size])
+            for start in range(0, len(texts), batch_size)
+        ]
+        embeddings = (
+            np.vstack(batches) if batches else np.zeros((0, 384), dtype=np.float32)
+        )
+
+        if normalize_embeddings and len(embeddings):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        """Run one padded batch through the ONNX graph and mean-pool it"""
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.array(
+                [e.type_ids for e in encodings], dtype=np.int64
+            )
+
+        token_embeddings = self._session.run(None, feeds)[0]
+
+        # Mean pooling over real (non-padding) tokens
+        mask = attention_mask[..., np.newaxis].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        return (summed / counts).astype(np.float32)
+
+
+def create_embedding_model(backend: str | None = None):
+    """
+    Create the configured embedding backend
+
+    Args:
+        backend: "torch" or "onnx" (defaults to EMBEDDINGS_BACKEND env var)
+
+    Returns:
+        Backend instance exposing encode()
+    """
+    backend = backend or get_embeddings_backend_name()
+
+    if backend == "onnx":
+        if not ONNX_BACKEND_AVAILABLE:
+            raise ImportError(
+                "ONNX backend requires onnxruntime and tokenizers. "
+                "Run: pip install onnxruntime tokenizers"
+            )
+        return OnnxEmbeddingBackend()
+
+    if backend != "torch":
+        raise ValueError(f"Unknown embeddings backend: {backend}")
+
+    if not TORCH_BACKEND_AVAILABLE:
+        raise ImportError(
+            "Torch backend requires sentence-transformers. "
+            "Run: pip install sentence-transformers"
+        )
+    return TorchEmbeddingBackend()
+
+
+def cos_sim(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity matrix between two sets of embeddings
+    Backend-agnostic replacement for sentence_transformers.util.cos_sim
+
+    Returns:
+        Array of shape (len(a), len(b))
+    """
+    a = np.atleast_2d(np.asarray(a, dtype=np.float32))
+    b = np.atleast_2d(np.asarray(b, dtype=np.float32))
+    a = a / np.clip(np.linalg.norm(a, axis=1, keepdims=True), 1e-12, None)
+    b = b / np.clip(np.linalg.norm(b, axis=1, keepdims=True), 1e-12, None)
+    return a @ b.T
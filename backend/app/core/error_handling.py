@@ -4,10 +4,15 @@ Eliminates duplication across all services
 """
 
 import logging
+import os
+import threading
+import time
 import traceback
 from functools import wraps
 from typing import Any
 
+from app.core.metrics import metrics
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -48,6 +53,195 @@ class ModelInitializationError(ServiceError):
         )
 
 
+class DocumentParseError(ServiceError):
+    """Exception for uploads the parser rejects or cannot finish within its limits"""
+
+    def __init__(
+        self,
+        message: str,
+        error_code: str = "PARSE_ERROR",
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(message, error_code, details)
+
+
+class CircuitOpenError(AIServiceError):
+    """Exception raised instead of calling a service whose circuit is open"""
+
+    def __init__(self, service: str, retry_after_s: float):
+        super().__init__(
+            f"{service} circuit is open, retry in {retry_after_s:.0f}s",
+            service.upper(),
+            {"retry_after_s": round(retry_after_s, 1)},
+        )
+
+
+# ============================================================================
+# CIRCUIT BREAKER
+# ============================================================================
+
+CIRCUIT_CLOSED = "closed"  # calls go through
+CIRCUIT_OPEN = "open"  # calls are rejected until the cool-down ends
+CIRCUIT_HALF_OPEN = "half_open"  # one probe call decides whether to close
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for an external service
+
+    After `failure_threshold` consecutive failures (errors, or calls slower
+    than `slow_call_s`) the circuit opens and calls are rejected with
+    CircuitOpenError, so callers go straight to their fallback instead of
+    waiting for each call to fail. After `cooldown_s` one probe call is let
+    through: success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cooldown_s: float = 30.0,
+        slow_call_s: float | None = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self.slow_call_s = slow_call_s
+
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+
+    def _refresh(self) -> None:
+        """Move an open circuit to half-open once the cool-down is over"""
+        if (
+            self._state == CIRCUIT_OPEN
+            and time.monotonic() - self._opened_at >= self.cooldown_s
+        ):
+            self._state = CIRCUIT_HALF_OPEN
+            self._probe_in_flight = False
+
+    def _retry_after_s(self) -> float:
+        return max(self.cooldown_s - (time.monotonic() - self._opened_at), 0.0)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls would be rejected (check before building a request)"""
+        with self._lock:
+            self._refresh()
+            return self._state == CIRCUIT_OPEN or (
+                self._state == CIRCUIT_HALF_OPEN and self._probe_in_flight
+            )
+
+    def allow_request(self) -> bool:
+        """Whether a call may go out now (claims the probe when half-open)"""
+        with self._lock:
+            self._refresh()
+            if self._state == CIRCUIT_CLOSED:
+                return True
+            if self._state == CIRCUIT_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+        metrics.increment(f"circuit.{self.name}.rejected")
+        return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            recovered = self._state != CIRCUIT_CLOSED
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+        if recovered:
+            logger.info(f"{self.name} circuit closed (probe succeeded)")
+            metrics.increment(f"circuit.{self.name}.closed")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            failures = self._failures
+            tripped = self._state == CIRCUIT_HALF_OPEN or (
+                self._state == CIRCUIT_CLOSED
+                and self._failures >= self.failure_threshold
+            )
+            if tripped:
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                self._times_opened += 1
+        metrics.increment(f"circuit.{self.name}.failures")
+        if tripped:
+            logger.warning(
+                f"{self.name} circuit opened after {failures} consecutive "
+                f"failures, rejecting calls for {self.cooldown_s:.0f}s"
+            )
+            metrics.increment(f"circuit.{self.name}.opened")
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call func through the breaker
+
+        Raises:
+            CircuitOpenError: If the circuit is open (func is not called)
+        """
+        if not self.allow_request():
+            with self._lock:
+                retry_after_s = self._retry_after_s()
+            raise CircuitOpenError(self.name, retry_after_s)
+
+        start = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+
+        if self.slow_call_s is not None and time.monotonic() - start > self.slow_call_s:
+            self.record_failure()
+        else:
+            self.record_success()
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """State for health checks and /metrics"""
+        with self._lock:
+            self._refresh()
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "cooldown_s": self.cooldown_s,
+                "retry_after_s": (
+                    round(self._retry_after_s(), 1)
+                    if self._state == CIRCUIT_OPEN
+                    else 0.0
+                ),
+                "times_opened": self._times_opened,
+            }
+
+
+# Shared breaker for every Gemini call
+gemini_breaker = CircuitBreaker(
+    "gemini",
+    failure_threshold=int(os.getenv("GEMINI_BREAKER_FAILURE_THRESHOLD", "5")),
+    cooldown_s=float(os.getenv("GEMINI_BREAKER_COOLDOWN_S", "30")),
+    slow_call_s=float(os.getenv("GEMINI_BREAKER_SLOW_CALL_S", "20")),
+)
+
+
+def circuit_breaker_states() -> dict[str, dict[str, Any]]:
+    """Snapshot of every shared circuit breaker"""
+    return {gemini_breaker.name: gemini_breaker.snapshot()}
+
+
 def handle_ai_error(func):
     """Decorator for handling AI service errors"""
 
@@ -0,0 +1,88 @@
+"""
+Centralized In-Process Metrics
+Thread-safe counters and value distributions exposed on /metrics
+"""
+
+import threading
+from typing import Any
+
+
+class _Distribution:
+    """Running summary of observed values with a coarse histogram"""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.bucket_counts[i] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"<={b:g}" for b in self.buckets] + [f">{self.buckets[-1]:g}"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0,
+            "min": self.min,
+            "max": self.max,
+            "histogram": dict(zip(labels, self.bucket_counts, strict=True)),
+        }
+
+
+class MetricsRegistry:
+    """Process-wide metrics registry"""
+
+    DEFAULT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._distributions: dict[str, _Distribution] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increase a counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(
+        self, name: str, value: float, buckets: tuple[float, ...] | None = None
+    ) -> None:
+        """Record a value in a named distribution"""
+        with self._lock:
+            dist = self._distributions.get(name)
+            if dist is None:
+                dist = _Distribution(buckets or self.DEFAULT_BUCKETS)
+                self._distributions[name] = dist
+            dist.observe(value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get a point-in-time copy of all metrics"""
+        with self._lock:
+            return {
+                "counters": dict(sorted(self._counters.items())),
+                "distributions": {
+                    name: dist.snapshot()
+                    for name, dist in sorted(self._distributions.items())
+                },
+            }
+
+    def reset(self) -> None:
+        """Clear all metrics"""
+        with self._lock:
+            self._counters.clear()
+            self._distributions.clear()
+
+
+# Global metrics instance
+metrics = MetricsRegistry()
@@ -0,0 +1,118 @@
+"""
+Response Serialization
+Fast JSON encoding (orjson) with optional MessagePack via Accept negotiation
+"""
+
+import json
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def _default(value: Any) -> Any:
+    """Fallback for values the encoders do not handle natively"""
+    # numpy scalars / arrays (scores and similarities)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Type is not serializable: {type(value).__name__}")
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode payload as JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            payload,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        payload, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def encode_msgpack(payload: Any) -> bytes:
+    """Encode payload as MessagePack bytes"""
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(payload, default=_default, use_bin_type=True)
+
+
+def wants_msgpack(accept: str | None) -> bool:
+    """
+    Check whether the Accept header prefers MessagePack over JSON
+
+    Honours q-values; JSON wins ties and is the default when msgpack
+    is not installed.
+    """
+    if not accept or not MSGPACK_AVAILABLE:
+        return False
+
+    msgpack_q = json_q = 0.0
+    for part in accept.split(","):
+        media_type, *params = (p.strip() for p in part.split(";"))
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        media_type = media_type.lower()
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_q = max(json_q, q)
+
+    return msgpack_q > json_q
+
+
+def negotiated_response(
+    request: Request, payload: Any, status_code: int = 200
+) -> Response:
+    """
+    Serialize payload in the format requested by the client
+
+    Args:
+        request: Incoming request (its Accept header is inspected)
+        payload: Response body
+        status_code: HTTP status code
+
+    Returns:
+        MessagePack response if preferred by Accept, otherwise JSON
+    """
+    headers = {"Vary": "Accept"}
+    if wants_msgpack(request.headers.get("accept")):
+        return Response(
+            content=encode_msgpack(payload),
+            status_code=status_code,
+            media_type=MSGPACK_MEDIA_TYPES[0],
+            headers=headers,
+        )
+    return Response(
+        content=encode_json(payload),
+        status_code=status_code,
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
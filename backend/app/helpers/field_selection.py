@@ -0,0 +1,104 @@
+# ============================================================================
+# FIELD SELECTION HELPERS - Response trimming and lazy section evaluation
+# ============================================================================
+
+from typing import Any
+
+# A response spec maps keys to plain values, nested specs (dicts), or
+# zero-argument callables that are only invoked when the key is selected
+ResponseSpec = dict[str, Any]
+
+
+def parse_fields(*raw_values: str | None) -> set[str] | None:
+    """
+    Parse comma-separated field selections (e.g. "ats_score,missing_keywords")
+
+    Dotted paths select nested keys: "extraction_details.skills_found".
+    Several raw values (e.g. fields= and include=) are merged.
+
+    Returns:
+        Set of selected paths, or None when nothing was requested (= everything)
+    """
+    selected = {
+        field.strip()
+        for raw in raw_values
+        if raw
+        for field in raw.split(",")
+        if field.strip()
+    }
+    return selected or None
+
+
+def is_selected(fields: set[str] | None, path: str) -> bool:
+    """True if path, one of its ancestors, or one of its descendants is selected"""
+    if fields is None:
+        return True
+    return _fully_selected(fields, path) or any(
+        field.startswith(path + ".") for field in fields
+    )
+
+
+def _fully_selected(fields: set[str] | None, path: str) -> bool:
+    """True if path itself or one of its ancestors was selected"""
+    if fields is None:
+        return True
+    parts = path.split(".")
+    return any(".".join(parts[:i]) in fields for i in range(1, len(parts) + 1))
+
+
+def build_selected(
+    spec: ResponseSpec,
+    fields: set[str] | None,
+    prefix: str = "",
+    evaluate: bool = True,
+) -> dict[str, Any]:
+    """
+    Materialize a response spec, evaluating only the selected sections
+
+    Args:
+        spec: Keys mapped to values, nested specs or lazy callables
+        fields: Selected paths from parse_fields (None = everything)
+        prefix: Dotted path of spec within the full response
+        evaluate: False leaves out lazy sections instead of computing them
+
+    Returns:
+        Response dictionary containing only the selected keys
+    """
+    result: dict[str, Any] = {}
+
+    for key, value in spec.items():
+        path = f"{prefix}{key}"
+        if not is_selected(fields, path):
+            continue
+
+        if callable(value):
+            if not evaluate:
+                continue
+            value = value()
+            # Computed sections can still be trimmed further
+            if isinstance(value, dict) and not _fully_selected(fields, path):
+                value = build_selected(value, fields, prefix=f"{path}.")
+        elif isinstance(value, dict):
+            # Nested spec: may hold lazy sections of its own
+            value = build_selected(value, fields, prefix=f"{path}.", evaluate=evaluate)
+
+        result[key] = value
+
+    return result
+
+
+def select_fields(payload: dict[str, Any], fields: set[str] | None) -> dict[str, Any]:
+    """Trim an already-computed payload to the selected fields"""
+    if fields is None:
+        return payload
+    return build_selected(payload, fields)
+
+
+def merge_sections(base: dict[str, Any], extra: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge two payloads (extra wins on conflicting values)"""
+    merged = dict(base)
+    for key, value in extra.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = merge_sections(merged[key], value)
+        merged[key] = value
+    return merged
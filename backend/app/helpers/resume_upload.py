@@ -0,0 +1,88 @@
+# ============================================================================
+# RESUME UPLOAD HELPERS - Upload validation, isolated parsing, stored documents
+# ============================================================================
+
+from typing import Any
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from app.core.error_handling import DocumentParseError
+from app.services.document_store import document_store
+from app.utils.parser_pool import parser_pool
+
+SUPPORTED_EXTENSIONS = ["pdf", "docx", "doc", "txt"]
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+
+
+async def parse_upload(file_content: bytes, filename: str) -> dict[str, Any]:
+    """
+    Parse an uploaded resume in the isolated parser pool
+
+    Files the parser rejects or cannot finish within its limits (page cap,
+    timeout, memory) are answered with 422, a saturated pool with 503.
+    """
+    try:
+        return await run_in_threadpool(parser_pool.parse, file_content, filename)
+    except DocumentParseError as e:
+        status_code = (
+            503 if e.error_code in ("PARSER_BUSY", "PARSER_UNAVAILABLE") else 422
+        )
+        raise HTTPException(status_code=status_code, detail=e.message)
+
+
+async def read_upload(file: UploadFile) -> tuple[dict[str, Any], str, int]:
+    """
+    Validate, read and parse an uploaded resume
+
+    Returns:
+        Tuple of (parsed resume, filename, file size in bytes)
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    # Check file type
+    file_extension = file.filename.lower().split(".")[-1]
+    if file_extension not in SUPPORTED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported file type. Please upload PDF, DOCX, or TXT files.",
+        )
+
+    # Read and check file size
+    file_content = await file.read()
+    if len(file_content) > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=400, detail="File too large. Maximum size is 10MB."
+        )
+
+    parsed_resume = await parse_upload(file_content, file.filename)
+    return parsed_resume, file.filename, len(file_content)
+
+
+async def resolve_resume(
+    file: UploadFile | None, document_id: str | None
+) -> tuple[dict[str, Any], str, int]:
+    """
+    Parsed resume of an analysis request: an upload or a stored document
+
+    Args:
+        file: Uploaded resume file
+        document_id: ID returned by POST /api/documents
+
+    Returns:
+        Tuple of (parsed resume, filename, file size in bytes)
+    """
+    if document_id:
+        if file is not None and file.filename:
+            raise HTTPException(
+                status_code=400, detail="Send either a file or a document_id, not both."
+            )
+        document = document_store.get(document_id)
+        if document is None:
+            raise HTTPException(status_code=404, detail="Document not found or expired")
+        return document["parsed_resume"], document["filename"], document["file_size"]
+
+    if file is None:
+        raise HTTPException(status_code=400, detail="No file provided")
+    return await read_upload(file)
@@ -4,6 +4,7 @@ This is like the main server file in Node.js/Express
 """
 
 import time
+from contextlib import asynccontextmanager
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -20,6 +21,7 @@ except ImportError:
 # Import FastAPI (like importing Express in Node.js)
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 load_dotenv()
 
@@ -32,11 +34,39 @@ except ImportError as e:
     print(f"Warning: Upload router not available: {e}")
     UPLOAD_ROUTER_AVAILABLE = False
 
+try:
+    from app.api.candidates import router as candidates_router
+
+    CANDIDATES_ROUTER_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Candidates router not available: {e}")
+    CANDIDATES_ROUTER_AVAILABLE = False
+
+try:
+    from app.api.documents import router as documents_router
+
+    DOCUMENTS_ROUTER_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Documents router not available: {e}")
+    DOCUMENTS_ROUTER_AVAILABLE = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the document parser workers with the app, stop them on shutdown"""
+    from app.utils.parser_pool import parser_pool
+
+    parser_pool.start()
+    yield
+    parser_pool.close()
+
+
 # Create FastAPI app instance (like const app = express())
 app = FastAPI(
     title="ATS Resume Checker API",
     description="Advanced ATS resume analysis and scoring system",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS (Cross-Origin Resource Sharing)
@@ -55,6 +85,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Compress responses (analysis payloads are large, deeply nested JSON)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # Define a route (like app.get() in Express)
 @app.get("/api")
@@ -91,6 +124,8 @@ async def health_check():
     import os
     import time
 
+    from app.core.error_handling import circuit_breaker_states
+
     # Basic health check - just verify the app is running
     # Don't load heavy ML models here to avoid timeout
     return {
@@ -100,6 +135,27 @@ async def health_check():
         "timestamp": time.time(),
         "environment": deployment_config.environment,
         "platform": deployment_config.get_platform_name(),
+        "circuit_breakers": circuit_breaker_states(),
+    }
+
+
+# Metrics endpoint
+@app.get("/metrics")
+async def metrics_snapshot():
+    """
+    In-process metrics (counters and distributions)
+    Includes achieved embedding batch sizes, queue wait times, the state
+    of the Gemini circuit breaker and the document parser pool
+    """
+    from app.core.error_handling import circuit_breaker_states
+    from app.core.metrics import metrics
+    from app.utils.parser_pool import parser_pool
+
+    return {
+        "timestamp": time.time(),
+        **metrics.snapshot(),
+        "circuit_breakers": circuit_breaker_states(),
+        "parser_pool": parser_pool.stats(),
     }
 
 
@@ -126,6 +182,13 @@ else:
         }
 
 
+if CANDIDATES_ROUTER_AVAILABLE:
+    app.include_router(candidates_router)
+
+if DOCUMENTS_ROUTER_AVAILABLE:
+    app.include_router(documents_router)
+
+
 # This is like the app.listen() in Node.js
 # But we'll run it with uvicorn command instead
 if __name__ == "__main__":
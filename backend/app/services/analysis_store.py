@@ -0,0 +1,95 @@
+"""
+Stored Analyses
+Recent analysis results kept server-side under an ID returned by /analyze
+and /quick-analyze, so follow-up calls (/improvement-plan) reference them
+instead of uploading them again
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from app.core.metrics import metrics
+
+ANALYSIS_STORE_SIZE = int(os.getenv("ANALYSIS_STORE_SIZE", "256"))
+ANALYSIS_STORE_TTL_S = float(os.getenv("ANALYSIS_STORE_TTL_S", "3600"))
+
+
+class AnalysisStore:
+    """
+    In-process LRU store of analyses with a time-to-live
+
+    Entries hold the analysis result, the resume text it was computed from,
+    the job description used and the analyzer's context (JD artifacts and
+    sub-scores), so the resume's extraction artifact can be found (or
+    rebuilt) from the stored text and edits can be re-analyzed incrementally.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = ANALYSIS_STORE_SIZE,
+        ttl_s: float = ANALYSIS_STORE_TTL_S,
+    ):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(
+        self,
+        analysis_result: dict[str, Any],
+        resume_text: str,
+        job_description: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Store an analysis
+
+        Args:
+            analysis_result: Analysis result as computed
+            resume_text: Resume text that was analyzed
+            job_description: Job description used
+            context: Analyzer context (see analyze_resume_with_job_description)
+
+        Returns:
+            The analysis ID
+        """
+        analysis_id = uuid.uuid4().hex
+        entry = {
+            "analysis_result": analysis_result,
+            "resume_text": resume_text,
+            "job_description": job_description,
+            "context": context,
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self._entries[analysis_id] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        metrics.increment("analysis_store.saved")
+        return analysis_id
+
+    def get(self, analysis_id: str) -> dict[str, Any] | None:
+        """Stored analysis by ID (None if unknown or expired)"""
+        with self._lock:
+            entry = self._entries.get(analysis_id)
+            if entry is None:
+                metrics.increment("analysis_store.misses")
+                return None
+            if time.time() - entry["created_at"] > self.ttl_s:
+                del self._entries[analysis_id]
+                metrics.increment("analysis_store.expired")
+                return None
+            self._entries.move_to_end(analysis_id)
+        metrics.increment("analysis_store.hits")
+        return entry
+
+
+# Global instance
+analysis_store = AnalysisStore()
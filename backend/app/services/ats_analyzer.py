@@ -3,27 +3,79 @@ Advanced ATS (Applicant Tracking System) Analysis Engine
 Uses semantic embeddings for concept matching, not just keywords
 """
 
+import os
 import re
-from collections import Counter
 from datetime import datetime
 from typing import Any
 
 # Import centralized AI configuration
 from app.core.ai_config import ai_config, is_gemini_available
-
-# Try to import sentence-transformers utilities
-try:
-    from sentence_transformers import util
-
-    UTIL_AVAILABLE = True
-except ImportError:
-    UTIL_AVAILABLE = False
-
-from app.services.job_description_generator import job_description_generator
+from app.core.deadline import (
+    LOCAL_STAGE_MIN_MS,
+    TIER_FULL,
+    TIER_MINIMAL,
+    Deadline,
+    choose_tier,
+    gemini_call_options,
+    stage_budget_ms,
+)
+from app.core.error_handling import CircuitOpenError, gemini_breaker
+from app.core.metrics import metrics
+from app.helpers.field_selection import build_selected, is_selected
 
 # Import job detector and project extractor
+from app.services.document_index import DocumentIndex
+from app.services.job_description_generator import job_description_generator
 from app.services.job_detector import job_detector
+from app.services.keyword_engine import GENERIC_KEYWORDS, keyword_engine
+from app.services.local_experience_extractor import (
+    DEGREE_PATTERN,
+    local_experience_extractor,
+)
 from app.services.project_extractor import project_extractor
+from app.services.resume_extraction import categorized_facet, resume_extractions
+from app.services.section_extraction import GROUP_SCHEMAS
+from app.services.semantic_matcher import diff_sections, semantic_matcher
+from app.services.skills_taxonomy import skills_taxonomy
+from app.services.term_weights import get_term_weights, is_learning_enabled
+
+# Structured experience extraction modes (see extract_structured_experience)
+EXTRACTION_MODES = ("fast", "ai", "hybrid")
+EXPERIENCE_EXTRACTION_MODE = os.getenv("EXPERIENCE_EXTRACTION_MODE", "ai")
+# "source" of a non-degraded result of each mode (only those are cached)
+MODE_SOURCES = {"fast": "rule_based", "ai": "ai", "hybrid": "hybrid"}
+# PDF layout facts counted on the text rather than measured on the page geometry
+TEXT_LAYOUT_KEYS = ("bullets", "capitalization", "special_characters")
+
+
+def _is_complete_extraction(result: dict[str, Any] | None, mode: str) -> bool:
+    """
+    Whether a structured experience result may be cached: produced by the
+    mode's own extractor, without sections that failed to extract
+    """
+    if not result:
+        return False
+    return result.get("source") == MODE_SOURCES[mode] and not result.get(
+        "extraction", {}
+    ).get("failed_sections")
+
+
+def _without_text_layout(parsed_resume: dict[str, Any]) -> dict[str, Any]:
+    """
+    Drop the text-derived PDF layout facts of a parsed resume whose text was
+    edited, so bullets and capitalization are counted on the edited text
+
+    Column, header/footer and table geometry still describe the file.
+    """
+    formatting = parsed_resume.get("formatting_analysis", {})
+    layout = formatting.get("layout")
+    if not layout:
+        return parsed_resume
+    geometry = {k: v for k, v in layout.items() if k not in TEXT_LAYOUT_KEYS}
+    return {
+        **parsed_resume,
+        "formatting_analysis": {**formatting, "layout": geometry},
+    }
 
 
 class ATSAnalyzer:
@@ -89,14 +141,146 @@ class ATSAnalyzer:
                 "ℹ️  ATS Analyzer: Google Gemini not configured. Content generation disabled."
             )
 
-    def extract_structured_experience(self, resume_text: str) -> dict[str, Any]:
+    def extract_structured_experience(
+        self,
+        resume_text: str,
+        deadline: Deadline | None = None,
+        mode: str | None = None,
+    ) -> dict[str, Any] | None:
         """
         Extract structured work experience with proper project association
+
+        Args:
+            resume_text: Resume text
+            deadline: Optional request deadline
+            mode: "fast" (local extractor only), "ai" (LLM extraction) or
+                "hybrid" (local extraction, LLM only for low-confidence
+                section groups); default EXPERIENCE_EXTRACTION_MODE
+
+        The AI modes fall back to the local extractor while the Gemini circuit
+        is open, and with a request deadline also when the AI call does not
+        fit (or fails); returns None when not even that fits. Results are
+        kept in the document's extraction artifact (degraded or partial ones,
+        with failed sections, are not), so repeated requests for the same
+        resume reuse them.
         """
-        return project_extractor.extract_structured_experience(resume_text)
+        mode = mode or EXPERIENCE_EXTRACTION_MODE
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {mode}")
+
+        extraction = resume_extractions.get(resume_text)
+        facet = f"structured:{mode}"
+        if extraction.has(facet) and deadline is not None:
+            deadline.record("structured_experience", "cached")
+        return extraction.facet(
+            facet,
+            lambda: self._extract_structured_experience(resume_text, deadline, mode),
+            keep=lambda result: _is_complete_extraction(result, mode),
+        )
+
+    def _extract_structured_experience(
+        self, resume_text: str, deadline: Deadline | None, mode: str
+    ) -> dict[str, Any] | None:
+        """Structured experience in the given mode (uncached)"""
+        if mode == "fast":
+            if deadline is not None:
+                deadline.record("structured_experience", "fast")
+            return self._local_structured_experience(resume_text)
+
+        tier = choose_tier(deadline, "structured_experience")
+        if tier == TIER_MINIMAL:
+            return None
+        if tier != TIER_FULL:
+            return self._local_structured_experience(resume_text)
+        if mode == "hybrid":
+            return self._hybrid_structured_experience(resume_text, deadline)
+
+        try:
+            structured_data = project_extractor.extract_structured_experience(
+                resume_text, deadline
+            )
+            structured_data["source"] = "ai"
+            self._record_failed_sections(structured_data, deadline)
+            return structured_data
+        except CircuitOpenError:
+            if deadline is not None:
+                deadline.degrade("structured_experience", "local", "circuit_open")
+        except Exception:
+            if deadline is None:
+                raise
+            deadline.degrade("structured_experience", "local", "error")
+        return self._local_structured_experience(resume_text)
+
+    def _local_structured_experience(self, text: str) -> dict[str, Any]:
+        """Structured experience from the local extractor (no AI call)"""
+        structured_data = local_experience_extractor.extract(
+            text, self.categorize_resume(text)
+        )
+        structured_data["source"] = "rule_based"
+        return structured_data
+
+    def _hybrid_structured_experience(
+        self, text: str, deadline: Deadline | None
+    ) -> dict[str, Any]:
+        """
+        Local extraction with the low-confidence section groups re-extracted
+        by the LLM (the local result is kept for any group the LLM misses)
+        """
+        structured_data = local_experience_extractor.extract(
+            text, self.categorize_resume(text)
+        )
+        structured_data["source"] = "hybrid"
+        extraction = structured_data["extraction"]
+        extraction["mode"] = "hybrid"
+        weak = local_experience_extractor.weak_groups(structured_data)
+        extraction["ai_groups"] = []
+        if not weak:
+            return structured_data
+
+        try:
+            ai_data = project_extractor.extract_sections(text, weak, deadline)
+        except CircuitOpenError:
+            if deadline is not None:
+                deadline.degrade("structured_experience", "local", "circuit_open")
+            structured_data["source"] = "rule_based"
+            return structured_data
+        except Exception as e:
+            print(f"⚠️  Hybrid extraction kept the local result: {e}")
+            if deadline is not None:
+                deadline.degrade("structured_experience", "local", "error")
+            structured_data["source"] = "rule_based"
+            return structured_data
+
+        for group in weak:
+            for key in GROUP_SCHEMAS[group]["required"]:
+                if ai_data.get(key):
+                    structured_data[key] = ai_data[key]
+        extraction["ai_groups"] = weak
+        if deadline is not None:
+            deadline.record("structured_experience", "hybrid")
+        if "extraction" in ai_data:
+            extraction["failed_sections"] = ai_data["extraction"]["failed_sections"]
+        self._record_failed_sections(structured_data, deadline)
+        return structured_data
+
+    def _record_failed_sections(
+        self, structured_data: dict[str, Any], deadline: Deadline | None
+    ) -> None:
+        """Report a partial AI extraction (some sections failed) as degraded"""
+        failed = structured_data.get("extraction", {}).get("failed_sections")
+        if not failed:
+            return
+        metrics.increment("extraction.partial")
+        if deadline is not None:
+            deadline.degrade("structured_experience", "partial", "failed_sections")
 
     def analyze_resume_with_job_description(
-        self, parsed_resume: dict[str, Any], job_description: str
+        self,
+        parsed_resume: dict[str, Any],
+        job_description: str,
+        fields: set[str] | None = None,
+        deadline: Deadline | None = None,
+        context: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         Complete ATS analysis comparing resume with job description
@@ -104,36 +288,66 @@ class ATSAnalyzer:
         Args:
             parsed_resume: Parsed resume from file_parser
             job_description: Job description text from user
+            fields: Optional selected response paths (see parse_fields).
+                Sections nobody asked for are neither returned nor computed.
+            deadline: Optional request deadline. AI stages fall back to
+                their local paths when the remaining budget is too small.
+            context: Optional dict filled with the job detection and JD
+                artifacts and the sub-scores, for reanalyze_resume(), and
+                with "full_result": every section that is computed
+                regardless of fields (for the analysis store)
 
         Returns:
             Comprehensive analysis with scores and recommendations
         """
-        resume_text = parsed_resume.get("text", "").lower()
+        full_text = parsed_resume.get("text", "")
+        resume_text = full_text.lower()
+        extraction = resume_extractions.get(full_text)
 
         # Detect job type first
-        detected_job, job_confidence = job_detector.detect_job_type(resume_text)
-
-        # Generate specific job description based on detected job type
-        experience_level = job_description_generator.determine_experience_level(
-            resume_text
-        )
-        specific_jd = job_description_generator.generate_job_description(
-            detected_job, experience_level
+        detected_job, job_confidence = job_detector.detect_job_type(
+            resume_text,
+            budget_ms=stage_budget_ms(
+                deadline, "job_detection", job_detector.latency_budget_ms
+            ),
         )
 
-        # Use the generated specific JD for analysis instead of the provided one
-        analysis_jd = specific_jd if detected_job != "Unknown" else job_description
+        # Use a JD generated for the detected job type instead of the provided
+        # one (the provided one is kept when there is no time to generate)
+        analysis_jd = job_description
+        if (
+            detected_job != "Unknown"
+            and not gemini_breaker.is_open
+            and choose_tier(deadline, "jd_generation") == TIER_FULL
+        ):
+            experience_level = job_description_generator.determine_experience_level(
+                resume_text
+            )
+            analysis_jd = job_description_generator.generate_job_description(
+                detected_job, experience_level, deadline
+            )
         jd_text = analysis_jd.lower()
 
         # Extract keywords from the analysis job description
         jd_keywords = self._extract_keywords(jd_text)
         jd_requirements = self._extract_requirements(jd_text)
+        self._learn_term_weights(jd_text)
 
-        # Perform all analyses
+        # Perform all analyses needed for the overall score
+        # (resume keyword extraction only feeds extraction_details)
         keyword_analysis = self._analyze_keywords_vs_jd(
-            resume_text, jd_keywords, jd_text
+            resume_text,
+            jd_keywords,
+            jd_text,
+            include_resume_keywords=is_selected(
+                fields, "extraction_details.all_resume_keywords"
+            )
+            or is_selected(fields, "extraction_details.total_resume_keywords"),
+            deadline=deadline,
+        )
+        semantic_analysis = self._analyze_semantic_match(
+            full_text, analysis_jd, deadline
         )
-        semantic_analysis = self._analyze_semantic_match(resume_text, jd_text)
 
         format_analysis = self._analyze_format(parsed_resume)
         content_analysis = self._analyze_content(
@@ -149,20 +363,52 @@ class ATSAnalyzer:
             content_analysis,
             ats_analysis,
         )
-
-        # Job type already detected above
-
-        # Generate recommendations
-        recommendations = self._generate_recommendations_with_jd(
+        detailed_scores = self._detailed_scores(
             keyword_analysis,
             semantic_analysis,
             format_analysis,
             content_analysis,
             ats_analysis,
-            jd_requirements,
         )
+        if context is not None:
+            context.update(
+                {
+                    "detected_job_type": detected_job,
+                    "job_detection_confidence": job_confidence,
+                    "analysis_jd": analysis_jd,
+                    "jd_keywords": jd_keywords,
+                    "jd_requirements": jd_requirements,
+                    "technical_keywords": keyword_analysis["technical_keywords_used"],
+                    "parsed_resume": {
+                        key: value
+                        for key, value in parsed_resume.items()
+                        if key != "text"
+                    },
+                    "detailed_scores": detailed_scores,
+                    "ats_score": overall_score,
+                }
+            )
 
-        return {
+        # Job type already detected above
+
+        # Generate recommendations (shared by suggestions/strengths/weaknesses)
+        recommendations_cache: dict[str, Any] = {}
+
+        def recommendations(key: str) -> list[str]:
+            if not recommendations_cache:
+                recommendations_cache.update(
+                    self._generate_recommendations_with_jd(
+                        keyword_analysis,
+                        semantic_analysis,
+                        format_analysis,
+                        content_analysis,
+                        ats_analysis,
+                        jd_requirements,
+                    )
+                )
+            return recommendations_cache[key]
+
+        response_spec = {
             "ats_score": overall_score,
             "match_category": self._get_match_category(overall_score),
             "detected_job_type": detected_job,
@@ -170,20 +416,14 @@ class ATSAnalyzer:
             "keyword_matches": keyword_analysis["matched_keywords"],
             "missing_keywords": keyword_analysis["missing_keywords"],
             "semantic_similarity": semantic_analysis["similarity_score"],
-            "suggestions": recommendations["suggestions"],
-            "strengths": recommendations["strengths"],
-            "weaknesses": recommendations["weaknesses"],
+            "suggestions": lambda: recommendations("suggestions"),
+            "strengths": lambda: recommendations("strengths"),
+            "weaknesses": lambda: recommendations("weaknesses"),
             "formatting_issues": ats_analysis.get("issues", []),
             "ats_friendly": ats_analysis.get("ats_friendly", True),
             "word_count": parsed_resume.get("word_count", 0),
             "job_description": job_description,  # Include the AI-generated job description
-            "detailed_scores": {
-                "keyword_score": round(keyword_analysis["score"], 1),
-                "semantic_score": round(semantic_analysis["score"], 1),
-                "format_score": round(format_analysis["score"], 1),
-                "content_score": round(content_analysis["score"], 1),
-                "ats_score": round(ats_analysis["score"], 1),
-            },
+            "detailed_scores": detailed_scores,
             "requirements_met": jd_requirements,
             # Enhanced analysis results
             "ats_compatibility": {
@@ -225,22 +465,30 @@ class ATSAnalyzer:
                 "all_missing_keywords": keyword_analysis[
                     "missing_keywords"
                 ],  # All missing, not limited
+                # Where each matched keyword occurs: [start, end] character offsets
+                "keyword_positions": keyword_analysis["keyword_positions"],
+                # Corpus IDF weight of each JD keyword in the keyword score
+                "keyword_weights": keyword_analysis["keyword_weights"],
+                # Best resume chunks for each JD requirement (semantic match)
+                "semantic_requirement_matches": semantic_analysis.get(
+                    "requirement_matches", []
+                ),
+                "semantic_coverage": semantic_analysis.get("coverage", {}),
                 # Skills & Technologies specifically identified
-                "skills_found": self._extract_skills(parsed_resume.get("text", "")),
-                "skills_required": self._extract_skills(job_description),
+                "skills_found": lambda: extraction.facet(
+                    "skills", lambda: self._extract_skills(full_text)
+                ),
+                "skills_required": lambda: self._extract_skills(job_description),
                 # COMPREHENSIVE RESUME CATEGORIZATION
-                "categorized_resume": self._categorize_resume(
-                    parsed_resume.get("text", "")
+                "categorized_resume": lambda: self.categorize_resume(
+                    full_text,
+                    layout=parsed_resume.get("formatting_analysis", {}).get("layout"),
                 ),
                 # Text samples for verification
-                "resume_text_sample": (
-                    parsed_resume.get("text", "")[:1000] + "..."
-                    if len(parsed_resume.get("text", "")) > 1000
-                    else parsed_resume.get("text", "")
+                "resume_text_sample": lambda: (
+                    full_text[:1000] + "..." if len(full_text) > 1000 else full_text
                 ),
-                "full_resume_text": parsed_resume.get(
-                    "text", ""
-                ),  # Complete text for advanced analysis
+                "full_resume_text": full_text,  # Complete text for advanced analysis
                 # Statistics
                 "total_resume_keywords": len(
                     keyword_analysis.get("resume_keywords", [])
@@ -257,637 +505,230 @@ class ATSAnalyzer:
                     2,
                 ),
                 # Validation flags
-                "extraction_successful": bool(parsed_resume.get("text", "").strip()),
-                "has_sufficient_content": len(parsed_resume.get("text", "").split())
-                >= 50,
+                "extraction_successful": bool(full_text.strip()),
+                "has_sufficient_content": len(full_text.split()) >= 50,
             },
         }
 
-    def _extract_keywords(self, text: str) -> list[str]:
+        if context is not None:
+            context["full_result"] = build_selected(response_spec, None, evaluate=False)
+        return build_selected(response_spec, fields)
+
+    def reanalyze_resume(
+        self,
+        parsed_resume: dict[str, Any],
+        previous_text: str,
+        context: dict[str, Any],
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         """
-        Enhanced keyword extraction based on industry ATS standards
+        Re-score an edited resume against the JD of an earlier analysis
+
+        Job detection, JD generation and the JD keyword extraction and
+        classification are reused from the earlier analysis; only the
+        resume-side analyses run again, and the semantic match encodes only
+        the chunks whose text changed (the rest come from the embedding cache).
+
+        Args:
+            parsed_resume: Edited resume text with the original file's metadata
+                (its text-derived layout facts are recomputed from the text)
+            previous_text: Resume text of the earlier analysis
+            context: Context filled by analyze_resume_with_job_description()
+                or by an earlier reanalysis (not modified)
+            deadline: Optional request deadline
+
+        Returns:
+            New score and sub-scores, the sub-scores that moved, the changed
+            sections and the keyword results
         """
-        # Industry-standard stop words (expanded)
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "should",
-            "can",
-            "could",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "me",
-            "him",
-            "her",
-            "us",
-            "them",
-            "my",
-            "your",
-            "his",
-            "her",
-            "its",
-            "our",
-            "their",
-            "am",
-            "being",
-            "been",
-            "get",
-            "got",
-            "getting",
-            # Additional generic words that don't add value to ATS scoring
-            "specific",
-            "company",
-            "brief",
-            "include",
-            "tailor",
-            "technologies",
-            "various",
-            "different",
-            "multiple",
-            "several",
-            "many",
-            "some",
-            "any",
-            "all",
-            "every",
-            "each",
-            "both",
-            "either",
-            "neither",
-            "other",
-            "another",
-            "same",
-            "similar",
-            "new",
-            "old",
-            "good",
-            "better",
-            "best",
-            "great",
-            "excellent",
-            "outstanding",
-            "amazing",
-            "wonderful",
-            "fantastic",
-            "important",
-            "significant",
-            "major",
-            "minor",
-            "main",
-            "primary",
-            "secondary",
-            "basic",
-            "advanced",
-            "intermediate",
-            "beginner",
-            "expert",
-            "professional",
-            "personal",
-            "individual",
-            "team",
-            "group",
-            "organization",
-            "business",
-            "work",
-            "job",
-            "position",
-            "role",
-            "career",
-            "field",
-            "industry",
-            "area",
-            "sector",
-            "domain",
-            "subject",
-            "topic",
-            "matter",
-            "issue",
-            "problem",
-            "solution",
-            "approach",
-            "method",
-            "way",
-            "manner",
-            "style",
-            "type",
-            "kind",
-            "sort",
-            "category",
-            "class",
-            "level",
-            "degree",
-            "amount",
-            "number",
-            "quantity",
-            "size",
-            "scale",
-            "scope",
-            "range",
-            "extent",
-            "limit",
-            "boundary",
-            "edge",
-            "side",
-            "part",
-            "section",
-            "portion",
-            "piece",
-            "bit",
-            "element",
-            "component",
-            "feature",
-            "aspect",
-            "characteristic",
-            "property",
-            "attribute",
-            "quality",
-            "nature",
-            "form",
-            "shape",
-            "structure",
-            "pattern",
-            "design",
-            "model",
-            "framework",
-            "system",
-            "process",
-            "procedure",
-            "step",
-            "stage",
-            "phase",
-            "period",
-            "time",
-            "moment",
-            "point",
-            "place",
-            "location",
-            "position",
-            "site",
-            "region",
-            "zone",
-            "space",
-            "room",
-            "environment",
-            "setting",
-            "context",
-            "situation",
-            "condition",
-            "state",
-            "status",
-            "circumstance",
-            "case",
-            "instance",
-            "example",
-            "sample",
-            "specimen",
-            "item",
-            "object",
-            "thing",
-            "stuff",
-            "material",
-            "substance",
-            "content",
-            "information",
-            "data",
-            "details",
-            "facts",
-            "figures",
-            "numbers",
-            "statistics",
-            "results",
-            "outcomes",
-            "consequences",
-            "effects",
-            "impacts",
-            "benefits",
-            "advantages",
-            "disadvantages",
-            "pros",
-            "cons",
-            "strengths",
-            "weaknesses",
-            "opportunities",
-            "threats",
-            "challenges",
-            "risks",
-            "goals",
-            "objectives",
-            "targets",
-            "aims",
-            "purposes",
-            "reasons",
-            "causes",
-            "factors",
-            "elements",
-            "components",
-            "parts",
-            "pieces",
-            "aspects",
-            "features",
-            "characteristics",
-            "properties",
-            "attributes",
-            "qualities",
-            "traits",
-            "skills",
-            "abilities",
-            "capabilities",
-            "competencies",
-            "knowledge",
-            "experience",
-            "background",
-            "history",
-            "record",
-            "track",
-            "performance",
-            "achievement",
-            "success",
-            "accomplishment",
-            "result",
-            "outcome",
-            "impact",
-            "contribution",
-            "value",
-            "worth",
-            "benefit",
-            "advantage",
-            "strength",
-            "asset",
-            "resource",
-            "tool",
-            "instrument",
-            "equipment",
-            "technology",
-            "platform",
-            "software",
-            "application",
-            "program",
-            "project",
-            "initiative",
-            "effort",
-            "endeavor",
-            "venture",
-            "enterprise",
-            "operation",
-            "activity",
-            "task",
-            "duty",
-            "responsibility",
-            "function",
-            "profession",
-            "occupation",
-            "specialty",
-            "expertise",
-            "focus",
-            "concentration",
-            "emphasis",
-            "priority",
-            "importance",
-            "significance",
-            "relevance",
-            "applicability",
-            "usefulness",
-            "utility",
-            "effectiveness",
-            "efficiency",
-            "productivity",
-            "standard",
-            "magnitude",
-            "intensity",
-            "power",
-            "force",
-            "energy",
-            "capacity",
-            "potential",
-            "talent",
-            "gift",
-            "merit",
-            "virtue",
-            "excellence",
-            "superiority",
-            "distinction",
-            "uniqueness",
-            "originality",
-            "creativity",
-            "innovation",
-            "invention",
-            "discovery",
-            "breakthrough",
-            "advancement",
-            "progress",
-            "development",
-            "growth",
-            "improvement",
-            "enhancement",
-            "upgrade",
-            "refinement",
-            "optimization",
-            "maximization",
-            "minimization",
-            "reduction",
-            "increase",
-            "decrease",
-            "change",
-            "modification",
-            "adjustment",
-            "adaptation",
-            "transformation",
-            "evolution",
-            "revolution",
-            "modernization",
-            "updating",
-            "upgrading",
-            "enhancing",
-            "improving",
-            "developing",
-            "growing",
-            "expanding",
-            "extending",
-            "broadening",
-            "deepening",
-            "strengthening",
-            "reinforcing",
-            "supporting",
-            "maintaining",
-            "sustaining",
-            "preserving",
-            "protecting",
-            "securing",
-            "ensuring",
-            "guaranteeing",
-            "promising",
-            "committing",
-            "dedicating",
-            "devoting",
-            "focusing",
-            "concentrating",
-            "specializing",
-            "expertising",
-            "mastering",
-            "learning",
-            "studying",
-            "researching",
-            "investigating",
-            "exploring",
-            "discovering",
-            "finding",
-            "identifying",
-            "recognizing",
-            "understanding",
-            "comprehending",
-            "grasping",
-            "appreciating",
-            "valuing",
-            "respecting",
-            "honoring",
-            "celebrating",
-            "acknowledging",
-            "accepting",
-            "embracing",
-            "welcoming",
-            "receiving",
-            "obtaining",
-            "acquiring",
-            "gaining",
-            "earning",
-            "achieving",
-            "accomplishing",
-            "completing",
-            "finishing",
-            "concluding",
-            "ending",
-            "stopping",
-            "starting",
-            "beginning",
-            "initiating",
-            "launching",
-            "introducing",
-            "presenting",
-            "offering",
-            "providing",
-            "delivering",
-            "supplying",
-            "furnishing",
-            "equipping",
-            "preparing",
-            "organizing",
-            "arranging",
-            "structuring",
-            "designing",
-            "planning",
-            "strategizing",
-            "thinking",
-            "considering",
-            "evaluating",
-            "assessing",
-            "analyzing",
-            "examining",
-            "reviewing",
-            "checking",
-            "verifying",
-            "confirming",
-            "validating",
-            "testing",
-            "trying",
-            "attempting",
-            "experimenting",
-            "practicing",
-            "training",
-            "coaching",
-            "mentoring",
-            "teaching",
-            "instructing",
-            "guiding",
-            "leading",
-            "managing",
-            "supervising",
-            "overseeing",
-            "controlling",
-            "directing",
-            "commanding",
-            "governing",
-            "ruling",
-            "regulating",
-            "monitoring",
-            "tracking",
-            "following",
-            "pursuing",
-            "chasing",
-            "seeking",
-            "searching",
-            "looking",
-            "uncovering",
-            "revealing",
-            "exposing",
-            "showing",
-            "displaying",
-            "demonstrating",
-            "proving",
-            "establishing",
-            "authenticating",
-            "certifying",
-            "accrediting",
-            "approving",
-            "endorsing",
-            "recommending",
-            "suggesting",
-            "proposing",
-            "submitting",
-            "furnishing",
-            "equipping",
-            "preparing",
-            "organizing",
-            "arranging",
-            "structuring",
-            "designing",
-            "planning",
-            "strategizing",
-            "thinking",
-            "considering",
-            "evaluating",
-            "assessing",
-            "analyzing",
-            "examining",
-            "reviewing",
-            "checking",
-            "verifying",
-            "confirming",
-            "validating",
-            "testing",
-            "trying",
-            "attempting",
-            "experimenting",
-            "practicing",
-            "training",
-            "coaching",
-            "mentoring",
-            "teaching",
-            "instructing",
-            "guiding",
-            "leading",
-            "managing",
-            "supervising",
-            "overseeing",
-            "controlling",
-            "directing",
-            "commanding",
-            "governing",
-            "ruling",
-            "regulating",
-            "monitoring",
-            "tracking",
-            "following",
-            "pursuing",
-            "chasing",
-            "seeking",
-            "searching",
-            "looking",
-            "finding",
-            "discovering",
+        parsed_resume = _without_text_layout(parsed_resume)
+        full_text = parsed_resume.get("text", "")
+        resume_text = full_text.lower()
+        sections = diff_sections(previous_text, full_text)
+
+        analysis_jd = context["analysis_jd"]
+        keyword_analysis = self._analyze_keywords_vs_jd(
+            resume_text,
+            context["jd_keywords"],
+            analysis_jd.lower(),
+            include_resume_keywords=False,
+            deadline=deadline,
+            technical_keywords=set(context["technical_keywords"]),
+        )
+        semantic_analysis = self._analyze_semantic_match(
+            full_text, analysis_jd, deadline
+        )
+        format_analysis = self._analyze_format(parsed_resume)
+        content_analysis = self._analyze_content(
+            resume_text, parsed_resume.get("word_count", 0)
+        )
+        ats_analysis = self._analyze_ats_compatibility(parsed_resume)
+
+        overall_score = self._calculate_overall_score(
+            keyword_analysis,
+            semantic_analysis,
+            format_analysis,
+            content_analysis,
+            ats_analysis,
+        )
+        detailed_scores = self._detailed_scores(
+            keyword_analysis,
+            semantic_analysis,
+            format_analysis,
+            content_analysis,
+            ats_analysis,
+        )
+
+        previous_scores = {
+            **context["detailed_scores"],
+            "overall": context["ats_score"],
+        }
+        current_scores = {**detailed_scores, "overall": overall_score}
+        score_changes = {
+            name: {
+                "before": previous_scores.get(name),
+                "after": score,
+                "delta": round(score - previous_scores.get(name, 0), 1),
+            }
+            for name, score in current_scores.items()
+            if score != previous_scores.get(name)
+        }
+        return {
+            "ats_score": overall_score,
+            "previous_ats_score": previous_scores["overall"],
+            "match_category": self._get_match_category(overall_score),
+            "detailed_scores": detailed_scores,
+            "score_changes": score_changes,
+            "changed_sections": sections["changed"],
+            "removed_sections": sections["removed"],
+            "detected_job_type": context["detected_job_type"],
+            "job_detection_confidence": round(context["job_detection_confidence"], 2),
+            "keyword_matches": keyword_analysis["matched_keywords"],
+            "missing_keywords": keyword_analysis["missing_keywords"],
+            "semantic_similarity": semantic_analysis["similarity_score"],
+            "formatting_issues": ats_analysis.get("issues", []),
+            "ats_friendly": ats_analysis.get("ats_friendly", True),
+            "word_count": parsed_resume.get("word_count", 0),
+            "requirements_met": context["jd_requirements"],
+            "extraction_details": {
+                "all_matched_keywords": keyword_analysis["matched_keywords"],
+                "all_missing_keywords": keyword_analysis["missing_keywords"],
+                "keyword_positions": keyword_analysis["keyword_positions"],
+                "keyword_weights": keyword_analysis["keyword_weights"],
+                "semantic_requirement_matches": semantic_analysis.get(
+                    "requirement_matches", []
+                ),
+                "semantic_coverage": semantic_analysis.get("coverage", {}),
+                "full_resume_text": full_text,
+            },
         }
 
-        # Extract words and phrases with better patterns
-        words = re.findall(r"\b[a-z]+\b", text)
-
-        # Filter and count with minimum length of 3
-        filtered_words = [w for w in words if w not in stop_words and len(w) >= 3]
-        word_freq = Counter(filtered_words)
-
-        # Get keywords with frequency-based scoring
-        keywords = []
-
-        # High-frequency keywords (appearing 2+ times)
-        high_freq = [word for word, freq in word_freq.most_common(50) if freq >= 2]
-        keywords.extend(high_freq)
-
-        # Industry-specific patterns with higher priority
-        industry_patterns = [
-            # Technical skills
-            r"\b(?:javascript|python|java|c\+\+|c#|ruby|php|swift|kotlin|go|rust|typescript|react|angular|vue|node|django|flask|spring|sql|mongodb|postgresql|mysql|redis|aws|azure|gcp|docker|kubernetes|jenkins|git|github|gitlab|jira|confluence|agile|scrum|devops|ci/cd|microservices|api|rest|graphql|machine learning|ai|data science|tensorflow|pytorch|pandas|numpy|scikit-learn)\b",
-            # Experience patterns
-            r"\b\d+\+?\s*years?\s*(?:of\s*)?(?:experience|exp)\b",
-            r"\b(?:entry|junior|mid|senior|lead|principal|architect|manager|director|vp|cto)\s*level\b",
-            # Education patterns
-            r"\b(?:bachelor|master|phd|doctorate|b\.?e\.?|b\.?tech|m\.?e\.?|m\.?tech|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|mba|diploma|certification|certified)\b",
-            # Soft skills
-            r"\b(?:leadership|communication|teamwork|problem solving|analytical|collaboration|time management|critical thinking|adaptability|creativity|attention to detail|multitasking|decision making|conflict resolution|negotiation|presentation|interpersonal|organizational|self-motivated|flexible|reliable)\b",
-            # Business terms
-            r"\b(?:project management|strategic planning|business analysis|stakeholder management|budgeting|forecasting|business development|operations management|process improvement|change management|vendor management|contract negotiation|pmp|six sigma|lean|prince2|scrum master|product management)\b",
-        ]
+    def rank_resume_against_job_descriptions(
+        self,
+        parsed_resume: dict[str, Any],
+        job_descriptions: list[dict[str, str]],
+        deadline: Deadline | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Score one resume against several job descriptions and rank them
 
-        for pattern in industry_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            keywords.extend([m.lower() for m in matches])
-
-        # Remove duplicates and return top keywords
-        unique_keywords = list(set(keywords))
-
-        # Prioritize by industry relevance and frequency
-        prioritized_keywords = []
-
-        # Add high-priority technical terms first
-        tech_priority = [
-            "python",
-            "javascript",
-            "java",
-            "react",
-            "aws",
-            "docker",
-            "kubernetes",
-            "sql",
-            "git",
-            "agile",
-        ]
-        for tech in tech_priority:
-            if tech in unique_keywords:
-                prioritized_keywords.append(tech)
+        Resume-only work (format/content/ATS checks, the keyword index and the
+        resume chunk embeddings) is done once; each JD only adds its keyword
+        extraction and its rows of one shared similarity matrix. JD keywords
+        are classified once for all JDs with the rule-based classifier, so
+        ranking makes no per-JD Gemini call and a keyword counts the same in
+        every JD.
+
+        Args:
+            parsed_resume: Parsed resume data from file_parser
+            job_descriptions: [{"id", "title", "description"}, ...]
+            deadline: Optional request deadline (AI stages degrade to local)
+
+        Returns:
+            Per-JD results sorted by ats_score (best first)
+        """
+        full_text = parsed_resume.get("text", "")
+        resume_text = full_text.lower()
+
+        # Shared resume analyses
+        resume_index = DocumentIndex(resume_text)
+        format_analysis = self._analyze_format(parsed_resume)
+        content_analysis = self._analyze_content(
+            resume_text, parsed_resume.get("word_count", 0)
+        )
+        ats_analysis = self._analyze_ats_compatibility(parsed_resume)
+        semantic_analyses = self._analyze_semantic_matches(
+            full_text, [jd["description"] for jd in job_descriptions], deadline
+        )
+
+        jd_texts = [jd["description"].lower() for jd in job_descriptions]
+        jd_keywords = [self._extract_keywords(jd_text) for jd_text in jd_texts]
+        technical_keywords = self._rule_based_technical_classification(
+            list({kw for keywords in jd_keywords for kw in keywords})
+        )
 
-        # Add remaining keywords
-        for keyword in unique_keywords:
-            if keyword not in prioritized_keywords:
-                prioritized_keywords.append(keyword)
+        rankings = []
+        for jd, jd_text, keywords, semantic_analysis in zip(
+            job_descriptions, jd_texts, jd_keywords, semantic_analyses, strict=True
+        ):
+            self._learn_term_weights(jd_text)
+
+            keyword_analysis = self._analyze_keywords_vs_jd(
+                resume_text,
+                keywords,
+                jd_text,
+                include_resume_keywords=False,
+                resume_index=resume_index,
+                deadline=deadline,
+                technical_keywords=technical_keywords,
+            )
+            overall_score = self._calculate_overall_score(
+                keyword_analysis,
+                semantic_analysis,
+                format_analysis,
+                content_analysis,
+                ats_analysis,
+            )
 
-        return prioritized_keywords[:60]  # Increased limit for better coverage
+            rankings.append(
+                {
+                    "id": jd.get("id"),
+                    "title": jd.get("title"),
+                    "ats_score": overall_score,
+                    "match_category": self._get_match_category(overall_score),
+                    "detailed_scores": self._detailed_scores(
+                        keyword_analysis,
+                        semantic_analysis,
+                        format_analysis,
+                        content_analysis,
+                        ats_analysis,
+                    ),
+                    "semantic_similarity": semantic_analysis["similarity_score"],
+                    "keyword_matches": keyword_analysis["matched_keywords"],
+                    "missing_keywords": keyword_analysis["missing_keywords"],
+                    "requirements_met": self._extract_requirements(jd_text),
+                }
+            )
+
+        rankings.sort(key=lambda r: r["ats_score"], reverse=True)
+        for rank, result in enumerate(rankings, start=1):
+            result["rank"] = rank
+        return rankings
+
+    def _extract_keywords(self, text: str) -> list[str]:
+        """
+        Enhanced keyword extraction based on industry ATS standards
+        (vocabularies and patterns are precompiled in keyword_engine,
+        candidates are ranked by corpus BM25 weights once the table has data)
+        """
+        return keyword_engine.extract(text, get_term_weights())
+
+    def _learn_term_weights(self, jd_text: str) -> None:
+        """Add a newly seen job description to the term weight corpus"""
+        if not is_learning_enabled():
+            return
+        terms, length = keyword_engine.document_terms(jd_text)
+        get_term_weights().add_document(jd_text, terms, length)
 
     def _extract_requirements(self, jd_text: str) -> dict[str, list[str]]:
         """
@@ -923,669 +764,34 @@ class ATSAnalyzer:
         return requirements
 
     def _analyze_keywords_vs_jd(
-        self, resume_text: str, jd_keywords: list[str], jd_text: str = ""
+        self,
+        resume_text: str,
+        jd_keywords: list[str],
+        jd_text: str = "",
+        *,
+        include_resume_keywords: bool = True,
+        resume_index: DocumentIndex | None = None,
+        deadline: Deadline | None = None,
+        technical_keywords: set[str] | None = None,
     ) -> dict[str, Any]:
         """
         Analyze keyword matching between resume and JD with improved filtering
+        (pass resume_index to reuse one index across several JDs, and
+        technical_keywords to reuse an earlier classification of the JD)
         """
-        # Extract keywords from resume for comparison - use AI if available
-        resume_keywords = self._extract_keywords_with_ai(resume_text)
-
-        # Filter out generic/non-meaningful keywords (including placeholder text keywords)
-        generic_keywords = {
-            "specific",
-            "company",
-            "brief",
-            "include",
-            "tailor",
-            "technologies",
-            "various",
-            "different",
-            "multiple",
-            "several",
-            "many",
-            "some",
-            "any",
-            "all",
-            "every",
-            "each",
-            "both",
-            "either",
-            "neither",
-            "other",
-            "another",
-            "same",
-            "similar",
-            "different",
-            "new",
-            "old",
-            "good",
-            "better",
-            "best",
-            "great",
-            "excellent",
-            "outstanding",
-            "amazing",
-            "wonderful",
-            "fantastic",
-            "strong",
-            "reliable",
-            "dedicated",
-            "passionate",
-            "motivated",
-            "committed",
-            "hardworking",
-            "diligent",
-            "thorough",
-            "careful",
-            "attentive",
-            "focused",
-            # Placeholder text keywords
-            "insert",
-            "engaging",
-            "paragraph",
-            "mission",
-            "culture",
-            "concise",
-            "seeking",
-            "motivated",
-            "experienced",
-            "growing",
-            "team",
-            "responsible",
-            "designing",
-            "implementing",
-            "managing",
-            "infrastructure",
-            "services",
-            "closely",
-            "development",
-            "operations",
-            "security",
-            "teams",
-            "ensure",
-            "solutions",
-            "scalable",
-            "secure",
-            "reliable",
-            "cost-effective",
-            "play",
-            "critical",
-            "role",
-            "defining",
-            "strategy",
-            "driving",
-            "innovation",
-            "overview",
-            "benefits",
-            "package",
-            "standard",
-            "equal",
-            "opportunity",
-            "employer",
-            "statement",
-            "communication",
-            "proficiency",
-            "native",
-            "deep",
-            "understanding",
-            "platforms",
-            "designing",
-            "microservices",
-            "expertise",
-            "section",
-            "architectures",
-            "functions",
-            "serverless",
-            "business",
-            "determined",
-            "persistent",
-            "resilient",
-            "adaptable",
-            "flexible",
-            "versatile",
-            "creative",
-            "innovative",
-            "proactive",
-            "self-motivated",
-            "independent",
-            "collaborative",
-            "team-oriented",
-            "people-oriented",
-            "customer-focused",
-            "results-driven",
-            "goal-oriented",
-            "detail-oriented",
-            "quality-focused",
-            "experienced",
-            "skilled",
-            "proficient",
-            "knowledgeable",
-            "capable",
-            "competent",
-            "qualified",
-            "trained",
-            "educated",
-            "certified",
-            "licensed",
-            "accredited",
-            "approved",
-            "validated",
-            "verified",
-            "tested",
-            "proven",
-            "established",
-            "recognized",
-            "accepted",
-            "standard",
-            "common",
-            "typical",
-            "usual",
-            "normal",
-            "regular",
-            "routine",
-            "standard",
-            "conventional",
-            "important",
-            "significant",
-            "major",
-            "minor",
-            "main",
-            "primary",
-            "secondary",
-            "basic",
-            "advanced",
-            "intermediate",
-            "beginner",
-            "expert",
-            "professional",
-            "personal",
-            "individual",
-            "team",
-            "group",
-            "organization",
-            "business",
-            "work",
-            "job",
-            "position",
-            "role",
-            "career",
-            "field",
-            "industry",
-            "area",
-            "sector",
-            "domain",
-            "subject",
-            "topic",
-            "matter",
-            "issue",
-            "problem",
-            "solution",
-            "approach",
-            "method",
-            "way",
-            "manner",
-            "style",
-            "type",
-            "kind",
-            "sort",
-            "category",
-            "class",
-            "level",
-            "degree",
-            "amount",
-            "number",
-            "quantity",
-            "size",
-            "scale",
-            "scope",
-            "range",
-            "extent",
-            "limit",
-            "boundary",
-            "edge",
-            "side",
-            "part",
-            "section",
-            "portion",
-            "piece",
-            "bit",
-            "element",
-            "component",
-            "feature",
-            "aspect",
-            "characteristic",
-            "property",
-            "attribute",
-            "quality",
-            "nature",
-            "form",
-            "shape",
-            "structure",
-            "pattern",
-            "design",
-            "model",
-            "framework",
-            "system",
-            "process",
-            "procedure",
-            "step",
-            "stage",
-            "phase",
-            "period",
-            "time",
-            "moment",
-            "point",
-            "place",
-            "location",
-            "position",
-            "site",
-            "area",
-            "region",
-            "zone",
-            "space",
-            "room",
-            "environment",
-            "setting",
-            "context",
-            "situation",
-            "condition",
-            "state",
-            "status",
-            "situation",
-            "circumstance",
-            "case",
-            "instance",
-            "example",
-            "sample",
-            "specimen",
-            "item",
-            "object",
-            "thing",
-            "stuff",
-            "material",
-            "substance",
-            "content",
-            "information",
-            "data",
-            "details",
-            "facts",
-            "figures",
-            "numbers",
-            "statistics",
-            "results",
-            "outcomes",
-            "consequences",
-            "effects",
-            "impacts",
-            "benefits",
-            "advantages",
-            "disadvantages",
-            "pros",
-            "cons",
-            "strengths",
-            "weaknesses",
-            "opportunities",
-            "threats",
-            "challenges",
-            "risks",
-            "goals",
-            "objectives",
-            "targets",
-            "aims",
-            "purposes",
-            "reasons",
-            "causes",
-            "factors",
-            "elements",
-            "components",
-            "parts",
-            "pieces",
-            "aspects",
-            "features",
-            "characteristics",
-            "properties",
-            "attributes",
-            "qualities",
-            "traits",
-            "skills",
-            "abilities",
-            "capabilities",
-            "competencies",
-            "knowledge",
-            "experience",
-            "background",
-            "history",
-            "record",
-            "track",
-            "performance",
-            "achievement",
-            "success",
-            "accomplishment",
-            "result",
-            "outcome",
-            "impact",
-            "contribution",
-            "value",
-            "worth",
-            "benefit",
-            "advantage",
-            "strength",
-            "asset",
-            "resource",
-            "tool",
-            "instrument",
-            "equipment",
-            "technology",
-            "system",
-            "platform",
-            "software",
-            "application",
-            "program",
-            "project",
-            "initiative",
-            "effort",
-            "endeavor",
-            "venture",
-            "enterprise",
-            "operation",
-            "activity",
-            "task",
-            "duty",
-            "responsibility",
-            "function",
-            "role",
-            "position",
-            "job",
-            "career",
-            "profession",
-            "occupation",
-            "field",
-            "industry",
-            "sector",
-            "domain",
-            "area",
-            "specialty",
-            "expertise",
-            "focus",
-            "concentration",
-            "emphasis",
-            "priority",
-            "importance",
-            "significance",
-            "relevance",
-            "applicability",
-            "usefulness",
-            "utility",
-            "effectiveness",
-            "efficiency",
-            "productivity",
-            "performance",
-            "quality",
-            "standard",
-            "level",
-            "degree",
-            "extent",
-            "scope",
-            "scale",
-            "size",
-            "magnitude",
-            "intensity",
-            "strength",
-            "power",
-            "force",
-            "energy",
-            "capacity",
-            "potential",
-            "ability",
-            "capability",
-            "competency",
-            "skill",
-            "talent",
-            "gift",
-            "strength",
-            "advantage",
-            "benefit",
-            "value",
-            "worth",
-            "merit",
-            "virtue",
-            "excellence",
-            "superiority",
-            "distinction",
-            "uniqueness",
-            "originality",
-            "creativity",
-            "innovation",
-            "invention",
-            "discovery",
-            "breakthrough",
-            "advancement",
-            "progress",
-            "development",
-            "growth",
-            "improvement",
-            "enhancement",
-            "upgrade",
-            "refinement",
-            "optimization",
-            "maximization",
-            "minimization",
-            "reduction",
-            "increase",
-            "decrease",
-            "change",
-            "modification",
-            "adjustment",
-            "adaptation",
-            "transformation",
-            "evolution",
-            "revolution",
-            "innovation",
-            "modernization",
-            "updating",
-            "upgrading",
-            "enhancing",
-            "improving",
-            "developing",
-            "growing",
-            "expanding",
-            "extending",
-            "broadening",
-            "deepening",
-            "strengthening",
-            "reinforcing",
-            "supporting",
-            "maintaining",
-            "sustaining",
-            "preserving",
-            "protecting",
-            "securing",
-            "ensuring",
-            "guaranteeing",
-            "promising",
-            "committing",
-            "dedicating",
-            "devoting",
-            "focusing",
-            "concentrating",
-            "specializing",
-            "expertising",
-            "mastering",
-            "learning",
-            "studying",
-            "researching",
-            "investigating",
-            "exploring",
-            "discovering",
-            "finding",
-            "identifying",
-            "recognizing",
-            "understanding",
-            "comprehending",
-            "grasping",
-            "appreciating",
-            "valuing",
-            "respecting",
-            "honoring",
-            "celebrating",
-            "acknowledging",
-            "accepting",
-            "embracing",
-            "welcoming",
-            "receiving",
-            "obtaining",
-            "acquiring",
-            "gaining",
-            "earning",
-            "achieving",
-            "accomplishing",
-            "completing",
-            "finishing",
-            "concluding",
-            "ending",
-            "stopping",
-            "starting",
-            "beginning",
-            "initiating",
-            "launching",
-            "introducing",
-            "presenting",
-            "offering",
-            "providing",
-            "delivering",
-            "supplying",
-            "furnishing",
-            "equipping",
-            "preparing",
-            "organizing",
-            "arranging",
-            "structuring",
-            "designing",
-            "planning",
-            "strategizing",
-            "thinking",
-            "considering",
-            "evaluating",
-            "assessing",
-            "analyzing",
-            "examining",
-            "reviewing",
-            "checking",
-            "verifying",
-            "confirming",
-            "validating",
-            "testing",
-            "trying",
-            "attempting",
-            "experimenting",
-            "practicing",
-            "training",
-            "coaching",
-            "mentoring",
-            "teaching",
-            "instructing",
-            "guiding",
-            "leading",
-            "managing",
-            "supervising",
-            "overseeing",
-            "controlling",
-            "directing",
-            "commanding",
-            "governing",
-            "ruling",
-            "regulating",
-            "monitoring",
-            "tracking",
-            "following",
-            "pursuing",
-            "chasing",
-            "seeking",
-            "searching",
-            "looking",
-            "finding",
-            "discovering",
-            "uncovering",
-            "revealing",
-            "exposing",
-            "showing",
-            "displaying",
-            "demonstrating",
-            "proving",
-            "establishing",
-            "confirming",
-            "verifying",
-            "validating",
-            "authenticating",
-            "certifying",
-            "accrediting",
-            "approving",
-            "endorsing",
-            "recommending",
-            "suggesting",
-            "proposing",
-            "offering",
-            "presenting",
-            "submitting",
-            "delivering",
-            "providing",
-            "supplying",
-            "furnishing",
-            "equipping",
-            "preparing",
-            "organizing",
-            "arranging",
-            "structuring",
-            "designing",
-            "planning",
-            "strategizing",
-            "thinking",
-            "considering",
-            "evaluating",
-            "assessing",
-            "analyzing",
-            "examining",
-            "reviewing",
-            "checking",
-            "verifying",
-            "confirming",
-            "validating",
-            "testing",
-            "trying",
-            "attempting",
-            "experimenting",
-            "practicing",
-            "training",
-            "coaching",
-            "mentoring",
-            "teaching",
-            "instructing",
-            "guiding",
-            "leading",
-            "managing",
-            "supervising",
-            "overseeing",
-            "controlling",
-            "directing",
-            "commanding",
-            "governing",
-            "ruling",
-            "regulating",
-            "monitoring",
-            "tracking",
-            "following",
-            "pursuing",
-            "chasing",
-            "seeking",
-            "searching",
-            "looking",
-            "finding",
-            "discovering",
-        }
+        # Extract keywords from resume for reporting - use AI if available
+        # (not used for matching, so skipped when the caller doesn't need it)
+        resume_keywords = (
+            self._extract_keywords_with_ai(resume_text, deadline)
+            if include_resume_keywords
+            else []
+        )
 
         # Use AI to classify keywords as technical vs non-technical
-        technical_keywords = self._classify_technical_keywords(jd_keywords, jd_text)
+        if technical_keywords is None:
+            technical_keywords = self._classify_technical_keywords(
+                jd_keywords, jd_text, deadline
+            )
 
         # Check if job description contains placeholder text
         placeholder_indicators = [
@@ -1616,7 +822,7 @@ class ATSAnalyzer:
                 for kw in jd_keywords
                 if (
                     kw.lower() in technical_keywords
-                    and kw.lower() not in generic_keywords
+                    and kw.lower() not in GENERIC_KEYWORDS
                 )
             ]
 
@@ -1646,18 +852,33 @@ class ATSAnalyzer:
                 }
             ]
 
+        # Index the resume once; lookups are boundary-correct
+        # ("java" does not match inside "javascript") and go through the
+        # taxonomy aliases, since JD keywords are reported under their
+        # canonical names ("react" matches "React.js" and "reactjs")
+        if resume_index is None:
+            resume_index = DocumentIndex(resume_text)
+        keyword_positions = skills_taxonomy.lookup(resume_index, meaningful_jd_keywords)
+
         matched_keywords = []
         missing_keywords = []
 
         for keyword in meaningful_jd_keywords:
-            if keyword.lower() in resume_text.lower():
+            if keyword in keyword_positions:
                 matched_keywords.append(keyword)
             else:
                 missing_keywords.append(keyword)
 
-        # Calculate score based on meaningful keywords only
-        if len(meaningful_jd_keywords) > 0:
-            score = (len(matched_keywords) / len(meaningful_jd_keywords)) * 100
+        # Calculate score based on meaningful keywords only, weighting each
+        # keyword by its corpus IDF (uniform until the corpus is large enough)
+        term_weights = get_term_weights()
+        keyword_weights = {
+            kw: round(term_weights.idf(kw), 3) for kw in meaningful_jd_keywords
+        }
+        total_weight = sum(keyword_weights.values())
+        if total_weight > 0:
+            matched_weight = sum(keyword_weights[kw] for kw in matched_keywords)
+            score = (matched_weight / total_weight) * 100
         else:
             score = 50  # Default if no meaningful keywords extracted
 
@@ -1669,19 +890,26 @@ class ATSAnalyzer:
             ),
             "score": min(score, 100),
             "resume_keywords": resume_keywords,  # All keywords found in resume
+            "keyword_positions": keyword_positions,  # Matched keyword -> resume offsets
+            "keyword_weights": keyword_weights,  # IDF weight used in the score
             "filtered_generic_keywords": [
-                kw for kw in jd_keywords if kw.lower() in generic_keywords
+                kw for kw in jd_keywords if kw.lower() in GENERIC_KEYWORDS
             ],  # Show what was filtered out
             "technical_keywords_used": technical_keywords,  # Show which keywords were classified as technical
         }
 
     def _classify_technical_keywords(
-        self, keywords: list[str], jd_text: str
+        self, keywords: list[str], jd_text: str, deadline: Deadline | None = None
     ) -> set[str]:
         """
         Use AI to classify keywords as technical vs non-technical with enhanced analysis
         """
-        if not is_gemini_available() or not self.model:
+        if (
+            not is_gemini_available()
+            or not self.model
+            or gemini_breaker.is_open
+            or choose_tier(deadline, "keyword_classification") != TIER_FULL
+        ):
             # Fallback to rule-based classification
             return self._rule_based_technical_classification(keywords)
 
@@ -1732,7 +960,11 @@ class ATSAnalyzer:
             """
 
             if self.use_content_generation and self.content_model:
-                response = self.content_model.generate_content(prompt)
+                response = gemini_breaker.call(
+                    self.content_model.generate_content,
+                    prompt,
+                    **gemini_call_options(deadline),
+                )
             else:
                 print(
                     "⚠️  AI keyword classification failed: Content generation model not available, using fallback"
@@ -1782,204 +1014,22 @@ class ATSAnalyzer:
     def _rule_based_technical_classification(self, keywords: list[str]) -> set[str]:
         """
         Rule-based fallback for technical keyword classification
+        (technical skills, aliases and terms come from the skills taxonomy)
         """
-        technical_terms = {
-            # Programming Languages
-            "python",
-            "java",
-            "javascript",
-            "typescript",
-            "c++",
-            "c#",
-            "go",
-            "rust",
-            "php",
-            "ruby",
-            "swift",
-            "kotlin",
-            "scala",
-            "r",
-            "matlab",
-            "perl",
-            "bash",
-            "powershell",
-            "sql",
-            "html",
-            "css",
-            "sass",
-            "less",
-            # Frameworks & Libraries
-            "react",
-            "angular",
-            "vue",
-            "node",
-            "express",
-            "django",
-            "flask",
-            "spring",
-            "laravel",
-            "rails",
-            "asp",
-            "net",
-            "jquery",
-            "bootstrap",
-            "tailwind",
-            "material",
-            "ui",
-            "redux",
-            "mobx",
-            "graphql",
-            # Databases
-            "mongodb",
-            "postgresql",
-            "mysql",
-            "oracle",
-            "sqlite",
-            "redis",
-            "elasticsearch",
-            "cassandra",
-            "dynamodb",
-            "firebase",
-            "supabase",
-            "prisma",
-            "sequelize",
-            "mongoose",
-            # Cloud & DevOps
-            "aws",
-            "azure",
-            "gcp",
-            "docker",
-            "kubernetes",
-            "terraform",
-            "ansible",
-            "jenkins",
-            "gitlab",
-            "github",
-            "circleci",
-            "travis",
-            "bamboo",
-            "helm",
-            "prometheus",
-            "grafana",
-            "elk",
-            "splunk",
-            # Data & AI/ML
-            "pandas",
-            "numpy",
-            "scikit",
-            "tensorflow",
-            "pytorch",
-            "keras",
-            "jupyter",
-            "spark",
-            "hadoop",
-            "kafka",
-            "airflow",
-            "dbt",
-            "tableau",
-            "powerbi",
-            "looker",
-            "machine",
-            "learning",
-            "deep",
-            # Mobile & Web
-            "ios",
-            "android",
-            "react",
-            "native",
-            "flutter",
-            "xamarin",
-            "cordova",
-            "ionic",
-            "pwa",
-            "responsive",
-            "design",
-            "ux",
-            "ui",
-            "figma",
-            "sketch",
-            "adobe",
-            "photoshop",
-            # Methodologies & Practices
-            "agile",
-            "scrum",
-            "kanban",
-            "devops",
-            "ci",
-            "cd",
-            "tdd",
-            "bdd",
-            "microservices",
-            "api",
-            "rest",
-            "soap",
-            "oauth",
-            "jwt",
-            "ldap",
-            "saml",
-            "oauth2",
-            # Tools & Platforms
-            "git",
-            "svn",
-            "mercurial",
-            "jira",
-            "confluence",
-            "slack",
-            "teams",
-            "zoom",
-            "figma",
-            "sketch",
-            "postman",
-            "insomnia",
-            "swagger",
-            "openapi",
-            "kubernetes",
-            "openshift",
-            "rancher",
-            # Security
-            "security",
-            "encryption",
-            "ssl",
-            "tls",
-            "oauth",
-            "saml",
-            "ldap",
-            "rbac",
-            "iam",
-            "vault",
-            "penetration",
-            "testing",
-            "vulnerability",
-            "assessment",
-            "compliance",
-            "gdpr",
-            "hipaa",
-            # Architecture & Design
-            "microservices",
-            "monolith",
-            "serverless",
-            "lambda",
-            "functions",
-            "containers",
-            "orchestration",
-            "load",
-            "balancing",
-            "caching",
-            "cdn",
-            "edge",
-            "computing",
-            "distributed",
-            "systems",
-        }
+        return {kw.lower() for kw in keywords if skills_taxonomy.is_technical(kw)}
 
-        # Return keywords that match technical terms
-        return {kw.lower() for kw in keywords if kw.lower() in technical_terms}
-
-    def _extract_keywords_with_ai(self, resume_text: str) -> list[str]:
+    def _extract_keywords_with_ai(
+        self, resume_text: str, deadline: Deadline | None = None
+    ) -> list[str]:
         """
         Extract keywords from resume using AI for better technical term identification
         """
-        if not is_gemini_available() or not self.model:
+        if (
+            not is_gemini_available()
+            or not self.model
+            or gemini_breaker.is_open
+            or choose_tier(deadline, "resume_keywords") != TIER_FULL
+        ):
             # Fallback to regular keyword extraction
             return self._extract_keywords(resume_text)
 
@@ -2017,7 +1067,11 @@ class ATSAnalyzer:
             """
 
             if self.use_content_generation and self.content_model:
-                response = self.content_model.generate_content(prompt)
+                response = gemini_breaker.call(
+                    self.content_model.generate_content,
+                    prompt,
+                    **gemini_call_options(deadline),
+                )
             else:
                 print(
                     "⚠️  AI resume keyword extraction failed: Content generation model not available, using fallback"
@@ -2061,9 +1115,15 @@ class ATSAnalyzer:
             print(f"⚠️  AI resume keyword extraction failed: {e}, using fallback")
             return self._extract_keywords(resume_text)
 
-    def _analyze_semantic_match(self, resume_text: str, jd_text: str) -> dict[str, Any]:
+    def _analyze_semantic_match(
+        self, resume_text: str, jd_text: str, deadline: Deadline | None = None
+    ) -> dict[str, Any]:
         """
         Analyze semantic similarity using embeddings (concept matching)
+
+        Pass original-case text so section headings can be detected. With a
+        deadline, the encode budget is capped by the remaining time (fewer
+        chunks) and the match is skipped when almost nothing is left.
         """
         # Check if embeddings model is available
         if not self.model or not self.use_embeddings:
@@ -2076,47 +1136,62 @@ class ATSAnalyzer:
                 "method": "fallback_keyword",
             }
 
-        try:
-            # Split into sentences for better matching
-            resume_sentences = [
-                s.strip() for s in resume_text.split(".") if len(s.strip()) > 20
-            ][:10]
-            jd_sentences = [
-                s.strip() for s in jd_text.split(".") if len(s.strip()) > 20
-            ][:10]
-
-            if not resume_sentences or not jd_sentences:
-                return {
-                    "similarity_score": 0,
-                    "score": 50,
-                    "method": "insufficient_text",
-                }
+        if choose_tier(deadline, "semantic_match", LOCAL_STAGE_MIN_MS) != TIER_FULL:
+            return {"similarity_score": 0.5, "score": 50, "method": "skipped_deadline"}
 
-            # Encode sentences
-            resume_embeddings = self.model.encode(
-                resume_sentences, convert_to_tensor=True
+        try:
+            # Whole-document match: section-aware resume chunks vs JD
+            # requirements, one batched encode and one similarity matrix
+            return semantic_matcher.match(
+                self.model,
+                resume_text,
+                jd_text,
+                budget_ms=self._semantic_budget_ms(deadline),
+                timeout_s=deadline.timeout_s() if deadline else None,
             )
-            jd_embeddings = self.model.encode(jd_sentences, convert_to_tensor=True)
-
-            # Calculate cosine similarity
-            similarities = util.cos_sim(resume_embeddings, jd_embeddings)
 
-            # Get max similarity for each resume sentence
-            max_similarities = similarities.max(dim=1)[0]
-            avg_similarity = max_similarities.mean().item()
+        except Exception as e:
+            print(f"Error in semantic analysis: {e}")
+            return {"similarity_score": 0, "score": 50, "method": "error"}
 
-            # Convert to score (0-100)
-            score = avg_similarity * 100
+    def _analyze_semantic_matches(
+        self, resume_text: str, jd_texts: list[str], deadline: Deadline | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Semantic match of one resume against several JDs (one batched encode)
+        """
+        if not self.model or not self.use_embeddings:
+            return [
+                {"similarity_score": 0.5, "score": 50, "method": "fallback_keyword"}
+                for _ in jd_texts
+            ]
 
-            return {
-                "similarity_score": round(avg_similarity, 3),
-                "score": round(score, 1),
-                "method": "sentence_transformers",
-            }
+        if choose_tier(deadline, "semantic_match", LOCAL_STAGE_MIN_MS) != TIER_FULL:
+            return [
+                {"similarity_score": 0.5, "score": 50, "method": "skipped_deadline"}
+                for _ in jd_texts
+            ]
 
+        try:
+            return semantic_matcher.match_many(
+                self.model,
+                resume_text,
+                jd_texts,
+                budget_ms=self._semantic_budget_ms(deadline),
+                timeout_s=deadline.timeout_s() if deadline else None,
+            )
         except Exception as e:
             print(f"Error in semantic analysis: {e}")
-            return {"similarity_score": 0, "score": 50, "method": "error"}
+            return [
+                {"similarity_score": 0, "score": 50, "method": "error"}
+                for _ in jd_texts
+            ]
+
+    def _semantic_budget_ms(self, deadline: Deadline | None) -> float | None:
+        """Encode budget of the semantic match, capped by the request deadline"""
+        if deadline is None:
+            return None
+        return deadline.budget_for(semantic_matcher.latency_budget_ms)
 
     def _analyze_format(self, parsed_resume: dict[str, Any]) -> dict[str, Any]:
         """
@@ -2213,7 +1288,9 @@ class ATSAnalyzer:
         github_found = bool(re.search(r"github\.com", text, re.IGNORECASE))
         portfolio_found = bool(
             re.search(
-                r"(https?://)?(?:www\.)?([\w\-]+\.(?:com|dev|io|net|org|in))", text
+                # Not the domain of an email address
+                r"(?<![@\w.\-])(https?://)?(?:www\.)?([\w\-]+\.(?:com|dev|io|net|org|in))\b",
+                text,
             )
         )
 
@@ -2375,6 +1452,17 @@ class ATSAnalyzer:
             "action_verbs_count": verb_count,
         }
 
+    def _count_bullets(self, lines: list[str]) -> dict[str, int]:
+        """Lines starting with each bullet type (text fallback for non-PDFs)"""
+        bullet_patterns = ["•", "●", "◦", "▪", "▸", "→", "-", "*", "✓", "►"]
+        bullet_counts: dict[str, int] = {}
+        for line in lines:
+            line_stripped = line.strip()
+            for bullet in bullet_patterns:
+                if line_stripped.startswith(bullet):
+                    bullet_counts[bullet] = bullet_counts.get(bullet, 0) + 1
+        return bullet_counts
+
     def _analyze_ats_compatibility(
         self, parsed_resume: dict[str, Any]
     ) -> dict[str, Any]:
@@ -2382,6 +1470,8 @@ class ATSAnalyzer:
         Enhanced ATS compatibility analysis based on industry standards
         """
         formatting = parsed_resume.get("formatting_analysis", {})
+        # Geometry-based layout facts of PDFs (None for other formats)
+        layout = formatting.get("layout")
         text = parsed_resume.get("text", "").lower()
         score: float = 100.0  # Start with perfect score
         issues = []
@@ -2406,6 +1496,28 @@ class ATSAnalyzer:
             issues.append("Contains tables. ATS may not parse table content correctly.")
             recommendations.append("Convert table content to simple text format.")
 
+        # 2b. Multi-column layout and contact details in header/footer zones
+        if layout:
+            multi_column_pages = layout["columns"]["multi_column_pages"]
+            if multi_column_pages:
+                score -= 10
+                issues.append(
+                    f"Multi-column layout on {len(multi_column_pages)} page(s). "
+                    "ATS may read the columns out of order."
+                )
+                recommendations.append("Use a single-column layout.")
+            if (
+                layout["header_zone"]["has_contact"]
+                or layout["footer_zone"]["has_contact"]
+            ):
+                warnings.append(
+                    "Contact details sit in the page header or footer, which some "
+                    "ATS skip."
+                )
+                recommendations.append(
+                    "Place contact information in the body at the top of the page."
+                )
+
         # 3. Font compatibility
         fonts_count = formatting.get("fonts_count", 1)
         if fonts_count > self.ats_standards["max_fonts"]:
@@ -2450,14 +1562,10 @@ class ATSAnalyzer:
             )
 
         # 7. Bullet point consistency
-        bullet_patterns = ["•", "●", "◦", "▪", "▸", "→", "-", "*", "✓", "►"]
-        bullet_counts: dict[str, int] = {}
-        lines = text.split("\n")
-        for line in lines:
-            line_stripped = line.strip()
-            for bullet in bullet_patterns:
-                if line_stripped.startswith(bullet):
-                    bullet_counts[bullet] = bullet_counts.get(bullet, 0) + 1
+        if layout and "bullets" in layout:
+            bullet_counts = layout["bullets"]["counts"]
+        else:
+            bullet_counts = self._count_bullets(text.split("\n"))
 
         if len(bullet_counts) > 2:
             score -= 10
@@ -2467,9 +1575,14 @@ class ATSAnalyzer:
             recommendations.append("Use consistent bullet points (• or -) throughout.")
 
         # 8. Text formatting issues
-        # Check for excessive caps
-        caps_words = [word for word in text.split() if word.isupper() and len(word) > 1]
-        if len(caps_words) > len(text.split()) * 0.15:  # More than 15% all caps
+        # Check for excessive caps, on original-case words in both paths
+        if layout and "capitalization" in layout:
+            caps_excessive = layout["capitalization"]["caps_ratio"] > 0.15
+        else:
+            words = parsed_resume.get("text", "").split()
+            caps_count = sum(1 for word in words if word.isupper() and len(word) > 1)
+            caps_excessive = caps_count > len(words) * 0.15  # More than 15% all caps
+        if caps_excessive:
             score -= 10
             warnings.append(
                 "Excessive use of ALL CAPS. Use title case for better readability."
@@ -2556,6 +1669,23 @@ class ATSAnalyzer:
         else:
             return "F (Very Poor)"
 
+    def _detailed_scores(
+        self,
+        keyword_analysis: dict,
+        semantic_analysis: dict,
+        format_analysis: dict,
+        content_analysis: dict,
+        ats_analysis: dict,
+    ) -> dict[str, float]:
+        """Rounded sub-scores as reported in detailed_scores"""
+        return {
+            "keyword_score": round(keyword_analysis["score"], 1),
+            "semantic_score": round(semantic_analysis["score"], 1),
+            "format_score": round(format_analysis["score"], 1),
+            "content_score": round(content_analysis["score"], 1),
+            "ats_score": round(ats_analysis["score"], 1),
+        }
+
     def _calculate_overall_score(
         self,
         keyword_analysis: dict,
@@ -2678,10 +1808,27 @@ class ATSAnalyzer:
             "weaknesses": weaknesses if weaknesses else ["Good overall structure"],
         }
 
-    def _categorize_resume(self, text: str) -> dict[str, Any]:
+    def categorize_resume(
+        self, text: str, layout: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Section categorization of a resume (cached in its extraction artifact
+        per layout, since the formatting analysis reads the PDF layout)
+        """
+        return resume_extractions.get(text).facet(
+            categorized_facet(layout), lambda: self._categorize_resume(text, layout)
+        )
+
+    def _categorize_resume(
+        self, text: str, layout: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """
         Comprehensive categorization of ALL resume sections
         Extracts: contact info, education, work experience, skills, hobbies, etc.
+
+        Args:
+            text: Resume text
+            layout: formatting_analysis["layout"] of a PDF, if available
         """
         text_lower = text.lower()
         lines = text.split("\n")
@@ -2695,15 +1842,20 @@ class ATSAnalyzer:
             "languages": self._extract_languages(text),
             "achievements": self._extract_achievements(text),
             "summary_profile": self._extract_summary(text),
-            "formatting_analysis": self._analyze_formatting(text, lines),
+            "formatting_analysis": self._analyze_formatting(text, lines, layout),
         }
 
         return categorized
 
-    def _analyze_formatting(self, text: str, lines: list[str]) -> dict[str, Any]:
+    def _analyze_formatting(
+        self, text: str, lines: list[str], layout: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """
         Detailed formatting analysis for ATS compatibility
         Checks: bullets, spacing, consistency, structure, etc.
+
+        Bullets and capitalization come from the PDF layout analysis when
+        given, otherwise they are derived from the text.
         """
         analysis: dict[str, Any] = {
             "images_count": 0,  # Add image detection
@@ -2747,17 +1899,15 @@ class ATSAnalyzer:
         }
 
         # Detect bullet points
-        bullet_patterns = ["•", "●", "◦", "▪", "▸", "→", "-", "*", "✓", "►"]
-        bullet_counts: dict[str, int] = {}
-
-        for line in lines:
-            line_stripped = line.strip()
-            for bullet in bullet_patterns:
-                if line_stripped.startswith(bullet):
-                    bullet_counts[bullet] = bullet_counts.get(bullet, 0) + 1
-                    analysis["bullet_points"]["detected"] = True
+        if layout:
+            analysis["structure"]["columns"] = layout["columns"]["count"]
+        if layout and "bullets" in layout:
+            bullet_counts = layout["bullets"]["counts"]
+        else:
+            bullet_counts = self._count_bullets(lines)
 
         if bullet_counts:
+            analysis["bullet_points"]["detected"] = True
             analysis["bullet_points"]["count"] = sum(bullet_counts.values())
             analysis["bullet_points"]["types_used"] = list(bullet_counts.keys())
 
@@ -2830,8 +1980,13 @@ class ATSAnalyzer:
                     analysis["structure"]["has_clear_sections"] = True
 
         # Check for excessive caps
-        caps_words = [word for word in text.split() if word.isupper() and len(word) > 1]
-        if len(caps_words) > len(text.split()) * 0.1:  # More than 10% all caps
+        if layout and "capitalization" in layout:
+            caps_ratio = layout["capitalization"]["caps_ratio"]
+        else:
+            words = text.split()
+            caps_count = sum(1 for word in words if word.isupper() and len(word) > 1)
+            caps_ratio = caps_count / len(words) if words else 0.0
+        if caps_ratio > 0.1:  # More than 10% all caps
             analysis["text_formatting"]["all_caps_excessive"] = True
             analysis["ats_compatibility"]["warnings"].append(
                 "Excessive use of ALL CAPS. Use title case for better ATS readability."
@@ -3008,7 +2163,8 @@ class ATSAnalyzer:
 
         # Extract portfolio/website
         portfolio_patterns = [
-            r"(https?://)?(?:www\.)?([\w\-]+\.(?:com|dev|io|net|org|in))",
+            # Not the domain of an email address
+            r"(?<![@\w.\-])(https?://)?(?:www\.)?([\w\-]+\.(?:com|dev|io|net|org|in))\b",
             r"portfolio\s*:?\s*([\w\-]+\.[\w\-]+)",
         ]
         for pattern in portfolio_patterns:
@@ -3106,10 +2262,8 @@ class ATSAnalyzer:
 
             if in_education and line_stripped:
                 # Extract degree
-                degree_match = re.search(
-                    r"(bachelor|master|phd|doctorate|b\.?e\.?|b\.?tech|m\.?e\.?|m\.?tech|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|mba|diploma)",
-                    line_lower,
-                )
+                # Whole-word degree names ("ma" inside "massachusetts" is not one)
+                degree_match = DEGREE_PATTERN.search(line_lower)
                 if degree_match:
                     # If we already have a current education entry, save it first
                     if current_edu and current_edu.get("degree_full"):
@@ -3715,399 +2869,17 @@ class ATSAnalyzer:
         """
         UNIVERSAL skill extraction for ANY profession
         Tech, Non-Tech, Creative, Medical, Education, Business, etc.
+        (categories, skills and aliases come from the skills taxonomy)
         """
-        text_lower = text.lower()
-
-        skills: dict[str, list[str]] = {
-            # Technical Skills (IT/Software)
-            "technical_programming": [],
-            "technical_tools": [],
-            # Business & Management
-            "business_management": [],
-            "financial_accounting": [],
-            # Creative & Design
-            "creative_design": [],
-            "media_content": [],
-            # Medical & Healthcare
-            "medical_clinical": [],
-            "healthcare_admin": [],
-            # Education & Training
-            "teaching_training": [],
-            "academic_research": [],
-            # Sales & Marketing
-            "sales_marketing": [],
-            "customer_service": [],
-            # Manufacturing & Operations
-            "manufacturing_operations": [],
-            "quality_control": [],
-            # Hospitality & Tourism
-            "hospitality_food": [],
-            "travel_tourism": [],
-            # Legal & Compliance
-            "legal_regulatory": [],
-            # HR & Recruitment
-            "hr_recruitment": [],
-            # Fashion & Beauty
-            "fashion_styling": [],
-            "beauty_cosmetology": [],
-            # Construction & Engineering
-            "construction_civil": [],
-            "mechanical_electrical": [],
-            # Soft Skills (Universal)
-            "soft_skills": [],
-            # Languages
-            "languages_spoken": [],
-            # Certifications & Tools (General)
-            "tools_software": [],
-            "certifications": [],
-        }
-
-        # === TECHNICAL / IT SKILLS ===
-        tech_programming = [
-            "python",
-            "javascript",
-            "java",
-            "c\\+\\+",
-            "c#",
-            "ruby",
-            "php",
-            "swift",
-            "kotlin",
-            "go",
-            "rust",
-            "typescript",
-            "react",
-            "angular",
-            "vue",
-            "node",
-            "django",
-            "flask",
-            "spring",
-            "sql",
-            "mongodb",
-            "aws",
-            "azure",
-            "docker",
-            "kubernetes",
-            "git",
-            "agile",
-            "devops",
-            "machine learning",
-            "ai",
-            "data science",
-        ]
-        for skill in tech_programming:
-            if re.search(r"\b" + skill.replace("+", "\\+") + r"\b", text_lower):
-                skills["technical_programming"].append(skill.replace("\\+", "+"))
-
-        # === BUSINESS & MANAGEMENT ===
-        business = [
-            "project management",
-            "strategic planning",
-            "business analysis",
-            "stakeholder management",
-            "budgeting",
-            "forecasting",
-            "business development",
-            "operations management",
-            "process improvement",
-            "change management",
-            "vendor management",
-            "contract negotiation",
-            "pmp",
-            "six sigma",
-            "lean",
-            "prince2",
-            "scrum master",
-            "product management",
-        ]
-        for skill in business:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["business_management"].append(skill.title())
-
-        # === FINANCIAL & ACCOUNTING ===
-        finance = [
-            "accounting",
-            "bookkeeping",
-            "financial reporting",
-            "tax",
-            "audit",
-            "payroll",
-            "accounts payable",
-            "accounts receivable",
-            "digital marketing",
-            "seo",
-            "sem",
-            "social media marketing",
-            "content marketing",
-            "email marketing",
-            "ppc",
-            "google ads",
-            "facebook ads",
-            "marketing automation",
-            "brand management",
-            "market research",
-            "copywriting",
-        ]
-        for skill in finance:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["financial_accounting"].append(skill.title())
-
-        # === CUSTOMER SERVICE ===
-        customer_service = [
-            "customer service",
-            "customer support",
-            "technical support",
-            "help desk",
-            "call center",
-            "ticketing",
-            "zendesk",
-            "freshdesk",
-            "complaint resolution",
-            "chat support",
-            "phone support",
-            "email support",
-            "customer satisfaction",
-        ]
-        for skill in customer_service:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["customer_service"].append(skill.title())
-
-        # === MANUFACTURING & OPERATIONS ===
-        manufacturing = [
-            "manufacturing",
-            "production",
-            "assembly",
-            "quality control",
-            "quality assurance",
-            "iso",
-            "lean manufacturing",
-            "continuous improvement",
-            "supply chain",
-            "inventory management",
-            "logistics",
-            "warehouse",
-            "forklift",
-            "cnc",
-            "welding",
-            "plc",
-            "automation",
-            "maintenance",
-        ]
-        for skill in manufacturing:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["manufacturing_operations"].append(skill.title())
-
-        # === HOSPITALITY & FOOD ===
-        hospitality = [
-            "hotel management",
-            "front desk",
-            "concierge",
-            "housekeeping",
-            "room service",
-            "food service",
-            "cooking",
-            "chef",
-            "baking",
-            "pastry",
-            "culinary",
-            "restaurant management",
-            "menu planning",
-            "food safety",
-            "haccp",
-            "bartending",
-            "sommelier",
-            "catering",
-            "banquet",
-        ]
-        for skill in hospitality:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["hospitality_food"].append(skill.title())
-
-        # === TRAVEL & TOURISM ===
-        travel = [
-            "travel planning",
-            "tour guide",
-            "ticketing",
-            "gds",
-            "amadeus",
-            "sabre",
-            "tourism",
-            "hospitality",
-            "visa processing",
-            "itinerary planning",
-            "destination knowledge",
-            "customer relations",
-        ]
-        for skill in travel:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["travel_tourism"].append(skill.title())
-
-        # === LEGAL ===
-        legal = [
-            "legal research",
-            "contract law",
-            "litigation",
-            "compliance",
-            "corporate law",
-            "intellectual property",
-            "labor law",
-            "legal writing",
-            "case management",
-            "mediation",
-            "arbitration",
-            "due diligence",
-            "regulatory compliance",
-        ]
-        for skill in legal:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["legal_regulatory"].append(skill.title())
-
-        # === HR & RECRUITMENT ===
-        hr = [
-            "recruitment",
-            "talent acquisition",
-            "onboarding",
-            "employee relations",
-            "performance management",
-            "hris",
-            "workday",
-            "bamboohr",
-            "compensation",
-            "benefits administration",
-            "training and development",
-            "hr policy",
-            "labor relations",
-            "interviewing",
-            "sourcing",
-            "linkedin recruiter",
-        ]
-        for skill in hr:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["hr_recruitment"].append(skill.title())
-
-        # === FASHION & BEAUTY ===
-        fashion = [
-            "fashion design",
-            "pattern making",
-            "sewing",
-            "tailoring",
-            "merchandising",
-            "fashion styling",
-            "trend analysis",
-            "textile",
-            "garment construction",
-            "fashion illustration",
-            "makeup",
-            "cosmetology",
-            "hair styling",
-            "manicure",
-            "pedicure",
-            "skincare",
-            "beauty consultation",
-            "bridal makeup",
-        ]
-        for skill in fashion:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["fashion_styling"].append(skill.title())
-
-        # === CONSTRUCTION & CIVIL ===
-        construction = [
-            "construction",
-            "civil engineering",
-            "project coordination",
-            "site management",
-            "autocad",
-            "revit",
-            "structural design",
-            "surveying",
-            "estimation",
-            "blueprints",
-            "building codes",
-            "safety compliance",
-            "concrete",
-            "steel",
-        ]
-        for skill in construction:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["construction_civil"].append(skill.title())
-
-        # === MECHANICAL & ELECTRICAL ===
-        mechanical = [
-            "mechanical engineering",
-            "electrical engineering",
-            "hvac",
-            "plumbing",
-            "electronics",
-            "circuit design",
-            "cad",
-            "solidworks",
-            "matlab",
-            "machinery",
-            "troubleshooting",
-            "preventive maintenance",
-            "robotics",
-        ]
-        for skill in mechanical:
-            if re.search(r"\b" + skill + r"\b", text_lower):
-                skills["mechanical_electrical"].append(skill.title())
-
-        # === SOFT SKILLS (Universal) ===
-        soft = [
-            "leadership",
-            "communication",
-            "teamwork",
-            "problem solving",
-            "analytical",
-            "collaboration",
-            "time management",
-            "critical thinking",
-            "adaptability",
-            "creativity",
-            "attention to detail",
-            "multitasking",
-            "decision making",
-            "conflict resolution",
-            "negotiation",
-            "presentation",
-            "interpersonal",
-            "organizational",
-            "self-motivated",
-            "flexible",
-            "reliable",
-        ]
-        for s in soft:
-            if re.search(r"\b" + s + r"\b", text_lower):
-                skills["soft_skills"].append(s.title())
-
-        # === TOOLS & SOFTWARE (General) ===
-        tools = [
-            "microsoft office",
-            "excel",
-            "word",
-            "powerpoint",
-            "outlook",
-            "teams",
-            "google workspace",
-            "sheets",
-            "docs",
-            "slides",
-            "slack",
-            "zoom",
-            "trello",
-            "asana",
-            "jira",
-            "confluence",
-            "notion",
-            "evernote",
-        ]
-        for tool in tools:
-            if re.search(r"\b" + tool + r"\b", text_lower):
-                skills["tools_software"].append(tool.title())
-
-        # Remove duplicates and sort
-        for category in list(skills.keys()):
-            skills[category] = sorted(list(set(skills[category])))
+        index = DocumentIndex(text)
+
+        skills: dict[str, list[str]] = {}
+        for category in skills_taxonomy.categories:
+            found = skills_taxonomy.find_skills(index, category)
+            # Technical skills keep their canonical spelling (c++, ci/cd)
+            if category not in skills_taxonomy.technical_categories:
+                found = [skill.title() for skill in found]
+            skills[category] = sorted(set(found))
 
         return skills
 
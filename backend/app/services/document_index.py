@@ -0,0 +1,148 @@
+"""
+Document Term Index
+Per-document inverted index of unigrams and n-grams with character offsets,
+so keyword lookups are O(1) and respect token boundaries
+"""
+
+import re
+from collections import defaultdict
+from itertools import pairwise
+
+# Alphanumeric runs, keeping trailing "+"/"#" so c++ and c# stay distinct
+# from c; other punctuation (/, -, .) separates tokens, so "ci/cd",
+# "scikit-learn" and "node.js" are looked up as n-grams
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*")
+
+DEFAULT_MAX_NGRAM = 5
+
+Span = tuple[int, int]
+
+
+def tokenize(text: str) -> list[tuple[str, int, int]]:
+    """
+    Split lowercased text into (token, start, end) triples
+
+    Args:
+        text: Text to tokenize (lowercased by the caller)
+
+    Returns:
+        Tokens with their character offsets in text
+    """
+    return [(m.group(0), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+
+def normalize_term(term: str) -> str:
+    """Normalize a keyword to the index key format ("CI/CD" -> "ci cd")"""
+    return " ".join(token for token, _, _ in tokenize(term.lower()))
+
+
+class DocumentIndex:
+    """
+    Inverted index over one document, built once
+
+    Maps every n-gram (n <= max_ngram) to the character spans where it
+    occurs, so "java" does not match inside "javascript" and "go" does not
+    match inside "google". Fragments of dotted names are not matches
+    either: "js" does not match inside "vue.js", while "vue.js" itself does,
+    and so does its undotted spelling "vuejs". A bare name such as "vue"
+    resolves to its dotted form through the taxonomy aliases
+    (SkillsTaxonomy.find).
+    """
+
+    def __init__(self, text: str, max_ngram: int = DEFAULT_MAX_NGRAM):
+        """
+        Args:
+            text: Document text
+            max_ngram: Longest phrase (in tokens) stored in the index
+        """
+        self.text = text
+        self.max_ngram = max(1, max_ngram)
+        lowered = text.lower()
+        self.tokens = tokenize(lowered)
+        self._postings: dict[str, list[Span]] = defaultdict(list)
+
+        # Token boundaries glued to a neighbouring token by "." ("vue|.|js");
+        # the pair is also indexed joined ("vuejs") so undotted aliases match
+        self._glued_starts: set[int] = set()
+        self._glued_ends: set[int] = set()
+        for (left, start, end), (right, next_start, next_end) in pairwise(self.tokens):
+            if next_start == end + 1 and lowered[end] == ".":
+                self._glued_ends.add(end)
+                self._glued_starts.add(next_start)
+                self._postings[left + right].append((start, next_end))
+
+        words = [token for token, _, _ in self.tokens]
+        for i in range(len(words)):
+            start = self.tokens[i][1]
+            for n in range(1, min(self.max_ngram, len(words) - i) + 1):
+                end = self.tokens[i + n - 1][2]
+                self._postings[" ".join(words[i : i + n])].append((start, end))
+
+    def __len__(self) -> int:
+        """Number of distinct indexed terms"""
+        return len(self._postings)
+
+    def find(self, term: str) -> list[Span]:
+        """
+        Get the character spans where a term occurs
+
+        Args:
+            term: Keyword or phrase (any case/punctuation)
+
+        Returns:
+            List of (start, end) offsets into the lowercased document,
+            empty if the term is absent
+        """
+        key = normalize_term(term)
+        if not key:
+            return []
+
+        n = key.count(" ") + 1
+        if n <= self.max_ngram:
+            spans = self._postings.get(key, ())
+        else:
+            spans = self._scan(key.split(" "))
+        return [
+            (start, end)
+            for start, end in spans
+            if start not in self._glued_starts and end not in self._glued_ends
+        ]
+
+    def contains(self, term: str) -> bool:
+        """Check whether a term occurs in the document"""
+        return bool(self.find(term))
+
+    def count(self, term: str) -> int:
+        """Number of occurrences of a term"""
+        return len(self.find(term))
+
+    def lookup(self, terms: list[str]) -> dict[str, list[Span]]:
+        """Find many terms at once; only terms that occur are returned"""
+        found = {}
+        for term in terms:
+            spans = self.find(term)
+            if spans:
+                found[term] = spans
+        return found
+
+    def _scan(self, words: list[str]) -> list[Span]:
+        """Fallback for phrases longer than max_ngram: extend indexed prefixes"""
+        prefix = " ".join(words[: self.max_ngram])
+        spans = []
+        for start, _ in self._postings.get(prefix, ()):
+            i = self._token_at(start)
+            window = self.tokens[i : i + len(words)]
+            if [token for token, _, _ in window] == words:
+                spans.append((start, window[-1][2]))
+        return spans
+
+    def _token_at(self, offset: int) -> int:
+        """Index of the token starting at a character offset"""
+        lo, hi = 0, len(self.tokens)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.tokens[mid][1] < offset:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
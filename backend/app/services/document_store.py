@@ -0,0 +1,135 @@
+"""
+Stored Documents
+Uploaded resumes parsed once and kept server-side under a document_id, so
+the frontend can upload a file once and reference it from every analysis
+endpoint instead of sending and parsing it again
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from app.core.metrics import metrics
+
+DOCUMENT_STORE_SIZE = int(os.getenv("DOCUMENT_STORE_SIZE", "128"))
+DOCUMENT_STORE_MAX_MB = float(os.getenv("DOCUMENT_STORE_MAX_MB", "64"))
+DOCUMENT_STORE_TTL_S = float(os.getenv("DOCUMENT_STORE_TTL_S", "3600"))
+
+
+def _parsed_size(parsed_resume: dict[str, Any]) -> int:
+    """Approximate memory of a parsed resume (its text dominates)"""
+    return len(parsed_resume.get("text", "").encode("utf-8")) + 1024
+
+
+class DocumentStore:
+    """
+    In-process LRU store of parsed uploads with a time-to-live
+
+    Entries are evicted when they expire, when the store holds more than
+    max_entries documents or when the parsed documents together exceed
+    max_bytes (least recently used first).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DOCUMENT_STORE_SIZE,
+        max_bytes: int = int(DOCUMENT_STORE_MAX_MB * 1024 * 1024),
+        ttl_s: float = DOCUMENT_STORE_TTL_S,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self, parsed_resume: dict[str, Any], filename: str, file_size: int) -> str:
+        """
+        Store a parsed upload
+
+        Args:
+            parsed_resume: FileParser.parse_file result
+            filename: Uploaded file name
+            file_size: Uploaded file size in bytes
+
+        Returns:
+            The document ID
+        """
+        document_id = uuid.uuid4().hex
+        entry: dict[str, Any] = {
+            "parsed_resume": parsed_resume,
+            "filename": filename,
+            "file_size": file_size,
+            "size_bytes": _parsed_size(parsed_resume),
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self._evict_expired()
+            self._entries[document_id] = entry
+            self._bytes += entry["size_bytes"]
+            # The new document always stays, even if it alone exceeds the budget
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted["size_bytes"]
+                metrics.increment("document_store.evicted")
+        metrics.increment("document_store.saved")
+        return document_id
+
+    def get(self, document_id: str) -> dict[str, Any] | None:
+        """Stored document by ID (None if unknown or expired)"""
+        with self._lock:
+            entry = self._entries.get(document_id)
+            if entry is None:
+                metrics.increment("document_store.misses")
+                return None
+            if time.time() - entry["created_at"] > self.ttl_s:
+                self._remove(document_id)
+                metrics.increment("document_store.expired")
+                return None
+            self._entries.move_to_end(document_id)
+        metrics.increment("document_store.hits")
+        return entry
+
+    def delete(self, document_id: str) -> bool:
+        """Remove a document; False if it was not stored"""
+        with self._lock:
+            if document_id not in self._entries:
+                return False
+            self._remove(document_id)
+        metrics.increment("document_store.deleted")
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Number and total size of stored documents"""
+        with self._lock:
+            return {
+                "documents": len(self._entries),
+                "size_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+            }
+
+    def _remove(self, document_id: str) -> None:
+        entry = self._entries.pop(document_id)
+        self._bytes -= entry["size_bytes"]
+
+    def _evict_expired(self) -> None:
+        cutoff = time.time() - self.ttl_s
+        for document_id in [
+            key for key, entry in self._entries.items() if entry["created_at"] < cutoff
+        ]:
+            self._remove(document_id)
+            metrics.increment("document_store.expired")
+
+
+# Global instance
+document_store = DocumentStore()
@@ -9,6 +9,8 @@ import re
 
 # Import centralized AI configuration
 from app.core.ai_config import ai_config, is_gemini_available
+from app.core.deadline import Deadline, gemini_call_options
+from app.core.error_handling import CircuitOpenError, gemini_breaker
 
 
 class JobDescriptionGenerator:
@@ -28,7 +30,10 @@ class JobDescriptionGenerator:
             print("ℹ️  Job Description Generator: Google Gemini not available")
 
     def generate_job_description(
-        self, job_type: str, experience_level: str = "mid-level"
+        self,
+        job_type: str,
+        experience_level: str = "mid-level",
+        deadline: Deadline | None = None,
     ) -> str:
         """
         Generate a specific job description for the detected job type using AI only
@@ -36,6 +41,7 @@ class JobDescriptionGenerator:
         Args:
             job_type: The detected job type (e.g., "DevOps Engineer", "Software Engineer")
             experience_level: Experience level (entry-level, mid-level, senior-level)
+            deadline: Optional request deadline bounding the Gemini call
 
         Returns:
             A specific job description for ATS analysis
@@ -47,7 +53,11 @@ class JobDescriptionGenerator:
 
         try:
             prompt = self._create_generation_prompt(job_type, experience_level)
-            response = self.model.generate_content(prompt)
+            response = gemini_breaker.call(
+                self.model.generate_content,
+                prompt,
+                **gemini_call_options(deadline),
+            )
 
             if response and response.text:
                 cleaned_jd = self._clean_generated_jd(response.text)
@@ -60,8 +70,17 @@ class JobDescriptionGenerator:
 
         except Exception as e:
             print(f"❌ Error generating job description with AI: {e}")
+            if deadline is not None:
+                reason = "circuit_open" if isinstance(e, CircuitOpenError) else "error"
+                deadline.degrade("jd_generation", "fallback", reason)
             # Return a minimal fallback instead of template
-            return f"Job Description for {job_type} ({experience_level}):\n\nThis position requires expertise in {job_type.lower()} with {experience_level} experience. Please configure GEMINI_API_KEY for detailed AI-generated job descriptions."
+            return self.fallback_job_description(job_type, experience_level)
+
+    def fallback_job_description(self, job_type: str, experience_level: str) -> str:
+        """
+        Minimal job description used when AI generation fails or is skipped
+        """
+        return f"Job Description for {job_type} ({experience_level}):\n\nThis position requires expertise in {job_type.lower()} with {experience_level} experience. Please configure GEMINI_API_KEY for detailed AI-generated job descriptions."
 
     def _create_generation_prompt(self, job_type: str, experience_level: str) -> str:
         """Create a prompt for generating job descriptions"""
@@ -1,22 +1,24 @@
 """
 Intelligent Job Type Detection using Semantic Embeddings
 Detects ANY job role, not just predefined ones
-Uses parallel execution for Gemini + Semantic for best results
+Uses a local semantic match first and Gemini only when it is inconclusive
 """
 
+import os
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # Import centralized AI configuration
 from app.core.ai_config import ai_config, is_embeddings_available, is_gemini_available
-
-# Try to import sentence-transformers
-try:
-    from sentence_transformers import SentenceTransformer, util
-
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+from app.core.deadline import Deadline, gemini_call_options
+from app.core.embeddings import EMBEDDING_MODEL_NAME
+from app.core.error_handling import gemini_breaker
+from app.core.metrics import metrics
+from app.services.document_index import DocumentIndex
+from app.services.job_titles import JobTitleIndex, job_titles_taxonomy
+from app.services.skills_taxonomy import skills_taxonomy
 
 # Try to import Google Gemini
 try:
@@ -26,6 +28,16 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# Minimum similarity for an unknown title to map onto a taxonomy role
+TITLE_MATCH_THRESHOLD = 0.8
+
+# Shared, bounded pool for Gemini detection calls (instead of a new
+# executor per request)
+_detection_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("JOB_DETECTION_WORKERS", "4")),
+    thread_name_prefix="job-detection",
+)
+
 
 class JobTypeDetector:
     """
@@ -37,326 +49,154 @@ class JobTypeDetector:
         """Initialize the detector with embedding model"""
         # Initialize AI configuration
         _gemini_available, _embeddings_available = ai_config.initialize()
-        # Comprehensive job titles database (200+ roles)
-        self.job_database = [
-            # Technology - Software Engineering
-            "Software Engineer",
-            "Frontend Developer",
-            "Backend Developer",
-            "Full Stack Developer",
-            "Mobile Developer",
-            "iOS Developer",
-            "Android Developer",
-            "React Developer",
-            "Vue Developer",
-            "Angular Developer",
-            "Node.js Developer",
-            "Python Developer",
-            "Java Developer",
-            "C++ Developer",
-            "Go Developer",
-            "Rust Developer",
-            # Technology - DevOps & Cloud
-            "DevOps Engineer",
-            "Cloud Engineer",
-            "Cloud Architect",
-            "Solutions Architect",
-            "AWS Engineer",
-            "Azure Engineer",
-            "GCP Engineer",
-            "Site Reliability Engineer",
-            "Platform Engineer",
-            "Infrastructure Engineer",
-            "Kubernetes Engineer",
-            "Docker Specialist",
-            "CI/CD Engineer",
-            # Technology - Data & AI
-            "Data Scientist",
-            "Data Engineer",
-            "Machine Learning Engineer",
-            "AI Engineer",
-            "Generative AI Engineer",
-            "Prompt Engineer",
-            "NLP Engineer",
-            "Computer Vision Engineer",
-            "AI Safety Researcher",
-            "MLOps Engineer",
-            "Data Architect",
-            "Big Data Engineer",
-            "Deep Learning Engineer",
-            "Research Scientist",
-            # Technology - Security
-            "Security Engineer",
-            "Cybersecurity Analyst",
-            "Penetration Tester",
-            "Security Architect",
-            "Information Security Analyst",
-            "Application Security Engineer",
-            "Network Security Engineer",
-            "Ethical Hacker",
-            "Security Operations Analyst",
-            "CISO",
-            # Technology - Emerging Tech
-            "Blockchain Developer",
-            "Web3 Developer",
-            "Smart Contract Developer",
-            "Cryptocurrency Developer",
-            "DeFi Developer",
-            "NFT Developer",
-            "IoT Engineer",
-            "IoT Security Architect",
-            "Embedded Systems Engineer",
-            "Robotics Engineer",
-            "Quantum Computing Engineer",
-            "AR/VR Developer",
-            "Metaverse Developer",
-            "Game Developer",
-            # Technology - Quality & Testing
-            "QA Engineer",
-            "Test Automation Engineer",
-            "SDET",
-            "Quality Assurance Analyst",
-            "Test Engineer",
-            "Performance Tester",
-            # Data & Analytics
-            "Business Analyst",
-            "Data Analyst",
-            "Business Intelligence Analyst",
-            "Analytics Engineer",
-            "Quantitative Analyst",
-            "Financial Analyst",
-            "Marketing Analyst",
-            "Operations Analyst",
-            "Systems Analyst",
-            "Insights Analyst",
-            "Revenue Analyst",
-            "Pricing Analyst",
-            # Product & Design
-            "Product Manager",
-            "Technical Product Manager",
-            "Product Owner",
-            "Senior Product Manager",
-            "Group Product Manager",
-            "VP of Product",
-            "UX Designer",
-            "UI Designer",
-            "Product Designer",
-            "UX Researcher",
-            "Interaction Designer",
-            "Visual Designer",
-            "UI/UX Designer",
-            "Experience Designer",
-            "Service Designer",
-            "Design Systems Designer",
-            "Motion Designer",
-            # Marketing & Growth
-            "Marketing Manager",
-            "Digital Marketing Specialist",
-            "SEO Specialist",
-            "Content Strategist",
-            "Social Media Manager",
-            "Growth Marketer",
-            "Content Marketing Manager",
-            "Email Marketing Specialist",
-            "Marketing Automation Specialist",
-            "Brand Manager",
-            "Performance Marketing Manager",
-            "Demand Generation Manager",
-            "Community Manager",
-            "Influencer Marketing Manager",
-            "Growth Hacker",
-            "Conversion Rate Optimizer",
-            # Sales & Business Development
-            "Sales Manager",
-            "Account Executive",
-            "Sales Engineer",
-            "Sales Development Representative",
-            "Business Development Manager",
-            "Partnerships Manager",
-            "Account Manager",
-            "Customer Success Manager",
-            "Sales Operations Manager",
-            "Inside Sales Representative",
-            "Territory Sales Manager",
-            "Enterprise Sales Executive",
-            # Operations & Management
-            "Operations Manager",
-            "Project Manager",
-            "Program Manager",
-            "Scrum Master",
-            "Agile Coach",
-            "Technical Program Manager",
-            "Operations Analyst",
-            "Supply Chain Manager",
-            "Logistics Manager",
-            "Process Improvement Manager",
-            "Change Manager",
-            "Revenue Operations Manager",
-            "Business Operations Manager",
-            # Finance & Accounting
-            "Accountant",
-            "Financial Analyst",
-            "Investment Analyst",
-            "Risk Analyst",
-            "Compliance Officer",
-            "Auditor",
-            "Cloud FinOps Analyst",
-            "Financial Controller",
-            "Treasury Analyst",
-            "Tax Analyst",
-            "Budget Analyst",
-            "Credit Analyst",
-            "Portfolio Manager",
-            "Investment Banking Analyst",
-            "Financial Planning Analyst",
-            "Management Accountant",
-            # Healthcare & Medical
-            "Registered Nurse",
-            "Physician",
-            "Medical Doctor",
-            "Healthcare Administrator",
-            "Clinical Research Coordinator",
-            "Pharmacist",
-            "Physical Therapist",
-            "Medical Lab Technician",
-            "Nurse Practitioner",
-            "Physician Assistant",
-            "Medical Coder",
-            "Healthcare Data Analyst",
-            "Clinical Analyst",
-            "Medical Writer",
-            "Radiologist",
-            "Surgeon",
-            "Dentist",
-            "Veterinarian",
-            # Education & Training
-            "Teacher",
-            "Professor",
-            "Academic Advisor",
-            "Instructional Designer",
-            "Education Coordinator",
-            "Training Specialist",
-            "Corporate Trainer",
-            "E-Learning Developer",
-            "Curriculum Developer",
-            "Educational Consultant",
-            # Customer Success & Support
-            "Customer Success Manager",
-            "Support Engineer",
-            "Technical Support Specialist",
-            "Customer Service Representative",
-            "Customer Experience Manager",
-            "Implementation Specialist",
-            "Onboarding Specialist",
-            # Human Resources
-            "Recruiter",
-            "HR Manager",
-            "Talent Acquisition Specialist",
-            "HR Business Partner",
-            "Compensation Analyst",
-            "Benefits Administrator",
-            "People Operations Manager",
-            "Organizational Development Specialist",
-            "Diversity and Inclusion Manager",
-            "Employee Relations Specialist",
-            # Legal & Compliance
-            "Legal Counsel",
-            "Paralegal",
-            "Contract Manager",
-            "Corporate Lawyer",
-            "Intellectual Property Attorney",
-            "Compliance Analyst",
-            "Regulatory Affairs Specialist",
-            # Content & Creative
-            "Technical Writer",
-            "Documentation Specialist",
-            "Content Writer",
-            "Copywriter",
-            "Editor",
-            "Video Producer",
-            "Graphic Designer",
-            "Creative Director",
-            "Art Director",
-            "Illustrator",
-            "Photographer",
-            "Videographer",
-            "3D Artist",
-            # Sustainability & Climate Tech
-            "Climate Tech Engineer",
-            "Sustainability Analyst",
-            "Carbon Analyst",
-            "Environmental Engineer",
-            "Renewable Energy Engineer",
-            "ESG Analyst",
-            "Sustainability Manager",
-            # Other Specialized Roles
-            "Management Consultant",
-            "Strategy Consultant",
-            "Real Estate Analyst",
-            "Urban Planner",
-            "Research Associate",
-            "Lab Technician",
-            "Manufacturing Engineer",
-            "Industrial Engineer",
-            "Mechanical Engineer",
-            "Electrical Engineer",
-            "Civil Engineer",
-            "Chemical Engineer",
-            "Aerospace Engineer",
-            "Biomedical Engineer",
-        ]
+        # Local results at or above this confidence skip Gemini
+        self.confidence_threshold = float(
+            os.getenv("JOB_DETECTION_CONFIDENCE_THRESHOLD", "0.75")
+        )
+        # Time detect_job_type may wait for Gemini before using the local result
+        self.latency_budget_ms = float(os.getenv("JOB_DETECTION_BUDGET_MS", "3000"))
 
-        # Load embedding model if available
+        # Hierarchical title taxonomy (families -> roles -> aliases)
+        self.title_taxonomy = job_titles_taxonomy
+        self.title_index: JobTitleIndex | None = None
+
+        # Use the shared embedding model (torch or ONNX backend) if available
         if is_embeddings_available():
             try:
-                self.model = SentenceTransformer("all-MiniLM-L6-v2")
-                # Pre-compute embeddings for job database
-                self.job_embeddings = self.model.encode(
-                    self.job_database, convert_to_tensor=True
+                self.model = ai_config.get_embeddings_model()
+                # Prebuilt title embeddings (cached on disk per taxonomy/model)
+                self.title_index = JobTitleIndex.build(
+                    self.title_taxonomy, self.model, EMBEDDING_MODEL_NAME
                 )
                 self.use_embeddings = True
-                print(f"✅ Job detector loaded with {len(self.job_database)} job titles")
+                print(
+                    f"✅ Job detector loaded with {len(self.title_taxonomy)} roles, "
+                    f"{len(self.title_index)} titles"
+                )
             except Exception as e:
                 print(f"Warning: Could not load embedding model: {e}")
                 self.use_embeddings = False
         else:
             self.use_embeddings = False
 
-    def detect_job_type(self, resume_text: str) -> tuple[str, float]:
+    def detect_job_type(
+        self, resume_text: str, budget_ms: float | None = None
+    ) -> tuple[str, float]:
         """
-        Detect job type using PARALLEL execution for best accuracy
-        - Runs Gemini + Semantic simultaneously
-        - Compares results for validation
-        - Returns best result with metadata
+        Detect job type, asking Gemini only when the local match is not
+        conclusive and only for as long as the latency budget allows
+        - Runs semantic + keyword detection first (tens of milliseconds)
+        - Returns it directly if confidence >= JOB_DETECTION_CONFIDENCE_THRESHOLD
+        - Otherwise asks Gemini on the shared executor and combines both,
+          falling back to the local result when Gemini overruns the budget
+        - Never waits longer than the budget, with or without a local result
+
+        Args:
+            resume_text: Resume text
+            budget_ms: Latency budget override (JOB_DETECTION_BUDGET_MS);
+                0 skips Gemini whenever a local result exists
 
         Returns:
             Tuple of (job_title, confidence_score)
             Note: In future, this could return Dict with alternatives
         """
-        # Run both detection methods in parallel
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both tasks
-            gemini_future = executor.submit(self._safe_gemini_detection, resume_text)
-            semantic_future = executor.submit(
-                self._semantic_and_keyword_detection, resume_text
+        start = time.perf_counter()
+        budget_ms = self.latency_budget_ms if budget_ms is None else budget_ms
+
+        local_error: Exception | None = None
+        semantic_result: tuple[str, float] | None = None
+        try:
+            semantic_result = self._semantic_and_keyword_detection(resume_text)
+        except Exception as e:
+            local_error = e
+
+        def decided(path: str, result: tuple[str, float]) -> tuple[str, float]:
+            metrics.increment(f"job_detection.decided_by.{path}")
+            metrics.observe(
+                "job_detection.latency_ms",
+                (time.perf_counter() - start) * 1000,
+                buckets=(25, 50, 100, 250, 500, 1000, 2000, 5000),
+            )
+            return result
+
+        local_failure = local_error or RuntimeError("Local job detection failed")
+
+        def local(path: str) -> tuple[str, float]:
+            """The local result, or the local detection's error if it failed"""
+            if semantic_result is None:
+                raise local_failure
+            return decided(path, semantic_result)
+
+        # Conclusive local match: skip the Gemini call entirely
+        if (
+            semantic_result is not None
+            and semantic_result[1] >= self.confidence_threshold
+        ):
+            print(
+                f"📊 Confident local detection: {semantic_result[0]} "
+                f"({semantic_result[1]:.2f}), skipping Gemini"
+            )
+            return decided("local_confident", semantic_result)
+
+        # No Gemini, or no budget left for it (request deadline nearly spent)
+        if not is_gemini_available() or budget_ms <= 0:
+            return local("local_no_budget" if is_gemini_available() else "local_only")
+
+        # Gemini failing or throttled: don't wait for it to error out
+        if gemini_breaker.is_open and semantic_result is not None:
+            return decided("local_circuit_open", semantic_result)
+
+        # The call gets what is left of the budget; a call still queued
+        # behind earlier ones when the budget runs out is skipped
+        gemini_deadline = Deadline(
+            max(budget_ms - (time.perf_counter() - start) * 1000, 0.0)
+        )
+        gemini_future = _detection_executor.submit(
+            self._safe_gemini_detection, resume_text, gemini_deadline
+        )
+        try:
+            gemini_result = gemini_future.result(timeout=gemini_deadline.timeout_s())
+        except FutureTimeoutError:
+            gemini_future.cancel()
+            if semantic_result is None:
+                metrics.increment("job_detection.decided_by.gemini_timeout")
+                raise TimeoutError(
+                    f"Job detection overran its {budget_ms:.0f}ms budget"
+                ) from local_error
+            print(
+                f"⏱️  Gemini detection overran {budget_ms:.0f}ms budget, "
+                f"using local result: {semantic_result[0]}"
             )
+            return decided("local_gemini_timeout", semantic_result)
 
-            # Wait for both to complete
-            gemini_result = gemini_future.result()
-            semantic_result = semantic_future.result()
+        title, confidence = gemini_result
+        if semantic_result is None:
+            if title is None:
+                raise local_failure
+            return decided("gemini_only", (title, confidence))
 
         # Combine and choose best result
-        return self._combine_results(gemini_result, semantic_result)
+        path = "combined" if title is not None else "local_gemini_failed"
+        return decided(path, self._combine_results(gemini_result, semantic_result))
 
-    def _safe_gemini_detection(self, resume_text: str) -> tuple[str | None, float]:
+    def _safe_gemini_detection(
+        self, resume_text: str, deadline: Deadline | None = None
+    ) -> tuple[str | None, float]:
         """
         Safely call Gemini detection with error handling
+
+        Args:
+            resume_text: Resume text
+            deadline: Detection budget; the call is skipped once it expired
         """
         if not is_gemini_available():
             return None, 0.0
+        if deadline is not None and deadline.expired:
+            metrics.increment("job_detection.gemini_skipped_expired")
+            return None, 0.0
 
         try:
-            return self._gemini_detection(resume_text)
+            return self._gemini_detection(resume_text, deadline)
         except Exception as e:
             print(f"Gemini detection failed: {e}")
             return None, 0.0
@@ -366,7 +206,7 @@ class JobTypeDetector:
         Combined semantic + keyword detection
         """
         # If embeddings not available, use keyword only
-        if not self.use_embeddings:
+        if not self.use_embeddings or self.title_index is None:
             return self._keyword_based_detection(resume_text)
 
         try:
@@ -374,15 +214,11 @@ class JobTypeDetector:
             relevant_text = self._extract_relevant_sections(resume_text)
 
             # Encode the resume text
-            resume_embedding = self.model.encode(relevant_text, convert_to_tensor=True)
-
-            # Calculate similarities with all job titles
-            similarities = util.cos_sim(resume_embedding, self.job_embeddings)[0]
+            resume_embedding = self.model.encode(relevant_text)
 
-            # Get top match
-            top_idx = similarities.argmax()
-            best_job = self.job_database[top_idx]
-            best_score = similarities[top_idx].item()
+            # Nearest title: best families first, then their titles
+            best_role, best_score = self.title_index.nearest(resume_embedding)
+            best_job = best_role.title
 
             # If confidence is low, try keyword detection
             if best_score < 0.4:
@@ -435,44 +271,33 @@ class JobTypeDetector:
 
     def _jobs_are_similar(self, job1: str, job2: str) -> bool:
         """
-        Check if two job titles are similar enough to be considered the same
+        Check if two job titles name the same role (canonical role IDs)
         """
-        j1_lower = job1.lower()
-        j2_lower = job2.lower()
-
-        # Exact match
-        if j1_lower == j2_lower:
-            return True
-
-        # Check for common variations
-        # E.g., "Software Engineer" vs "Software Developer"
-        j1_words = set(j1_lower.split())
-        j2_words = set(j2_lower.split())
-
-        # If they share major keywords
-        overlap = j1_words & j2_words
-        if len(overlap) >= 2:  # At least 2 words in common
-            return True
-
-        # Check for synonyms
-        synonyms = {
-            frozenset(["engineer", "developer"]),
-            frozenset(["manager", "lead"]),
-            frozenset(["analyst", "specialist"]),
-            frozenset(["designer", "architect"]),
-        }
-
-        for syn_set in synonyms:
-            if any(w in j1_lower for w in syn_set) and any(
-                w in j2_lower for w in syn_set
-            ):
-                # Check if rest of the words match
-                j1_remaining = j1_words - syn_set
-                j2_remaining = j2_words - syn_set
-                if j1_remaining & j2_remaining:
-                    return True
-
-        return False
+        role1 = self._canonical_role_id(job1)
+        role2 = self._canonical_role_id(job2)
+        if role1 and role2:
+            return role1 == role2
+
+        # Titles outside the taxonomy only match themselves
+        return job1.strip().lower() == job2.strip().lower()
+
+    def _canonical_role_id(self, title: str) -> str | None:
+        """
+        Canonical role ID of a title: exact title/alias lookup first, then
+        the nearest taxonomy title if it is close enough
+        """
+        role = self.title_taxonomy.resolve(title)
+        if role:
+            return role.id
+
+        if self.use_embeddings and self.title_index is not None:
+            try:
+                role, score = self.title_index.nearest(self.model.encode(title))
+                if score >= TITLE_MATCH_THRESHOLD:
+                    return role.id
+            except Exception as e:
+                print(f"Error resolving job title: {e}")
+        return None
 
     def _extract_relevant_sections(self, resume_text: str) -> str:
         """
@@ -510,78 +335,20 @@ class JobTypeDetector:
         """
         text_lower = resume_text.lower()
 
-        # Define keyword patterns for common roles
-        role_keywords = {
-            "Software Engineer": [
-                "software engineer",
-                "developer",
-                "programming",
-                "coding",
-            ],
-            "Data Scientist": [
-                "data scientist",
-                "machine learning",
-                "data analysis",
-                "statistics",
-            ],
-            "Product Manager": [
-                "product manager",
-                "product owner",
-                "roadmap",
-                "stakeholders",
-            ],
-            "DevOps Engineer": [
-                "devops",
-                "infrastructure",
-                "ci/cd",
-                "kubernetes",
-                "docker",
-            ],
-            "Frontend Developer": [
-                "frontend",
-                "react",
-                "vue",
-                "angular",
-                "ui development",
-            ],
-            "Backend Developer": [
-                "backend",
-                "api",
-                "database",
-                "server",
-                "microservices",
-            ],
-            "Data Engineer": [
-                "data engineer",
-                "etl",
-                "data pipeline",
-                "data warehouse",
-            ],
-            "Marketing Manager": [
-                "marketing",
-                "campaigns",
-                "branding",
-                "market research",
-            ],
-            "UX Designer": [
-                "ux designer",
-                "user experience",
-                "wireframes",
-                "prototypes",
-            ],
-            "Business Analyst": [
-                "business analyst",
-                "requirements",
-                "process improvement",
-            ],
-        }
+        # Role signals and associated skills come from the skills taxonomy;
+        # skills are matched on token boundaries under any alias (k8s)
+        index = DocumentIndex(resume_text)
 
         # Score each role
         role_scores = {}
-        for role, keywords in role_keywords.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
+        for role in skills_taxonomy.roles.values():
+            score = sum(1 for signal in role.signals if signal in text_lower)
+            score += sum(
+                1 for skill in role.skills if skills_taxonomy.mentions(index, skill)
+            )
+            total = len(role.signals) + len(role.skills)
             if score > 0:
-                role_scores[role] = score / len(keywords)
+                role_scores[role.name] = score / total
 
         if role_scores:
             best_role = max(role_scores, key=role_scores.get)
@@ -593,10 +360,16 @@ class JobTypeDetector:
             "AI job detection is required. Please configure GEMINI_API_KEY environment variable"
         )
 
-    def _gemini_detection(self, resume_text: str) -> tuple[str, float]:
+    def _gemini_detection(
+        self, resume_text: str, deadline: Deadline | None = None
+    ) -> tuple[str, float]:
         """
         Use Google Gemini LLM to detect job type
         FREE tier: 15 requests/minute, 1500 requests/day
+
+        Args:
+            resume_text: Resume text
+            deadline: Detection budget (bounds the request timeout)
         """
         if not is_gemini_available():
             raise Exception(
@@ -621,12 +394,14 @@ Resume excerpt:
 Job Title:"""
 
             # Generate response
-            response = model.generate_content(
+            response = gemini_breaker.call(
+                model.generate_content,
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     max_output_tokens=20,
                     temperature=0.1,  # Low temperature for consistent results
                 ),
+                **gemini_call_options(deadline),
             )
 
             # Extract job title
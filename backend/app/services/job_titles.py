@@ -0,0 +1,276 @@
+"""
+Job Title Taxonomy
+Hierarchical job titles (family -> role -> aliases) with canonical role IDs
+and a coarse-to-fine nearest-neighbour index over title embeddings
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.services.document_index import normalize_term
+
+DEFAULT_TAXONOMY_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "job_titles_taxonomy.json"
+)
+DEFAULT_INDEX_CACHE_PATH = (
+    Path(__file__).resolve().parent.parent.parent / "data" / "job_title_index.npz"
+)
+
+# Leading words that qualify a title without changing the role
+SENIORITY_TOKENS = frozenset(
+    {
+        "senior",
+        "sr",
+        "junior",
+        "jr",
+        "lead",
+        "principal",
+        "staff",
+        "entry",
+        "level",
+        "mid",
+        "intern",
+        "trainee",
+        "associate",
+    }
+)
+# Trailing level markers ("Software Engineer II")
+LEVEL_TOKENS = frozenset({"i", "ii", "iii", "iv", "1", "2", "3", "4"})
+
+
+class JobRole:
+    """One canonical role of the title taxonomy"""
+
+    __slots__ = ("aliases", "family", "id", "title")
+
+    def __init__(self, role_id: str, title: str, family: str, aliases: list[str]):
+        self.id = role_id
+        self.title = title
+        self.family = family
+        self.aliases = tuple(aliases)
+
+    @property
+    def surface_forms(self) -> tuple[str, ...]:
+        """Canonical title followed by its aliases"""
+        return (self.title, *self.aliases)
+
+
+def strip_seniority(key: str) -> str:
+    """Drop seniority words and level markers from a normalized title"""
+    tokens = key.split()
+    while len(tokens) > 1 and tokens[0] in SENIORITY_TOKENS:
+        tokens.pop(0)
+    while len(tokens) > 1 and tokens[-1] in LEVEL_TOKENS:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+class JobTitleTaxonomy:
+    """
+    Compiled title taxonomy (built once, shared by all services)
+
+    Titles are compared by canonical role ID, so "Front-End Engineer",
+    "Senior Frontend Developer" and "UI Developer" are the same role.
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self.version: str = data.get("version", "0")
+
+        self.families: dict[str, str] = {}
+        self.roles: dict[str, JobRole] = {}
+        self._family_roles: dict[str, list[JobRole]] = {}
+        self._by_title: dict[str, str] = {}
+
+        for family_id, family in data.get("families", {}).items():
+            self.families[family_id] = family.get("label", family_id)
+            self._family_roles[family_id] = []
+            for role_key, info in family.get("roles", {}).items():
+                role = JobRole(
+                    f"{family_id}/{role_key}",
+                    info["title"],
+                    family_id,
+                    info.get("aliases", []),
+                )
+                self.roles[role.id] = role
+                self._family_roles[family_id].append(role)
+                for form in role.surface_forms:
+                    self._by_title.setdefault(normalize_term(form), role.id)
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def resolve(self, title: str) -> JobRole | None:
+        """Role named exactly by a title or alias (ignoring seniority)"""
+        key = normalize_term(title)
+        role_id = self._by_title.get(key) or self._by_title.get(strip_seniority(key))
+        return self.roles.get(role_id) if role_id else None
+
+    def family_roles(self, family_id: str) -> list[JobRole]:
+        return self._family_roles.get(family_id, [])
+
+    def fingerprint(self) -> str:
+        """Hash of every surface form (invalidates cached embeddings)"""
+        digest = hashlib.sha1(self.version.encode("utf-8"))
+        for role in self.roles.values():
+            digest.update(role.id.encode("utf-8"))
+            for form in role.surface_forms:
+                digest.update(b"\0" + form.encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+
+def load_job_titles_taxonomy(path: Path | str | None = None) -> JobTitleTaxonomy:
+    """
+    Load and compile the title taxonomy file
+
+    Args:
+        path: Taxonomy JSON (defaults to JOB_TITLES_TAXONOMY_PATH or the
+            bundled file)
+
+    Returns:
+        Compiled JobTitleTaxonomy
+    """
+    path = Path(path or os.getenv("JOB_TITLES_TAXONOMY_PATH") or DEFAULT_TAXONOMY_PATH)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return JobTitleTaxonomy(data)
+
+
+class JobTitleIndex:
+    """
+    Coarse-to-fine nearest-neighbour search over title embeddings
+
+    Surface forms are stored grouped by family. A query is first compared
+    with one centroid per family, then only the forms of the best
+    `probe_families` families are scored, so lookup cost depends on family
+    size rather than on the size of the whole taxonomy.
+    """
+
+    def __init__(
+        self,
+        taxonomy: JobTitleTaxonomy,
+        embeddings: np.ndarray,
+        probe_families: int = 3,
+    ):
+        """
+        Args:
+            taxonomy: Title taxonomy the embeddings were built from
+            embeddings: One row per surface form, in index_forms() order
+            probe_families: Families scored in the fine stage
+        """
+        self.taxonomy = taxonomy
+        self.probe_families = probe_families
+
+        forms = self.index_forms(taxonomy)
+        self._form_roles = [role_id for role_id, _ in forms]
+
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        self._embeddings = embeddings / np.maximum(norms, 1e-12)
+
+        # Contiguous row range and centroid per family
+        self._family_ranges: list[tuple[int, int]] = []
+        family_means: list[np.ndarray] = []
+        start = 0
+        for family_id in taxonomy.families:
+            count = sum(
+                len(role.surface_forms) for role in taxonomy.family_roles(family_id)
+            )
+            if count:
+                self._family_ranges.append((start, start + count))
+                family_means.append(
+                    self._embeddings[start : start + count].mean(axis=0)
+                )
+            start += count
+        centroids = np.asarray(family_means, dtype=np.float32)
+        self._centroids = centroids / np.maximum(
+            np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12
+        )
+
+    @staticmethod
+    def index_forms(taxonomy: JobTitleTaxonomy) -> list[tuple[str, str]]:
+        """(role ID, surface form) pairs grouped by family"""
+        return [
+            (role.id, form)
+            for family_id in taxonomy.families
+            for role in taxonomy.family_roles(family_id)
+            for form in role.surface_forms
+        ]
+
+    @classmethod
+    def build(
+        cls,
+        taxonomy: JobTitleTaxonomy,
+        model,
+        model_name: str,
+        cache_path: Path | None = None,
+        probe_families: int = 3,
+    ) -> "JobTitleIndex":
+        """
+        Load prebuilt title embeddings, or encode and cache them
+
+        The cache is keyed by the taxonomy fingerprint and model name, so
+        editing the taxonomy or switching models rebuilds it.
+        """
+        cache_path = Path(
+            cache_path or os.getenv("JOB_TITLE_INDEX_PATH") or DEFAULT_INDEX_CACHE_PATH
+        )
+        fingerprint = f"{taxonomy.fingerprint()}:{model_name}"
+
+        if cache_path.exists():
+            try:
+                data = np.load(cache_path)
+                if str(data["fingerprint"]) == fingerprint:
+                    return cls(taxonomy, data["embeddings"], probe_families)
+            except (OSError, KeyError, ValueError) as e:
+                print(f"⚠️  Ignoring job title index cache: {e}")
+
+        forms = [form for _, form in cls.index_forms(taxonomy)]
+        embeddings = np.asarray(model.encode(forms), dtype=np.float32)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp.npz")
+            np.savez(
+                tmp_path,
+                embeddings=embeddings.astype(np.float16),
+                fingerprint=fingerprint,
+            )
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not cache job title index: {e}")
+        return cls(taxonomy, embeddings, probe_families)
+
+    def __len__(self) -> int:
+        return len(self._form_roles)
+
+    def nearest(self, embedding: np.ndarray) -> tuple[JobRole, float]:
+        """
+        Closest role to an embedding (coarse family probe, then fine search)
+
+        Returns:
+            (role, cosine similarity of its best-matching surface form)
+        """
+        query = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        probe = min(self.probe_families, len(self._centroids))
+        family_scores = self._centroids @ query
+        families = np.argpartition(-family_scores, probe - 1)[:probe]
+
+        best_row, best_score = -1, -np.inf
+        for family in families:
+            start, end = self._family_ranges[family]
+            scores = self._embeddings[start:end] @ query
+            row = int(scores.argmax())
+            if scores[row] > best_score:
+                best_row, best_score = start + row, float(scores[row])
+
+        return self.taxonomy.roles[self._form_roles[best_row]], best_score
+
+
+# Global taxonomy instance (compiled at import/startup)
+job_titles_taxonomy = load_job_titles_taxonomy()
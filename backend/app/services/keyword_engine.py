@@ -0,0 +1,1300 @@
+"""
+Keyword Extraction Engine
+Frozen vocabularies and precompiled patterns for ATS keyword extraction
+"""
+
+import re
+from collections import Counter
+
+from app.services.skills_taxonomy import skills_taxonomy
+from app.services.term_weights import TermWeightTable
+
+# ============================================================================
+# VOCABULARIES (built once at import)
+# ============================================================================
+
+# Industry-standard stop words (expanded)
+STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "should",
+        "can",
+        "could",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+        "me",
+        "him",
+        "her",
+        "us",
+        "them",
+        "my",
+        "your",
+        "his",
+        "its",
+        "our",
+        "their",
+        "am",
+        "being",
+        "get",
+        "got",
+        "getting",
+        # Additional generic words that don't add value to ATS scoring
+        "specific",
+        "company",
+        "brief",
+        "include",
+        "tailor",
+        "technologies",
+        "various",
+        "different",
+        "multiple",
+        "several",
+        "many",
+        "some",
+        "any",
+        "all",
+        "every",
+        "each",
+        "both",
+        "either",
+        "neither",
+        "other",
+        "another",
+        "same",
+        "similar",
+        "new",
+        "old",
+        "good",
+        "better",
+        "best",
+        "great",
+        "excellent",
+        "outstanding",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "important",
+        "significant",
+        "major",
+        "minor",
+        "main",
+        "primary",
+        "secondary",
+        "basic",
+        "advanced",
+        "intermediate",
+        "beginner",
+        "expert",
+        "professional",
+        "personal",
+        "individual",
+        "team",
+        "group",
+        "organization",
+        "business",
+        "work",
+        "job",
+        "position",
+        "role",
+        "career",
+        "field",
+        "industry",
+        "area",
+        "sector",
+        "domain",
+        "subject",
+        "topic",
+        "matter",
+        "issue",
+        "problem",
+        "solution",
+        "approach",
+        "method",
+        "way",
+        "manner",
+        "style",
+        "type",
+        "kind",
+        "sort",
+        "category",
+        "class",
+        "level",
+        "degree",
+        "amount",
+        "number",
+        "quantity",
+        "size",
+        "scale",
+        "scope",
+        "range",
+        "extent",
+        "limit",
+        "boundary",
+        "edge",
+        "side",
+        "part",
+        "section",
+        "portion",
+        "piece",
+        "bit",
+        "element",
+        "component",
+        "feature",
+        "aspect",
+        "characteristic",
+        "property",
+        "attribute",
+        "quality",
+        "nature",
+        "form",
+        "shape",
+        "structure",
+        "pattern",
+        "design",
+        "model",
+        "framework",
+        "system",
+        "process",
+        "procedure",
+        "step",
+        "stage",
+        "phase",
+        "period",
+        "time",
+        "moment",
+        "point",
+        "place",
+        "location",
+        "site",
+        "region",
+        "zone",
+        "space",
+        "room",
+        "environment",
+        "setting",
+        "context",
+        "situation",
+        "condition",
+        "state",
+        "status",
+        "circumstance",
+        "case",
+        "instance",
+        "example",
+        "sample",
+        "specimen",
+        "item",
+        "object",
+        "thing",
+        "stuff",
+        "material",
+        "substance",
+        "content",
+        "information",
+        "data",
+        "details",
+        "facts",
+        "figures",
+        "numbers",
+        "statistics",
+        "results",
+        "outcomes",
+        "consequences",
+        "effects",
+        "impacts",
+        "benefits",
+        "advantages",
+        "disadvantages",
+        "pros",
+        "cons",
+        "strengths",
+        "weaknesses",
+        "opportunities",
+        "threats",
+        "challenges",
+        "risks",
+        "goals",
+        "objectives",
+        "targets",
+        "aims",
+        "purposes",
+        "reasons",
+        "causes",
+        "factors",
+        "elements",
+        "components",
+        "parts",
+        "pieces",
+        "aspects",
+        "features",
+        "characteristics",
+        "properties",
+        "attributes",
+        "qualities",
+        "traits",
+        "skills",
+        "abilities",
+        "capabilities",
+        "competencies",
+        "knowledge",
+        "experience",
+        "background",
+        "history",
+        "record",
+        "track",
+        "performance",
+        "achievement",
+        "success",
+        "accomplishment",
+        "result",
+        "outcome",
+        "impact",
+        "contribution",
+        "value",
+        "worth",
+        "benefit",
+        "advantage",
+        "strength",
+        "asset",
+        "resource",
+        "tool",
+        "instrument",
+        "equipment",
+        "technology",
+        "platform",
+        "software",
+        "application",
+        "program",
+        "project",
+        "initiative",
+        "effort",
+        "endeavor",
+        "venture",
+        "enterprise",
+        "operation",
+        "activity",
+        "task",
+        "duty",
+        "responsibility",
+        "function",
+        "profession",
+        "occupation",
+        "specialty",
+        "expertise",
+        "focus",
+        "concentration",
+        "emphasis",
+        "priority",
+        "importance",
+        "significance",
+        "relevance",
+        "applicability",
+        "usefulness",
+        "utility",
+        "effectiveness",
+        "efficiency",
+        "productivity",
+        "standard",
+        "magnitude",
+        "intensity",
+        "power",
+        "force",
+        "energy",
+        "capacity",
+        "potential",
+        "talent",
+        "gift",
+        "merit",
+        "virtue",
+        "excellence",
+        "superiority",
+        "distinction",
+        "uniqueness",
+        "originality",
+        "creativity",
+        "innovation",
+        "invention",
+        "discovery",
+        "breakthrough",
+        "advancement",
+        "progress",
+        "development",
+        "growth",
+        "improvement",
+        "enhancement",
+        "upgrade",
+        "refinement",
+        "optimization",
+        "maximization",
+        "minimization",
+        "reduction",
+        "increase",
+        "decrease",
+        "change",
+        "modification",
+        "adjustment",
+        "adaptation",
+        "transformation",
+        "evolution",
+        "revolution",
+        "modernization",
+        "updating",
+        "upgrading",
+        "enhancing",
+        "improving",
+        "developing",
+        "growing",
+        "expanding",
+        "extending",
+        "broadening",
+        "deepening",
+        "strengthening",
+        "reinforcing",
+        "supporting",
+        "maintaining",
+        "sustaining",
+        "preserving",
+        "protecting",
+        "securing",
+        "ensuring",
+        "guaranteeing",
+        "promising",
+        "committing",
+        "dedicating",
+        "devoting",
+        "focusing",
+        "concentrating",
+        "specializing",
+        "expertising",
+        "mastering",
+        "learning",
+        "studying",
+        "researching",
+        "investigating",
+        "exploring",
+        "discovering",
+        "finding",
+        "identifying",
+        "recognizing",
+        "understanding",
+        "comprehending",
+        "grasping",
+        "appreciating",
+        "valuing",
+        "respecting",
+        "honoring",
+        "celebrating",
+        "acknowledging",
+        "accepting",
+        "embracing",
+        "welcoming",
+        "receiving",
+        "obtaining",
+        "acquiring",
+        "gaining",
+        "earning",
+        "achieving",
+        "accomplishing",
+        "completing",
+        "finishing",
+        "concluding",
+        "ending",
+        "stopping",
+        "starting",
+        "beginning",
+        "initiating",
+        "launching",
+        "introducing",
+        "presenting",
+        "offering",
+        "providing",
+        "delivering",
+        "supplying",
+        "furnishing",
+        "equipping",
+        "preparing",
+        "organizing",
+        "arranging",
+        "structuring",
+        "designing",
+        "planning",
+        "strategizing",
+        "thinking",
+        "considering",
+        "evaluating",
+        "assessing",
+        "analyzing",
+        "examining",
+        "reviewing",
+        "checking",
+        "verifying",
+        "confirming",
+        "validating",
+        "testing",
+        "trying",
+        "attempting",
+        "experimenting",
+        "practicing",
+        "training",
+        "coaching",
+        "mentoring",
+        "teaching",
+        "instructing",
+        "guiding",
+        "leading",
+        "managing",
+        "supervising",
+        "overseeing",
+        "controlling",
+        "directing",
+        "commanding",
+        "governing",
+        "ruling",
+        "regulating",
+        "monitoring",
+        "tracking",
+        "following",
+        "pursuing",
+        "chasing",
+        "seeking",
+        "searching",
+        "looking",
+        "uncovering",
+        "revealing",
+        "exposing",
+        "showing",
+        "displaying",
+        "demonstrating",
+        "proving",
+        "establishing",
+        "authenticating",
+        "certifying",
+        "accrediting",
+        "approving",
+        "endorsing",
+        "recommending",
+        "suggesting",
+        "proposing",
+        "submitting",
+    }
+)
+
+# Generic/non-meaningful keywords filtered out of JD matching
+# (including placeholder text keywords)
+GENERIC_KEYWORDS = frozenset(
+    {
+        "specific",
+        "company",
+        "brief",
+        "include",
+        "tailor",
+        "technologies",
+        "various",
+        "different",
+        "multiple",
+        "several",
+        "many",
+        "some",
+        "any",
+        "all",
+        "every",
+        "each",
+        "both",
+        "either",
+        "neither",
+        "other",
+        "another",
+        "same",
+        "similar",
+        "new",
+        "old",
+        "good",
+        "better",
+        "best",
+        "great",
+        "excellent",
+        "outstanding",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "strong",
+        "reliable",
+        "dedicated",
+        "passionate",
+        "motivated",
+        "committed",
+        "hardworking",
+        "diligent",
+        "thorough",
+        "careful",
+        "attentive",
+        "focused",
+        # Placeholder text keywords
+        "insert",
+        "engaging",
+        "paragraph",
+        "mission",
+        "culture",
+        "concise",
+        "seeking",
+        "experienced",
+        "growing",
+        "team",
+        "responsible",
+        "designing",
+        "implementing",
+        "managing",
+        "infrastructure",
+        "services",
+        "closely",
+        "development",
+        "operations",
+        "security",
+        "teams",
+        "ensure",
+        "solutions",
+        "scalable",
+        "secure",
+        "cost-effective",
+        "play",
+        "critical",
+        "role",
+        "defining",
+        "strategy",
+        "driving",
+        "innovation",
+        "overview",
+        "benefits",
+        "package",
+        "standard",
+        "equal",
+        "opportunity",
+        "employer",
+        "statement",
+        "communication",
+        "proficiency",
+        "native",
+        "deep",
+        "understanding",
+        "platforms",
+        "microservices",
+        "expertise",
+        "section",
+        "architectures",
+        "functions",
+        "serverless",
+        "business",
+        "determined",
+        "persistent",
+        "resilient",
+        "adaptable",
+        "flexible",
+        "versatile",
+        "creative",
+        "innovative",
+        "proactive",
+        "self-motivated",
+        "independent",
+        "collaborative",
+        "team-oriented",
+        "people-oriented",
+        "customer-focused",
+        "results-driven",
+        "goal-oriented",
+        "detail-oriented",
+        "quality-focused",
+        "skilled",
+        "proficient",
+        "knowledgeable",
+        "capable",
+        "competent",
+        "qualified",
+        "trained",
+        "educated",
+        "certified",
+        "licensed",
+        "accredited",
+        "approved",
+        "validated",
+        "verified",
+        "tested",
+        "proven",
+        "established",
+        "recognized",
+        "accepted",
+        "common",
+        "typical",
+        "usual",
+        "normal",
+        "regular",
+        "routine",
+        "conventional",
+        "important",
+        "significant",
+        "major",
+        "minor",
+        "main",
+        "primary",
+        "secondary",
+        "basic",
+        "advanced",
+        "intermediate",
+        "beginner",
+        "expert",
+        "professional",
+        "personal",
+        "individual",
+        "group",
+        "organization",
+        "work",
+        "job",
+        "position",
+        "career",
+        "field",
+        "industry",
+        "area",
+        "sector",
+        "domain",
+        "subject",
+        "topic",
+        "matter",
+        "issue",
+        "problem",
+        "solution",
+        "approach",
+        "method",
+        "way",
+        "manner",
+        "style",
+        "type",
+        "kind",
+        "sort",
+        "category",
+        "class",
+        "level",
+        "degree",
+        "amount",
+        "number",
+        "quantity",
+        "size",
+        "scale",
+        "scope",
+        "range",
+        "extent",
+        "limit",
+        "boundary",
+        "edge",
+        "side",
+        "part",
+        "portion",
+        "piece",
+        "bit",
+        "element",
+        "component",
+        "feature",
+        "aspect",
+        "characteristic",
+        "property",
+        "attribute",
+        "quality",
+        "nature",
+        "form",
+        "shape",
+        "structure",
+        "pattern",
+        "design",
+        "model",
+        "framework",
+        "system",
+        "process",
+        "procedure",
+        "step",
+        "stage",
+        "phase",
+        "period",
+        "time",
+        "moment",
+        "point",
+        "place",
+        "location",
+        "site",
+        "region",
+        "zone",
+        "space",
+        "room",
+        "environment",
+        "setting",
+        "context",
+        "situation",
+        "condition",
+        "state",
+        "status",
+        "circumstance",
+        "case",
+        "instance",
+        "example",
+        "sample",
+        "specimen",
+        "item",
+        "object",
+        "thing",
+        "stuff",
+        "material",
+        "substance",
+        "content",
+        "information",
+        "data",
+        "details",
+        "facts",
+        "figures",
+        "numbers",
+        "statistics",
+        "results",
+        "outcomes",
+        "consequences",
+        "effects",
+        "impacts",
+        "advantages",
+        "disadvantages",
+        "pros",
+        "cons",
+        "strengths",
+        "weaknesses",
+        "opportunities",
+        "threats",
+        "challenges",
+        "risks",
+        "goals",
+        "objectives",
+        "targets",
+        "aims",
+        "purposes",
+        "reasons",
+        "causes",
+        "factors",
+        "elements",
+        "components",
+        "parts",
+        "pieces",
+        "aspects",
+        "features",
+        "characteristics",
+        "properties",
+        "attributes",
+        "qualities",
+        "traits",
+        "skills",
+        "abilities",
+        "capabilities",
+        "competencies",
+        "knowledge",
+        "experience",
+        "background",
+        "history",
+        "record",
+        "track",
+        "performance",
+        "achievement",
+        "success",
+        "accomplishment",
+        "result",
+        "outcome",
+        "impact",
+        "contribution",
+        "value",
+        "worth",
+        "benefit",
+        "advantage",
+        "strength",
+        "asset",
+        "resource",
+        "tool",
+        "instrument",
+        "equipment",
+        "technology",
+        "platform",
+        "software",
+        "application",
+        "program",
+        "project",
+        "initiative",
+        "effort",
+        "endeavor",
+        "venture",
+        "enterprise",
+        "operation",
+        "activity",
+        "task",
+        "duty",
+        "responsibility",
+        "function",
+        "profession",
+        "occupation",
+        "specialty",
+        "focus",
+        "concentration",
+        "emphasis",
+        "priority",
+        "importance",
+        "significance",
+        "relevance",
+        "applicability",
+        "usefulness",
+        "utility",
+        "effectiveness",
+        "efficiency",
+        "productivity",
+        "magnitude",
+        "intensity",
+        "power",
+        "force",
+        "energy",
+        "capacity",
+        "potential",
+        "ability",
+        "capability",
+        "competency",
+        "skill",
+        "talent",
+        "gift",
+        "merit",
+        "virtue",
+        "excellence",
+        "superiority",
+        "distinction",
+        "uniqueness",
+        "originality",
+        "creativity",
+        "invention",
+        "discovery",
+        "breakthrough",
+        "advancement",
+        "progress",
+        "growth",
+        "improvement",
+        "enhancement",
+        "upgrade",
+        "refinement",
+        "optimization",
+        "maximization",
+        "minimization",
+        "reduction",
+        "increase",
+        "decrease",
+        "change",
+        "modification",
+        "adjustment",
+        "adaptation",
+        "transformation",
+        "evolution",
+        "revolution",
+        "modernization",
+        "updating",
+        "upgrading",
+        "enhancing",
+        "improving",
+        "developing",
+        "expanding",
+        "extending",
+        "broadening",
+        "deepening",
+        "strengthening",
+        "reinforcing",
+        "supporting",
+        "maintaining",
+        "sustaining",
+        "preserving",
+        "protecting",
+        "securing",
+        "ensuring",
+        "guaranteeing",
+        "promising",
+        "committing",
+        "dedicating",
+        "devoting",
+        "focusing",
+        "concentrating",
+        "specializing",
+        "expertising",
+        "mastering",
+        "learning",
+        "studying",
+        "researching",
+        "investigating",
+        "exploring",
+        "discovering",
+        "finding",
+        "identifying",
+        "recognizing",
+        "comprehending",
+        "grasping",
+        "appreciating",
+        "valuing",
+        "respecting",
+        "honoring",
+        "celebrating",
+        "acknowledging",
+        "accepting",
+        "embracing",
+        "welcoming",
+        "receiving",
+        "obtaining",
+        "acquiring",
+        "gaining",
+        "earning",
+        "achieving",
+        "accomplishing",
+        "completing",
+        "finishing",
+        "concluding",
+        "ending",
+        "stopping",
+        "starting",
+        "beginning",
+        "initiating",
+        "launching",
+        "introducing",
+        "presenting",
+        "offering",
+        "providing",
+        "delivering",
+        "supplying",
+        "furnishing",
+        "equipping",
+        "preparing",
+        "organizing",
+        "arranging",
+        "structuring",
+        "planning",
+        "strategizing",
+        "thinking",
+        "considering",
+        "evaluating",
+        "assessing",
+        "analyzing",
+        "examining",
+        "reviewing",
+        "checking",
+        "verifying",
+        "confirming",
+        "validating",
+        "testing",
+        "trying",
+        "attempting",
+        "experimenting",
+        "practicing",
+        "training",
+        "coaching",
+        "mentoring",
+        "teaching",
+        "instructing",
+        "guiding",
+        "leading",
+        "supervising",
+        "overseeing",
+        "controlling",
+        "directing",
+        "commanding",
+        "governing",
+        "ruling",
+        "regulating",
+        "monitoring",
+        "tracking",
+        "following",
+        "pursuing",
+        "chasing",
+        "searching",
+        "looking",
+        "uncovering",
+        "revealing",
+        "exposing",
+        "showing",
+        "displaying",
+        "demonstrating",
+        "proving",
+        "establishing",
+        "authenticating",
+        "certifying",
+        "accrediting",
+        "approving",
+        "endorsing",
+        "recommending",
+        "suggesting",
+        "proposing",
+        "submitting",
+    }
+)
+
+
+# Industry vocabularies matched as whole words/phrases, taken from the
+# shared skills taxonomy (aliases included, longest spelling tried first)
+def _taxonomy_terms(*categories: str) -> tuple[str, ...]:
+    terms = dict.fromkeys(
+        form
+        for category in categories
+        for form in skills_taxonomy.category_terms(category, include_aliases=True)
+    )
+    return tuple(sorted(terms, key=len, reverse=True))
+
+
+TECH_TERMS = _taxonomy_terms("technical_programming", "technical_tools")
+SOFT_SKILL_TERMS = _taxonomy_terms("soft_skills")
+BUSINESS_TERMS = _taxonomy_terms("business_management")
+
+# High-priority technical terms listed first in the output
+TECH_PRIORITY = (
+    "python",
+    "javascript",
+    "java",
+    "react",
+    "aws",
+    "docker",
+    "kubernetes",
+    "sql",
+    "git",
+    "agile",
+)
+
+MAX_KEYWORDS = 60
+
+# With corpus weights, a word seen once still qualifies if at most this
+# fraction of corpus documents contain it
+DISTINCTIVE_DF_RATIO = 0.05
+
+# ============================================================================
+# PATTERNS (compiled once at import)
+# ============================================================================
+
+# Maximal runs of word characters; a run made only of a-z is what
+# the legacy r"\b[a-z]+\b" word pattern matched
+TOKEN_PATTERN = re.compile(r"\w+")
+
+EXPERIENCE_YEARS_PATTERN = re.compile(
+    r"\b\d+\+?\s*years?\s*(?:of\s*)?(?:experience|exp)\b", re.IGNORECASE
+)
+SENIORITY_PATTERN = re.compile(
+    r"\b(?:entry|junior|mid|senior|lead|principal|architect|manager|director|vp|cto)\s*level\b",
+    re.IGNORECASE,
+)
+EDUCATION_PATTERN = re.compile(
+    r"\b(?:bachelor|master|phd|doctorate|b\.?e\.?|b\.?tech|m\.?e\.?|m\.?tech|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|mba|diploma|certification|certified)\b",
+    re.IGNORECASE,
+)
+
+
+def vocabulary_pattern(terms: tuple[str, ...]) -> re.Pattern:
+    """Whole-word alternation over literal terms (first listed term wins)"""
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\b",
+        re.IGNORECASE,
+    )
+
+
+def _leading_token(term: str) -> str:
+    """First word token of a vocabulary term (terms start with a word character)"""
+    token = TOKEN_PATTERN.match(term)
+    if token is None:
+        raise ValueError(f"Vocabulary term must start with a word character: {term!r}")
+    return token.group(0)
+
+
+class _Vocabulary:
+    """Compiled vocabulary pattern plus the tokens a match can start with"""
+
+    __slots__ = ("pattern", "triggers")
+
+    def __init__(self, terms: tuple[str, ...]):
+        self.pattern = vocabulary_pattern(terms)
+        self.triggers = frozenset(_leading_token(term) for term in terms)
+
+
+# Applied in this order (matches the legacy industry_patterns order)
+_VOCABULARY_STAGES = (
+    _Vocabulary(TECH_TERMS),
+    (EXPERIENCE_YEARS_PATTERN, SENIORITY_PATTERN, EDUCATION_PATTERN),
+    _Vocabulary(SOFT_SKILL_TERMS),
+    _Vocabulary(BUSINESS_TERMS),
+)
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+
+class KeywordEngine:
+    """
+    Keyword extraction over a single tokenization pass
+
+    Unigram candidates come from word frequencies; phrase candidates come
+    from the industry vocabularies, which are only tried at token
+    positions whose word can start a vocabulary term.
+    """
+
+    def extract(self, text: str, weights: TermWeightTable | None = None) -> list[str]:
+        """
+        Extract prioritized ATS keywords from text
+
+        Args:
+            text: Text to analyze (callers pass lowercased text)
+            weights: Corpus term weights; when given and large enough
+                (weights.ready), candidates are ranked by BM25 instead of
+                raw frequency
+
+        Returns:
+            Up to MAX_KEYWORDS keywords, most important first
+        """
+        word_freq, phrases, length = self._candidates(text)
+
+        if weights is not None and weights.ready:
+            return self._rank_by_weight(word_freq, phrases, length, weights)
+
+        keywords = [word for word, freq in word_freq.most_common(50) if freq >= 2]
+        keywords.extend(phrases)
+
+        # Remove duplicates, then prioritize by industry relevance
+        unique_keywords = list(set(keywords))
+        unique_set = set(unique_keywords)
+        prioritized = [tech for tech in TECH_PRIORITY if tech in unique_set]
+        prioritized.extend(kw for kw in unique_keywords if kw not in TECH_PRIORITY)
+
+        return prioritized[:MAX_KEYWORDS]
+
+    def document_terms(self, text: str) -> tuple[set[str], int]:
+        """
+        Distinct candidate terms of a document, for corpus statistics
+
+        Returns:
+            (terms, document length in words)
+        """
+        word_freq, phrases, length = self._candidates(text)
+        return set(word_freq) | set(phrases), length
+
+    def _candidates(self, text: str) -> tuple[Counter, list[str], int]:
+        """
+        Unigram frequencies and phrase matches from one tokenization pass
+
+        Returns:
+            (non-stop word frequencies, phrase matches in order, word count)
+        """
+        # Anchored matching relies on token offsets lining up with the
+        # case-insensitive patterns, which holds for lowercase text
+        is_lower = text == text.lower()
+
+        tokens = list(TOKEN_PATTERN.finditer(text))
+        words = [
+            word
+            for word in (token.group(0) for token in tokens)
+            if word.isascii() and word.isalpha() and word.islower()
+        ]
+
+        # Unigram candidates: non-stop words (minimum length 3)
+        word_freq = Counter(w for w in words if len(w) >= 3 and w not in STOP_WORDS)
+
+        # Phrase candidates from industry vocabularies and patterns
+        phrases: list[str] = []
+        for stage in _VOCABULARY_STAGES:
+            if isinstance(stage, tuple):
+                for pattern in stage:
+                    phrases.extend(m.lower() for m in pattern.findall(text))
+            else:
+                matches = (
+                    self._match_at_tokens(stage, text, tokens)
+                    if is_lower
+                    else [m.lower() for m in stage.pattern.findall(text)]
+                )
+                # Aliases are reported under their canonical skill name
+                phrases.extend(skills_taxonomy.canonical(m) or m for m in matches)
+
+        return word_freq, phrases, len(words)
+
+    @staticmethod
+    def _rank_by_weight(
+        word_freq: Counter,
+        phrases: list[str],
+        length: int,
+        weights: TermWeightTable,
+    ) -> list[str]:
+        """
+        Rank candidates by BM25 weight
+
+        Unigrams qualify when repeated or distinctive in the corpus;
+        vocabulary phrases always qualify.
+        """
+        scores: dict[str, float] = {}
+
+        for word, freq in word_freq.items():
+            if freq >= 2 or 0 < weights.document_ratio(word) <= DISTINCTIVE_DF_RATIO:
+                scores[word] = weights.bm25(word, freq, length)
+        top_unigrams = sorted(scores, key=lambda w: (-scores[w], w))[:50]
+        scores = {word: scores[word] for word in top_unigrams}
+
+        for phrase, freq in Counter(phrases).items():
+            scores[phrase] = weights.bm25(phrase, freq, length)
+
+        return sorted(scores, key=lambda kw: (-scores[kw], kw))[:MAX_KEYWORDS]
+
+    @staticmethod
+    def _match_at_tokens(
+        vocabulary: _Vocabulary, text: str, tokens: list[re.Match]
+    ) -> list[str]:
+        """
+        Equivalent of vocabulary.pattern.findall(text) that only attempts
+        matches where a trigger token starts, skipping overlapped positions
+        """
+        matches = []
+        resume_at = 0
+        for token in tokens:
+            start = token.start()
+            if start < resume_at or token.group(0) not in vocabulary.triggers:
+                continue
+            match = vocabulary.pattern.match(text, start)
+            if match:
+                matches.append(match.group(0).lower())
+                resume_at = match.end()
+        return matches
+
+
+# Global keyword engine instance
+keyword_engine = KeywordEngine()
@@ -0,0 +1,551 @@
+"""
+Local Structured Experience Extractor
+Builds the AI extractor's structured experience schema with rules only in
+milliseconds: contact details, summary and education come from the
+analyzer's section categorization of the same document, work experience,
+skills and credentials from section-aware line patterns. Each section group
+is rated so hybrid extraction can send only weak groups to the LLM
+"""
+
+import os
+import re
+from datetime import date
+from typing import Any
+
+from app.services.document_index import DocumentIndex
+from app.services.section_extraction import empty_result, plan_tasks
+from app.services.skills_taxonomy import skills_taxonomy
+
+_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s*'?\d{{2,4}}|\d{{1,2}}[/.-]\d{{4}}|\d{{4}})"
+_ONGOING = r"(?:present|current|now|till date|to date|ongoing)"
+DATE_RANGE_PATTERN = re.compile(
+    rf"({_DATE})\s*(?:–|—|-|to|until)\s*({_DATE}|{_ONGOING})", re.IGNORECASE
+)
+YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+BULLET_PATTERN = re.compile(r"^\s*[•●▪■◦\-\*–·>]\s*")
+TRAILING_PARENS_PATTERN = re.compile(r"\(([^()]+)\)\s*$")
+METRIC_PATTERN = re.compile(
+    r"\d+(?:\.\d+)?\s*(?:%|x\b|\+|k\b|m\b)|[$€£₹]\s?\d", re.IGNORECASE
+)
+COLUMN_GAP_PATTERN = re.compile(r"\s{2,}|\t+")
+ROLE_WORDS_PATTERN = re.compile(
+    r"\b(?:engineer|developer|architect|manager|admin\w*|analyst|consultant"
+    r"|designer|lead|intern|specialist|scientist|director|officer|head"
+    r"|administrator|programmer|tester|associate|executive|coordinator)\b",
+    re.IGNORECASE,
+)
+
+DEGREE_PATTERN = re.compile(
+    r"\b(bachelor|master|b\.?\s?(?:e|tech|sc|s|a|com)\b\.?"
+    r"|m\.?\s?(?:e|tech|sc|s|a|ba)\b\.?|mba|ph\.?\s?d|doctor|diploma|associate|secondary|high school|class\s*1[02]"
+    r"|a-levels?|certificate)",
+    re.IGNORECASE,
+)
+INSTITUTION_PATTERN = re.compile(
+    r"([A-Z][\w.&'-]*(?:\s+(?:of|for|and|&|[A-Z][\w.&'-]*))*\s+"
+    r"(?:University|College|Institute|School|Academy|Polytechnic)"
+    r"(?:\s+of(?:\s+[A-Z][\w.&'-]*)+)?"
+    r"|(?:University|College|Institute|School|Academy)\s+of(?:\s+[A-Z][\w.&'-]*)+)"
+)
+GRADE_PATTERN = re.compile(
+    r"\(?\s*(?:c?gpa|grade|percentage)\s*:?\s*\d+(?:\.\d+)?(?:\s*/\s*\d+(?:\.\d+)?)?\s*\)?"
+    r"|\(?\s*\d+(?:\.\d+)?\s*(?:/\s*\d+(?:\.\d+)?\s*)?(?:c?gpa|%)\s*\)?",
+    re.IGNORECASE,
+)
+NAME_PATTERN = re.compile(r"[A-Za-z][A-Za-z.'-]*(?:\s+[A-Za-z][A-Za-z.'-]*){1,3}")
+
+# Confidence below which hybrid mode re-extracts a group with the LLM
+HYBRID_MIN_CONFIDENCE = float(os.getenv("EXPERIENCE_HYBRID_MIN_CONFIDENCE", "0.7"))
+
+
+def _clean(text: str) -> str:
+    return re.sub(r"\s+", " ", BULLET_PATTERN.sub("", text)).strip(" |,;:-–—")
+
+
+def _parse_date(value: str, end: bool = False) -> tuple[int, int] | None:
+    """(year, month) of a resume date; ongoing dates map to today"""
+    value = value.strip().lower()
+    if re.fullmatch(_ONGOING, value):
+        today = date.today()
+        return today.year, today.month
+    numeric = re.fullmatch(r"(\d{1,2})[/.-](\d{4})", value)
+    if numeric:
+        return int(numeric.group(2)), int(numeric.group(1))
+    named = re.fullmatch(rf"({_MONTH})\s*'?(\d{{2,4}})", value)
+    if named:
+        year = int(named.group(2))
+        year += 2000 if year < 100 else 0
+        return year, _MONTHS.get(named.group(1)[:3], 1)
+    if re.fullmatch(r"\d{4}", value):
+        return int(value), 12 if end else 1
+    return None
+
+
+def _months_between(start: str, end: str) -> int:
+    start_date = _parse_date(start)
+    end_date = _parse_date(end, end=True)
+    if not start_date or not end_date:
+        return 0
+    months = (end_date[0] - start_date[0]) * 12 + end_date[1] - start_date[1] + 1
+    return max(months, 0)
+
+
+def _display_date(value: str) -> str:
+    return "Present" if re.fullmatch(_ONGOING, value.strip(), re.IGNORECASE) else value
+
+
+def _without_dates(text: str) -> str:
+    """Text with its date ranges, years and grades taken out"""
+    text = GRADE_PATTERN.sub(" | ", DATE_RANGE_PATTERN.sub(" | ", text))
+    text = re.sub(r"\(\s*\)", " ", YEAR_PATTERN.sub(" | ", text))
+    return _clean(re.sub(r"(?:\s*[|,;]\s*)+", ", ", text))
+
+
+def _split_degree_line(line: str, institution: str) -> tuple[str, str]:
+    """
+    (degree, institution) of an education line, with the institution, the
+    dates and the grade taken out of the degree
+
+    "B.Tech Computer Science, Delhi University 2013 - 2017"
+        -> ("B.Tech Computer Science", "Delhi University")
+
+    When the institution cannot be told apart from the degree, both keep
+    the line (see _fields_overlap).
+    """
+    match = INSTITUTION_PATTERN.search(line)
+    if match:
+        institution = match.group()
+        line = line[: match.start()] + " | " + line[match.end() :]
+    elif institution and institution.strip() != line.strip():
+        line = line.replace(institution, " | ")
+    return _without_dates(line), _without_dates(institution)
+
+
+def _fields_overlap(entry: dict[str, Any]) -> bool:
+    """Whether an education entry's degree and institution share their text"""
+    degree = entry["degree"].lower()
+    institution = entry["institution"].lower()
+    return bool(
+        degree and institution and (degree in institution or institution in degree)
+    )
+
+
+def _split_name_location(text: str) -> tuple[str, str]:
+    """("AKQA, India") -> ("AKQA", "India"); long tails stay in the name"""
+    name, sep, tail = text.partition(",")
+    if sep and 0 < len(tail.split()) <= 3:
+        return name.strip(), tail.strip()
+    return text.strip(), ""
+
+
+class LocalExperienceExtractor:
+    """
+    Rule-based structured experience extractor (no AI)
+
+    Produces the same top-level schema as the AI extractor (summary,
+    contact_info, skills, work_experience, education, certifications,
+    awards, automations) plus a confidence per section group.
+    """
+
+    def extract(self, resume_text: str, categorized: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract structured experience from resume text
+
+        Args:
+            resume_text: Resume text
+            categorized: The analyzer's section categorization of the same
+                text (ATSAnalyzer.categorize_resume), reused for contact
+                details, summary and education
+
+        Returns:
+            Structured data with "extraction": {"mode", "confidence"}
+        """
+        blocks: dict[str, list[str]] = {}
+        for task in plan_tasks(resume_text):
+            blocks.setdefault(task["group"], []).append(task["text"])
+
+        def group_text(group: str) -> str:
+            return "\n".join(blocks.get(group, []))
+
+        result = empty_result()
+        confidence: dict[str, float] = {}
+
+        result["contact_info"] = self._contact_info(categorized["contact_info"])
+        result["summary"] = categorized["summary_profile"]
+        confidence["profile"] = (
+            0.4 * bool(result["contact_info"].get("email"))
+            + 0.3 * bool(result["contact_info"].get("full_name"))
+            + 0.3 * bool(result["summary"])
+        )
+
+        jobs = self._extract_work_experience(group_text("experience"))
+        result["work_experience"] = jobs
+        confidence["experience"] = self._experience_confidence(
+            jobs, bool(blocks.get("experience"))
+        )
+
+        result["skills"], confidence["skills"] = self._extract_skills(
+            group_text("skills"), resume_text
+        )
+
+        result["education"] = self._education(categorized["education"])
+        confidence["education"] = self._education_confidence(
+            result["education"], bool(blocks.get("education"))
+        )
+
+        credentials_text = group_text("credentials")
+        result["certifications"], result["awards"] = self._extract_credentials(
+            credentials_text
+        )
+        if not credentials_text:
+            confidence["credentials"] = 1.0  # nothing to extract
+        elif result["certifications"] or result["awards"]:
+            confidence["credentials"] = 0.8
+        else:
+            confidence["credentials"] = 0.3
+
+        result["extraction"] = {
+            "mode": "fast",
+            "confidence": {
+                group: round(score, 2) for group, score in confidence.items()
+            },
+        }
+        return result
+
+    def weak_groups(
+        self, result: dict[str, Any], min_confidence: float = HYBRID_MIN_CONFIDENCE
+    ) -> list[str]:
+        """Section groups of an extract() result rated below min_confidence"""
+        confidence = result.get("extraction", {}).get("confidence", {})
+        return [group for group, score in confidence.items() if score < min_confidence]
+
+    # ------------------------------------------------------------------
+    # Profile
+    # ------------------------------------------------------------------
+
+    def _contact_info(self, contact: dict[str, Any]) -> dict[str, str]:
+        """Flat contact details from the analyzer's nested contact info"""
+        name = contact["full_name"]
+        if not NAME_PATTERN.fullmatch(name):
+            name = ""  # first line of the resume is not a name
+        return {
+            "full_name": name.title() if name.isupper() else name,
+            "email": contact["email"],
+            "phone": contact["phone"]["raw"],
+            "location": contact["location"]["full"],
+            "linkedin": contact["linkedin"]["username"],
+            "github": contact["github"]["username"],
+            "portfolio": contact["portfolio"],
+        }
+
+    # ------------------------------------------------------------------
+    # Work experience
+    # ------------------------------------------------------------------
+
+    def _extract_work_experience(self, text: str) -> list[dict[str, Any]]:
+        jobs: list[dict[str, Any]] = []
+        job: dict[str, Any] | None = None
+        project: dict[str, Any] | None = None
+        pending: list[str] = []  # short lines that may name the next job
+
+        for raw_line in text.split("\n"):
+            line = raw_line.strip()
+            if not line:
+                project = None
+                continue
+
+            range_match = DATE_RANGE_PATTERN.search(line)
+            if range_match:
+                job = self._start_job(line, range_match, pending)
+                jobs.append(job)
+                project, pending = None, []
+                continue
+
+            if job is None:
+                if len(line.split()) <= 10:
+                    pending = [*pending, line][-2:]
+                continue
+
+            is_bullet = bool(BULLET_PATTERN.match(raw_line))
+            content = _clean(line)
+            if not content:
+                continue
+
+            # Title line right after the company/date line
+            # ("Senior Engineer          Gurugram, India")
+            position = job["positions"][0]
+            if (
+                not position["title"]
+                and not is_bullet
+                and len(content.split()) <= 8
+                and not content.endswith(".")
+            ):
+                parts = COLUMN_GAP_PATTERN.split(line, maxsplit=1)
+                position["title"] = _clean(parts[0])
+                if len(parts) > 1 and _clean(parts[1]):
+                    position["location"] = _clean(parts[1])
+                continue
+
+            # Trailing "(React, Node.js)" on a description lists technologies;
+            # on a short line it describes a project name instead
+            technologies = []
+            tech_match = TRAILING_PARENS_PATTERN.search(content)
+            if (
+                tech_match
+                and "," in tech_match.group(1)
+                and (is_bullet or len(content[: tech_match.start()].split()) > 10)
+            ):
+                technologies = [
+                    tech.strip()
+                    for tech in re.split(r"[,;]", tech_match.group(1))
+                    if tech.strip()
+                ]
+                content = content[: tech_match.start()].strip()
+
+            # Short non-bullet line opening a project ("Acme Portal (E-commerce)")
+            if not is_bullet and not technologies and len(content.split()) <= 10:
+                name = TRAILING_PARENS_PATTERN.sub("", content).strip()
+                project = {
+                    "name": name,
+                    "description": "",
+                    "technologies": [],
+                    "achievements": [],
+                }
+                job["projects"].append(project)
+                continue
+
+            if project is not None:
+                if is_bullet:
+                    project["achievements"].append(content)
+                else:
+                    project["description"] = (
+                        project["description"] + " " + content
+                    ).strip()
+                project["technologies"].extend(technologies)
+            elif METRIC_PATTERN.search(content):
+                job["achievements"].append(content)
+            else:
+                job["responsibilities"].append(content)
+            job["skills_used"].extend(technologies)
+
+        for job in jobs:
+            job["skills_used"] = list(
+                dict.fromkeys(
+                    job["skills_used"]
+                    + [t for p in job["projects"] for t in p["technologies"]]
+                )
+            )
+        return jobs
+
+    def _start_job(
+        self, line: str, range_match: re.Match, pending: list[str]
+    ) -> dict[str, Any]:
+        """Job entry from its company/date line (or the lines just before it)"""
+        start, end = range_match.group(1), range_match.group(2)
+        header = _clean(COLUMN_GAP_PATTERN.sub(" | ", line[: range_match.start()]))
+        header = header.strip(" |()")
+        trailer = _clean(line[range_match.end() :])
+
+        title = ""
+        if " at " in header:
+            title, _, header = header.partition(" at ")
+        elif "|" in header:
+            parts = [p.strip() for p in header.split("|") if p.strip()]
+            header, title = parts[0], " ".join(parts[1:2])
+        if not header and pending:
+            header = pending[-1]
+            if len(pending) > 1 and not title:
+                header, title = pending[0], pending[1]
+
+        # "Senior Architect, Abinbev" names the role first
+        head, sep, tail = header.partition(",")
+        if not title and sep and ROLE_WORDS_PATTERN.search(head):
+            title, header = head, tail
+
+        company, location = _split_name_location(_clean(header))
+        if trailer and not DATE_RANGE_PATTERN.search(trailer):
+            location = trailer
+        months = _months_between(start, end)
+        return {
+            "company": company,
+            "positions": [
+                {
+                    "title": _clean(title),
+                    "location": location,
+                    "duration": f"{_display_date(start)} - {_display_date(end)}",
+                    "start_date": start,
+                    "end_date": _display_date(end),
+                }
+            ],
+            "responsibilities": [],
+            "projects": [],
+            "achievements": [],
+            "skills_used": [],
+            "total_experience_years": round(months / 12, 1),
+            "current": bool(re.fullmatch(_ONGOING, end.strip(), re.IGNORECASE)),
+        }
+
+    def _experience_confidence(
+        self, jobs: list[dict[str, Any]], has_section: bool
+    ) -> float:
+        if not jobs:
+            return 0.0 if has_section else 0.5
+        complete = [
+            bool(job["company"])
+            + bool(job["positions"][0]["title"])
+            + bool(job["total_experience_years"])
+            for job in jobs
+        ]
+        return sum(complete) / (3 * len(jobs))
+
+    # ------------------------------------------------------------------
+    # Skills, education, credentials
+    # ------------------------------------------------------------------
+
+    def _extract_skills(
+        self, text: str, resume_text: str
+    ) -> tuple[list[dict[str, Any]], float]:
+        """Skills from "Category: a, b" lines, else from the skills taxonomy"""
+        categories: dict[str, list[str]] = {}
+        default_category = "Other"
+        for line in text.split("\n"):
+            line = _clean(line)
+            if not line or DATE_RANGE_PATTERN.search(line):
+                continue
+            # Bare sub-heading ("LANGUAGES") names the lines below it
+            if ":" not in line and "," not in line and len(line.split()) <= 3:
+                heading = line.title()
+                default_category = (
+                    "Other"
+                    if re.search(r"skill|technolog|competenc", line, re.IGNORECASE)
+                    else heading
+                )
+                continue
+            category, sep, items = line.partition(":")
+            if not sep or len(category.split()) > 4:
+                category, items = default_category, line
+            names = [
+                _clean(item)
+                for item in re.split(r",|;|•|\|", items)
+                if 0 < len(_clean(item)) <= 40
+            ]
+            if len(names) > 1 or sep:
+                categories.setdefault(category.strip().title(), []).extend(names)
+
+        if categories:
+            skills = [
+                {
+                    "category": category,
+                    "skills": [
+                        {"name": name, "proficiency": ""}
+                        for name in dict.fromkeys(names)
+                    ],
+                }
+                for category, names in categories.items()
+                if names
+            ]
+            return skills, 0.9
+
+        index = DocumentIndex(resume_text.lower())
+        skills = []
+        for category in skills_taxonomy.technical_categories:
+            found = skills_taxonomy.find_skills(index, category)
+            if found:
+                skills.append(
+                    {
+                        "category": category.replace("_", " ").title(),
+                        "skills": [{"name": s, "proficiency": ""} for s in found],
+                    }
+                )
+        return skills, 0.6 if skills else 0.3
+
+    def _education(self, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Education entries from the analyzer's, in the structured schema"""
+        education = []
+        for entry in entries:
+            degree, institution = _split_degree_line(
+                entry["degree_full"], entry["institution"]["name"]
+            )
+            grade = entry["grade"]
+            education.append(
+                {
+                    "degree": degree,
+                    "institution": institution,
+                    "location": entry["institution"]["location"],
+                    "graduation_year": entry["duration"]["end_year"],
+                    "gpa": grade["value"]
+                    + ("%" if grade["type"] == "Percentage" else ""),
+                    "relevant_coursework": [],
+                }
+            )
+        return education
+
+    def _education_confidence(
+        self, education: list[dict[str, Any]], has_section: bool
+    ) -> float:
+        """Share of filled fields; entries whose fields overlap count half"""
+        if not education:
+            return 0.0 if has_section else 0.5
+        fields = ("degree", "institution", "graduation_year")
+        scores = [
+            sum(bool(entry[field]) for field in fields)
+            / len(fields)
+            * (0.5 if _fields_overlap(entry) else 1.0)
+            for entry in education
+        ]
+        return sum(scores) / len(scores)
+
+    def _extract_credentials(
+        self, text: str
+    ) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+        certifications: list[dict[str, str]] = []
+        awards: list[dict[str, str]] = []
+        target = certifications
+        for line in text.split("\n"):
+            content = _clean(line)
+            if not content:
+                continue
+            # Sub-headings switch between certifications and awards
+            if len(content.split()) <= 3:
+                lowered = content.lower()
+                if re.search(r"certif|licen", lowered):
+                    target = certifications
+                    continue
+                if re.search(r"award|achievement|honou?r|publication", lowered):
+                    target = awards
+                    continue
+
+            years = [match.group() for match in YEAR_PATTERN.finditer(content)]
+            name = YEAR_PATTERN.sub("", content).strip(" ,()-–")
+            name, _, issuer = re.sub(r"\(\s*\)", "", name).partition(" - ")
+            entry = {
+                "name": name.strip(" ,"),
+                "issuer": issuer.strip(" ,"),
+                "date": years[-1] if years else "",
+            }
+            if target is certifications:
+                entry["expiry"] = ""
+            else:
+                entry["description"] = ""
+            target.append(entry)
+        return certifications, awards
+
+
+# Global instance
+local_experience_extractor = LocalExperienceExtractor()
@@ -3,10 +3,42 @@ Simplified Project Extractor Service - AI Only
 """
 
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
 # Import centralized AI configuration
-from app.core.ai_config import ai_config, is_gemini_available
+from app.core.ai_config import (
+    GEMINI_RESPONSE_SCHEMA_SUPPORTED,
+    ai_config,
+    is_gemini_available,
+)
+from app.core.deadline import Deadline, gemini_call_options
+from app.core.error_handling import CircuitOpenError, gemini_breaker
+from app.core.metrics import metrics
+from app.services.section_extraction import (
+    GROUP_SCHEMAS,
+    build_prompt,
+    gemini_schema,
+    merge_results,
+    parse_json_object,
+    plan_tasks,
+    validate,
+)
+
+# "sections": one schema-constrained call per resume section, in parallel;
+# "document": one call for the whole resume
+EXTRACTION_STRATEGY = os.getenv("AI_EXTRACTION_STRATEGY", "sections")
+# Extra attempts for a section whose output is malformed
+SECTION_RETRIES = int(os.getenv("EXTRACTION_SECTION_RETRIES", "1"))
+
+# Shared pool for concurrent section extraction
+_section_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("EXTRACTION_SECTION_WORKERS", "5")),
+    thread_name_prefix="section-extraction",
+)
 
 
 class ProjectExtractor:
@@ -18,22 +50,172 @@ class ProjectExtractor:
         # Initialize AI configuration
         gemini_available, _ = ai_config.initialize()
 
-        self.model = None
+        # Gemini GenerativeModel; callers check it is set before extracting
+        self.model: Any = None
         if gemini_available:
             self.model = ai_config.get_gemini_model()
             print("✅ Project Extractor: Google Gemini configured")
         else:
             print("ℹ️  Project Extractor: Google Gemini not available")
 
-    def extract_structured_experience(self, resume_text: str) -> dict[str, Any]:
+    def extract_structured_experience(
+        self,
+        resume_text: str,
+        deadline: Deadline | None = None,
+        strategy: str | None = None,
+    ) -> dict[str, Any]:
         """
         Use AI to extract and structure work experience
+        (Gemini calls are bounded by the request deadline, if any)
+
+        Args:
+            resume_text: Resume text
+            deadline: Optional request deadline
+            strategy: "sections" or "document" (default AI_EXTRACTION_STRATEGY).
+                Resumes without recognisable sections use "document".
+
+        Returns:
+            Structured resume data (work experience, skills, education, ...)
+        """
+        if not is_gemini_available() or not self.model:
+            raise Exception(
+                "AI work experience extraction is required. Please configure GEMINI_API_KEY environment variable"
+            )
+
+        if (strategy or EXTRACTION_STRATEGY) == "sections":
+            tasks = plan_tasks(resume_text)
+            if len(tasks) > 1:
+                return self._extract_by_section(tasks, deadline)
+
+        return self._extract_whole_document(resume_text, deadline)
+
+    def extract_sections(
+        self,
+        resume_text: str,
+        groups: list[str],
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """
+        Extract only the sections of the given groups (for hybrid extraction)
+
+        Returns:
+            Merged section data (only the groups' keys are meaningful), or {}
+            if the resume has no section of those groups
         """
         if not is_gemini_available() or not self.model:
             raise Exception(
                 "AI work experience extraction is required. Please configure GEMINI_API_KEY environment variable"
             )
 
+        tasks = [task for task in plan_tasks(resume_text) if task["group"] in groups]
+        if not tasks:
+            return {}
+        return self._extract_by_section(tasks, deadline)
+
+    def _extract_by_section(
+        self, tasks: list[dict[str, Any]], deadline: Deadline | None
+    ) -> dict[str, Any]:
+        """
+        Extract every section concurrently and merge the results
+
+        A section that fails or stays malformed after its retries is left out
+        (and reported) instead of failing the whole document.
+        """
+        start = time.perf_counter()
+        futures = [
+            _section_executor.submit(self._extract_section, task, deadline)
+            for task in tasks
+        ]
+
+        parts, retried, failed = [], [], []
+        for task, future in zip(tasks, futures, strict=True):
+            label = "+".join(task["sections"])
+            try:
+                data, attempts = future.result(
+                    timeout=deadline.timeout_s() if deadline else None
+                )
+            except CircuitOpenError:
+                for pending in futures:
+                    pending.cancel()
+                raise
+            except FutureTimeoutError:
+                print(f"⏱️  Section extraction overran the deadline: {label}")
+                failed.append(label)
+                continue
+            except Exception as e:
+                print(f"⚠️  Section extraction failed ({label}): {e}")
+                failed.append(label)
+                continue
+            if attempts > 1:
+                retried.append(label)
+            parts.append(data)
+
+        metrics.observe(
+            "extraction.sections_ms",
+            (time.perf_counter() - start) * 1000,
+            buckets=(500, 1000, 2000, 4000, 8000, 16000, 32000),
+        )
+        if not parts:
+            raise Exception("AI work experience extraction failed for every section")
+
+        structured_data = merge_results(parts)
+        structured_data["extraction"] = {
+            "strategy": "sections",
+            "sections": len(tasks),
+            "retried_sections": retried,
+            "failed_sections": failed,
+        }
+        print(
+            f"✅ AI section extraction successful - {len(tasks)} sections, "
+            f"{len(structured_data['work_experience'])} work experience entries"
+        )
+        return structured_data
+
+    def _extract_section(
+        self, task: dict[str, Any], deadline: Deadline | None
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Extract one section with its group's schema, retrying malformed output
+
+        Returns:
+            (section data, attempts used)
+
+        Raises:
+            ValueError: If the output is still malformed after the retries
+        """
+        schema = GROUP_SCHEMAS[task["group"]]
+        generation_config: dict[str, Any] = {"temperature": 0.1}
+        if GEMINI_RESPONSE_SCHEMA_SUPPORTED:
+            generation_config["response_mime_type"] = "application/json"
+            generation_config["response_schema"] = gemini_schema(schema)
+
+        errors: list[str] = []
+        for attempt in range(1, SECTION_RETRIES + 2):
+            if attempt > 1:
+                metrics.increment("extraction.section_retries")
+            response = gemini_breaker.call(
+                self.model.generate_content,
+                build_prompt(task, errors),
+                generation_config=generation_config,
+                **gemini_call_options(deadline),
+            )
+            try:
+                data = parse_json_object(response.text)
+                errors = validate(data, schema)
+            except (TypeError, ValueError) as e:
+                errors = [str(e)]
+            if not errors:
+                return data, attempt
+
+        metrics.increment("extraction.section_failures")
+        raise ValueError("; ".join(errors[:3]))
+
+    def _extract_whole_document(
+        self, resume_text: str, deadline: Deadline | None
+    ) -> dict[str, Any]:
+        """
+        Extract everything with one prompt over the whole resume
+        """
         try:
             # Enhanced prompt with proper time calculation
             prompt = f"""Extract ALL work experience from this resume. Calculate exact time periods and identify current company. Return ONLY valid JSON.
@@ -149,7 +331,11 @@ CRITICAL RULES:
 Resume text:
 {resume_text}"""
 
-            response = self.model.generate_content(prompt)
+            response = gemini_breaker.call(
+                self.model.generate_content,
+                prompt,
+                **gemini_call_options(deadline),
+            )
 
             if not response or not response.text:
                 raise Exception("AI failed to generate response")
@@ -179,6 +365,8 @@ Resume text:
                 print(f"Raw response: {json_text[:500]}...")
                 raise Exception(f"AI generated invalid JSON: {e}")
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"❌ AI extraction error: {e}")
             raise Exception(f"AI work experience extraction failed: {e}")
@@ -0,0 +1,148 @@
+"""
+Per-Document Extraction Artifacts
+Everything extracted from one resume text (structured experience, section
+categorization, skills) computed once and cached by content hash, so the
+analyzer, the structured-experience output and the improvement planner
+consume the same facts instead of re-deriving them
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.core.metrics import metrics
+
+EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", "64"))
+
+
+def content_hash(text: str) -> str:
+    """Cache key of a resume text"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def categorized_facet(layout: dict[str, Any] | None = None) -> str:
+    """
+    Facet name of a section categorization, which also depends on the PDF
+    layout it was computed with ("categorized" for text only)
+    """
+    if not layout:
+        return "categorized"
+    return "categorized:" + content_hash(
+        json.dumps(layout, sort_keys=True, default=str)
+    )
+
+
+class ResumeExtraction:
+    """
+    Extraction artifact of one resume text
+
+    Facets ("categorized", "skills", "structured:<mode>", ...) are computed
+    on first use and kept; concurrent requests for the same facet wait for
+    the first computation instead of repeating it.
+    """
+
+    def __init__(self, text: str, digest: str):
+        self.text = text
+        self.content_hash = digest
+        self._facets: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._facet_locks: dict[str, threading.Lock] = {}
+
+    def has(self, name: str) -> bool:
+        return name in self._facets
+
+    def peek(self, name: str, default: Any = None) -> Any:
+        """A facet if it has been computed (never computes)"""
+        return self._facets.get(name, default)
+
+    def peek_latest(self, name: str, default: Any = None) -> Any:
+        """
+        The most recently computed facet named name or "name:<variant>"
+        (never computes)
+        """
+        for facet_name in reversed(list(self._facets)):
+            if facet_name == name or facet_name.startswith(name + ":"):
+                return self._facets[facet_name]
+        return default
+
+    def facet(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        keep: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Get a facet, computing it once
+
+        Args:
+            name: Facet name
+            compute: Builds the facet from the text
+            keep: Optional check whether a result may be cached (e.g. not
+                a deadline-degraded fallback); rejected results are returned
+                but computed again next time
+
+        Returns:
+            The facet value
+        """
+        if name in self._facets:
+            metrics.increment("extraction_cache.facet_hits")
+            return self._facets[name]
+
+        with self._lock:
+            facet_lock = self._facet_locks.setdefault(name, threading.Lock())
+        with facet_lock:
+            if name in self._facets:
+                metrics.increment("extraction_cache.facet_hits")
+                return self._facets[name]
+            metrics.increment("extraction_cache.facet_misses")
+            value = compute()
+            if keep is None or keep(value):
+                self._facets[name] = value
+            return value
+
+
+class ExtractionCache:
+    """LRU cache of extraction artifacts keyed by content hash"""
+
+    def __init__(self, max_documents: int = EXTRACTION_CACHE_SIZE):
+        self.max_documents = max_documents
+        self._documents: OrderedDict[str, ResumeExtraction] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, text: str) -> ResumeExtraction:
+        """Artifact of a resume text (created empty on first sight)"""
+        digest = content_hash(text)
+        with self._lock:
+            artifact = self._documents.get(digest)
+            if artifact is not None:
+                self._documents.move_to_end(digest)
+                metrics.increment("extraction_cache.hits")
+                return artifact
+
+            metrics.increment("extraction_cache.misses")
+            artifact = ResumeExtraction(text, digest)
+            if self.max_documents > 0:
+                self._documents[digest] = artifact
+                while len(self._documents) > self.max_documents:
+                    self._documents.popitem(last=False)
+            return artifact
+
+    def find(self, digest: str) -> ResumeExtraction | None:
+        """Cached artifact by content hash, if any"""
+        with self._lock:
+            return self._documents.get(digest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+
+
+# Global instance
+resume_extractions = ExtractionCache()
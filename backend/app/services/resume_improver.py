@@ -4,7 +4,10 @@ Generates specific, actionable suggestions to boost ATS score
 """
 
 import logging
+import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
 from ..types.common_types import ATSAnalysisResult, ExtractionResult
@@ -13,6 +16,70 @@ logger = logging.getLogger(__name__)
 
 # Import centralized AI configuration
 from app.core.ai_config import ai_config
+from app.core.deadline import TIER_FULL, Deadline, choose_tier, gemini_call_options
+from app.core.error_handling import gemini_breaker
+from app.services.resume_extraction import content_hash, resume_extractions
+from app.services.skills_taxonomy import skills_taxonomy
+
+# Gemini content checks, run concurrently before the generators need them
+AI_CHECKS = (
+    "bullet_points",
+    "quantified_achievements",
+    "professional_summary",
+    "contact_info",
+)
+# Longest wait for the AI checks (less if the request deadline is closer)
+IMPROVEMENT_AI_BUDGET_MS = float(os.getenv("IMPROVEMENT_AI_BUDGET_MS", "10000"))
+
+# Shared pool for the AI checks of all improvement plans
+_ai_check_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("IMPROVEMENT_AI_WORKERS", "4")),
+    thread_name_prefix="improvement-ai",
+)
+
+
+class _AIChecks:
+    """
+    AI checks of one plan, started together and awaited within one shared
+    budget; a check that fails or misses the budget yields None and its
+    generator uses the rule-based result
+
+    The checks run under their own deadline (the shared budget), which
+    bounds each Gemini call, so a check that misses the budget does not
+    hold its worker or keep calling Gemini after the plan is returned.
+    """
+
+    def __init__(
+        self, futures: dict[str, Future], deadline: Deadline, check_deadline: Deadline
+    ):
+        self._pending = futures
+        self._results: dict[str, dict[str, Any] | None] = {}
+        self.deadline = deadline
+        self.check_deadline = check_deadline
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        if name in self._results:
+            return self._results[name]
+        future = self._pending.get(name)
+        result = None
+        if future is not None:
+            stage = f"improvement.{name}"
+            try:
+                result = future.result(timeout=self.check_deadline.timeout_s())
+            except FutureTimeoutError:
+                future.cancel()
+                self.deadline.degrade(stage, "rule_based", "timeout")
+            else:
+                if result is None:
+                    self.deadline.degrade(stage, "rule_based", "error")
+                else:
+                    self.deadline.record(stage, "ai")
+        self._results[name] = result
+        return result
+
+    @property
+    def used_ai(self) -> bool:
+        return any(result is not None for result in self._results.values())
 
 
 class ResumeImprover:
@@ -30,61 +97,77 @@ class ResumeImprover:
         else:
             print("⚠️  Resume Improver: Google Gemini not available")
 
+    @property
+    def ai_enabled(self) -> bool:
+        """Gemini configured and its circuit not open"""
+        return self.use_ai and not gemini_breaker.is_open
+
     def generate_improvement_plan(
         self,
         analysis_result: ATSAnalysisResult,
         extracted_data: ExtractionResult,
         job_description: str | None = None,
+        deadline: Deadline | None = None,
     ) -> dict[str, Any]:
         """
         Generate comprehensive ATS-focused improvement plan
 
+        The Gemini checks start together up front; the rule-based generators
+        run while they are in flight, and each AI-backed generator falls back
+        to its rule-based result if its check is not back within the deadline.
+
         Args:
             analysis_result: ATS analysis results
             extracted_data: Extracted resume data
             job_description: Optional job description for targeted suggestions
+            deadline: Optional request deadline (the AI checks also stop
+                waiting after IMPROVEMENT_AI_BUDGET_MS)
 
         Returns:
             Dictionary with improvements, summary, and quick wins
         """
         try:
-            improvements = []
+            ai_checks = self._start_ai_checks(analysis_result, deadline or Deadline())
+            formatting_analysis = extracted_data.get("formatting_analysis", {})
 
+            # Rule-based generators (while the AI checks run)
             # 1. ATS Compatibility Improvements (Highest Priority)
-            improvements.extend(
-                self._generate_ats_improvements(
-                    extracted_data.get("formatting_analysis", {}), analysis_result
-                )
+            ats_improvements = self._generate_ats_improvements(
+                formatting_analysis, analysis_result
             )
-
             # 2. Keyword Optimization (Critical for ATS)
-            improvements.extend(
-                self._generate_keyword_improvements(analysis_result, job_description)
+            keyword_improvements = self._generate_keyword_improvements(
+                analysis_result, job_description
+            )
+            # 6. AI-Powered Missing Elements Analysis
+            missing_element_improvements = self._generate_ai_powered_improvements(
+                analysis_result, extracted_data
             )
 
+            improvements = ats_improvements + keyword_improvements
+
             # 3. Formatting Improvements (ATS Parsing)
             improvements.extend(
                 self._generate_formatting_improvements(
-                    extracted_data.get("formatting_analysis", {}),
-                    extracted_data,
-                    analysis_result,
+                    formatting_analysis, extracted_data, analysis_result, ai_checks
                 )
             )
 
             # 4. Content Quality (ATS + Human Readability)
             improvements.extend(
-                self._generate_content_improvements(extracted_data, analysis_result)
+                self._generate_content_improvements(
+                    extracted_data, analysis_result, ai_checks
+                )
             )
 
             # 5. Structure Improvements (ATS Navigation)
             improvements.extend(
-                self._generate_structure_improvements(extracted_data, analysis_result)
+                self._generate_structure_improvements(
+                    extracted_data, analysis_result, ai_checks
+                )
             )
 
-            # 6. AI-Powered Missing Elements Analysis
-            improvements.extend(
-                self._generate_ai_powered_improvements(analysis_result, extracted_data)
-            )
+            improvements.extend(missing_element_improvements)
 
             # Sort by ATS impact and priority
             priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
@@ -102,9 +185,9 @@ class ResumeImprover:
                 "improvements": improvements,
                 "summary": summary,
                 "quick_wins": quick_wins,
-                "ai_analysis_available": self.use_ai,
+                "ai_analysis_available": self.ai_enabled,
                 "analysis_method": (
-                    "AI-powered" if self.use_ai else "Rule-based fallback"
+                    "AI-powered" if ai_checks.used_ai else "Rule-based fallback"
                 ),
             }
 
@@ -122,6 +205,50 @@ class ResumeImprover:
                 "analysis_method": "Error occurred",
             }
 
+    def _start_ai_checks(
+        self, analysis_result: ATSAnalysisResult, deadline: Deadline
+    ) -> _AIChecks:
+        """Submit every AI check of a plan (none without AI, text or budget)"""
+        resume_text = self._resume_text(analysis_result)
+        check_deadline = Deadline(deadline.budget_for(IMPROVEMENT_AI_BUDGET_MS))
+        futures: dict[str, Future] = {}
+        if (
+            self.ai_enabled
+            and resume_text
+            and choose_tier(deadline, "improvement_ai_checks") == TIER_FULL
+        ):
+            futures = {
+                name: _ai_check_executor.submit(
+                    self._ai_analyze_resume_content, resume_text, name, check_deadline
+                )
+                for name in AI_CHECKS
+            }
+        return _AIChecks(futures, deadline, check_deadline)
+
+    def _resume_text(self, analysis_result: ATSAnalysisResult | None) -> str:
+        """Full resume text of an analysis (empty if not included)"""
+        if analysis_result and analysis_result.get("extraction_details"):
+            return analysis_result["extraction_details"].get("full_resume_text", "")
+        return ""
+
+    def with_document_extraction(
+        self, analysis_result: ATSAnalysisResult, extracted_data: ExtractionResult
+    ) -> ExtractionResult:
+        """
+        Use the categorization the analyzer extracted for the analysed resume
+        (looked up by content hash) instead of the client's copy
+        """
+        details: Any = analysis_result.get("extraction_details") or {}
+        text = details.get("full_resume_text") if isinstance(details, dict) else None
+        if not text:
+            return extracted_data
+        extraction = resume_extractions.find(content_hash(text))
+        categorized = extraction.peek_latest("categorized") if extraction else None
+        if not categorized:
+            return extracted_data
+        merged: Any = {**extracted_data, **categorized}
+        return merged
+
     def _generate_keyword_improvements(
         self, analysis_result: ATSAnalysisResult, job_description: str | None = None
     ) -> list[dict[str, Any]]:
@@ -203,6 +330,7 @@ class ResumeImprover:
         formatting_analysis: dict[str, Any],
         extracted_data: ExtractionResult,
         analysis_result: ATSAnalysisResult,
+        ai_checks: _AIChecks | None = None,
     ) -> list[dict[str, Any]]:
         """Generate formatting-specific improvements"""
         improvements = []
@@ -211,15 +339,8 @@ class ResumeImprover:
         bullet_points = formatting_analysis.get("bullet_points", {})
         bullet_detected = bullet_points.get("detected", False)
 
-        # Get resume text for AI analysis
-        resume_text = ""
-        if analysis_result and analysis_result.get("extraction_details"):
-            resume_text = analysis_result["extraction_details"].get(
-                "full_resume_text", ""
-            )
-
-        if self.use_ai and resume_text:
-            ai_analysis = self._ai_analyze_resume_content(resume_text, "bullet_points")
+        ai_analysis = ai_checks.get("bullet_points") if ai_checks else None
+        if ai_analysis is not None:
             bullet_detected = (
                 ai_analysis.get("found", False)
                 and ai_analysis.get("confidence", 0) > 70
@@ -447,11 +568,22 @@ class ResumeImprover:
         return word_count
 
     def _ai_analyze_resume_content(
-        self, resume_text: str, analysis_type: str
-    ) -> dict[str, Any]:
-        """Use AI to analyze resume content for specific information"""
-        if not self.use_ai or not resume_text:
-            return {"found": False, "confidence": 0, "details": ""}
+        self, resume_text: str, analysis_type: str, deadline: Deadline | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Use AI to analyze resume content for specific information
+
+        Returns:
+            The parsed AI verdict, or None if AI is unavailable, the deadline
+            has passed (e.g. while the check was queued) or the call or its
+            JSON failed (callers use their rule-based check)
+        """
+        if (
+            not self.ai_enabled
+            or not resume_text
+            or (deadline is not None and deadline.expired)
+        ):
+            return None
 
         try:
             if analysis_type == "contact_info":
@@ -546,13 +678,11 @@ class ResumeImprover:
                 """
 
             else:
-                return {
-                    "found": False,
-                    "confidence": 0,
-                    "details": "Unknown analysis type",
-                }
+                return None
 
-            response = self.model.generate_content(prompt)
+            response = gemini_breaker.call(
+                self.model.generate_content, prompt, **gemini_call_options(deadline)
+            )
 
             # Try to parse JSON response
             import json
@@ -564,29 +694,21 @@ class ResumeImprover:
                 json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
                 if json_match:
                     return json.loads(json_match.group())
-                else:
-                    return {
-                        "found": False,
-                        "confidence": 0,
-                        "details": "Could not parse AI response",
-                    }
+                logger.warning(f"Could not parse AI response for {analysis_type}")
+                return None
             except json.JSONDecodeError:
-                return {
-                    "found": False,
-                    "confidence": 0,
-                    "details": "Invalid JSON response from AI",
-                }
+                logger.warning(f"Invalid JSON response from AI for {analysis_type}")
+                return None
 
         except Exception as e:
             logger.warning(f"AI analysis failed for {analysis_type}: {e}")
-            return {
-                "found": False,
-                "confidence": 0,
-                "details": f"AI analysis error: {e!s}",
-            }
+            return None
 
     def _generate_content_improvements(
-        self, extracted_data: ExtractionResult, analysis_result: ATSAnalysisResult
+        self,
+        extracted_data: ExtractionResult,
+        analysis_result: ATSAnalysisResult,
+        ai_checks: _AIChecks | None = None,
     ) -> list[dict[str, Any]]:
         """Generate content-specific improvements"""
         improvements = []
@@ -595,17 +717,8 @@ class ResumeImprover:
         # Check for quantifiable achievements - use AI analysis if available
         has_numbers = False
 
-        # Get resume text for AI analysis
-        resume_text = ""
-        if analysis_result and analysis_result.get("extraction_details"):
-            resume_text = analysis_result["extraction_details"].get(
-                "full_resume_text", ""
-            )
-
-        if self.use_ai and resume_text:
-            ai_analysis = self._ai_analyze_resume_content(
-                resume_text, "quantified_achievements"
-            )
+        ai_analysis = ai_checks.get("quantified_achievements") if ai_checks else None
+        if ai_analysis is not None:
             has_numbers = (
                 ai_analysis.get("found", False)
                 and ai_analysis.get("confidence", 0) > 70
@@ -761,25 +874,17 @@ class ResumeImprover:
         self,
         extracted_data: ExtractionResult,
         analysis_result: ATSAnalysisResult | None = None,
+        ai_checks: _AIChecks | None = None,
     ) -> list[dict[str, Any]]:
         """Generate structure-specific improvements"""
         improvements = []
 
-        # Get resume text for AI analysis
-        resume_text = ""
-        if analysis_result and analysis_result.get("extraction_details"):
-            resume_text = analysis_result["extraction_details"].get(
-                "full_resume_text", ""
-            )
-
         # Check if summary exists - use AI analysis if available
         summary = extracted_data.get("summary_profile")
         summary_exists = False
 
-        if self.use_ai and resume_text:
-            ai_analysis = self._ai_analyze_resume_content(
-                resume_text, "professional_summary"
-            )
+        ai_analysis = ai_checks.get("professional_summary") if ai_checks else None
+        if ai_analysis is not None:
             summary_exists = (
                 ai_analysis.get("found", False)
                 and ai_analysis.get("confidence", 0) > 70
@@ -834,19 +939,25 @@ class ResumeImprover:
             missing_contact.append("location (city, state)")
 
         # If AI is available and we found missing contact info, double-check with AI
-        if self.use_ai and resume_text and missing_contact:
-            ai_analysis = self._ai_analyze_resume_content(resume_text, "contact_info")
+        contact_analysis = ai_checks.get("contact_info") if ai_checks else None
+        if contact_analysis is not None and missing_contact:
             if (
-                ai_analysis.get("found", False)
-                and ai_analysis.get("confidence", 0) > 70
+                contact_analysis.get("found", False)
+                and contact_analysis.get("confidence", 0) > 70
             ):
                 # AI found contact info, remove from missing list if AI confirms it exists
-                if ai_analysis.get("email_found", False) and "email" in missing_contact:
+                if (
+                    contact_analysis.get("email_found", False)
+                    and "email" in missing_contact
+                ):
                     missing_contact.remove("email")
-                if ai_analysis.get("phone_found", False) and "phone" in missing_contact:
+                if (
+                    contact_analysis.get("phone_found", False)
+                    and "phone" in missing_contact
+                ):
                     missing_contact.remove("phone")
                 if (
-                    ai_analysis.get("location_found", False)
+                    contact_analysis.get("location_found", False)
                     and "location (city, state)" in missing_contact
                 ):
                     missing_contact.remove("location (city, state)")
@@ -872,9 +983,8 @@ class ResumeImprover:
 
         # Check for LinkedIn profile - use AI analysis if available
         linkedin_missing = False
-        if self.use_ai and resume_text:
-            ai_analysis = self._ai_analyze_resume_content(resume_text, "contact_info")
-            linkedin_missing = not ai_analysis.get("linkedin_found", False)
+        if contact_analysis is not None:
+            linkedin_missing = not contact_analysis.get("linkedin_found", False)
         else:
             # Fallback to original logic
             linkedin = contact.get("linkedin", {})
@@ -1107,16 +1217,10 @@ class ResumeImprover:
             ).lower()
 
             # Basic alignment check (can be enhanced with more sophisticated analysis)
-            if job_type.lower() in ["software engineer", "developer", "programmer"]:
-                tech_keywords = [
-                    "code",
-                    "develop",
-                    "program",
-                    "software",
-                    "application",
-                    "system",
-                ]
-                if not any(keyword in experience_text for keyword in tech_keywords):
+            # Typical experience wording per role comes from the skills taxonomy
+            role = skills_taxonomy.find_role(job_type)
+            if role and role.experience_terms:
+                if not any(term in experience_text for term in role.experience_terms):
                     improvements.append(
                         {
                             "id": "ai-002",
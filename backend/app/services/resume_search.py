@@ -0,0 +1,255 @@
+"""
+Resume Search
+Persists analyzed resumes with their chunk embeddings in the local vector
+index and finds the best stored resumes for a job description
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.core.ai_config import ai_config
+from app.core.metrics import metrics
+from app.services.semantic_matcher import (
+    chunk_document,
+    extract_requirements,
+    semantic_matcher,
+)
+from app.services.vector_index import HEADER_FILE, VectorIndex
+
+DEFAULT_INDEX_DIR = (
+    Path(__file__).resolve().parent.parent.parent / "data" / "resume_index"
+)
+
+HIGHLIGHTS_PER_RESUME = 3
+
+
+def resume_document_id(text: str) -> str:
+    """Stable ID of a resume (hash of its text)"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class ResumeSearch:
+    """
+    Candidate search over stored resumes
+
+    Resumes are split with the same section-aware chunker as the semantic
+    matcher, so a search ranks resumes by the same rule: the mean over JD
+    requirements of the best-matching resume chunk.
+    """
+
+    def __init__(self, directory: Path, **index_options):
+        """
+        Args:
+            directory: Vector index directory
+            index_options: VectorIndex options (dtype, mode, nprobe, ...)
+        """
+        self.directory = directory
+        self.index_options = index_options
+        self._index: VectorIndex | None = None
+        self._lock = threading.Lock()
+
+    def _get_index(self) -> VectorIndex | None:
+        """Open the existing index, if any (its dimension is in the header)"""
+        if self._index is None:
+            header_path = self.directory / HEADER_FILE
+            if not header_path.exists():
+                return None
+            header = json.loads(header_path.read_text(encoding="utf-8"))
+            return self._open_index(header["dim"])
+        return self._index
+
+    def _open_index(self, dim: int) -> VectorIndex:
+        """Open or create the index (its dimension comes from the embeddings)"""
+        with self._lock:
+            if self._index is None or self._index.dim != dim:
+                self._index = VectorIndex.open(
+                    self.directory, dim, **self.index_options
+                )
+            return self._index
+
+    def add_resume(
+        self, model, text: str, metadata: dict[str, Any] | None = None
+    ) -> str | None:
+        """
+        Chunk, embed and store a resume (re-adding replaces the old entry)
+
+        Chunks are embedded through the semantic matcher's embedding cache,
+        so a resume that was just analyzed reuses its chunk embeddings.
+
+        Args:
+            model: Embedding model exposing encode()
+            text: Resume text (original case)
+            metadata: Display metadata (filename, detected job, score, ...)
+
+        Returns:
+            Document ID, or None if the resume had no indexable text
+        """
+        chunks = chunk_document(text, semantic_matcher.chunk_tokens)
+        if not chunks:
+            return None
+
+        start = time.perf_counter()
+        embeddings = semantic_matcher.encode(model, [c["text"] for c in chunks])
+        document_id = resume_document_id(text)
+
+        index = self._open_index(embeddings.shape[1])
+        index.add(
+            document_id,
+            embeddings,
+            payloads=chunks,
+            metadata={**(metadata or {}), "indexed_at": time.time()},
+        )
+        metrics.observe(
+            "resume_index.add_ms",
+            (time.perf_counter() - start) * 1000,
+            buckets=(10, 50, 100, 250, 500, 1000),
+        )
+        return document_id
+
+    def remove(self, document_id: str) -> bool:
+        """Delete a stored resume"""
+        index = self._get_index()
+        return bool(index and index.delete(document_id))
+
+    def get(self, document_id: str) -> dict[str, Any] | None:
+        """Stored metadata and chunks of a resume"""
+        index = self._get_index()
+        document = index.get(document_id) if index else None
+        if document is None:
+            return None
+        return {
+            "document_id": document_id,
+            "metadata": document["metadata"],
+            "chunks": document["payloads"],
+        }
+
+    def search(self, model, jd_text: str, top_k: int = 50) -> list[dict[str, Any]]:
+        """
+        Best stored resumes for a job description
+
+        Args:
+            model: Embedding model exposing encode()
+            jd_text: Job description text
+            top_k: Number of resumes to return
+
+        Returns:
+            Resumes best first, with score (0-100), metadata and the resume
+            chunks that best match the JD's requirements
+        """
+        index = self._get_index()
+        if not index or not len(index):
+            return []
+
+        start = time.perf_counter()
+        requirements = extract_requirements(jd_text, semantic_matcher.chunk_tokens)
+        if not requirements:
+            requirements = [jd_text.strip()]
+        queries = semantic_matcher.encode(model, requirements)
+
+        results = []
+        for document in index.search_documents(queries, top_k):
+            similarity = document["score"]
+            results.append(
+                {
+                    "document_id": document["key"],
+                    "similarity": round(similarity, 3),
+                    "score": round(similarity * 100, 1),
+                    "metadata": document["metadata"],
+                    "highlights": self._highlights(
+                        document["row_scores"], document["payloads"], requirements
+                    ),
+                }
+            )
+
+        metrics.observe(
+            "resume_index.search_ms",
+            (time.perf_counter() - start) * 1000,
+            buckets=(5, 10, 25, 50, 100, 250, 500),
+        )
+        return results
+
+    def _highlights(
+        self,
+        scores: np.ndarray,
+        payloads: list[dict[str, Any]],
+        requirements: list[str],
+    ) -> list[dict[str, Any]]:
+        """Best-matching chunk for the requirements this resume covers best"""
+        best_rows = scores.argmax(axis=1)
+        best_scores = scores.max(axis=1)
+
+        highlights = []
+        for q in np.argsort(-best_scores)[:HIGHLIGHTS_PER_RESUME]:
+            chunk = payloads[best_rows[q]]
+            highlights.append(
+                {
+                    "requirement": requirements[q],
+                    "section": chunk.get("section"),
+                    "text": chunk.get("text", "")[:200],
+                    "similarity": round(float(best_scores[q]), 3),
+                }
+            )
+        return highlights
+
+    def stats(self) -> dict[str, Any]:
+        index = self._get_index()
+        if not index:
+            return {"documents": 0, "directory": str(self.directory)}
+        return {**index.stats(), "directory": str(self.directory)}
+
+
+def is_indexing_enabled() -> bool:
+    """
+    Check whether analyzed resumes may be stored (RESUME_INDEX_ENABLED, off
+    by default); each upload must also opt in with index_consent
+    """
+    return os.getenv("RESUME_INDEX_ENABLED", "false").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+# Global resume search instance (index opened on first use)
+_resume_search: ResumeSearch | None = None
+_resume_search_lock = threading.Lock()
+
+
+def get_resume_search() -> ResumeSearch:
+    """Get the shared resume search service"""
+    global _resume_search
+    if _resume_search is None:
+        with _resume_search_lock:
+            if _resume_search is None:
+                _resume_search = ResumeSearch(
+                    Path(os.getenv("RESUME_INDEX_DIR", str(DEFAULT_INDEX_DIR))),
+                    dtype=os.getenv("RESUME_INDEX_DTYPE", "float16"),
+                    mode=os.getenv("RESUME_INDEX_MODE", "auto"),
+                    nprobe=int(os.getenv("RESUME_INDEX_NPROBE", "8")),
+                    ivf_min_vectors=int(
+                        os.getenv("RESUME_INDEX_IVF_MIN_VECTORS", "20000")
+                    ),
+                )
+    return _resume_search
+
+
+def index_analyzed_resume(text: str, metadata: dict[str, Any]) -> None:
+    """
+    Store an analyzed resume for candidate search (runs as a background task)
+    """
+    model = ai_config.get_embeddings_model()
+    if model is None or not text.strip():
+        return
+    try:
+        get_resume_search().add_resume(model, text, metadata)
+        metrics.increment("resume_index.added")
+    except Exception as e:
+        print(f"⚠️  Could not index resume: {e}")
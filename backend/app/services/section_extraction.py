@@ -0,0 +1,362 @@
+"""
+Section-Parallel Extraction Helpers
+Splits a resume into per-section extraction tasks, each with the JSON schema
+of its section group, and validates and merges the per-section results
+"""
+
+import json
+import os
+import re
+from typing import Any
+
+from app.services.semantic_matcher import split_sections
+
+# Largest section block sent in one extraction call
+MAX_TASK_CHARS = int(os.getenv("EXTRACTION_SECTION_MAX_CHARS", "6000"))
+MIN_SECTION_CHARS = 20
+
+
+# ============================================================================
+# SCHEMAS (JSON Schema subset supported by Gemini response_schema)
+# ============================================================================
+
+
+def _object(**properties: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "object", "properties": properties}
+
+
+def _array(items: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "array", "items": items}
+
+
+_STRING = {"type": "string"}
+_STRINGS = _array(_STRING)
+
+CONTACT_INFO_SCHEMA = _object(
+    full_name=_STRING,
+    email=_STRING,
+    phone=_STRING,
+    location=_STRING,
+    linkedin=_STRING,
+    github=_STRING,
+    portfolio=_STRING,
+)
+SKILLS_SCHEMA = _array(
+    _object(
+        category=_STRING,
+        skills=_array(_object(name=_STRING, proficiency=_STRING)),
+    )
+)
+WORK_EXPERIENCE_SCHEMA = _array(
+    _object(
+        company=_STRING,
+        positions=_array(
+            _object(
+                title=_STRING,
+                location=_STRING,
+                duration=_STRING,
+                start_date=_STRING,
+                end_date=_STRING,
+            )
+        ),
+        responsibilities=_STRINGS,
+        projects=_array(
+            _object(
+                name=_STRING,
+                description=_STRING,
+                technologies=_STRINGS,
+                achievements=_STRINGS,
+            )
+        ),
+        achievements=_STRINGS,
+        skills_used=_STRINGS,
+        total_experience_years={"type": "number"},
+        current={"type": "boolean"},
+    )
+)
+EDUCATION_SCHEMA = _array(
+    _object(
+        degree=_STRING,
+        institution=_STRING,
+        location=_STRING,
+        graduation_year=_STRING,
+        gpa=_STRING,
+        relevant_coursework=_STRINGS,
+    )
+)
+CERTIFICATIONS_SCHEMA = _array(
+    _object(name=_STRING, issuer=_STRING, date=_STRING, expiry=_STRING)
+)
+AWARDS_SCHEMA = _array(
+    _object(name=_STRING, issuer=_STRING, date=_STRING, description=_STRING)
+)
+AUTOMATIONS_SCHEMA = _array(
+    _object(name=_STRING, description=_STRING, technologies=_STRINGS, impact=_STRING)
+)
+
+
+def _group_schema(**properties: dict[str, Any]) -> dict[str, Any]:
+    schema = _object(**properties)
+    schema["required"] = list(properties)
+    return schema
+
+
+# One schema per section group (top-level keys of the structured result)
+GROUP_SCHEMAS: dict[str, dict[str, Any]] = {
+    "profile": _group_schema(summary=_STRING, contact_info=CONTACT_INFO_SCHEMA),
+    "experience": _group_schema(
+        work_experience=WORK_EXPERIENCE_SCHEMA, automations=AUTOMATIONS_SCHEMA
+    ),
+    "skills": _group_schema(skills=SKILLS_SCHEMA),
+    "education": _group_schema(education=EDUCATION_SCHEMA),
+    "credentials": _group_schema(
+        certifications=CERTIFICATIONS_SCHEMA, awards=AWARDS_SCHEMA
+    ),
+}
+
+GROUP_INSTRUCTIONS = {
+    "profile": "the professional summary and the contact details",
+    "experience": (
+        "every company and position with exact dates (group positions at the "
+        "same company, mark the current one with current: true, "
+        "total_experience_years as a decimal), responsibilities (daily tasks) "
+        "separate from achievements (measurable results), projects, the "
+        "technologies used and any automation projects with their impact"
+    ),
+    "skills": "every skill grouped by category, with proficiency when stated",
+    "education": "every degree with institution, dates, GPA and coursework",
+    "credentials": "certifications (issuer, dates) and awards",
+}
+
+# Section heading (see semantic_matcher.SECTION_HEADINGS) -> group (None =
+# not extracted). Unknown headings are usually the candidate's name at the
+# top, later employers or project names in capitals.
+SECTION_GROUPS: dict[str, str | None] = {
+    "header": "profile",
+    "summary": "profile",
+    "profile": "profile",
+    "objective": "profile",
+    "experience": "experience",
+    "employment": "experience",
+    "work history": "experience",
+    "projects": "experience",
+    "responsibilities": "experience",
+    "volunteer": "experience",
+    "skills": "skills",
+    "technologies": "skills",
+    "languages": "skills",
+    "interests": None,  # not part of the structured result
+    "hobbies": None,
+    "education": "education",
+    "certifications": "credentials",
+    "achievements": "credentials",
+    "awards": "credentials",
+    "publications": "credentials",
+}
+DEFAULT_GROUP = "experience"
+
+
+def empty_result() -> dict[str, Any]:
+    """Structured experience with every top-level field empty"""
+    return {
+        "summary": "",
+        "contact_info": {},
+        "skills": [],
+        "work_experience": [],
+        "education": [],
+        "certifications": [],
+        "awards": [],
+        "automations": [],
+    }
+
+
+# ============================================================================
+# PLANNING
+# ============================================================================
+
+
+def plan_tasks(text: str, max_chars: int = MAX_TASK_CHARS) -> list[dict[str, Any]]:
+    """
+    Split a resume into extraction tasks
+
+    Consecutive sections of the same group are sent together (an employer
+    heading stays with its experience section) up to max_chars per task.
+
+    Returns:
+        [{"group", "sections", "text"}, ...] in document order
+    """
+    tasks: list[dict[str, Any]] = []
+    seen_known_section = False
+    for section, block in split_sections(text):
+        if len(block) < MIN_SECTION_CHARS:
+            continue
+        if section in SECTION_GROUPS:
+            seen_known_section |= section != "header"
+            group = SECTION_GROUPS[section]
+        else:
+            group = DEFAULT_GROUP if seen_known_section else "profile"
+        if group is None:
+            continue
+        last = tasks[-1] if tasks else None
+        if (
+            last
+            and last["group"] == group
+            and len(last["text"]) + len(block) <= max_chars
+        ):
+            last["sections"].append(section)
+            last["text"] += "\n" + block
+        else:
+            tasks.append({"group": group, "sections": [section], "text": block})
+    return tasks
+
+
+def build_prompt(task: dict[str, Any], errors: list[str] | None = None) -> str:
+    """Extraction prompt for one task (errors: why the last answer was rejected)"""
+    schema = GROUP_SCHEMAS[task["group"]]
+    retry_note = ""
+    if errors:
+        retry_note = (
+            "\nYour previous answer was rejected: "
+            + "; ".join(errors[:5])
+            + ". Return corrected JSON.\n"
+        )
+    return f"""Extract {GROUP_INSTRUCTIONS[task["group"]]} from this resume section.
+Use the exact wording and dates of the resume. Use "" or [] for anything the section does not state; do not invent content.
+Return ONLY valid JSON matching this JSON schema:
+{json.dumps(schema, separators=(",", ":"))}
+{retry_note}
+Resume section ({", ".join(task["sections"])}):
+{task["text"]}"""
+
+
+def gemini_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """JSON schema in the form accepted by Gemini's response_schema"""
+    converted: dict[str, Any] = {"type": schema["type"].upper()}
+    if "properties" in schema:
+        converted["properties"] = {
+            name: gemini_schema(sub) for name, sub in schema["properties"].items()
+        }
+    if "items" in schema:
+        converted["items"] = gemini_schema(schema["items"])
+    if "required" in schema:
+        converted["required"] = list(schema["required"])
+    return converted
+
+
+# ============================================================================
+# PARSING, VALIDATION AND MERGING
+# ============================================================================
+
+_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+_TYPES: dict[str, Any] = {
+    "string": str,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
+def parse_json_object(text: str) -> dict[str, Any]:
+    """
+    Parse a JSON object from model output (tolerates fences and chatter)
+
+    Raises:
+        ValueError: If no JSON object can be parsed
+        TypeError: If the parsed JSON is not an object
+    """
+    text = _FENCE_PATTERN.sub("", (text or "").strip())
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        match = re.search(r"\{.*\}", text, re.DOTALL)
+        if not match:
+            raise ValueError("no JSON object in response")
+        try:
+            data = json.loads(match.group())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON: {e}")
+    if not isinstance(data, dict):
+        raise TypeError("response is not a JSON object")
+    return data
+
+
+def validate(value: Any, schema: dict[str, Any], path: str = "$") -> list[str]:
+    """
+    Check a value against a schema (types and required keys; null allowed)
+
+    Returns:
+        Error messages (empty if valid)
+    """
+    if value is None:
+        return []
+    expected = _TYPES[schema["type"]]
+    if not isinstance(value, expected) or (
+        schema["type"] == "number" and isinstance(value, bool)
+    ):
+        return [f"{path} should be {schema['type']}"]
+
+    errors: list[str] = []
+    if schema["type"] == "object":
+        errors.extend(
+            f"{path}.{key} is missing"
+            for key in schema.get("required", [])
+            if key not in value
+        )
+        for key, sub in schema.get("properties", {}).items():
+            if key in value:
+                errors.extend(validate(value[key], sub, f"{path}.{key}"))
+    elif schema["type"] == "array":
+        for i, item in enumerate(value):
+            errors.extend(validate(item, schema["items"], f"{path}[{i}]"))
+    return errors
+
+
+def _company_key(entry: dict[str, Any]) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", str(entry.get("company") or "").lower()).strip()
+
+
+def _merge_work_experience(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Combine entries of the same company extracted from different sections"""
+    merged: dict[str, dict[str, Any]] = {}
+    result = []
+    for entry in entries:
+        key = _company_key(entry)
+        if not key or key not in merged:
+            result.append(entry)
+            if key:
+                merged[key] = entry
+            continue
+        target = merged[key]
+        for field, value in entry.items():
+            if isinstance(value, list):
+                target[field] = (target.get(field) or []) + value
+            elif value and not target.get(field):
+                target[field] = value
+    return result
+
+
+def merge_results(parts: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge per-section results in document order
+
+    Lists are concatenated, objects fill their empty fields, strings keep
+    the first non-empty value.
+    """
+    result = empty_result()
+    for part in parts:
+        for key, value in part.items():
+            if key not in result or value in (None, "", [], {}):
+                continue
+            current = result[key]
+            if isinstance(current, list) and isinstance(value, list):
+                current.extend(value)
+            elif isinstance(current, dict) and isinstance(value, dict):
+                for field, field_value in value.items():
+                    if field_value and not current.get(field):
+                        current[field] = field_value
+            elif not current:
+                result[key] = value
+
+    result["work_experience"] = _merge_work_experience(result["work_experience"])
+    return result
@@ -0,0 +1,500 @@
+"""
+Chunked Semantic Matcher
+Covers the whole resume with section-aware chunks, encodes resume chunks and
+JD requirements in one batch, and scores every requirement against every
+chunk with a single similarity matrix
+"""
+
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any
+
+import numpy as np
+
+from app.core.embedding_batcher import EmbeddingBatcher
+from app.core.embeddings import cos_sim
+from app.core.metrics import metrics
+
+# Section headings recognised when chunking (matched on short lines)
+SECTION_HEADINGS = (
+    "summary",
+    "profile",
+    "objective",
+    "experience",
+    "employment",
+    "work history",
+    "projects",
+    "education",
+    "skills",
+    "technologies",
+    "certifications",
+    "achievements",
+    "awards",
+    "publications",
+    "volunteer",
+    "languages",
+    "interests",
+    "responsibilities",
+    "requirements",
+    "qualifications",
+)
+
+BULLET_PATTERN = re.compile(r"^\s*[•●▪■◦\-\*–·]\s*")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?;])\s+")
+
+MIN_CHUNK_CHARS = 20
+
+# Rough wordpiece-per-word ratio for budgeting tokens without a tokenizer
+TOKENS_PER_WORD = 1.3
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate model tokens for a piece of text"""
+    return int(len(text.split()) * TOKENS_PER_WORD) + 1
+
+
+def _heading(line: str) -> str | None:
+    """Section name if the line looks like a section heading"""
+    stripped = line.strip().rstrip(":").strip()
+    if not stripped or len(stripped.split()) > 4:
+        return None
+    lowered = stripped.lower()
+    for heading in SECTION_HEADINGS:
+        if heading in lowered:
+            return heading
+    if stripped.isupper():
+        return lowered
+    return None
+
+
+def _split_heading(line: str) -> tuple[str | None, str]:
+    """
+    Separate a heading from inline content ("Skills: Python, React")
+
+    Returns:
+        (section name or None, remaining content)
+    """
+    heading = _heading(line)
+    if heading:
+        return heading, ""
+    head, sep, rest = line.partition(":")
+    if sep:
+        heading = _heading(head)
+        if heading:
+            return heading, rest
+    return None, line
+
+
+def _units(line: str) -> list[str]:
+    """Split a line into bullet/sentence units"""
+    line = BULLET_PATTERN.sub("", line).strip()
+    return [u.strip() for u in SENTENCE_SPLIT_PATTERN.split(line) if u.strip()]
+
+
+def chunk_document(text: str, max_tokens: int) -> list[dict[str, str]]:
+    """
+    Split a document into section-aware chunks within a token budget
+
+    Chunks never cross a section heading; within a section, consecutive
+    bullets/sentences are packed until the token budget is reached.
+
+    Args:
+        text: Document text (original case helps heading detection)
+        max_tokens: Approximate token budget per chunk
+
+    Returns:
+        List of {"section", "text"} chunks covering the whole document
+    """
+    chunks: list[dict[str, str]] = []
+    section = "header"
+    current: list[str] = []
+    current_tokens = 0
+
+    def flush():
+        nonlocal current, current_tokens
+        chunk_text = " ".join(current).strip()
+        if len(chunk_text) >= MIN_CHUNK_CHARS:
+            chunks.append({"section": section, "text": chunk_text})
+        current, current_tokens = [], 0
+
+    for line in text.split("\n"):
+        heading, line = _split_heading(line)
+        if heading:
+            flush()
+            section = heading
+
+        for unit in _units(line):
+            unit_tokens = estimate_tokens(unit)
+            if current and current_tokens + unit_tokens > max_tokens:
+                flush()
+            # Over-long single units are split on word boundaries
+            while unit_tokens > max_tokens:
+                words = unit.split()
+                cut = max(1, int(max_tokens / TOKENS_PER_WORD))
+                current = [" ".join(words[:cut])]
+                flush()
+                unit = " ".join(words[cut:])
+                unit_tokens = estimate_tokens(unit)
+            current.append(unit)
+            current_tokens += unit_tokens
+
+    flush()
+    return chunks
+
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """
+    Split a document into sections at its headings, keeping original lines
+
+    Each section's text starts with its heading line; text before the first
+    heading is the "header" section.
+
+    Returns:
+        (section name, section text) pairs in document order
+    """
+    sections: list[tuple[str, str]] = []
+    section = "header"
+    lines: list[str] = []
+
+    for line in text.split("\n"):
+        heading, _ = _split_heading(line)
+        if heading:
+            block = "\n".join(lines).strip()
+            if block:
+                sections.append((section, block))
+            section, lines = heading, []
+        lines.append(line)
+
+    block = "\n".join(lines).strip()
+    if block:
+        sections.append((section, block))
+    return sections
+
+
+def diff_sections(old_text: str, new_text: str) -> dict[str, list[str]]:
+    """
+    Compare two versions of a document section by section
+
+    Returns:
+        {"changed": sections of new_text that are new or edited,
+         "removed": sections of old_text with no counterpart left}
+    """
+    old_blocks = Counter(split_sections(old_text))
+    changed = []
+    for block in split_sections(new_text):
+        if old_blocks[block] > 0:
+            old_blocks[block] -= 1
+        else:
+            changed.append(block[0])
+    removed = [
+        name
+        for (name, _), count in old_blocks.items()
+        if count > 0 and name not in changed
+    ]
+    return {
+        "changed": list(dict.fromkeys(changed)),
+        "removed": list(dict.fromkeys(removed)),
+    }
+
+
+def extract_requirements(jd_text: str, max_tokens: int) -> list[str]:
+    """
+    Split a job description into requirement units (bullets/sentences)
+
+    Returns:
+        Requirement texts in document order
+    """
+    requirements = []
+    for line in jd_text.split("\n"):
+        _, line = _split_heading(line)
+        for unit in _units(line):
+            if len(unit) < MIN_CHUNK_CHARS:
+                continue
+            # Keep each requirement within the model's input budget
+            words = unit.split()
+            limit = max(1, int(max_tokens / TOKENS_PER_WORD))
+            requirements.append(" ".join(words[:limit]))
+    return requirements
+
+
+def sample_evenly(items: list, limit: int) -> list:
+    """
+    Pick `limit` items spread evenly across the list (keeps order)
+
+    Used instead of truncation so every part of the document is represented.
+    """
+    if limit <= 0:
+        return []
+    if len(items) <= limit:
+        return list(items)
+    positions = np.rint(np.linspace(0, len(items) - 1, num=limit)).astype(int)
+    return [items[p] for p in positions]
+
+
+class SemanticMatcher:
+    """
+    Whole-document semantic matcher with a latency cap
+
+    Tracks the observed encode cost per text so the latency budget can be
+    translated into a maximum number of chunks to encode. Embeddings of
+    recently encoded texts are kept, so unchanged chunks of an edited resume
+    and repeated JD requirements are not encoded again.
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = 128,
+        top_k: int = 3,
+        latency_budget_ms: float = 1500.0,
+        min_chunks: int = 16,
+        embedding_cache_size: int = 4096,
+    ):
+        """
+        Args:
+            chunk_tokens: Approximate token budget per chunk
+            top_k: Best-matching resume chunks kept per JD requirement
+            latency_budget_ms: Target time for the batched encode
+            min_chunks: Never sample below this many texts
+            embedding_cache_size: Texts whose embeddings are kept (0 = none)
+        """
+        self.chunk_tokens = chunk_tokens
+        self.top_k = max(1, top_k)
+        self.latency_budget_ms = latency_budget_ms
+        self.min_chunks = min_chunks
+
+        self.embedding_cache_size = embedding_cache_size
+
+        self._lock = threading.Lock()
+        self._ms_per_text = 4.0  # initial CPU estimate, refined as we go
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def max_texts(self, budget_ms: float | None = None) -> int:
+        """Number of texts that fit in the latency budget"""
+        budget = self.latency_budget_ms if budget_ms is None else budget_ms
+        with self._lock:
+            per_text = self._ms_per_text
+        return max(self.min_chunks, int(budget / max(per_text, 0.01)))
+
+    def encode(
+        self, model, texts: list[str], timeout_s: float | None = None
+    ) -> np.ndarray:
+        """
+        Encode texts, batching the ones not in the embedding cache, and
+        update the per-text cost estimate
+
+        timeout_s bounds the wait for a shared micro-batch (EmbeddingBatcher)
+        """
+        cached: dict[str, np.ndarray] = {}
+        with self._lock:
+            for text in texts:
+                vector = self._embeddings.get(text)
+                if vector is not None:
+                    self._embeddings.move_to_end(text)
+                    cached[text] = vector
+        missing = [text for text in dict.fromkeys(texts) if text not in cached]
+        metrics.increment("semantic.embedding_cache_hits", len(cached))
+
+        if missing:
+            start = time.perf_counter()
+            if timeout_s is not None and isinstance(model, EmbeddingBatcher):
+                encoded = np.asarray(model.encode(missing, timeout_s=timeout_s))
+            else:
+                encoded = np.asarray(model.encode(missing))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            cached.update(zip(missing, encoded, strict=True))
+
+            with self._lock:
+                # Exponential moving average of the per-text cost
+                observed = elapsed_ms / len(missing)
+                self._ms_per_text = 0.8 * self._ms_per_text + 0.2 * observed
+                if self.embedding_cache_size > 0:
+                    self._embeddings.update(zip(missing, encoded, strict=True))
+                    while len(self._embeddings) > self.embedding_cache_size:
+                        self._embeddings.popitem(last=False)
+            metrics.observe(
+                "semantic.encode_ms",
+                elapsed_ms,
+                buckets=(50, 100, 250, 500, 1000, 2000),
+            )
+
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([cached[text] for text in texts])
+
+    def plan(
+        self,
+        resume_text: str,
+        jd_texts: list[str],
+        budget_ms: float | None = None,
+    ) -> tuple[list[dict[str, str]], list[list[str]], dict[str, Any]]:
+        """
+        Chunk the resume and JDs, sampling when over the latency budget
+
+        Returns:
+            (resume chunks, requirements per JD, coverage info)
+        """
+        chunks = chunk_document(resume_text, self.chunk_tokens)
+        requirements = [extract_requirements(jd, self.chunk_tokens) for jd in jd_texts]
+
+        total_chunks = len(chunks)
+        total_requirements = sum(len(r) for r in requirements)
+        limit = self.max_texts(budget_ms)
+
+        sampled = total_chunks + total_requirements > limit
+        if sampled:
+            # Split the budget proportionally, sampling evenly within each
+            share = limit / max(total_chunks + total_requirements, 1)
+            chunks = sample_evenly(chunks, max(1, int(total_chunks * share)))
+            requirements = [
+                sample_evenly(reqs, max(1, int(len(reqs) * share)))
+                for reqs in requirements
+            ]
+            metrics.increment("semantic.sampled")
+
+        coverage = {
+            "chunks_total": total_chunks,
+            "chunks_encoded": len(chunks),
+            "requirements_total": total_requirements,
+            "requirements_encoded": sum(len(r) for r in requirements),
+            "sampled": sampled,
+        }
+        return chunks, requirements, coverage
+
+    def score(
+        self,
+        similarities: np.ndarray,
+        requirements: list[str],
+        chunks: list[dict[str, str]],
+    ) -> dict[str, Any]:
+        """
+        Score one JD from its (requirements x chunks) similarity block
+
+        Returns:
+            similarity_score (mean best-chunk similarity over requirements)
+            and the top-k chunks per requirement
+        """
+        if similarities.size == 0:
+            return {"similarity_score": 0.0, "requirement_matches": []}
+
+        k = min(self.top_k, similarities.shape[1])
+        # Top-k chunk indices per requirement, best first
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        requirement_matches = [
+            {
+                "requirement": requirement,
+                "similarity": round(float(top_scores[i, 0]), 3),
+                "matches": [
+                    {
+                        "section": chunks[j]["section"],
+                        "text": chunks[j]["text"][:200],
+                        "similarity": round(float(s), 3),
+                    }
+                    for j, s in zip(top[i], top_scores[i], strict=True)
+                ],
+            }
+            for i, requirement in enumerate(requirements)
+        ]
+
+        return {
+            "similarity_score": float(top_scores[:, 0].mean()),
+            "requirement_matches": requirement_matches,
+        }
+
+    def match(
+        self,
+        model,
+        resume_text: str,
+        jd_text: str,
+        budget_ms: float | None = None,
+        timeout_s: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Semantic match of a whole resume against one job description
+
+        Args:
+            model: Embedding model exposing encode()
+            resume_text: Full resume text
+            jd_text: Job description text
+            budget_ms: Latency budget override for the encode
+            timeout_s: Longest wait for the embeddings (request deadline)
+
+        Returns:
+            similarity_score, score (0-100), requirement matches and coverage
+        """
+        return self.match_many(model, resume_text, [jd_text], budget_ms, timeout_s)[0]
+
+    def match_many(
+        self,
+        model,
+        resume_text: str,
+        jd_texts: list[str],
+        budget_ms: float | None = None,
+        timeout_s: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Semantic match of one resume against several job descriptions
+
+        The resume chunks are encoded once together with the requirements of
+        every JD, and a single (requirements x chunks) similarity matrix is
+        sliced per JD.
+
+        Returns:
+            One match result per JD, in input order
+        """
+        chunks, requirements, coverage = self.plan(resume_text, jd_texts, budget_ms)
+        all_requirements = [r for reqs in requirements for r in reqs]
+        insufficient = {
+            "similarity_score": 0,
+            "score": 50,
+            "method": "insufficient_text",
+            "coverage": coverage,
+        }
+        if not chunks or not all_requirements:
+            return [dict(insufficient) for _ in jd_texts]
+
+        # One batched encode for every text, one matrix operation
+        embeddings = self.encode(
+            model, all_requirements + [c["text"] for c in chunks], timeout_s
+        )
+        n = len(all_requirements)
+        similarities = cos_sim(embeddings[:n], embeddings[n:])
+
+        results = []
+        offset = 0
+        for reqs in requirements:
+            block = similarities[offset : offset + len(reqs)]
+            offset += len(reqs)
+            if not reqs:
+                results.append(dict(insufficient))
+                continue
+
+            result = self.score(block, reqs, chunks)
+            similarity = result["similarity_score"]
+            results.append(
+                {
+                    "similarity_score": round(similarity, 3),
+                    "score": round(similarity * 100, 1),
+                    "method": "chunked_embeddings",
+                    "requirement_matches": result["requirement_matches"],
+                    "coverage": coverage,
+                }
+            )
+        return results
+
+
+# Global semantic matcher instance
+semantic_matcher = SemanticMatcher(
+    chunk_tokens=int(os.getenv("SEMANTIC_CHUNK_TOKENS", "128")),
+    top_k=int(os.getenv("SEMANTIC_TOP_K", "3")),
+    latency_budget_ms=float(os.getenv("SEMANTIC_LATENCY_BUDGET_MS", "1500")),
+    min_chunks=int(os.getenv("SEMANTIC_MIN_CHUNKS", "16")),
+    embedding_cache_size=int(os.getenv("SEMANTIC_EMBEDDING_CACHE_SIZE", "4096")),
+)
@@ -0,0 +1,199 @@
+"""
+Skills Taxonomy
+Loads the versioned skills/technology taxonomy (app/data/skills_taxonomy.json)
+and compiles it into one shared lookup index: aliases -> canonical skills,
+categories, technical terms and role associations
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from app.services.document_index import DocumentIndex, Span, normalize_term
+
+DEFAULT_TAXONOMY_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "skills_taxonomy.json"
+)
+
+
+class RoleProfile:
+    """Signals associated with one job role"""
+
+    __slots__ = ("experience_terms", "name", "signals", "skills", "title_aliases")
+
+    def __init__(
+        self,
+        name: str,
+        signals: list[str],
+        skills: list[str],
+        title_aliases: list[str],
+        experience_terms: list[str],
+    ):
+        self.name = name
+        self.signals = tuple(signals)
+        self.skills = tuple(skills)
+        self.title_aliases = tuple(title_aliases)
+        self.experience_terms = tuple(experience_terms)
+
+    def matches_title(self, title: str) -> bool:
+        """Check whether a job title names this role"""
+        title = title.strip().lower()
+        return title == self.name.lower() or title in self.title_aliases
+
+
+class SkillsTaxonomy:
+    """
+    Compiled taxonomy index (built once, shared by all services)
+
+    Every lookup normalizes terms the same way DocumentIndex does, so
+    "CI/CD" and "ci-cd" are the same key ("ci cd"); spellings that differ
+    beyond punctuation, such as "cicd" or "k8s", resolve through the
+    aliases listed in the taxonomy file.
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self.version: str = data.get("version", "0")
+
+        skills: dict[str, dict[str, Any]] = data.get("skills", {})
+        categories: dict[str, dict[str, Any]] = data.get("categories", {})
+
+        # Alias / canonical name -> canonical skill
+        self._canonical: dict[str, str] = {}
+        self._surface_forms: dict[str, tuple[str, ...]] = {}
+        for skill, info in skills.items():
+            forms = (skill, *info.get("aliases", []))
+            self._surface_forms[skill] = forms
+            for form in forms:
+                self._canonical.setdefault(normalize_term(form), skill)
+
+        # Category -> ordered canonical skills
+        self.categories: dict[str, tuple[str, ...]] = {}
+        self.category_labels: dict[str, str] = {}
+        self.technical_categories: frozenset[str] = frozenset(
+            name for name, info in categories.items() if info.get("technical")
+        )
+        technical_skills: set[str] = set()
+        for name, info in categories.items():
+            members = tuple(info.get("skills", []))
+            self.categories[name] = members
+            self.category_labels[name] = info.get("label", name)
+            if name in self.technical_categories:
+                technical_skills.update(members)
+
+        # Normalized keys counted as technical (skills, their aliases and
+        # generic technical words that are too ambiguous to be skills)
+        technical_forms = [
+            form
+            for skill in technical_skills
+            for form in self._surface_forms.get(skill, (skill,))
+        ]
+        technical_forms.extend(data.get("technical_terms", []))
+        self._technical_keys = frozenset(
+            normalize_term(form) for form in technical_forms
+        )
+
+        # Roles with their associated skills
+        role_skills: dict[str, list[str]] = {}
+        for skill, info in skills.items():
+            for role in info.get("roles", []):
+                role_skills.setdefault(role, []).append(skill)
+        self.roles: dict[str, RoleProfile] = {
+            name: RoleProfile(
+                name,
+                signals=info.get("signals", []),
+                skills=role_skills.get(name, []),
+                title_aliases=info.get("title_aliases", []),
+                experience_terms=info.get("experience_terms", []),
+            )
+            for name, info in data.get("roles", {}).items()
+        }
+
+    def canonical(self, term: str) -> str | None:
+        """Canonical skill for a name or alias ("k8s" -> "kubernetes")"""
+        return self._canonical.get(normalize_term(term))
+
+    def surface_forms(self, skill: str) -> tuple[str, ...]:
+        """Canonical name followed by its aliases"""
+        return self._surface_forms.get(skill, (skill,))
+
+    def category_terms(
+        self, category: str, include_aliases: bool = False
+    ) -> tuple[str, ...]:
+        """Skills of a category, optionally with every alias spelled out"""
+        members = self.categories.get(category, ())
+        if not include_aliases:
+            return members
+        return tuple(form for skill in members for form in self.surface_forms(skill))
+
+    def is_technical(self, term: str) -> bool:
+        """Check whether a keyword is a technical term"""
+        return normalize_term(term) in self._technical_keys
+
+    def mentions(self, index: DocumentIndex, skill: str) -> bool:
+        """Check whether a document mentions a skill under any of its names"""
+        return any(index.contains(form) for form in self.surface_forms(skill))
+
+    def find(self, index: DocumentIndex, term: str) -> list[Span]:
+        """
+        Get the spans where a document mentions a term under any name
+
+        A term that names a skill is looked up under all of that skill's
+        surface forms, so "react" is found as "React.js" or "reactjs" and
+        the alias's own positions are returned; other terms are looked up
+        as written.
+
+        Args:
+            index: Index of the document
+            term: Keyword or phrase (canonical name, alias or free text)
+
+        Returns:
+            Sorted (start, end) offsets, empty if the term is not mentioned
+        """
+        skill = self.canonical(term)
+        forms = self.surface_forms(skill) if skill else (term,)
+        return sorted({span for form in forms for span in index.find(form)})
+
+    def lookup(self, index: DocumentIndex, terms: list[str]) -> dict[str, list[Span]]:
+        """Find many terms at once; only terms that are mentioned are returned"""
+        found = {}
+        for term in terms:
+            spans = self.find(index, term)
+            if spans:
+                found[term] = spans
+        return found
+
+    def find_skills(self, index: DocumentIndex, category: str) -> list[str]:
+        """Canonical skills of a category mentioned in a document"""
+        return [
+            skill
+            for skill in self.categories.get(category, ())
+            if self.mentions(index, skill)
+        ]
+
+    def find_role(self, title: str) -> RoleProfile | None:
+        """Role profile named by a job title (or one of its title aliases)"""
+        for role in self.roles.values():
+            if role.matches_title(title):
+                return role
+        return None
+
+
+def load_skills_taxonomy(path: Path | str | None = None) -> SkillsTaxonomy:
+    """
+    Load and compile the taxonomy file
+
+    Args:
+        path: Taxonomy JSON (defaults to SKILLS_TAXONOMY_PATH or the bundled file)
+
+    Returns:
+        Compiled SkillsTaxonomy
+    """
+    path = Path(path or os.getenv("SKILLS_TAXONOMY_PATH") or DEFAULT_TAXONOMY_PATH)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return SkillsTaxonomy(data)
+
+
+# Global taxonomy instance (compiled at import/startup)
+skills_taxonomy = load_skills_taxonomy()
@@ -0,0 +1,264 @@
+"""
+Corpus-Backed Term Weights
+Document frequencies learned from local JDs/resumes, stored as a compact
+precomputed table and used for BM25/IDF keyword weighting
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+TABLE_VERSION = 1
+
+DEFAULT_TABLE_PATH = (
+    Path(__file__).resolve().parent.parent.parent / "data" / "term_weights.json.gz"
+)
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Below this corpus size IDF is too noisy (with one document every term
+# weighs nearly the same and ties rank alphabetically), so terms stay uniform
+MIN_DOCUMENTS = int(os.getenv("TERM_WEIGHTS_MIN_DOCUMENTS", "20"))
+# Document hashes remembered for de-duplication (oldest forgotten first)
+MAX_SEEN_DOCUMENTS = int(os.getenv("TERM_WEIGHTS_MAX_SEEN", "10000"))
+
+
+class TermWeightTable:
+    """
+    Document-frequency table with incremental updates
+
+    Lookups are dictionary reads; no corpus work happens per request.
+    Until the corpus holds min_documents documents every term weighs 1.0
+    (plain counting).
+    """
+
+    def __init__(
+        self,
+        document_frequencies: dict[str, int] | None = None,
+        num_documents: int = 0,
+        total_terms: int = 0,
+        seen_documents: list[str] | None = None,
+        *,
+        path: Path | None = None,
+        save_every: int = 10,
+        min_documents: int = MIN_DOCUMENTS,
+        max_seen_documents: int = MAX_SEEN_DOCUMENTS,
+    ):
+        """
+        Args:
+            document_frequencies: Number of documents containing each term
+            num_documents: Corpus size
+            total_terms: Sum of document lengths (for BM25 length norm)
+            seen_documents: Hashes of documents already counted, oldest first
+            path: Where save() writes the table
+            save_every: Persist after this many new documents (0 = never)
+            min_documents: Corpus size from which IDF weighting applies
+            max_seen_documents: Document hashes kept for de-duplication
+        """
+        self.document_frequencies = document_frequencies or {}
+        self.num_documents = num_documents
+        self.total_terms = total_terms
+        self.path = path
+        self.save_every = save_every
+        self.min_documents = max(min_documents, 1)
+        self.max_seen_documents = max(max_seen_documents, 1)
+        self.seen_documents: OrderedDict[str, None] = OrderedDict.fromkeys(
+            (seen_documents or [])[-self.max_seen_documents :]
+        )
+
+        self._lock = threading.Lock()
+        # Serializes writers so concurrent saves never interleave
+        self._save_lock = threading.Lock()
+        self._unsaved = 0
+
+    def __len__(self) -> int:
+        return len(self.document_frequencies)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the corpus is large enough for IDF weighting"""
+        return self.num_documents >= self.min_documents
+
+    @property
+    def average_document_length(self) -> float:
+        if not self.num_documents:
+            return 0.0
+        return self.total_terms / self.num_documents
+
+    def idf(self, term: str) -> float:
+        """
+        BM25 inverse document frequency (always positive)
+
+        Returns 1.0 for every term until the corpus is large enough.
+        """
+        if not self.ready:
+            return 1.0
+        df = self.document_frequencies.get(term, 0)
+        return math.log(1 + (self.num_documents - df + 0.5) / (df + 0.5))
+
+    def document_ratio(self, term: str) -> float:
+        """Fraction of corpus documents containing the term"""
+        if not self.num_documents:
+            return 0.0
+        return self.document_frequencies.get(term, 0) / self.num_documents
+
+    def bm25(self, term: str, term_frequency: int, document_length: int) -> float:
+        """
+        BM25 weight of a term within one document
+
+        Args:
+            term: Normalized term
+            term_frequency: Occurrences in the document
+            document_length: Document length in tokens
+        """
+        avg_length = self.average_document_length or max(document_length, 1)
+        norm = 1 - BM25_B + BM25_B * document_length / avg_length
+        saturation = term_frequency * (BM25_K1 + 1) / (term_frequency + BM25_K1 * norm)
+        return self.idf(term) * saturation
+
+    def add_document(self, text: str, terms: set[str], length: int) -> bool:
+        """
+        Count a new document (e.g. a JD that just arrived)
+
+        Args:
+            text: Document text (hashed so repeats are counted once)
+            terms: Distinct terms in the document
+            length: Document length in tokens
+
+        Returns:
+            True if the document was new and has been counted
+        """
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+        with self._lock:
+            if digest in self.seen_documents:
+                return False
+            self.seen_documents[digest] = None
+            while len(self.seen_documents) > self.max_seen_documents:
+                self.seen_documents.popitem(last=False)
+            self.num_documents += 1
+            self.total_terms += length
+            for term in terms:
+                self.document_frequencies[term] = (
+                    self.document_frequencies.get(term, 0) + 1
+                )
+            self._unsaved += 1
+            should_save = (
+                self.path is not None
+                and self.save_every > 0
+                and self._unsaved >= self.save_every
+            )
+
+        if should_save:
+            try:
+                self.save()
+            except OSError as e:
+                print(f"⚠️  Could not save term weights: {e}")
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "version": TABLE_VERSION,
+                "num_documents": self.num_documents,
+                "total_terms": self.total_terms,
+                "document_frequencies": dict(sorted(self.document_frequencies.items())),
+                "seen_documents": list(self.seen_documents),
+            }
+
+    def save(self, path: Path | None = None) -> Path:
+        """
+        Write the table as gzipped JSON (atomic replace)
+
+        Saves are serialized within the process, and each writes its own
+        temporary file, so concurrent writers (threads or worker processes)
+        never corrupt each other's output.
+        """
+        path = Path(path or self.path or DEFAULT_TABLE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._save_lock:
+            with self._lock:
+                unsaved = self._unsaved
+            payload = json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=path.name + ".", suffix=".tmp", dir=path.parent
+            )
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wb") as f:
+                    f.write(payload)
+                Path(tmp_name).replace(path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+            with self._lock:
+                self._unsaved = max(self._unsaved - unsaved, 0)
+        return path
+
+    @classmethod
+    def load(cls, path: Path, save_every: int = 10) -> "TermWeightTable":
+        """Load a table; a missing file gives an empty table bound to path"""
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path, save_every=save_every)
+
+        with gzip.open(path, "rb") as f:
+            data = json.loads(f.read().decode("utf-8"))
+
+        if data.get("version") != TABLE_VERSION:
+            print(f"⚠️  Ignoring term weights with unsupported version: {path}")
+            return cls(path=path, save_every=save_every)
+
+        return cls(
+            document_frequencies=data.get("document_frequencies", {}),
+            num_documents=data.get("num_documents", 0),
+            total_terms=data.get("total_terms", 0),
+            seen_documents=list(data.get("seen_documents", [])),
+            path=path,
+            save_every=save_every,
+        )
+
+
+def is_learning_enabled() -> bool:
+    """Check whether incoming JDs update the table (TERM_WEIGHTS_LEARNING)"""
+    return os.getenv("TERM_WEIGHTS_LEARNING", "true").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+# Global term weight table (loaded on first use)
+_term_weights: TermWeightTable | None = None
+_term_weights_lock = threading.Lock()
+
+
+def get_term_weights() -> TermWeightTable:
+    """Get the shared term weight table, loading it on first use"""
+    global _term_weights
+    if _term_weights is None:
+        with _term_weights_lock:
+            if _term_weights is None:
+                path = Path(os.getenv("TERM_WEIGHTS_PATH", str(DEFAULT_TABLE_PATH)))
+                save_every = int(os.getenv("TERM_WEIGHTS_SAVE_EVERY", "10"))
+                try:
+                    _term_weights = TermWeightTable.load(path, save_every=save_every)
+                    print(
+                        f"✅ Term weights loaded: {_term_weights.num_documents} "
+                        f"documents, {len(_term_weights)} terms"
+                    )
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Term weights unavailable ({e}), using uniform")
+                    _term_weights = TermWeightTable(path=path)
+    return _term_weights
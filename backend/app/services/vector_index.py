@@ -0,0 +1,682 @@
+"""
+Local Vector Index
+Memory-mapped matrix of normalized embeddings (float16 or int8) with
+incremental inserts, tombstone deletes, exact (flat) search and an
+approximate inverted-file (IVF) mode for large collections
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+INDEX_VERSION = 1
+
+SUPPORTED_DTYPES = ("float16", "int8")
+SUPPORTED_MODES = ("flat", "ivf", "auto")
+
+INITIAL_CAPACITY = 1024
+SCORE_BLOCK_ROWS = 65536  # rows dequantized per block while scoring
+COMPACT_DELETED_RATIO = 0.25
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+
+HEADER_FILE = "index.json"
+VECTORS_FILE = "vectors.npy"
+SCALES_FILE = "scales.npy"
+LOG_FILE = "documents.jsonl"
+IVF_FILE = "ivf.npz"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so dot products are cosine similarities"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class VectorIndex:
+    """
+    Document-grouped vector index stored in a local directory
+
+    Each document (e.g. one resume) owns a contiguous block of rows (its
+    chunk embeddings) plus JSON metadata. Vectors live in a memory-mapped
+    .npy file, documents in an append-only JSONL log that is replayed on
+    load, so inserts and deletes never rewrite the whole collection.
+
+    compact() writes the surviving rows to a new generation of files and
+    switches to it by atomically replacing the header, so a crash at any
+    point leaves either the old or the new generation intact.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        dim: int,
+        *,
+        dtype: str = "float16",
+        mode: str = "auto",
+        nprobe: int = 8,
+        ivf_min_vectors: int = 20000,
+    ):
+        """
+        Args:
+            directory: Where the index files are kept
+            dim: Embedding dimension
+            dtype: Storage precision ("float16" or "int8" with per-row scale)
+            mode: "flat" (exact), "ivf" (approximate) or "auto"
+                (flat until ivf_min_vectors live rows, then IVF)
+            nprobe: Inverted lists scanned per query in IVF mode
+            ivf_min_vectors: Live rows needed before IVF lists are trained
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported vector dtype: {dtype}")
+        if mode not in SUPPORTED_MODES:
+            raise ValueError(f"Unsupported index mode: {mode}")
+
+        self.directory = Path(directory)
+        self.dim = dim
+        self.dtype = dtype
+        self.mode = mode
+        self.nprobe = nprobe
+        self.ivf_min_vectors = ivf_min_vectors
+
+        self._lock = threading.RLock()
+        self.generation = 0
+        self.rows = 0
+        self.capacity = 0
+        self._vectors: np.memmap | None = None
+        self._scales: np.memmap | None = None
+
+        # Row bookkeeping (rebuilt from the log on load)
+        self.documents: dict[str, dict[str, Any]] = {}
+        self._deleted = np.zeros(0, dtype=bool)
+        self._row_document = np.zeros(0, dtype=np.int64)
+        self._document_keys: list[str] = []
+
+        # IVF state
+        self._centroids: np.ndarray | None = None
+        self._assignments: np.ndarray | None = None
+        self._trained_rows = 0
+        self._compaction: threading.Thread | None = None
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def _file(self, name: str, generation: int | None = None) -> Path:
+        """Path of an index file in a generation ("vectors.3.npy")"""
+        generation = self.generation if generation is None else generation
+        if not generation:
+            return self.directory / name
+        stem, suffix = name.split(".", 1)
+        return self.directory / f"{stem}.{generation}.{suffix}"
+
+    def _remove_generation(self, generation: int) -> None:
+        for name in (VECTORS_FILE, SCALES_FILE, LOG_FILE, IVF_FILE):
+            self._file(name, generation).unlink(missing_ok=True)
+
+    @classmethod
+    def open(cls, directory: Path | str, dim: int, **options) -> "VectorIndex":
+        """Open the index in a directory, creating it if missing"""
+        index = cls(directory, dim, **options)
+        index.directory.mkdir(parents=True, exist_ok=True)
+
+        header_path = index.directory / HEADER_FILE
+        if header_path.exists():
+            header = json.loads(header_path.read_text(encoding="utf-8"))
+            if (
+                header.get("version") != INDEX_VERSION
+                or header.get("dim") != dim
+                or header.get("dtype") != index.dtype
+            ):
+                print(
+                    f"⚠️  Ignoring vector index with incompatible layout: "
+                    f"{index.directory}"
+                )
+                index._reset_files()
+            else:
+                index._load(header)
+        else:
+            index._reset_files()
+        return index
+
+    def _write_header(self, generation: int | None = None) -> None:
+        """Atomically replace the header (the commit point of compaction)"""
+        header = {
+            "version": INDEX_VERSION,
+            "dim": self.dim,
+            "dtype": self.dtype,
+            "capacity": self.capacity,
+            "generation": self.generation if generation is None else generation,
+        }
+        tmp_path = self.directory / (HEADER_FILE + ".tmp")
+        tmp_path.write_text(json.dumps(header), encoding="utf-8")
+        tmp_path.replace(self.directory / HEADER_FILE)
+
+    def _reset_files(self) -> None:
+        for name in (LOG_FILE, IVF_FILE):
+            self._file(name).unlink(missing_ok=True)
+        self._allocate(INITIAL_CAPACITY)
+        self._write_header()
+
+    def _create_maps(
+        self, capacity: int, vectors_path: Path, scales_path: Path
+    ) -> tuple[np.memmap, np.memmap]:
+        storage_dtype = np.int8 if self.dtype == "int8" else np.float16
+        vectors = np.lib.format.open_memmap(
+            str(vectors_path),
+            mode="w+",
+            dtype=storage_dtype,
+            shape=(capacity, self.dim),
+        )
+        scales = np.lib.format.open_memmap(
+            str(scales_path), mode="w+", dtype=np.float32, shape=(capacity,)
+        )
+        return vectors, scales
+
+    def _allocate(self, capacity: int) -> None:
+        """Create (or grow) the memory-mapped vector and scale files"""
+        vectors_path = self._file(VECTORS_FILE)
+        scales_path = self._file(SCALES_FILE)
+
+        vectors_tmp = vectors_path.with_name(vectors_path.name + ".tmp")
+        scales_tmp = scales_path.with_name(scales_path.name + ".tmp")
+        new_vectors, new_scales = self._create_maps(capacity, vectors_tmp, scales_tmp)
+        if self._vectors is not None and self.rows:
+            vectors, scales = self._maps()
+            new_vectors[: self.rows] = vectors[: self.rows]
+            new_scales[: self.rows] = scales[: self.rows]
+            del vectors, scales
+        new_vectors.flush()
+        new_scales.flush()
+        del new_vectors, new_scales
+
+        self._vectors = self._scales = None
+        vectors_tmp.replace(vectors_path)
+        scales_tmp.replace(scales_path)
+        self._open_maps()
+        self.capacity = capacity
+
+        self._deleted = np.resize(self._deleted, capacity)
+        self._deleted[self.rows :] = False
+        self._row_document = np.resize(self._row_document, capacity)
+
+    def _open_maps(self) -> None:
+        self._vectors = np.load(self._file(VECTORS_FILE), mmap_mode="r+")
+        self._scales = np.load(self._file(SCALES_FILE), mmap_mode="r+")
+
+    def _maps(self) -> tuple[np.memmap, np.memmap]:
+        """The open vector and scale maps"""
+        if self._vectors is None or self._scales is None:
+            raise RuntimeError(f"Vector index files are not open: {self.directory}")
+        return self._vectors, self._scales
+
+    def _load(self, header: dict[str, Any]) -> None:
+        """Map the vector files and replay the document log"""
+        self.capacity = header["capacity"]
+        self.generation = header.get("generation", 0)
+        self._open_maps()
+        self._deleted = np.zeros(self.capacity, dtype=bool)
+        self._row_document = np.zeros(self.capacity, dtype=np.int64)
+        # Leftovers of a compaction interrupted before (next generation) or
+        # after (previous generation) the header switch
+        self._remove_generation(self.generation + 1)
+        if self.generation:
+            self._remove_generation(self.generation - 1)
+
+        log_path = self._file(LOG_FILE)
+        if log_path.exists():
+            with open(log_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply(json.loads(line))
+                    except (json.JSONDecodeError, KeyError):
+                        # A torn final line from a crash: vectors without a
+                        # log entry are simply unused rows
+                        break
+
+        ivf_path = self._file(IVF_FILE)
+        if ivf_path.exists():
+            data = np.load(ivf_path)
+            self._centroids = data["centroids"]
+            self._assignments = np.resize(data["assignments"], self.capacity)
+            self._trained_rows = int(data["trained_rows"])
+            # Rows added after the lists were saved
+            saved_rows = len(data["assignments"])
+            if saved_rows < self.rows:
+                self._assign_rows(saved_rows, self.rows)
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        """Apply one log event to the in-memory bookkeeping"""
+        key = event["key"]
+        if event["op"] == "add":
+            start, end = event["rows"]
+            self._remove_document(key)
+            self._document_keys.append(key)
+            self._row_document[start:end] = len(self._document_keys) - 1
+            self._deleted[start:end] = False
+            self.documents[key] = {
+                "rows": (start, end),
+                "metadata": event.get("metadata", {}),
+                "payloads": event.get("payloads", []),
+            }
+            self.rows = max(self.rows, end)
+        elif event["op"] == "delete":
+            self._remove_document(key)
+
+    def _append_log(self, event: dict[str, Any]) -> None:
+        with open(self._file(LOG_FILE), "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def _save_ivf(self) -> None:
+        ivf_path = self._file(IVF_FILE)
+        if self._centroids is None or self._assignments is None:
+            ivf_path.unlink(missing_ok=True)
+            return
+        tmp_path = ivf_path.with_name(ivf_path.name + ".tmp.npz")
+        np.savez(
+            tmp_path,
+            centroids=self._centroids,
+            assignments=self._assignments[: self.rows],
+            trained_rows=self._trained_rows,
+        )
+        tmp_path.replace(ivf_path)
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @property
+    def live_rows(self) -> int:
+        return int(self.rows - self._deleted[: self.rows].sum())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.documents
+
+    def add(
+        self,
+        key: str,
+        vectors: np.ndarray,
+        payloads: list[dict[str, Any]] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Insert (or replace) a document and its vectors
+
+        Args:
+            key: Document ID
+            vectors: (n, dim) embeddings, one per chunk
+            payloads: Per-row JSON payloads (e.g. chunk text and section)
+            metadata: Document-level JSON metadata
+        """
+        vectors = _normalize(vectors)
+        if not vectors.size:
+            raise ValueError("Cannot index a document without vectors")
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim vectors, got {vectors.shape[1]}")
+        count = len(vectors)
+
+        with self._lock:
+            if self.rows + count > self.capacity:
+                capacity = max(self.capacity * 2, INITIAL_CAPACITY)
+                while capacity < self.rows + count:
+                    capacity *= 2
+                self._allocate(capacity)
+                self._write_header()
+
+            start, end = self.rows, self.rows + count
+            self._write_rows(start, vectors)
+
+            # Vectors are flushed before the log entry that references them
+            event = {
+                "op": "add",
+                "key": key,
+                "rows": [start, end],
+                "metadata": metadata or {},
+                "payloads": payloads or [{} for _ in range(count)],
+            }
+            self._append_log(event)
+            self._apply(event)
+
+            if self._centroids is not None:
+                self._assign_rows(start, end)
+            self._maybe_train()
+
+    def _write_rows(self, start: int, vectors: np.ndarray) -> None:
+        end = start + len(vectors)
+        stored_vectors, stored_scales = self._maps()
+        if self.dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales = np.maximum(scales, 1e-12)
+            stored_vectors[start:end] = np.round(vectors / scales[:, None]).astype(
+                np.int8
+            )
+            stored_scales[start:end] = scales
+        else:
+            stored_vectors[start:end] = vectors.astype(np.float16)
+            stored_scales[start:end] = 1.0
+        stored_vectors.flush()
+        stored_scales.flush()
+
+    def _remove_document(self, key: str) -> bool:
+        document = self.documents.pop(key, None)
+        if document is None:
+            return False
+        start, end = document["rows"]
+        self._deleted[start:end] = True
+        return True
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a document (rows are tombstoned, reclaimed by compact())
+
+        Once more than COMPACT_DELETED_RATIO of the rows are deleted, a
+        compaction is started in a background thread.
+
+        Returns:
+            True if the document existed
+        """
+        with self._lock:
+            if key not in self.documents:
+                return False
+            self._append_log({"op": "delete", "key": key})
+            self._remove_document(key)
+
+            if self.rows and self._deleted[: self.rows].mean() > COMPACT_DELETED_RATIO:
+                self._schedule_compaction()
+            return True
+
+    def _schedule_compaction(self) -> None:
+        """Compact in a background thread (at most one at a time)"""
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        self._compaction = threading.Thread(
+            target=self._compact_in_background,
+            name="vector-index-compaction",
+            daemon=True,
+        )
+        self._compaction.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            print(f"⚠️  Vector index compaction failed: {e}")
+
+    def wait_for_compaction(self, timeout: float | None = None) -> None:
+        """Block until a background compaction (if any) has finished"""
+        if self._compaction is not None:
+            self._compaction.join(timeout)
+
+    def compact(self) -> None:
+        """
+        Rewrite the index without deleted rows
+
+        The surviving rows and a fresh log are written as the next
+        generation of files; replacing the header then switches to it in
+        one atomic step, and the old generation is removed afterwards.
+        """
+        with self._lock:
+            documents = sorted(self.documents.items(), key=lambda d: d[1]["rows"])
+            live = sum(end - start for _, d in documents for start, end in [d["rows"]])
+            capacity = INITIAL_CAPACITY
+            while capacity < live:
+                capacity *= 2
+
+            old_generation = self.generation
+            generation = old_generation + 1
+            self._remove_generation(generation)
+
+            # Copy stored rows as they are (no re-quantization)
+            vectors, scales = self._create_maps(
+                capacity,
+                self._file(VECTORS_FILE, generation),
+                self._file(SCALES_FILE, generation),
+            )
+            old_vectors, old_scales = self._maps()
+            events = []
+            row = 0
+            for key, document in documents:
+                start, end = document["rows"]
+                count = end - start
+                vectors[row : row + count] = old_vectors[start:end]
+                scales[row : row + count] = old_scales[start:end]
+                events.append(
+                    {
+                        "op": "add",
+                        "key": key,
+                        "rows": [row, row + count],
+                        "metadata": document["metadata"],
+                        "payloads": document["payloads"],
+                    }
+                )
+                row += count
+            vectors.flush()
+            scales.flush()
+            del vectors, scales, old_vectors, old_scales
+
+            with open(self._file(LOG_FILE, generation), "w", encoding="utf-8") as f:
+                for event in events:
+                    f.write(json.dumps(event, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Commit point: the header now names the new generation
+            self.capacity = capacity
+            self._write_header(generation)
+
+            # Switch the in-memory state to the new generation
+            self.generation = generation
+            self._vectors = self._scales = None
+            self._open_maps()
+            self.rows = 0
+            self.documents = {}
+            self._document_keys = []
+            self._deleted = np.zeros(capacity, dtype=bool)
+            self._row_document = np.zeros(capacity, dtype=np.int64)
+            for event in events:
+                self._apply(event)
+            self._centroids = self._assignments = None
+            self._trained_rows = 0
+            self._remove_generation(old_generation)
+            self._maybe_train()
+
+    # ========================================================================
+    # IVF (APPROXIMATE MODE)
+    # ========================================================================
+
+    def _ivf_enabled(self) -> bool:
+        if self.mode == "flat":
+            return False
+        if self.mode == "ivf":
+            return self.live_rows > 0
+        return self.live_rows >= self.ivf_min_vectors
+
+    def _maybe_train(self) -> None:
+        """Train IVF lists once enabled, retrain when the collection doubles"""
+        if not self._ivf_enabled():
+            return
+        if self._centroids is not None and self.live_rows < 2 * self._trained_rows:
+            return
+        self.train()
+
+    def train(self, seed: int = 0) -> None:
+        """Train coarse centroids (spherical k-means) and assign every row"""
+        with self._lock:
+            live = np.flatnonzero(~self._deleted[: self.rows])
+            if not len(live):
+                return
+            lists = max(1, int(np.sqrt(len(live))))
+
+            rng = np.random.default_rng(seed)
+            sample_size = min(len(live), lists * KMEANS_SAMPLE_PER_LIST)
+            sample = self._dequantize(
+                np.sort(rng.choice(live, size=sample_size, replace=False))
+            )
+
+            centroids = sample[rng.choice(len(sample), size=lists, replace=False)]
+            for _ in range(KMEANS_ITERATIONS):
+                nearest = (sample @ centroids.T).argmax(axis=1)
+                for c in range(lists):
+                    members = sample[nearest == c]
+                    if len(members):
+                        centroids[c] = members.sum(axis=0)
+                centroids = _normalize(centroids)
+
+            self._centroids = centroids.astype(np.float32)
+            self._assignments = np.full(self.capacity, -1, dtype=np.int32)
+            self._assign_rows(0, self.rows)
+            self._trained_rows = len(live)
+            self._save_ivf()
+            print(f"✅ Vector index: trained {lists} IVF lists on {len(live)} rows")
+
+    def _assign_rows(self, start: int, end: int) -> None:
+        if self._centroids is None or self._assignments is None:
+            return
+        if len(self._assignments) < self.capacity:
+            self._assignments = np.resize(self._assignments, self.capacity)
+        for block_start in range(start, end, SCORE_BLOCK_ROWS):
+            rows = np.arange(block_start, min(end, block_start + SCORE_BLOCK_ROWS))
+            self._assignments[rows] = (
+                self._dequantize(rows) @ self._centroids.T
+            ).argmax(axis=1)
+
+    # ========================================================================
+    # SEARCH
+    # ========================================================================
+
+    def _dequantize(self, rows: np.ndarray) -> np.ndarray:
+        stored_vectors, stored_scales = self._maps()
+        vectors = np.asarray(stored_vectors[rows], dtype=np.float32)
+        if self.dtype == "int8":
+            vectors *= stored_scales[rows][:, None]
+        return vectors
+
+    def _candidate_rows(self, queries: np.ndarray) -> np.ndarray:
+        """Live rows to score: all of them (flat) or the probed lists (IVF)"""
+        live = ~self._deleted[: self.rows]
+        if (
+            self._centroids is not None
+            and self._assignments is not None
+            and self._ivf_enabled()
+        ):
+            nprobe = min(self.nprobe, len(self._centroids))
+            probes = np.argpartition(
+                -(queries @ self._centroids.T), nprobe - 1, axis=1
+            )[:, :nprobe]
+            live &= np.isin(self._assignments[: self.rows], np.unique(probes))
+        return np.flatnonzero(live)
+
+    def score_rows(self, queries: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Cosine similarities (queries x rows) for the given rows"""
+        queries = _normalize(queries)
+        scores = np.empty((len(queries), len(rows)), dtype=np.float32)
+        for block_start in range(0, len(rows), SCORE_BLOCK_ROWS):
+            block = rows[block_start : block_start + SCORE_BLOCK_ROWS]
+            scores[:, block_start : block_start + len(block)] = (
+                queries @ self._dequantize(block).T
+            )
+        return scores
+
+    def search(self, queries: np.ndarray, top_k: int = 50) -> list[tuple[str, float]]:
+        """
+        Rank documents for a set of query vectors
+
+        A document's score is the mean over queries of its best-matching
+        row (the same requirement-vs-best-chunk rule as SemanticMatcher).
+
+        Args:
+            queries: (q, dim) query embeddings (e.g. JD requirements)
+            top_k: Number of documents to return
+
+        Returns:
+            [(document key, score)] best first
+        """
+        queries = _normalize(queries)
+        with self._lock:
+            rows = self._candidate_rows(queries)
+            if not len(rows):
+                return []
+            scores = self.score_rows(queries, rows)
+            row_documents = self._row_document[rows]
+            keys = self._document_keys
+
+        # Best row per (query, document); every document has at least one
+        # candidate row, so no -inf survives
+        documents, inverse = np.unique(row_documents, return_inverse=True)
+        best = np.full((len(queries), len(documents)), -np.inf, dtype=np.float32)
+        for q in range(len(queries)):
+            np.maximum.at(best[q], inverse, scores[q])
+        document_scores = best.mean(axis=0)
+
+        k = min(top_k, len(documents))
+        top = np.argpartition(-document_scores, k - 1)[:k]
+        top = top[np.argsort(-document_scores[top])]
+        return [(keys[documents[i]], float(document_scores[i])) for i in top]
+
+    def search_documents(
+        self, queries: np.ndarray, top_k: int = 50
+    ) -> list[dict[str, Any]]:
+        """
+        search() plus each hit's stored data, read under the index lock so
+        a concurrent delete or compaction cannot change the documents
+        between ranking and fetching
+
+        Returns:
+            [{"key", "score", "metadata", "payloads", "row_scores"}] best
+            first; row_scores are the (queries x document rows) similarities
+        """
+        queries = _normalize(queries)
+        with self._lock:
+            results = []
+            for key, score in self.search(queries, top_k):
+                document = self.documents[key]
+                results.append(
+                    {
+                        "key": key,
+                        "score": score,
+                        "metadata": document["metadata"],
+                        "payloads": document["payloads"],
+                        "row_scores": self.score_rows(
+                            queries, np.arange(*document["rows"])
+                        ),
+                    }
+                )
+            return results
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Stored metadata and payloads of a document (None if absent)"""
+        with self._lock:
+            document = self.documents.get(key)
+            if document is None:
+                return None
+            return {
+                "metadata": document["metadata"],
+                "payloads": document["payloads"],
+            }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self.documents),
+                "rows": self.rows,
+                "live_rows": self.live_rows,
+                "capacity": self.capacity,
+                "dim": self.dim,
+                "dtype": self.dtype,
+                "generation": self.generation,
+                "mode": "ivf" if self._centroids is not None else "flat",
+                "ivf_lists": 0 if self._centroids is None else len(self._centroids),
+                "nprobe": self.nprobe,
+            }
@@ -5,11 +5,14 @@
 # Export all types from centralized location
 from .api import (
     AnalysisResponse,
+    CandidateSearchRequest,
     ErrorResponse,
     FileUploadResponse,
     HealthCheckResponse,
     ImprovementPlanRequest,
     JobDescriptionRequest,
+    ReanalyzeRequest,
+    TextEdit,
 )
 from .ats import (
     AnalysisMetadata,
@@ -3,7 +3,7 @@
 # ============================================================================
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .common_types import ATSAnalysisResult, ExtractionResult
 
@@ -16,13 +16,48 @@ class JobDescriptionRequest(BaseModel):
 
 
 class ImprovementPlanRequest(BaseModel):
-    """Request model for improvement plan generation"""
+    """
+    Request model for improvement plan generation
 
-    analysis_result: ATSAnalysisResult
-    extracted_data: ExtractionResult
+    Either analysis_id (from /analyze or /quick-analyze), with the other
+    fields as optional overrides, or the full analysis_result and
+    extracted_data.
+    """
+
+    analysis_id: str | None = None
+    analysis_result: ATSAnalysisResult | None = None
+    extracted_data: ExtractionResult | None = None
     job_description: str | None = None
 
 
+class TextEdit(BaseModel):
+    """Replacement of the text between two character offsets"""
+
+    start: int = Field(ge=0)
+    end: int = Field(ge=0)
+    text: str = ""
+
+
+class ReanalyzeRequest(BaseModel):
+    """
+    Request model for incremental re-analysis of an edited resume
+
+    The edited resume is either the full text or a list of edits with
+    offsets into the text of the referenced analysis.
+    """
+
+    analysis_id: str
+    text: str | None = None
+    edits: list[TextEdit] | None = None
+
+
+class CandidateSearchRequest(BaseModel):
+    """Request model for searching stored resumes with a job description"""
+
+    job_description: str
+    top_k: int = Field(default=50, ge=1, le=500)
+
+
 class FileUploadResponse(BaseModel):
     """Response model for file upload"""
 
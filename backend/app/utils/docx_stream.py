@@ -0,0 +1,271 @@
+"""
+Streaming DOCX reader
+Reads the OOXML package directly: word/document.xml, headers and footers are
+streamed from the zip with an incremental XML parser (no object model), and
+images are counted from the package relationships. Produces the same text
+python-docx does for the parts the file parser uses.
+"""
+
+import posixpath
+import zipfile
+from typing import IO, Any
+from xml.etree.ElementTree import iterparse
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+DOCUMENT_PART = "word/document.xml"
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+
+# Run children with a text equivalent (as in python-docx CT_R.text)
+_RUN_TEXT = {
+    "tab": "\t",
+    "ptab": "\t",
+    "cr": "\n",
+    "noBreakHyphen": "-",
+}
+
+
+def _local(tag: str) -> str:
+    """Local name of a WordprocessingML tag ("" for other namespaces)"""
+    return tag[len(W_NS) :] if tag.startswith(W_NS) else ""
+
+
+class _ParagraphText:
+    """
+    Collects a paragraph's text from run events
+
+    Like python-docx, only runs that are children of the paragraph or of a
+    hyperlink in it count (tracked insertions, fields and content controls
+    inside the paragraph are skipped).
+    """
+
+    def __init__(self, depth: int):
+        self.depth = depth  # stack depth of the w:p element
+        self.parts: list[str] = []
+
+    def add(self, stack: list[str], elem: Any) -> None:
+        """Handle the end of a run child at the top of the stack"""
+        run_depth = len(stack) - 2
+        if stack[run_depth] != "r":
+            return
+        run_parent = run_depth - 1
+        if run_parent != self.depth and not (
+            run_parent == self.depth + 1 and stack[run_parent] == "hyperlink"
+        ):
+            return
+
+        name = stack[-1]
+        if name == "t":
+            self.parts.append(elem.text or "")
+        elif name == "br":
+            if elem.get(f"{W_NS}type", "textWrapping") == "textWrapping":
+                self.parts.append("\n")
+        elif name in _RUN_TEXT:
+            self.parts.append(_RUN_TEXT[name])
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
+class _TableCells:
+    """
+    Cell texts of a table in python-docx's grid layout
+
+    Mirrors python-docx Table._cells: every grid column a cell spans repeats
+    it, a vertically merged continuation repeats the cell one grid row up,
+    and rows are slices of column_count cells.
+    """
+
+    def __init__(self):
+        self.column_count = 0
+        self.row_count = 0
+        self.cells: list[str] = []
+
+    def add_cell(self, text: str, span: int, continues: bool) -> None:
+        for i in range(max(span, 1)):
+            if continues and len(self.cells) >= self.column_count > 0:
+                self.cells.append(self.cells[-self.column_count])
+            elif i > 0:
+                self.cells.append(self.cells[-1])
+            else:
+                self.cells.append(text)
+
+    def rows(self) -> list[list[str]]:
+        n = self.column_count
+        return [self.cells[i * n : (i + 1) * n] for i in range(self.row_count)]
+
+
+class DocxContent:
+    """Text-bearing content of a DOCX package, in python-docx terms"""
+
+    def __init__(self):
+        self.paragraphs: list[str] = []  # doc.paragraphs texts
+        self.tables: list[list[list[str]]] = []  # doc.tables -> rows -> row.cells
+        # Per section: header, footer texts (a section without either adds
+        # nothing, where python-docx would add an empty paragraph)
+        self.headers_footers: list[str] = []
+        self.images_count = 0
+
+
+def read_docx(file: IO[bytes]) -> DocxContent:
+    """
+    Read the text of a DOCX file by streaming its XML parts
+
+    Args:
+        file: Binary file object of the .docx package
+
+    Returns:
+        Body paragraphs, top-level tables (row.cells semantics: a merged cell
+        repeats for every grid column it spans and every row it continues
+        into), section header/footer paragraphs and the image count
+
+    Raises:
+        zipfile.BadZipFile, KeyError, xml.etree.ElementTree.ParseError
+    """
+    content = DocxContent()
+    with zipfile.ZipFile(file) as package:
+        relationships = _read_relationships(package)
+        content.images_count = sum(
+            1 for target in relationships.values() if "image" in target
+        )
+
+        with package.open(DOCUMENT_PART) as stream:
+            sections = _read_document(stream, content)
+
+        part_cache: dict[str, list[str]] = {}
+
+        def part_paragraphs(rel_id: str | None) -> list[str]:
+            if rel_id is None or rel_id not in relationships:
+                return []
+            name = posixpath.normpath(posixpath.join("word", relationships[rel_id]))
+            if name not in part_cache:
+                with package.open(name) as stream:
+                    part_cache[name] = _read_header_footer(stream)
+            return part_cache[name]
+
+        # A section without its own default header/footer shows the previous one's
+        header_id = footer_id = None
+        for section in sections:
+            header_id = section["header"] or header_id
+            footer_id = section["footer"] or footer_id
+            content.headers_footers.extend(part_paragraphs(header_id))
+            content.headers_footers.extend(part_paragraphs(footer_id))
+    return content
+
+
+def _read_relationships(package: zipfile.ZipFile) -> dict[str, str]:
+    """Relationship ID -> target of the main document part"""
+    try:
+        stream = package.open(DOCUMENT_RELS_PART)
+    except KeyError:
+        return {}
+    with stream:
+        return {
+            elem.get("Id", ""): elem.get("Target", "")
+            for _, elem in iterparse(stream)
+            if elem.tag == f"{REL_NS}Relationship"
+        }
+
+
+def _read_document(stream: IO[bytes], content: DocxContent) -> list[dict[str, Any]]:
+    """
+    Stream word/document.xml into content
+
+    Returns:
+        Sections in document order with their default header/footer rel IDs
+    """
+    stack: list[str] = []
+    body = None
+    paragraph: _ParagraphText | None = None
+    table: _TableCells | None = None
+    cell_paragraphs: list[str] | None = None
+    cell_span = 1
+    cell_continues = False
+    sections: list[dict[str, Any]] = []
+    section: dict[str, Any] | None = None
+
+    for event, elem in iterparse(stream, events=("start", "end")):
+        if event == "start":
+            name = _local(elem.tag)
+            stack.append(name)
+            depth = len(stack) - 1
+            if depth == 1 and name == "body":
+                body = elem
+            elif name == "p" and (
+                depth == 2 or (depth == 5 and cell_paragraphs is not None)
+            ):
+                paragraph = _ParagraphText(depth)
+            elif depth == 2 and name == "tbl":
+                table = _TableCells()
+            elif depth == 4 and name == "tc" and table is not None:
+                cell_paragraphs, cell_span, cell_continues = [], 1, False
+            elif name == "sectPr" and (
+                depth == 2 or (depth == 4 and stack[2] == "p" and stack[3] == "pPr")
+            ):
+                section = {"header": None, "footer": None}
+            continue
+
+        name = stack[-1]
+        depth = len(stack) - 1
+        if paragraph is not None and depth > paragraph.depth + 1:
+            paragraph.add(stack, elem)
+
+        if paragraph is not None and depth == paragraph.depth and name == "p":
+            if depth == 2:
+                content.paragraphs.append(paragraph.text)
+            elif cell_paragraphs is not None:
+                cell_paragraphs.append(paragraph.text)
+            paragraph = None
+        elif table is not None and depth == 4 and name == "tc":
+            table.add_cell("\n".join(cell_paragraphs or []), cell_span, cell_continues)
+            cell_paragraphs = None
+        elif table is not None and depth == 6 and stack[4:6] == ["tc", "tcPr"]:
+            if name == "gridSpan":
+                cell_span = int(elem.get(f"{W_NS}val", "1"))
+            elif name == "vMerge":
+                cell_continues = elem.get(f"{W_NS}val", "continue") == "continue"
+        elif table is not None and depth == 4 and name == "gridCol":
+            table.column_count += 1
+        elif table is not None and depth == 3 and name == "tr":
+            table.row_count += 1
+        elif table is not None and depth == 2 and name == "tbl":
+            content.tables.append(table.rows())
+            table = None
+        elif section is not None and name in ("headerReference", "footerReference"):
+            if elem.get(f"{W_NS}type", "default") == "default":
+                key = "header" if name == "headerReference" else "footer"
+                section[key] = elem.get(f"{R_NS}id")
+        elif section is not None and name == "sectPr":
+            sections.append(section)
+            section = None
+
+        stack.pop()
+        # Drop finished body children so memory stays flat on long documents
+        if depth == 2 and body is not None:
+            body.remove(elem)
+
+    return sections
+
+
+def _read_header_footer(stream: IO[bytes]) -> list[str]:
+    """Texts of the paragraphs directly in a header or footer part"""
+    stack: list[str] = []
+    paragraphs: list[str] = []
+    paragraph: _ParagraphText | None = None
+    for event, elem in iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(_local(elem.tag))
+            if len(stack) == 2 and stack[-1] == "p":
+                paragraph = _ParagraphText(1)
+            continue
+        if paragraph is not None:
+            if len(stack) == 2 and stack[-1] == "p":
+                paragraphs.append(paragraph.text)
+                paragraph = None
+            elif len(stack) > 3:
+                paragraph.add(stack, elem)
+        stack.pop()
+    return paragraphs
@@ -4,21 +4,31 @@ Uses PyMuPDF (fitz) for better PDF extraction and includes formatting checks
 """
 
 import io
-import re
+import os
 from typing import Any
 
 import fitz  # PyMuPDF
 from docx import Document
 
+from app.core.error_handling import DocumentParseError
+from app.utils.docx_stream import DocxContent, read_docx
+from app.utils.pdf_layout import PdfLayoutAnalysis
+
+# DOCX engine: "stream" (zip + incremental XML) or "python-docx" (object model)
+DOCX_PARSER = os.getenv("DOCX_PARSER", "stream").lower()
+# PDFs with more pages are rejected before any page is read (0 = no limit)
+MAX_PDF_PAGES = int(os.getenv("PARSER_MAX_PAGES", "50"))
+
 
 class FileParser:
     """
     Enhanced file parser with better PDF extraction and formatting analysis
     """
 
-    def __init__(self):
-        """Initialize parser with supported formats"""
+    def __init__(self, max_pages: int = MAX_PDF_PAGES):
+        """Initialize parser with supported formats and the PDF page cap"""
         self.supported_formats = [".pdf", ".docx", ".doc", ".txt"]
+        self.max_pages = max_pages
 
     def parse_file(self, file_content: bytes, filename: str) -> dict[str, Any]:
         """
@@ -50,12 +60,18 @@ class FileParser:
         try:
             pdf_file = io.BytesIO(file_content)
             doc = fitz.open(stream=pdf_file, filetype="pdf")
+            if self.max_pages and len(doc) > self.max_pages:
+                raise DocumentParseError(
+                    f"PDF has {len(doc)} pages - the limit is {self.max_pages}",
+                    "PAGE_LIMIT",
+                    {"pages": len(doc), "max_pages": self.max_pages},
+                )
 
             text = ""
             images_count = 0
-            tables_detected = False
             fonts_used = set()
             formatting_issues = []
+            layout = PdfLayoutAnalysis()
 
             for page_num in range(len(doc)):
                 page = doc[page_num]
@@ -96,17 +112,12 @@ class FileParser:
                             for span in line["spans"]:
                                 fonts_used.add(span.get("font", "Unknown"))
 
-                # Detect tables (can cause parsing issues)
-                if self._detect_tables_in_text(page_text):
-                    tables_detected = True
-
-                # Detect text formatting issues
-                if self._detect_formatting_issues(page_text):
-                    formatting_issues.append(
-                        f"Page {page_num + 1}: Potential formatting issues detected"
-                    )
+                # Columns, tables, bullets and header zones from the geometry
+                layout.add_page(text_dict)
 
             # Analyze formatting issues
+            formatting_issues.extend(layout.issues())
+            tables_detected = layout.tables_count > 0
             if images_count > 0:
                 formatting_issues.append(
                     f"Contains {images_count} image(s) - may cause ATS parsing issues"
@@ -148,71 +159,62 @@ class FileParser:
                 "file_type": "pdf",
                 "formatting_analysis": {
                     "images_count": images_count,
+                    "tables_count": layout.tables_count,
                     "tables_detected": tables_detected,
                     "fonts_count": len(fonts_used),
                     "fonts_used": list(fonts_used),
+                    "layout": layout.to_dict(),
                     "formatting_issues": formatting_issues,
                     "ats_friendly": len(formatting_issues) == 0,
                 },
             }
 
+        except DocumentParseError:
+            raise
         except Exception as e:
             raise Exception(f"Error parsing PDF: {e!s}")
 
     def _parse_docx_enhanced(self, file_content: bytes) -> dict[str, Any]:
         """
         Enhanced DOCX parsing with formatting analysis
+
+        Uses the streaming reader (DOCX_PARSER=stream, default) or the
+        python-docx object model (DOCX_PARSER=python-docx); both yield the
+        same text and formatting analysis.
         """
         try:
             docx_file = io.BytesIO(file_content)
-            doc = Document(docx_file)
+            if DOCX_PARSER == "python-docx":
+                content = self._read_docx_object_model(docx_file)
+            else:
+                content = read_docx(docx_file)
 
             text = ""
-            tables_count = len(doc.tables)
-            images_count = 0
+            tables_count = len(content.tables)
+            images_count = content.images_count
             formatting_issues = []
 
             # Extract text from paragraphs with better structure preservation
-            for paragraph in doc.paragraphs:
-                para_text = paragraph.text.strip()
+            for paragraph_text in content.paragraphs:
+                para_text = paragraph_text.strip()
                 if para_text:
                     text += para_text + "\n"
 
             # Extract text from tables with better formatting
-            for table in doc.tables:
+            for table in content.tables:
                 table_text = ""
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        cell_text = cell.text.strip()
-                        if cell_text:
-                            row_text.append(cell_text)
+                for row in table:
+                    row_text = [cell.strip() for cell in row if cell.strip()]
                     if row_text:
                         table_text += " | ".join(row_text) + "\n"
                 if table_text:
                     text += table_text + "\n"
 
             # Extract text from headers and footers
-            for section in doc.sections:
-                if section.header:
-                    for paragraph in section.header.paragraphs:
-                        header_text = paragraph.text.strip()
-                        if header_text:
-                            text += header_text + "\n"
-
-                if section.footer:
-                    for paragraph in section.footer.paragraphs:
-                        footer_text = paragraph.text.strip()
-                        if footer_text:
-                            text += footer_text + "\n"
-
-            # Count images/shapes
-            try:
-                for rel in doc.part.rels.values():
-                    if "image" in rel.target_ref:
-                        images_count += 1
-            except:
-                pass
+            for paragraph_text in content.headers_footers:
+                header_text = paragraph_text.strip()
+                if header_text:
+                    text += header_text + "\n"
 
             # Analyze formatting issues
             if images_count > 0:
@@ -233,7 +235,7 @@ class FileParser:
                 "text": text.strip(),
                 "word_count": word_count,
                 "character_count": character_count,
-                "paragraph_count": len(doc.paragraphs),
+                "paragraph_count": len(content.paragraphs),
                 "file_type": "docx",
                 "formatting_analysis": {
                     "images_count": images_count,
@@ -247,6 +249,28 @@ class FileParser:
         except Exception as e:
             raise Exception(f"Error parsing DOCX: {e!s}")
 
+    def _read_docx_object_model(self, docx_file: io.BytesIO) -> DocxContent:
+        """Read a DOCX through the full python-docx object model"""
+        doc = Document(docx_file)
+        content = DocxContent()
+        content.paragraphs = [paragraph.text for paragraph in doc.paragraphs]
+        content.tables = [
+            [[cell.text for cell in row.cells] for row in table.rows]
+            for table in doc.tables
+        ]
+        for section in doc.sections:
+            for part in (section.header, section.footer):
+                content.headers_footers.extend(p.text for p in part.paragraphs)
+
+        # Count images/shapes
+        try:
+            content.images_count = sum(
+                1 for rel in doc.part.rels.values() if "image" in rel.target_ref
+            )
+        except:
+            pass
+        return content
+
     def _parse_txt(self, file_content: bytes) -> dict[str, Any]:
         """
         Parse TXT files (always ATS-friendly)
@@ -274,37 +298,6 @@ class FileParser:
         except Exception as e:
             raise Exception(f"Error parsing TXT: {e!s}")
 
-    def _detect_tables_in_text(self, text: str) -> bool:
-        """
-        Simple table detection based on text patterns
-        """
-        lines = text.split("\n")
-
-        # Look for patterns like multiple tabs or spaces indicating columns
-        tabular_lines = 0
-        for line in lines:
-            if "\t" in line or re.search(r"\s{3,}", line):
-                tabular_lines += 1
-
-        # If more than 3 lines look like tables, flag it
-        return tabular_lines > 3
-
-    def _detect_formatting_issues(self, text: str) -> bool:
-        """Detect potential formatting issues in text"""
-        # Check for excessive special characters
-        special_char_count = len(re.findall(r"[^\w\s\.\,\;\:\!\?\-\(\)]", text))
-        if special_char_count > len(text) * 0.1:  # More than 10% special characters
-            return True
-
-        # Check for excessive whitespace
-        if re.search(r"\s{5,}", text):  # 5 or more consecutive spaces
-            return True
-
-        # Check for mixed case issues
-        return (
-            re.search(r"[A-Z]{5,}", text) is not None
-        )  # 5 or more consecutive uppercase letters
-
 
 # Create global instance
 file_parser = FileParser()
@@ -0,0 +1,381 @@
+"""
+Isolated Document Parser Pool
+Runs FileParser.parse_file in sandboxed subprocess workers so a pathological
+upload (huge page count, decompression bomb, deeply nested objects) can only
+take down its own worker: every job has a wall-clock timeout, every worker an
+address-space limit and the PDF page cap. Workers are started with the app;
+workers that time out, exceed their memory or crash are replaced in the
+background.
+"""
+
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Any
+
+from app.core.error_handling import DocumentParseError
+from app.core.metrics import metrics
+from app.utils.file_parser import MAX_PDF_PAGES, FileParser, file_parser
+
+PARSER_POOL_ENABLED = os.getenv("PARSER_POOL_ENABLED", "true").lower() == "true"
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", "2"))
+PARSER_TIMEOUT_S = float(os.getenv("PARSER_TIMEOUT_S", "20"))
+# Time a job waits for a free worker before it is rejected as busy
+PARSER_SLOT_TIMEOUT_S = float(os.getenv("PARSER_SLOT_TIMEOUT_S", "2"))
+# Time a new worker gets to import the parsers before it counts as failed
+PARSER_START_TIMEOUT_S = float(os.getenv("PARSER_START_TIMEOUT_S", "30"))
+# Address-space limit of a worker process (0 = no limit)
+PARSER_MEMORY_LIMIT_MB = int(os.getenv("PARSER_MEMORY_LIMIT_MB", "1024"))
+# Workers are replaced after this many jobs to bound leaks in native parsers
+PARSER_MAX_JOBS_PER_WORKER = int(os.getenv("PARSER_MAX_JOBS_PER_WORKER", "200"))
+
+PARSE_MS_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000)
+
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+
+def _limit_memory(limit_mb: int) -> None:
+    """Cap the worker's address space (a no-op where rlimits are unsupported)"""
+    if limit_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        print(f"⚠️  Parser worker memory limit not applied: {e}")
+
+
+def _worker_main(conn: Connection, memory_limit_mb: int, max_pages: int) -> None:
+    """
+    Worker loop: receive (file_content, filename), send back a tagged result
+
+    The worker sends ("ready",) once set up. Replies are ("ok", parsed),
+    ("rejected", error_code, message, details), ("error", message) or
+    ("memory", message); the worker exits after a MemoryError since the
+    parser's native state can no longer be trusted.
+    """
+    _limit_memory(memory_limit_mb)
+    parser = FileParser(max_pages=max_pages)
+    conn.send(("ready",))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        except MemoryError:
+            # The upload alone does not fit in the worker's address space
+            conn.send(("memory", "parser ran out of memory"))
+            return
+        if job is None:
+            return
+
+        file_content, filename = job
+        try:
+            conn.send(("ok", parser.parse_file(file_content, filename)))
+        except DocumentParseError as e:
+            conn.send(("rejected", e.error_code, e.message, e.details))
+        except MemoryError:
+            conn.send(("memory", "parser ran out of memory"))
+            return
+        except Exception as e:
+            if isinstance(e.__context__, MemoryError):
+                conn.send(("memory", "parser ran out of memory"))
+                return
+            conn.send(("error", str(e)))
+
+
+class _Worker:
+    """One parser subprocess and the parent's end of its pipe"""
+
+    def __init__(self, context: Any, memory_limit_mb: int, max_pages: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, max_pages),
+            name="resume-parser",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        """Stop the process at once (timeouts, crashes)"""
+        self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+    def stop(self) -> None:
+        """Ask the process to exit after its current job"""
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=1)
+        except (BrokenPipeError, OSError):
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+
+# ============================================================================
+# POOL
+# ============================================================================
+
+
+class ParserPool:
+    """
+    Fixed-size pool of isolated parser processes
+
+    A job checks out one worker slot. start() fills every slot with a
+    process ahead of the first job; a slot whose worker was killed or has
+    served max_jobs_per_worker jobs is refilled in the background, so a
+    crashed or poisoned worker never serves another request and requests
+    do not wait for process start-up. A job that still finds an empty slot
+    (start-up failed) spawns inline, within its own parse timeout.
+
+    A request therefore takes at most slot_timeout_s + timeout_s.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = PARSER_WORKERS,
+        timeout_s: float = PARSER_TIMEOUT_S,
+        memory_limit_mb: int = PARSER_MEMORY_LIMIT_MB,
+        max_pages: int = MAX_PDF_PAGES,
+        max_jobs_per_worker: int = PARSER_MAX_JOBS_PER_WORKER,
+        enabled: bool = PARSER_POOL_ENABLED,
+        slot_timeout_s: float = PARSER_SLOT_TIMEOUT_S,
+    ):
+        self.workers = workers
+        self.timeout_s = timeout_s
+        self.slot_timeout_s = slot_timeout_s
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.enabled = enabled and workers > 0
+        # spawn: a forked copy of a threaded server process is not safe
+        self._context = multiprocessing.get_context("spawn")
+        self._slots: queue.Queue[_Worker | None] = queue.Queue()
+        for _ in range(max(workers, 0)):
+            self._slots.put(None)
+        self._live: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def start(self) -> None:
+        """Spawn the workers in the background (call once at app start-up)"""
+        if not self.enabled or self._started:
+            return
+        self._started = True
+        for _ in range(self.workers):
+            try:
+                worker = self._slots.get_nowait()
+            except queue.Empty:
+                break
+            if worker is None:
+                self._refill()
+            else:
+                self._slots.put(worker)
+
+    def _refill(self) -> None:
+        """Spawn a worker for a checked-out empty slot, off the request path"""
+
+        def spawn() -> None:
+            worker = None
+            try:
+                worker = self._spawn(PARSER_START_TIMEOUT_S)
+                if self._closed:
+                    self._discard(worker)
+                    worker = None
+            except DocumentParseError as e:
+                print(f"⚠️  Parser worker did not start: {e.message}")
+            finally:
+                self._slots.put(worker)
+
+        threading.Thread(target=spawn, name="parser-pool-spawn", daemon=True).start()
+
+    def parse(self, file_content: bytes, filename: str) -> dict[str, Any]:
+        """
+        Parse a document in a worker process
+
+        Args:
+            file_content: The file data as bytes
+            filename: The name of the file
+
+        Returns:
+            FileParser.parse_file result
+
+        Raises:
+            DocumentParseError: Page cap exceeded, parse timeout, memory limit,
+                worker crash or no worker free within slot_timeout_s
+            Exception: The parser's own error for unreadable files
+        """
+        if not self.enabled:
+            return file_parser.parse_file(file_content, filename)
+
+        started = time.perf_counter()
+        try:
+            worker = self._slots.get(timeout=self.slot_timeout_s)
+        except queue.Empty:
+            metrics.increment("parser_pool.busy")
+            raise DocumentParseError(
+                "All document parser workers are busy, try again shortly",
+                "PARSER_BUSY",
+            )
+
+        try:
+            if worker is not None and not worker.is_alive():
+                metrics.increment("parser_pool.crashes")
+                self._discard(worker, kill=True)
+                worker = None
+            # Start-up time of an inline spawn counts against the parse timeout
+            timeout_s = self.timeout_s
+            if worker is None:
+                spawn_started = time.perf_counter()
+                worker = self._spawn(min(PARSER_START_TIMEOUT_S, self.timeout_s))
+                timeout_s -= time.perf_counter() - spawn_started
+
+            reply = self._run(worker, file_content, filename, max(timeout_s, 0.0))
+            worker.jobs += 1
+            if worker.jobs >= self.max_jobs_per_worker:
+                metrics.increment("parser_pool.recycled")
+                self._discard(worker)
+                worker = None
+        except BaseException:
+            if worker is not None and not worker.is_alive():
+                self._discard(worker, kill=True)
+                worker = None
+            raise
+        finally:
+            if worker is None and self._started:
+                self._refill()
+            else:
+                self._slots.put(worker)
+            metrics.observe(
+                "parser_pool.parse_ms",
+                (time.perf_counter() - started) * 1000,
+                buckets=PARSE_MS_BUCKETS,
+            )
+
+        metrics.increment("parser_pool.jobs")
+        return reply
+
+    def _run(
+        self, worker: _Worker, file_content: bytes, filename: str, timeout_s: float
+    ) -> Any:
+        """Send one job and wait for its reply, killing the worker on timeout"""
+        try:
+            worker.conn.send((file_content, filename))
+            ready = worker.conn.poll(timeout_s)
+        except (BrokenPipeError, EOFError, OSError):
+            ready = True  # the worker died; recv below reports it
+
+        if not ready:
+            metrics.increment("parser_pool.timeouts")
+            metrics.increment("parser_pool.kills")
+            worker.kill()
+            raise DocumentParseError(
+                f"Document parsing took longer than {self.timeout_s:g}s",
+                "PARSE_TIMEOUT",
+                {"timeout_s": self.timeout_s},
+            )
+
+        try:
+            reply = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=1)
+            exitcode = worker.process.exitcode
+            metrics.increment("parser_pool.crashes")
+            worker.kill()
+            raise DocumentParseError(
+                "Document parser crashed on this file",
+                "PARSER_CRASHED",
+                {"exitcode": exitcode},
+            )
+
+        status = reply[0]
+        if status == "ok":
+            return reply[1]
+        if status == "rejected":
+            metrics.increment("parser_pool.rejected")
+            raise DocumentParseError(reply[2], reply[1], reply[3])
+        if status == "memory":
+            metrics.increment("parser_pool.memory_limit")
+            worker.kill()
+            raise DocumentParseError(
+                f"Document parsing exceeded the {self.memory_limit_mb} MB memory limit",
+                "MEMORY_LIMIT",
+                {"memory_limit_mb": self.memory_limit_mb},
+            )
+        raise Exception(reply[1])
+
+    def _spawn(self, timeout_s: float) -> _Worker:
+        """Start a worker and wait (up to timeout_s) until it is ready for jobs"""
+        worker = _Worker(self._context, self.memory_limit_mb, self.max_pages)
+        try:
+            ready = worker.conn.poll(timeout_s) and worker.conn.recv()
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            metrics.increment("parser_pool.start_failures")
+            worker.kill()
+            raise DocumentParseError(
+                "Document parser is unavailable, try again shortly",
+                "PARSER_UNAVAILABLE",
+            )
+        with self._lock:
+            self._live.add(worker)
+        metrics.increment("parser_pool.spawned")
+        return worker
+
+    def _discard(self, worker: _Worker, kill: bool = False) -> None:
+        with self._lock:
+            self._live.discard(worker)
+        if kill:
+            if worker.process.is_alive():
+                metrics.increment("parser_pool.kills")
+            worker.kill()
+        else:
+            worker.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """Pool configuration and live worker count"""
+        with self._lock:
+            live = sum(1 for worker in self._live if worker.is_alive())
+        return {
+            "enabled": self.enabled,
+            "workers": self.workers,
+            "live_workers": live,
+            "timeout_s": self.timeout_s,
+            "slot_timeout_s": self.slot_timeout_s,
+            "memory_limit_mb": self.memory_limit_mb,
+            "max_pages": self.max_pages,
+        }
+
+    def close(self) -> None:
+        """Stop all worker processes"""
+        with self._lock:
+            self._closed = True
+            workers, self._live = list(self._live), set()
+        for worker in workers:
+            worker.stop()
+
+
+# Global instance
+parser_pool = ParserPool()
+atexit.register(parser_pool.close)
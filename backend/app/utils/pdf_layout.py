@@ -0,0 +1,389 @@
+"""
+PDF Layout Analysis
+Finds columns, tables, bullets and header/footer zones from the block, line
+and span geometry of PyMuPDF's page.get_text("dict"), in one pass per page,
+so the parser and the analyzers read layout facts instead of re-deriving
+them from plain text with whitespace and capitalization regexes
+"""
+
+import bisect
+import re
+from typing import Any
+
+# Bullet glyphs counted by the analyzers; symbol-font bullets (private use
+# area code points from Word exports) are reported as their visible glyph
+BULLET_GLYPHS = ("•", "●", "◦", "▪", "▸", "→", "-", "*", "✓", "►")
+SYMBOL_FONT_BULLETS = {"\uf0b7": "•", "\uf0a7": "▪", "\uf0fc": "✓", "\uf0d8": "►"}
+
+# Top and bottom page bands treated as header and footer zones
+ZONE_RATIO = 0.05
+# Column gutters are searched in this horizontal band of the page
+GUTTER_BAND = (0.2, 0.8)
+GUTTER_BINS = 100
+MIN_GUTTER_BINS = 2
+# Lines on each side of a gutter: at least this many and this share
+MIN_COLUMN_LINES = 5
+MIN_COLUMN_SHARE = 0.15
+# Share of lines allowed to cross a gutter (full-width name, headings)
+MAX_GUTTER_CROSSING = 0.05
+# Sides whose lines share rows beyond this share are table cells, not columns
+MAX_COLUMN_ROW_SHARE = 0.8
+# Cells of consecutive table rows start or end within this share of the width
+CELL_ALIGN_RATIO = 0.02
+# Spans further apart than this many font sizes are separate cells
+CELL_GAP_EM = 1.0
+# Rows needed for a table of 2 cells per row / of 3 or more
+MIN_TABLE_ROWS = {2: 4, 3: 3}
+
+_CONTACT_PATTERN = re.compile(r"@|\+?\d[\d\s().-]{7,}\d|linkedin\.com", re.IGNORECASE)
+_SPECIAL_CHAR_PATTERN = re.compile(r"[^\w\s\.\,\;\:\!\?\-\(\)]")
+
+
+class _Segment:
+    """Horizontally contiguous text of one row (a table cell candidate)"""
+
+    def __init__(self, bbox: tuple[float, ...], size: float):
+        self.x0, self.y0, self.x1, self.y1 = bbox[:4]
+        self.size = size
+
+    def extend(self, bbox: tuple[float, ...]) -> None:
+        self.x1 = max(self.x1, bbox[2])
+        self.y0 = min(self.y0, bbox[1])
+        self.y1 = max(self.y1, bbox[3])
+
+
+def _bullet(text: str, first_span_text: str) -> str | None:
+    """Bullet glyph a line starts with (None if it is not a bullet line)"""
+    stripped = text.lstrip()
+    if not stripped:
+        return None
+    glyph = SYMBOL_FONT_BULLETS.get(stripped[0], stripped[0])
+    if glyph not in BULLET_GLYPHS:
+        return None
+    # "-" and "*" only count as bullets when set apart ("- Led", not "-5%")
+    if glyph in ("-", "*"):
+        rest = stripped[1:2]
+        if rest and not rest.isspace() and first_span_text.strip() != stripped[0]:
+            return None
+    return glyph
+
+
+def _row_share(
+    left: list[tuple[float, float, float, float]],
+    right: list[tuple[float, float, float, float]],
+) -> float:
+    """Share of the smaller side's lines with a line on the same row opposite"""
+    side, other = (left, right) if len(left) <= len(right) else (right, left)
+    centers = sorted((ln[1] + ln[3]) / 2 for ln in other)
+    shared = 0
+    for x0, y0, x1, y1 in side:
+        center, half = (y0 + y1) / 2, (y1 - y0) / 2
+        index = bisect.bisect_left(centers, center - half)
+        if index < len(centers) and centers[index] <= center + half:
+            shared += 1
+    return shared / len(side)
+
+
+class PdfLayoutAnalysis:
+    """
+    Layout facts of a PDF, accumulated page by page
+
+    Call add_page() with each page's get_text("dict") result, then
+    to_dict() for the formatting_analysis "layout" entry and issues() for
+    formatting issues.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.multi_column_pages: list[int] = []
+        self.max_columns = 1
+        self.table_pages: list[int] = []
+        self.tables_count = 0
+        self.table_rows = 0
+        self.bullet_counts: dict[str, int] = {}
+        self.zones: dict[str, list[list[str]]] = {"header": [], "footer": []}
+        self.words = 0
+        self.caps_words = 0
+        self.characters = 0
+        self.special_characters = 0
+        self.special_character_pages: list[int] = []
+
+    def add_page(self, page_dict: dict[str, Any]) -> dict[str, Any]:
+        """
+        Analyze one page
+
+        Args:
+            page_dict: PyMuPDF page.get_text("dict") result
+
+        Returns:
+            Page summary: {"columns", "tables", "bullets"}
+        """
+        self.pages += 1
+        page_number = self.pages
+        width = page_dict.get("width") or 1.0
+        height = page_dict.get("height") or 1.0
+        top, bottom = height * ZONE_RATIO, height * (1 - ZONE_RATIO)
+
+        body_lines: list[tuple[float, float, float, float]] = []
+        spans: list[tuple[tuple[float, ...], float]] = []
+        zone_text: dict[str, list[str]] = {"header": [], "footer": []}
+        page_bullets = 0
+        page_chars = page_special = 0
+
+        for block in page_dict.get("blocks", []):
+            for line in block.get("lines", []):
+                line_spans = [s for s in line.get("spans", []) if s.get("text")]
+                text = "".join(s["text"] for s in line_spans)
+                if not text.strip():
+                    continue
+                x0, y0, x1, y1 = line["bbox"]
+
+                words = text.split()
+                self.words += len(words)
+                self.caps_words += sum(1 for w in words if w.isupper() and len(w) > 1)
+                page_chars += len(text)
+                page_special += len(_SPECIAL_CHAR_PATTERN.findall(text))
+
+                if y1 <= top:
+                    zone_text["header"].append(text.strip())
+                    continue
+                if y0 >= bottom:
+                    zone_text["footer"].append(text.strip())
+                    continue
+
+                glyph = _bullet(text, line_spans[0]["text"])
+                if glyph:
+                    self.bullet_counts[glyph] = self.bullet_counts.get(glyph, 0) + 1
+                    page_bullets += 1
+
+                # Horizontal text only: rotated sidebars say nothing of columns
+                direction = line.get("dir", (1, 0))
+                if abs(direction[1]) > 0.01:
+                    continue
+                body_lines.append((x0, y0, x1, y1))
+                spans.extend(
+                    (s["bbox"], s.get("size", 10.0))
+                    for s in line_spans
+                    if s["text"].strip()
+                )
+
+        for zone, texts in zone_text.items():
+            self.zones[zone].append(texts)
+
+        self.characters += page_chars
+        self.special_characters += page_special
+        if page_chars and page_special > page_chars * 0.1:
+            self.special_character_pages.append(page_number)
+
+        gutters = self._find_gutters(body_lines, width)
+        columns = len(gutters) + 1
+        if columns > 1:
+            self.multi_column_pages.append(page_number)
+            self.max_columns = max(self.max_columns, columns)
+
+        tables, rows = self._find_tables(spans, gutters, width)
+        if tables:
+            self.table_pages.append(page_number)
+            self.tables_count += tables
+            self.table_rows += rows
+
+        return {"columns": columns, "tables": tables, "bullets": page_bullets}
+
+    def _find_gutters(
+        self, lines: list[tuple[float, float, float, float]], width: float
+    ) -> list[float]:
+        """
+        X positions of column gutters: vertical strips no (or almost no) line
+        crosses, with enough vertically overlapping lines on both sides
+        """
+        if len(lines) < 2 * MIN_COLUMN_LINES:
+            return []
+
+        coverage = [0] * GUTTER_BINS
+        for x0, _, x1, _ in lines:
+            first = max(int(x0 / width * GUTTER_BINS), 0)
+            last = min(int(x1 / width * GUTTER_BINS), GUTTER_BINS - 1)
+            for b in range(first, last + 1):
+                coverage[b] += 1
+
+        allowed = max(1, int(len(lines) * MAX_GUTTER_CROSSING))
+        band = range(
+            int(GUTTER_BAND[0] * GUTTER_BINS), int(GUTTER_BAND[1] * GUTTER_BINS)
+        )
+        runs: list[tuple[int, int]] = []
+        for b in band:
+            if coverage[b] <= allowed:
+                if runs and runs[-1][1] == b - 1:
+                    runs[-1] = (runs[-1][0], b)
+                else:
+                    runs.append((b, b))
+
+        min_side = max(MIN_COLUMN_LINES, int(len(lines) * MIN_COLUMN_SHARE))
+        gutters = []
+        for start, end in runs:
+            if end - start + 1 < MIN_GUTTER_BINS:
+                continue
+            left_edge = start / GUTTER_BINS * width
+            right_edge = (end + 1) / GUTTER_BINS * width
+            left = [ln for ln in lines if ln[2] <= right_edge and ln[0] < left_edge]
+            right = [ln for ln in lines if ln[0] >= left_edge and ln[2] > right_edge]
+            if len(left) < min_side or len(right) < min_side:
+                continue
+            # Side by side, not one block above the other
+            top = max(min(ln[1] for ln in left), min(ln[1] for ln in right))
+            bottom = min(max(ln[3] for ln in left), max(ln[3] for ln in right))
+            shorter = min(
+                max(ln[3] for ln in left) - min(ln[1] for ln in left),
+                max(ln[3] for ln in right) - min(ln[1] for ln in right),
+            )
+            if shorter <= 0 or bottom - top < shorter * 0.5:
+                continue
+            # Columns are separate text flows; cells of one grid share rows
+            if _row_share(left, right) > MAX_COLUMN_ROW_SHARE:
+                continue
+            gutters.append((left_edge + right_edge) / 2)
+        return gutters
+
+    def _find_tables(
+        self,
+        spans: list[tuple[tuple[float, ...], float]],
+        gutters: list[float],
+        width: float,
+    ) -> tuple[int, int]:
+        """
+        Count tables: runs of consecutive rows, within one column, that split
+        into the same number of aligned cells
+
+        Returns:
+            Tuple of (tables, table rows)
+        """
+        if not spans:
+            return 0, 0
+
+        # Group spans into rows by vertical center
+        spans = sorted(spans, key=lambda s: ((s[0][1] + s[0][3]) / 2, s[0][0]))
+        rows: list[list[tuple[tuple[float, ...], float]]] = []
+        row_center = row_height = 0.0
+        for bbox, size in spans:
+            center, span_height = (bbox[1] + bbox[3]) / 2, bbox[3] - bbox[1]
+            if rows and abs(center - row_center) <= max(row_height, span_height) * 0.5:
+                rows[-1].append((bbox, size))
+            else:
+                rows.append([(bbox, size)])
+                row_center, row_height = center, span_height
+
+        edges = [0.0, *gutters, float("inf")]
+        tolerance = width * CELL_ALIGN_RATIO
+        runs: list[list[list[_Segment]]] = []
+        for column in range(len(edges) - 1):
+            run: list[list[_Segment]] = []
+            for row in rows:
+                cells = self._row_cells(row, edges[column], edges[column + 1])
+                if not cells:
+                    continue  # row of another column
+                if (
+                    run
+                    and len(cells) == len(run[-1])
+                    and all(
+                        abs(a.x0 - b.x0) <= tolerance or abs(a.x1 - b.x1) <= tolerance
+                        for a, b in zip(cells, run[-1], strict=True)
+                    )
+                ):
+                    run.append(cells)
+                    continue
+                runs.append(run)
+                run = [cells] if len(cells) >= 2 else []
+            runs.append(run)
+
+        tables = [
+            run
+            for run in runs
+            if run and len(run) >= MIN_TABLE_ROWS[min(len(run[0]), 3)]
+        ]
+        return len(tables), sum(len(run) for run in tables)
+
+    @staticmethod
+    def _row_cells(
+        row: list[tuple[tuple[float, ...], float]], left: float, right: float
+    ) -> list[_Segment]:
+        """Merge a row's spans inside [left, right) into cells"""
+        cells: list[_Segment] = []
+        for bbox, size in sorted(row, key=lambda s: s[0][0]):
+            center = (bbox[0] + bbox[2]) / 2
+            if not left <= center < right:
+                continue
+            if (
+                cells
+                and bbox[0] - cells[-1].x1 < max(size, cells[-1].size) * CELL_GAP_EM
+            ):
+                cells[-1].extend(bbox)
+            else:
+                cells.append(_Segment(bbox, size))
+        return cells
+
+    def _zone_summary(self, zone: str) -> dict[str, Any]:
+        pages = self.zones[zone]
+        texts = [text for page in pages for text in page]
+        non_empty = [tuple(page) for page in pages if page]
+        return {
+            "lines": len(texts),
+            "text": texts[:5],
+            "repeated": len(non_empty) > 1 and len(set(non_empty)) < len(non_empty),
+            "has_contact": any(_CONTACT_PATTERN.search(text) for text in texts),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Layout summary carried in formatting_analysis["layout"]"""
+        return {
+            "source": "pdf_geometry",
+            "pages": self.pages,
+            "columns": {
+                "count": self.max_columns,
+                "multi_column_pages": self.multi_column_pages,
+            },
+            "tables": {
+                "count": self.tables_count,
+                "rows": self.table_rows,
+                "pages": self.table_pages,
+            },
+            "bullets": {
+                "count": sum(self.bullet_counts.values()),
+                "types_used": list(self.bullet_counts),
+                "counts": dict(self.bullet_counts),
+            },
+            "header_zone": self._zone_summary("header"),
+            "footer_zone": self._zone_summary("footer"),
+            "capitalization": {
+                "words": self.words,
+                "caps_words": self.caps_words,
+                "caps_ratio": (
+                    round(self.caps_words / self.words, 3) if self.words else 0.0
+                ),
+            },
+            "special_characters": {
+                "count": self.special_characters,
+                "ratio": (
+                    round(self.special_characters / self.characters, 3)
+                    if self.characters
+                    else 0.0
+                ),
+            },
+        }
+
+    def issues(self) -> list[str]:
+        """Layout-related formatting issues (tables are reported by the parser)"""
+        issues = [
+            f"Page {page}: Multi-column layout - ATS may read the columns out of order"
+            for page in self.multi_column_pages
+        ]
+        issues.extend(
+            f"Page {page}: High share of special characters - may confuse ATS parsing"
+            for page in self.special_character_pages
+        )
+        for zone in ("header", "footer"):
+            if self._zone_summary(zone)["has_contact"]:
+                issues.append(
+                    f"Contact details in the page {zone} zone - some ATS skip "
+                    "headers and footers"
+                )
+        return issues
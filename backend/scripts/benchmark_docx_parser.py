@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCX parsing: streaming reader vs python-docx object model
+
+Generates DOCX packages of increasing size (paragraphs with runs and
+hyperlinks, tables, a header and footer, image relationships) and reports
+parse time per engine, checking both return the same result, and how much
+reading the package raises the peak RSS of a fresh process (Linux: lxml's
+allocations are invisible to tracemalloc).
+
+Usage:
+    python scripts/benchmark_docx_parser.py [--runs 5]
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+import zipfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import file_parser
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+R = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WML = "application/vnd.openxmlformats-officedocument.wordprocessingml"
+
+
+def build_docx(paragraphs: int) -> bytes:
+    """Resume-like DOCX with the given number of body paragraphs"""
+    body = []
+    for i in range(paragraphs):
+        body.append(
+            f"<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>Delivered project {i}</w:t></w:r>"
+            f'<w:r><w:tab/><w:t xml:space="preserve"> improving latency by '
+            f"{i % 50}% across services</w:t></w:r>"
+            f'<w:hyperlink r:id="rIdLink"><w:r><w:t>link {i}</w:t></w:r>'
+            f"</w:hyperlink></w:p>"
+        )
+        if i % 200 == 199:
+            rows = "".join(
+                "<w:tr>"
+                + "".join(
+                    f"<w:tc><w:p><w:r><w:t>cell {r}.{c}</w:t></w:r></w:p></w:tc>"
+                    for c in range(3)
+                )
+                + "</w:tr>"
+                for r in range(5)
+            )
+            body.append(
+                "<w:tbl><w:tblGrid>"
+                + "<w:gridCol/>" * 3
+                + f"</w:tblGrid>{rows}</w:tbl>"
+            )
+    body.append(
+        '<w:sectPr><w:headerReference w:type="default" r:id="rIdHeader"/>'
+        '<w:footerReference w:type="default" r:id="rIdFooter"/></w:sectPr>'
+    )
+    document = f"<w:document {W} {R}><w:body>{''.join(body)}</w:body></w:document>"
+
+    def part(tag: str, text: str) -> str:
+        return f"<w:{tag} {W}><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:{tag}>"
+
+    images = "".join(
+        f'<Relationship Id="rIdImg{i}" Type="{DOC_REL}/image" '
+        f'Target="media/image{i}.png"/>'
+        for i in range(3)
+    )
+    document_rels = (
+        f'<Relationships xmlns="{PKG_RELS}">'
+        f'<Relationship Id="rIdHeader" Type="{DOC_REL}/header" Target="header1.xml"/>'
+        f'<Relationship Id="rIdFooter" Type="{DOC_REL}/footer" Target="footer1.xml"/>'
+        f'<Relationship Id="rIdLink" Type="{DOC_REL}/hyperlink" '
+        f'Target="https://example.com" TargetMode="External"/>{images}</Relationships>'
+    )
+    content_types = (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        f'<Override PartName="/word/document.xml" '
+        f'ContentType="{WML}.document.main+xml"/>'
+        f'<Override PartName="/word/header1.xml" ContentType="{WML}.header+xml"/>'
+        f'<Override PartName="/word/footer1.xml" ContentType="{WML}.footer+xml"/>'
+        "</Types>"
+    )
+    package_rels = (
+        f'<Relationships xmlns="{PKG_RELS}"><Relationship Id="rId1" '
+        f'Type="{DOC_REL}/officeDocument" Target="word/document.xml"/></Relationships>'
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", content_types)
+        package.writestr("_rels/.rels", package_rels)
+        package.writestr("word/document.xml", document)
+        package.writestr("word/_rels/document.xml.rels", document_rels)
+        package.writestr("word/header1.xml", part("hdr", "Jane Doe - Engineer"))
+        package.writestr("word/footer1.xml", part("ftr", "jane@example.com"))
+        for i in range(3):
+            package.writestr(f"word/media/image{i}.png", b"\x89PNG\r\n\x1a\n")
+    return buffer.getvalue()
+
+
+def read_peak_rss_mb(engine: str, data: bytes) -> float:
+    """Peak RSS growth in MB while one engine reads the package (child process)"""
+    parser = file_parser.FileParser()
+    docx_file = io.BytesIO(data)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if engine == "python-docx":
+        parser._read_docx_object_model(docx_file)
+    else:
+        file_parser.read_docx(docx_file)
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024
+
+
+def run_engine(engine: str, data: bytes, runs: int) -> tuple[float, float, dict]:
+    """Median parse time in ms, read peak RSS growth in MB and one result"""
+    file_parser.DOCX_PARSER = engine
+    parser = file_parser.FileParser()
+    result = parser._parse_docx_enhanced(data)
+
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        peak_mb = pool.apply(read_peak_rss_mb, (engine, data))
+
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        parser._parse_docx_enhanced(data)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings), peak_mb, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'paragraphs':>10} {'docx KB':>8} {'engine':<12} {'parse ms':>9} "
+        f"{'speedup':>8} {'read MB':>8} {'same':>5}"
+    )
+    for paragraphs in (200, 2000, 20000):
+        data = build_docx(paragraphs)
+        baseline = None
+        for engine in ("python-docx", "stream"):
+            ms, peak_mb, result = run_engine(engine, data, args.runs)
+            if baseline is None:
+                baseline = (ms, result)
+            print(
+                f"{paragraphs:>10} {len(data) / 1024:>8.0f} {engine:<12} {ms:>9.1f} "
+                f"{baseline[0] / ms:>7.1f}x {peak_mb:>8.1f} "
+                f"{result == baseline[1]!s:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Accuracy check and benchmark: torch vs quantized ONNX embedding backends
+
+1. Accuracy - encodes the same sentences with both backends and reports the
+   per-sentence cosine agreement and whether nearest-neighbour rankings match.
+   Exits non-zero if agreement drops below --min-cosine.
+2. Performance - runs each backend in a fresh subprocess and reports load time,
+   single-sentence latency (p50/p95), batch throughput and peak RSS.
+
+Usage:
+    python scripts/benchmark_embeddings.py [--runs 50] [--min-cosine 0.98]
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BACKENDS = ["torch", "onnx"]
+SAMPLE_RESUME = Path(__file__).resolve().parent.parent / (
+    "Bhuvesh_Singla_Resume.docx_extracted.txt"
+)
+REFERENCE_TITLES = [
+    "Software Engineer",
+    "Frontend Developer",
+    "Backend Developer",
+    "Data Scientist",
+    "DevOps Engineer",
+    "Product Manager",
+    "UX Designer",
+    "Marketing Manager",
+    "Registered Nurse",
+    "Financial Analyst",
+]
+
+
+def load_sentences() -> list[str]:
+    """Real resume lines when available, otherwise a fixed sample"""
+    if SAMPLE_RESUME.exists():
+        lines = [
+            line.strip()
+            for line in SAMPLE_RESUME.read_text(encoding="utf-8").split("\n")
+            if len(line.strip()) > 20
+        ]
+        if lines:
+            return lines[:200]
+    return [
+        "Built scalable REST APIs in Python and FastAPI deployed on AWS Lambda",
+        "Led a team of five engineers delivering a React and TypeScript dashboard",
+        "Designed CI/CD pipelines with Docker, Kubernetes and GitHub Actions",
+        "Reduced page load time by 40% through code splitting and caching",
+        "Managed stakeholder communication and quarterly product roadmaps",
+    ] * 20
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return usage / 1024 if sys.platform != "darwin" else usage / (1024 * 1024)
+
+
+def run_worker(backend: str, runs: int) -> dict:
+    """Measure one backend in isolation (called inside a subprocess)"""
+    from app.core.embeddings import create_embedding_model
+
+    sentences = load_sentences()
+
+    start = time.perf_counter()
+    model = create_embedding_model(backend)
+    model.encode(sentences[:4])  # warm-up
+    load_seconds = time.perf_counter() - start
+
+    latencies = []
+    for i in range(runs):
+        t0 = time.perf_counter()
+        model.encode(sentences[i % len(sentences)])
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    model.encode(sentences, batch_size=32)
+    batch_seconds = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 2),
+        "latency_p50_ms": round(statistics.median(latencies), 2),
+        "latency_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        "throughput_sentences_per_s": round(len(sentences) / batch_seconds, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def check_accuracy(min_cosine: float) -> bool:
+    """Compare ONNX embeddings against the torch reference"""
+    import numpy as np
+
+    from app.core.embeddings import cos_sim, create_embedding_model
+
+    sentences = load_sentences()
+    torch_model = create_embedding_model("torch")
+    onnx_model = create_embedding_model("onnx")
+
+    torch_emb = torch_model.encode(sentences)
+    onnx_emb = onnx_model.encode(sentences)
+    agreement = np.sum(torch_emb * onnx_emb, axis=1) / (
+        np.linalg.norm(torch_emb, axis=1) * np.linalg.norm(onnx_emb, axis=1)
+    )
+
+    # Ranking agreement: does each sentence pick the same nearest title?
+    torch_rank = cos_sim(torch_emb, torch_model.encode(REFERENCE_TITLES)).argmax(1)
+    onnx_rank = cos_sim(onnx_emb, onnx_model.encode(REFERENCE_TITLES)).argmax(1)
+    top1_match = float(np.mean(torch_rank == onnx_rank))
+
+    print("\n=== Accuracy (ONNX int8 vs torch) ===")
+    print(f"Sentences:            {len(sentences)}")
+    print(f"Mean cosine:          {agreement.mean():.4f}")
+    print(f"Min cosine:           {agreement.min():.4f}")
+    print(f"Top-1 title agreement: {top1_match:.1%}")
+
+    passed = bool(agreement.min() >= min_cosine)
+    print("✅ Accuracy check passed" if passed else "❌ Accuracy check failed")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--min-cosine", type=float, default=0.98)
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.runs)))
+        return
+
+    passed = check_accuracy(args.min_cosine)
+
+    print("\n=== Performance (fresh process per backend) ===")
+    header = f"{'backend':<8} {'load s':>7} {'p50 ms':>8} {'p95 ms':>8} {'sent/s':>8} {'RSS MB':>8}"
+    print(header)
+    for backend in BACKENDS:
+        output = subprocess.run(
+            [sys.executable, __file__, "--worker", backend, "--runs", str(args.runs)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        r = json.loads(output.splitlines()[-1])
+        print(
+            f"{r['backend']:<8} {r['load_seconds']:>7} {r['latency_p50_ms']:>8} "
+            f"{r['latency_p95_ms']:>8} {r['throughput_sentences_per_s']:>8} "
+            f"{r['peak_rss_mb']:>8}"
+        )
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check for the keyword extraction engine
+
+Compares app.services.keyword_engine (without corpus weights) against a
+reference copy of the previous per-call implementation (stop-word set
+rebuilt on every call, industry patterns passed to re.findall as strings).
+Exits non-zero if the two ever return different keywords.
+
+Usage:
+    python scripts/benchmark_keywords.py [--runs 200]
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.keyword_engine import (
+    BUSINESS_TERMS,
+    EDUCATION_PATTERN,
+    EXPERIENCE_YEARS_PATTERN,
+    SENIORITY_PATTERN,
+    SOFT_SKILL_TERMS,
+    STOP_WORDS,
+    TECH_PRIORITY,
+    TECH_TERMS,
+    keyword_engine,
+    vocabulary_pattern,
+)
+from app.services.skills_taxonomy import skills_taxonomy
+
+SAMPLE_RESUME = Path(__file__).resolve().parent.parent / (
+    "Bhuvesh_Singla_Resume.docx_extracted.txt"
+)
+SAMPLE_JD = """
+We are looking for a Senior Software Engineer with 5+ years of experience
+building scalable microservices in Python, Java and Go. You will design REST
+and GraphQL APIs, deploy on AWS and Kubernetes with Docker, own CI/CD
+pipelines in Jenkins and GitHub, and mentor junior engineers. Strong
+communication, leadership and problem solving skills are required, as is a
+bachelor degree in computer science. Experience with machine learning,
+TensorFlow or PyTorch, stakeholder management and agile/scrum is a plus.
+"""
+
+# Reference data in the shape the previous implementation rebuilt per call
+_STOP_WORD_LITERALS = tuple(STOP_WORDS)
+_LEGACY_PATTERNS = [
+    (vocabulary_pattern(TECH_TERMS).pattern, True),
+    (EXPERIENCE_YEARS_PATTERN.pattern, False),
+    (SENIORITY_PATTERN.pattern, False),
+    (EDUCATION_PATTERN.pattern, False),
+    (vocabulary_pattern(SOFT_SKILL_TERMS).pattern, True),
+    (vocabulary_pattern(BUSINESS_TERMS).pattern, True),
+]
+
+
+def legacy_extract_keywords(text: str) -> list[str]:
+    """Reference copy of the previous ATSAnalyzer._extract_keywords"""
+    stop_words = set(_STOP_WORD_LITERALS)
+    words = re.findall(r"\b[a-z]+\b", text)
+    filtered_words = [w for w in words if w not in stop_words and len(w) >= 3]
+    word_freq = Counter(filtered_words)
+
+    keywords = [word for word, freq in word_freq.most_common(50) if freq >= 2]
+    for pattern, is_vocabulary in _LEGACY_PATTERNS:
+        matches = [m.lower() for m in re.findall(pattern, text, re.IGNORECASE)]
+        if is_vocabulary:
+            matches = [skills_taxonomy.canonical(m) or m for m in matches]
+        keywords.extend(matches)
+
+    unique_keywords = list(set(keywords))
+    prioritized_keywords = []
+    for tech in TECH_PRIORITY:
+        if tech in unique_keywords:
+            prioritized_keywords.append(tech)
+    for keyword in unique_keywords:
+        if keyword not in prioritized_keywords:
+            prioritized_keywords.append(keyword)
+    return prioritized_keywords[:60]
+
+
+def load_texts() -> dict[str, str]:
+    texts = {"job description": SAMPLE_JD.lower()}
+    if SAMPLE_RESUME.exists():
+        texts["resume"] = SAMPLE_RESUME.read_text(encoding="utf-8").lower()
+    return texts
+
+
+def random_texts(count: int) -> list[str]:
+    """Vocabulary-heavy random texts for the equivalence check"""
+    rng = random.Random(42)
+    pool = [
+        *TECH_TERMS,
+        *SOFT_SKILL_TERMS,
+        *BUSINESS_TERMS,
+        "5+ years of experience",
+        "senior level",
+        "b.tech",
+        "m.s.",
+        "c++11",
+        "python3",
+        "the",
+        "team",
+        "data",
+        ",",
+        "/",
+        ".",
+    ]
+    return [
+        " ".join(rng.choice(pool) for _ in range(rng.randint(1, 80)))
+        for _ in range(count)
+    ]
+
+
+def median_ms(func, text: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        func(text)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    texts = load_texts()
+
+    # Equivalence: identical keywords (same order) on samples and random texts
+    candidates = list(texts.values()) + random_texts(2000)
+    mismatches = sum(
+        legacy_extract_keywords(t) != keyword_engine.extract(t) for t in candidates
+    )
+    print(f"Equivalence: {len(candidates)} texts, {mismatches} mismatches")
+
+    print(
+        f"\n{'text':<16} {'chars':>7} {'legacy ms':>10} {'engine ms':>10} {'speedup':>8}"
+    )
+    for name, text in texts.items():
+        legacy_ms = median_ms(legacy_extract_keywords, text, args.runs)
+        engine_ms = median_ms(keyword_engine.extract, text, args.runs)
+        print(
+            f"{name:<16} {len(text):>7} {legacy_ms:>10.3f} {engine_ms:>10.3f} "
+            f"{legacy_ms / engine_ms:>7.1f}x"
+        )
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
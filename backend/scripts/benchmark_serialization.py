@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark response serialization: stdlib JSON vs orjson vs MessagePack
+
+Builds analysis-shaped payloads (deeply nested dicts, keyword lists, float
+scores) at several sizes and reports encode time and payload size, raw and
+gzip-compressed.
+
+Usage:
+    python scripts/benchmark_serialization.py [--runs 200]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.serialization import (
+    MSGPACK_AVAILABLE,
+    ORJSON_AVAILABLE,
+    encode_json,
+    encode_msgpack,
+)
+
+
+def build_payload(scale: int) -> dict:
+    """Analysis-shaped response; scale multiplies list lengths"""
+    keywords = [f"keyword {i}" for i in range(40 * scale)]
+    return {
+        "success": True,
+        "data": {
+            "ats_score": 78.4,
+            "match_category": "Good Match",
+            "detailed_scores": {
+                "keyword_score": 71.25,
+                "semantic_score": 83.1,
+                "format_score": 90.0,
+                "content_score": 65.5,
+                "ats_score": 88.0,
+            },
+            "matching_keywords": keywords[: len(keywords) // 2],
+            "missing_keywords": keywords[len(keywords) // 2 :],
+            "suggestions": [
+                f"Add quantified achievements to bullet {i}" for i in range(10 * scale)
+            ],
+            "extraction_details": {
+                "skills_found": {
+                    category: [f"{category} skill {i}" for i in range(8 * scale)]
+                    for category in ("technical", "soft", "tools", "languages")
+                },
+                "categorized_resume": {
+                    "work_experience": [
+                        {
+                            "title": f"Engineer {i}",
+                            "company": f"Company {i}",
+                            "duration": "2020 - 2023",
+                            "responsibilities": [
+                                f"Delivered project {i}.{j} improving latency by {j * 5}%"
+                                for j in range(6)
+                            ],
+                        }
+                        for i in range(4 * scale)
+                    ],
+                    "education": [
+                        {"degree": "B.Tech", "institution": "University", "year": 2019}
+                    ],
+                },
+                "resume_text_sample": "Lorem ipsum dolor sit amet " * 20 * scale,
+            },
+        },
+        "message": "ATS analysis completed successfully",
+    }
+
+
+def time_encoder(encoder, payload, runs: int) -> tuple[float, bytes]:
+    """Median encode time in ms and one encoded sample"""
+    encoded = encoder(payload)
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        encoder(payload)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings), encoded
+
+
+def stdlib_json(payload) -> bytes:
+    """Baseline: what the default JSON response path does"""
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    encoders = [("json (stdlib)", stdlib_json)]
+    if ORJSON_AVAILABLE:
+        encoders.append(("orjson", encode_json))
+    else:
+        print("⚠️  orjson not installed - skipping")
+    if MSGPACK_AVAILABLE:
+        encoders.append(("msgpack", encode_msgpack))
+    else:
+        print("⚠️  msgpack not installed - skipping")
+
+    print(
+        f"{'scale':>5} {'encoder':<14} {'encode ms':>10} {'speedup':>8} "
+        f"{'bytes':>9} {'gzip bytes':>11}"
+    )
+    for scale in (1, 5, 25):
+        payload = build_payload(scale)
+        baseline_ms = None
+        for name, encoder in encoders:
+            ms, encoded = time_encoder(encoder, payload, args.runs)
+            baseline_ms = baseline_ms or ms
+            print(
+                f"{scale:>5} {name:<14} {ms:>10.3f} {baseline_ms / ms:>7.1f}x "
+                f"{len(encoded):>9} {len(gzip.compress(encoded)):>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
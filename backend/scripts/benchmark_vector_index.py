@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the local vector index: flat vs IVF, float16 vs int8
+
+Builds throwaway indexes from clustered synthetic "resume chunk" vectors
+(no model needed) and reports insert throughput, search latency (p50/p95),
+on-disk size and IVF recall@k against exact flat search.
+
+Usage:
+    python scripts/benchmark_vector_index.py [--documents 5000]
+        [--chunks 10] [--queries 50] [--top-k 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vector_index import VectorIndex
+
+DIM = 384  # all-MiniLM-L6-v2
+
+
+def synthetic_documents(profiles: np.ndarray, documents: int, chunks: int):
+    """Documents whose chunks cluster around shared profile vectors"""
+    rng = np.random.default_rng(0)
+    for i in range(documents):
+        profile = profiles[rng.integers(len(profiles))]
+        yield f"doc-{i}", profile + 0.8 * rng.normal(size=(chunks, DIM))
+
+
+def run(args, directory, profiles, queries, *, dtype, mode):
+    index = VectorIndex.open(directory, DIM, dtype=dtype, mode=mode)
+
+    start = time.perf_counter()
+    for key, vectors in synthetic_documents(profiles, args.documents, args.chunks):
+        index.add(key, vectors)
+    insert_s = time.perf_counter() - start
+
+    timings, results = [], []
+    for query in queries:
+        t0 = time.perf_counter()
+        results.append([key for key, _ in index.search(query, args.top_k)])
+        timings.append((time.perf_counter() - t0) * 1000)
+
+    size_mb = sum(f.stat().st_size for f in directory.iterdir()) / 1024 / 1024
+    return insert_s, timings, results, size_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--chunks", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    profiles = rng.normal(size=(max(args.documents // 10, 1), DIM))
+    queries = [
+        profiles[rng.integers(len(profiles))] + 0.8 * rng.normal(size=(8, DIM))
+        for _ in range(args.queries)
+    ]
+
+    print(
+        f"{args.documents} documents x {args.chunks} chunks, "
+        f"{args.queries} queries of 8 requirements, top {args.top_k}\n"
+    )
+    print(
+        f"{'dtype':<8} {'mode':<5} {'insert/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'disk MB':>8} {'recall':>7}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for dtype in ("float16", "int8"):
+            exact: list[list[str]] = []
+            for mode in ("flat", "ivf"):
+                directory = Path(tmp) / f"{dtype}-{mode}"
+                insert_s, timings, results, size_mb = run(
+                    args, directory, profiles, queries, dtype=dtype, mode=mode
+                )
+                if mode == "flat":
+                    exact = results
+                    recall = 1.0
+                else:
+                    recall = statistics.mean(
+                        len(set(r) & set(e)) / max(len(e), 1)
+                        for r, e in zip(results, exact, strict=True)
+                    )
+                timings.sort()
+                print(
+                    f"{dtype:<8} {mode:<5} {args.documents / insert_s:>9.0f} "
+                    f"{statistics.median(timings):>8.2f} "
+                    f"{timings[int(len(timings) * 0.95) - 1]:>8.2f} "
+                    f"{size_mb:>8.1f} {recall:>7.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
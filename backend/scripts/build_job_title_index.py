@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Prebuild the job title index (title embeddings cache)
+
+Encodes every title and alias of the title taxonomy once and stores the
+embeddings next to the taxonomy fingerprint, so the job detector starts
+without re-encoding the taxonomy. Run after editing the taxonomy or in the
+image build.
+
+With --benchmark, also measures coarse-to-fine lookup latency against a
+full scan on synthetic taxonomies of growing size (no model needed).
+
+Usage:
+    python scripts/build_job_title_index.py [--output data/job_title_index.npz]
+    python scripts/build_job_title_index.py --benchmark
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.job_titles import (
+    DEFAULT_INDEX_CACHE_PATH,
+    JobTitleIndex,
+    JobTitleTaxonomy,
+    job_titles_taxonomy,
+)
+
+DIM = 384  # all-MiniLM-L6-v2
+
+
+def build(output: Path):
+    from app.core.embeddings import EMBEDDING_MODEL_NAME, create_embedding_model
+
+    output.unlink(missing_ok=True)
+    model = create_embedding_model(os.getenv("EMBEDDINGS_BACKEND", "torch"))
+
+    start = time.perf_counter()
+    index = JobTitleIndex.build(
+        job_titles_taxonomy, model, EMBEDDING_MODEL_NAME, cache_path=output
+    )
+    print(
+        f"✅ {len(job_titles_taxonomy)} roles, {len(index)} titles encoded in "
+        f"{time.perf_counter() - start:.1f}s -> {output} "
+        f"({output.stat().st_size / 1024:.1f} KB)"
+    )
+
+
+def synthetic_taxonomy(families: int, roles: int, aliases: int):
+    """Taxonomy data plus clustered embeddings in index_forms() order"""
+    rng = np.random.default_rng(0)
+    data: dict[str, Any] = {"version": "synthetic", "families": {}}
+    vectors: list[np.ndarray] = []
+    for f in range(families):
+        family_center = rng.normal(size=DIM)
+        family_roles = {}
+        for r in range(roles):
+            role_center = family_center + 0.5 * rng.normal(size=DIM)
+            family_roles[f"r{r}"] = {
+                "title": f"Role {f}-{r}",
+                "aliases": [f"Role {f}-{r} alias {a}" for a in range(aliases)],
+            }
+            vectors.extend(
+                role_center + 0.2 * rng.normal(size=DIM) for _ in range(aliases + 1)
+            )
+        data["families"][f"f{f}"] = {"label": f"Family {f}", "roles": family_roles}
+    return JobTitleTaxonomy(data), np.asarray(vectors, dtype=np.float32)
+
+
+def median_ms(func, queries) -> float:
+    timings = []
+    for query in queries:
+        t0 = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def benchmark():
+    print(
+        f"{'titles':>8} {'families':>9} {'coarse ms':>10} {'scan ms':>8} {'agree':>6}"
+    )
+    for families in (20, 100, 400, 1000):
+        taxonomy, vectors = synthetic_taxonomy(families, roles=20, aliases=4)
+        index = JobTitleIndex(taxonomy, vectors)
+        rng = np.random.default_rng(1)
+        queries = vectors[rng.choice(len(vectors), 200)] + 0.3 * rng.normal(
+            size=(200, DIM)
+        )
+
+        def full_scan(query, index=index):
+            return index._form_roles[int((index._embeddings @ query).argmax())]
+
+        agree = statistics.mean(
+            index.nearest(q)[0].id == full_scan(q / np.linalg.norm(q)) for q in queries
+        )
+        print(
+            f"{len(index):>8} {families:>9} "
+            f"{median_ms(index.nearest, queries):>10.3f} "
+            f"{median_ms(full_scan, queries):>8.3f} {agree:>6.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=DEFAULT_INDEX_CACHE_PATH)
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    else:
+        build(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Build (or extend) the term weight table from a local corpus
+
+Reads job descriptions and resumes (.txt/.md directly, .pdf/.docx through
+the file parser) and records document frequencies of keyword candidates.
+Documents already in the table are skipped, so the script can be re-run
+as the corpus grows.
+
+Usage:
+    python scripts/build_term_weights.py CORPUS_DIR [CORPUS_DIR ...]
+        [--output data/term_weights.json.gz] [--rebuild]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.keyword_engine import keyword_engine
+from app.services.term_weights import (
+    DEFAULT_TABLE_PATH,
+    TermWeightTable,
+)
+
+TEXT_EXTENSIONS = {".txt", ".md"}
+PARSED_EXTENSIONS = {".pdf", ".docx"}
+
+
+def read_document(path: Path) -> str:
+    """Get the plain text of a corpus document"""
+    if path.suffix.lower() in TEXT_EXTENSIONS:
+        return path.read_text(encoding="utf-8", errors="ignore")
+
+    from app.utils.file_parser import file_parser
+
+    parsed = file_parser.parse_file(path.read_bytes(), path.name)
+    return parsed.get("text", "")
+
+
+def iter_corpus(directories: list[str]):
+    extensions = TEXT_EXTENSIONS | PARSED_EXTENSIONS
+    for directory in directories:
+        for path in sorted(Path(directory).rglob("*")):
+            if path.is_file() and path.suffix.lower() in extensions:
+                yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", nargs="+", help="Directories of JDs/resumes")
+    parser.add_argument("--output", type=Path, default=DEFAULT_TABLE_PATH)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Start from an empty table"
+    )
+    args = parser.parse_args()
+
+    table = (
+        TermWeightTable(path=args.output)
+        if args.rebuild
+        else TermWeightTable.load(args.output)
+    )
+    table.save_every = 0  # save once at the end
+
+    added = skipped = failed = 0
+    for path in iter_corpus(args.corpus):
+        try:
+            text = read_document(path).lower()
+        except Exception as e:
+            print(f"⚠️  Skipping {path}: {e}")
+            failed += 1
+            continue
+        if not text.strip():
+            continue
+
+        terms, length = keyword_engine.document_terms(text)
+        if table.add_document(text, terms, length):
+            added += 1
+        else:
+            skipped += 1
+
+    output = table.save(args.output)
+    print(
+        f"✅ {added} documents added, {skipped} already counted, {failed} failed\n"
+        f"   {table.num_documents} documents, {len(table)} terms -> {output} "
+        f"({output.stat().st_size / 1024:.1f} KB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Export all-MiniLM-L6-v2 to ONNX and quantize it to int8
+Produces the model directory used by EMBEDDINGS_BACKEND=onnx
+
+Requires the export toolchain (not needed at runtime):
+    pip install torch transformers onnx onnxruntime tokenizers
+
+Usage:
+    python scripts/export_onnx_embeddings.py [--output models/all-MiniLM-L6-v2-onnx]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.embeddings import DEFAULT_ONNX_MODEL_DIR, ONNX_MODEL_FILE
+
+HF_MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def export(output_dir: Path) -> None:
+    """Export the transformer to ONNX (fp32) and write a dynamic int8 copy"""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModel, AutoTokenizer
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = output_dir / "model.onnx"
+    int8_path = output_dir / ONNX_MODEL_FILE
+
+    print(f"📦 Loading {HF_MODEL_ID}...")
+    tokenizer = AutoTokenizer.from_pretrained(HF_MODEL_ID)
+    model = AutoModel.from_pretrained(HF_MODEL_ID)
+    model.eval()
+
+    sample = tokenizer(
+        ["Senior Python developer with AWS experience"],
+        padding=True,
+        return_tensors="pt",
+    )
+    input_names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    print("🔄 Exporting to ONNX...")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"], sample["token_type_ids"]),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+        )
+
+    print("🔄 Quantizing weights to int8...")
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+
+    # tokenizer.json is all the runtime needs (tokenizers library, no torch)
+    tokenizer.save_pretrained(str(output_dir))
+
+    fp32_mb = fp32_path.stat().st_size / (1024 * 1024)
+    int8_mb = int8_path.stat().st_size / (1024 * 1024)
+    print(f"✅ Exported {fp32_path.name} ({fp32_mb:.1f} MB)")
+    print(f"✅ Exported {int8_path.name} ({int8_mb:.1f} MB)")
+    print(f"   Set EMBEDDINGS_BACKEND=onnx EMBEDDINGS_ONNX_DIR={output_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default=DEFAULT_ONNX_MODEL_DIR)
+    args = parser.parse_args()
+    export(Path(args.output))
+
+
+if __name__ == "__main__":
+    main()
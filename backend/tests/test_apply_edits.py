@@ -0,0 +1,65 @@
+"""Tests for offset-based resume edits (/reanalyze)"""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.upload import _apply_edits
+from app.types import TextEdit
+
+TEXT = "Python developer with AWS"
+
+
+def test_edits_use_original_offsets():
+    edits = [
+        TextEdit(start=0, end=6, text="Go"),
+        TextEdit(start=22, end=25, text="GCP"),
+    ]
+
+    assert _apply_edits(TEXT, edits) == "Go developer with GCP"
+
+
+def test_edit_order_does_not_matter():
+    edits = [
+        TextEdit(start=22, end=25, text="GCP"),
+        TextEdit(start=0, end=6, text="Go"),
+    ]
+
+    assert _apply_edits(TEXT, edits) == "Go developer with GCP"
+
+
+def test_adjacent_edits_and_insertions():
+    edits = [
+        TextEdit(start=0, end=6, text="Rust"),
+        TextEdit(start=6, end=6, text=" and C++"),
+        TextEdit(start=len(TEXT), end=len(TEXT), text=" and Azure"),
+    ]
+
+    assert _apply_edits(TEXT, edits) == "Rust and C++ developer with AWS and Azure"
+
+
+@pytest.mark.parametrize(
+    "edits",
+    [
+        [TextEdit(start=0, end=10), TextEdit(start=5, end=12)],
+        [TextEdit(start=0, end=10), TextEdit(start=4, end=4, text="x")],
+        [TextEdit(start=2, end=8), TextEdit(start=2, end=8)],
+    ],
+)
+def test_overlapping_edits_are_rejected(edits):
+    with pytest.raises(HTTPException) as error:
+        _apply_edits(TEXT, edits)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        TextEdit(start=0, end=len(TEXT) + 1),
+        TextEdit(start=len(TEXT) + 1, end=len(TEXT) + 1),
+        TextEdit(start=10, end=5),
+    ],
+)
+def test_invalid_ranges_are_rejected(edit):
+    with pytest.raises(HTTPException) as error:
+        _apply_edits(TEXT, [edit])
+    assert error.value.status_code == 400
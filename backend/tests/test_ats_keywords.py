@@ -0,0 +1,50 @@
+"""Tests for matching job description keywords against a resume"""
+
+import pytest
+
+from app.services import ats_analyzer as ats_analyzer_module
+from app.services.ats_analyzer import get_ats_analyzer
+from app.services.document_index import DocumentIndex
+from app.services.skills_taxonomy import skills_taxonomy
+
+SKILLS = "Skills: reactjs, nodejs, k8s, golang, postgres. Also Vue.js and React.js"
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    # Rule-based keyword classification
+    monkeypatch.setattr(ats_analyzer_module, "is_gemini_available", lambda: False)
+    return get_ats_analyzer()
+
+
+def test_canonical_keyword_matches_its_aliases(analyzer):
+    resume = "Built dashboards in React.js; earlier reactjs and Kubernetes work"
+
+    result = analyzer._analyze_keywords_vs_jd(
+        resume, ["react", "kubernetes"], "React and Kubernetes"
+    )
+
+    assert result["matched_keywords"] == ["react", "kubernetes"]
+    assert result["missing_keywords"] == []
+    # Positions are those of the aliases as written in the resume
+    spans = result["keyword_positions"]["react"]
+    assert [resume[start:end] for start, end in spans] == ["React.js", "reactjs"]
+
+
+def test_identical_jd_and_resume_match_every_keyword(analyzer):
+    jd_keywords = analyzer._extract_keywords(SKILLS)
+    assert {"react", "node", "kubernetes", "go", "postgresql", "vue"} <= set(
+        jd_keywords
+    )
+
+    result = analyzer._analyze_keywords_vs_jd(SKILLS, jd_keywords, SKILLS)
+
+    assert result["missing_keywords"] == []
+    assert result["match_percentage"] == 100.0
+
+
+def test_lookup_of_free_text_terms_is_literal():
+    index = DocumentIndex("Led payments team")
+    assert skills_taxonomy.lookup(index, ["payments", "billing"]) == {
+        "payments": [(4, 12)]
+    }
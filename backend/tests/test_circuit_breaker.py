@@ -0,0 +1,111 @@
+"""Tests for the circuit breaker state transitions"""
+
+import pytest
+
+from app.core import error_handling
+from app.core.error_handling import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(error_handling.time, "monotonic", clock)
+    return clock
+
+
+def _fail():
+    raise RuntimeError("service down")
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, cooldown_s=10)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+    assert breaker.call(lambda: "ok") == "ok"
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+    assert breaker.state == CIRCUIT_CLOSED
+
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.state == CIRCUIT_OPEN
+    assert breaker.is_open
+
+
+def test_open_circuit_rejects_without_calling(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_s=10)
+    _trip(breaker)
+    calls: list[int] = []
+    clock.now += 4
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.call(calls.append, 1)
+
+    assert calls == []
+    assert error.value.details["retry_after_s"] == pytest.approx(6.0)
+
+
+def test_half_open_allows_one_probe_and_closes_on_success(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_s=10)
+    _trip(breaker)
+    clock.now += 10
+
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert not breaker.is_open
+    # The first request is the probe; the circuit stays open while it runs
+    assert [breaker.allow_request(), breaker.is_open] == [True, True]
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_s=10)
+    _trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+
+    assert breaker.state == CIRCUIT_OPEN
+    assert breaker.snapshot()["times_opened"] == 2
+    clock.now += 9
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_slow_calls_count_as_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, slow_call_s=1.0)
+
+    def slow():
+        clock.now += 2
+        return "late"
+
+    assert breaker.call(slow) == "late"
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.call(slow) == "late"
+    assert breaker.state == CIRCUIT_OPEN
@@ -0,0 +1,92 @@
+"""Tests for request deadlines and degradation tier selection"""
+
+import pytest
+
+from app.core import deadline as deadline_module
+from app.core.deadline import (
+    AI_STAGE_MIN_MS,
+    DEFAULT_DEADLINE_MS,
+    LOCAL_STAGE_MIN_MS,
+    MAX_DEADLINE_MS,
+    TIER_FULL,
+    TIER_LOCAL,
+    TIER_MINIMAL,
+    Deadline,
+    choose_tier,
+    gemini_call_options,
+    stage_budget_ms,
+)
+
+
+@pytest.mark.parametrize(
+    ("budget_ms", "expected"),
+    [
+        (AI_STAGE_MIN_MS + 1000, TIER_FULL),
+        (AI_STAGE_MIN_MS - 1000, TIER_LOCAL),
+        (LOCAL_STAGE_MIN_MS - 100, TIER_MINIMAL),
+        (0, TIER_MINIMAL),
+    ],
+)
+def test_tier_follows_remaining_budget(budget_ms, expected):
+    assert Deadline(budget_ms).tier() == expected
+
+
+def test_stage_ai_threshold_overrides_default():
+    assert Deadline(2000).tier(ai_min_ms=1000) == TIER_FULL
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, DEFAULT_DEADLINE_MS),
+        ("", DEFAULT_DEADLINE_MS),
+        ("not-a-number", DEFAULT_DEADLINE_MS),
+        ("1500", 1500.0),
+        ("-5", 0.0),
+        (str(MAX_DEADLINE_MS * 10), MAX_DEADLINE_MS),
+    ],
+)
+def test_header_budget_is_clamped(header, expected):
+    assert Deadline.from_header(header).budget_ms == expected
+
+
+def test_choose_tier_records_stages_and_degradation():
+    assert choose_tier(None, "keywords") == TIER_FULL
+
+    roomy = Deadline(AI_STAGE_MIN_MS + 5000)
+    assert choose_tier(roomy, "keywords") == TIER_FULL
+    assert roomy.stages == {"keywords": "full"}
+    assert roomy.degraded == []
+
+    tight = Deadline(1000)
+    assert choose_tier(tight, "keywords") == TIER_LOCAL
+    assert choose_tier(tight, "suggestions", ai_min_ms=500) == TIER_FULL
+    expired = Deadline(0)
+    assert choose_tier(expired, "suggestions") == TIER_MINIMAL
+
+    assert tight.stages == {"keywords": "local", "suggestions": "full"}
+    assert [(d["stage"], d["reason"]) for d in tight.degraded] == [
+        ("keywords", "insufficient_budget")
+    ]
+    assert expired.to_dict()["degraded_stages"][0]["path"] == "skipped"
+
+
+def test_stage_budgets_are_capped_by_the_request():
+    assert stage_budget_ms(None, "semantic", 800) is None
+    assert stage_budget_ms(Deadline(1000), "semantic", 800) == 0.0
+    budget = stage_budget_ms(Deadline(AI_STAGE_MIN_MS + 5000), "semantic", 800)
+    assert budget == 800
+    assert Deadline(500).budget_for(800) <= 500
+
+
+def test_gemini_options_bound_calls_by_the_deadline(monkeypatch):
+    monkeypatch.setattr(deadline_module, "GEMINI_REQUEST_OPTIONS_SUPPORTED", True)
+
+    assert gemini_call_options(None) == {}
+    timeout = gemini_call_options(Deadline(5000))["request_options"]["timeout"]
+    assert 4.0 < timeout <= 5.0
+    # Nearly expired deadlines still give the client a usable timeout
+    assert gemini_call_options(Deadline(0)) == {"request_options": {"timeout": 1.0}}
+
+    monkeypatch.setattr(deadline_module, "GEMINI_REQUEST_OPTIONS_SUPPORTED", False)
+    assert gemini_call_options(Deadline(5000)) == {}
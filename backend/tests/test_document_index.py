@@ -0,0 +1,64 @@
+"""Tests for the token-boundary document index"""
+
+from app.services.document_index import DocumentIndex, normalize_term
+from app.services.skills_taxonomy import skills_taxonomy
+
+
+def test_terms_do_not_match_inside_longer_words():
+    index = DocumentIndex("JavaScript developer at Google")
+    assert not index.contains("java")
+    assert not index.contains("go")
+    assert index.contains("javascript")
+    assert index.contains("google")
+
+
+def test_punctuated_terms_match_as_ngrams():
+    index = DocumentIndex("Owned CI/CD in Jenkins and scikit-learn models")
+    assert normalize_term("CI/CD") == "ci cd"
+    assert index.find("ci/cd") == [(6, 11)]
+    assert index.contains("scikit-learn")
+
+
+def test_plus_and_hash_keep_languages_distinct():
+    index = DocumentIndex("Wrote C++ and C# services")
+    assert index.contains("c++")
+    assert index.contains("c#")
+    assert not index.contains("c")
+
+
+def test_fragments_of_dotted_names_do_not_match():
+    index = DocumentIndex("Built apps with Vue.js and ASP.NET. Python. Go")
+    assert index.find("js") == []
+    assert index.find("net") == []
+    assert index.contains("vue.js")
+    assert index.contains("asp.net")
+    # A sentence-ending period does not glue words together
+    assert index.contains("python")
+    assert index.contains("go")
+
+
+def test_dotted_names_do_not_imply_javascript():
+    index = DocumentIndex("Frontend work in vue.js with node.js services")
+    found = skills_taxonomy.find_skills(index, "technical_programming")
+    assert "vue" in found
+    assert "node" in found
+    assert "javascript" not in found
+
+
+def test_phrases_longer_than_max_ngram_are_scanned():
+    index = DocumentIndex("one two three four five six", max_ngram=2)
+    assert index.find("two three four five") == [(4, 23)]
+    assert index.count("three") == 1
+
+
+def test_dotted_names_match_their_spellings():
+    index = DocumentIndex("Frontends in Vue.js and Angular.js, APIs in Node.js")
+    assert index.contains("vuejs")
+    assert index.contains("angularjs")
+    # JD keywords are canonical names; the taxonomy resolves dotted forms
+    for skill in ("vue", "angular", "node"):
+        spans = skills_taxonomy.find(index, skill)
+        assert [index.text[start:end].lower() for start, end in spans] == [
+            f"{skill}.js"
+        ]
+    assert skills_taxonomy.find(index, "js") == []
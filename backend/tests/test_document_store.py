@@ -0,0 +1,101 @@
+"""Tests for the parsed document store (TTL and LRU eviction)"""
+
+import pytest
+
+from app.services import document_store as document_store_module
+from app.services.document_store import DocumentStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(document_store_module.time, "time", clock)
+    return clock
+
+
+def _resume(chars: int = 10) -> dict:
+    return {"text": "x" * chars}
+
+
+def _size(chars: int) -> int:
+    return chars + 1024
+
+
+def test_get_expires_after_ttl(clock):
+    store = DocumentStore(ttl_s=60)
+    document_id = store.save(_resume(), "resume.pdf", 100)
+
+    clock.now += 60
+    document = store.get(document_id)
+    assert document is not None and document["filename"] == "resume.pdf"
+
+    clock.now += 1
+    assert store.get(document_id) is None
+    assert len(store) == 0
+    assert store.stats()["size_bytes"] == 0
+
+
+def test_save_drops_expired_documents(clock):
+    store = DocumentStore(ttl_s=60)
+    old = store.save(_resume(), "old.pdf", 100)
+    clock.now += 30
+    recent = store.save(_resume(), "recent.pdf", 100)
+
+    clock.now += 31
+    store.save(_resume(), "new.pdf", 100)
+
+    assert old not in store._entries
+    assert recent in store._entries
+    assert len(store) == 2
+
+
+def test_entry_limit_evicts_least_recently_used(clock):
+    store = DocumentStore(max_entries=2)
+    first = store.save(_resume(), "first.pdf", 100)
+    second = store.save(_resume(), "second.pdf", 100)
+    assert store.get(first) is not None  # first is now the most recent
+
+    third = store.save(_resume(), "third.pdf", 100)
+
+    assert store.get(second) is None
+    assert store.get(first) is not None
+    assert store.get(third) is not None
+
+
+def test_size_limit_evicts_until_within_budget(clock):
+    store = DocumentStore(max_bytes=3 * _size(1000))
+    ids = [store.save(_resume(1000), f"{i}.pdf", 100) for i in range(3)]
+
+    large = store.save(_resume(2000), "large.pdf", 100)
+
+    assert [store.get(i) is not None for i in ids] == [False, False, True]
+    assert store.get(large) is not None
+    assert store.stats()["size_bytes"] == _size(1000) + _size(2000)
+
+
+def test_oversized_document_is_kept_alone(clock):
+    store = DocumentStore(max_bytes=_size(100))
+    small = store.save(_resume(100), "small.pdf", 100)
+
+    huge = store.save(_resume(10_000), "huge.pdf", 100)
+
+    assert store.get(small) is None
+    assert store.get(huge) is not None
+    assert len(store) == 1
+
+
+def test_delete_releases_size(clock):
+    store = DocumentStore()
+    document_id = store.save(_resume(500), "resume.pdf", 100)
+
+    assert store.delete(document_id)
+    assert not store.delete(document_id)
+    assert store.stats()["size_bytes"] == 0
@@ -0,0 +1,96 @@
+"""Tests for the streaming DOCX reader against the python-docx object model"""
+
+import importlib.util
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.enum.section import WD_SECTION
+
+from app.utils import file_parser
+from app.utils.docx_stream import read_docx
+from app.utils.file_parser import FileParser
+
+BENCHMARK = (
+    Path(__file__).resolve().parent.parent / "scripts" / "benchmark_docx_parser.py"
+)
+
+
+def _save(document) -> bytes:
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _assert_same_content(data: bytes, monkeypatch) -> None:
+    streamed = read_docx(io.BytesIO(data))
+    expected = FileParser()._read_docx_object_model(io.BytesIO(data))
+
+    assert streamed.paragraphs == expected.paragraphs
+    assert streamed.tables == expected.tables
+    # python-docx adds an empty header/footer to sections without one
+    assert streamed.headers_footers == [
+        text for text in expected.headers_footers if text
+    ]
+    assert streamed.images_count == expected.images_count
+
+    results = []
+    for engine in ("python-docx", "stream"):
+        monkeypatch.setattr(file_parser, "DOCX_PARSER", engine)
+        results.append(FileParser()._parse_docx_enhanced(data))
+    assert results[0] == results[1]
+
+
+def test_merged_table_cells(monkeypatch):
+    document = Document()
+    document.add_paragraph("Skills")
+    table = document.add_table(rows=4, cols=4)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"cell {r}.{c}"
+    # Horizontal, vertical and block merges
+    table.cell(0, 0).merge(table.cell(0, 2)).text = "Languages"
+    table.cell(1, 0).merge(table.cell(3, 0)).text = "Frameworks"
+    table.cell(1, 2).merge(table.cell(2, 3)).text = "Cloud"
+    document.add_paragraph("After the table")
+
+    data = _save(document)
+    streamed = read_docx(io.BytesIO(data))
+
+    assert streamed.tables[0][0][:3] == ["Languages"] * 3
+    assert [row[0] for row in streamed.tables[0][1:]] == ["Frameworks"] * 3
+    _assert_same_content(data, monkeypatch)
+
+
+def test_headers_and_footers_per_section(monkeypatch):
+    document = Document()
+    first = document.sections[0]
+    first.header.paragraphs[0].text = "Jane Doe - Backend Engineer"
+    first.footer.paragraphs[0].text = "jane@example.com | (555) 123-4567"
+    document.add_paragraph("EXPERIENCE")
+    document.add_paragraph("Built payment APIs\twith Python")
+
+    second = document.add_section(WD_SECTION.NEW_PAGE)
+    second.header.is_linked_to_previous = False
+    second.header.paragraphs[0].text = "Page two header"
+    document.add_paragraph("EDUCATION")
+
+    _assert_same_content(_save(document), monkeypatch)
+
+
+def test_generated_resume_package(monkeypatch):
+    spec = importlib.util.spec_from_file_location("benchmark_docx_parser", BENCHMARK)
+    assert spec is not None and spec.loader is not None
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+
+    # Runs with tabs, hyperlinks, tables, header/footer and image relationships
+    _assert_same_content(benchmark.build_docx(400), monkeypatch)
+
+
+@pytest.mark.parametrize("data", [b"", b"not a zip file"])
+def test_invalid_package_raises(data):
+    with pytest.raises(zipfile.BadZipFile):
+        read_docx(io.BytesIO(data))
@@ -0,0 +1,81 @@
+"""Tests for the embedding micro-batcher"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from app.core.embedding_batcher import EmbeddingBatcher
+
+
+class FakeModel:
+    """Embeds each sentence as [len(sentence), 1]"""
+
+    backend_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def encode(self, sentences, batch_size=32, normalize_embeddings=True):
+        self.calls += 1
+        self.release.wait()
+        texts = [sentences] if isinstance(sentences, str) else sentences
+        return np.array([[len(text), 1.0] for text in texts])
+
+
+def test_concurrent_requests_share_a_batch():
+    model = FakeModel()
+    batcher = EmbeddingBatcher(model, max_batch_size=64, max_wait_ms=50)
+    results = {}
+
+    def encode(texts):
+        results[tuple(texts)] = batcher.encode(texts)
+
+    threads = [
+        threading.Thread(target=encode, args=([f"s{i}", "ab"],)) for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert model.calls == 1
+    for texts, embeddings in results.items():
+        assert embeddings[:, 0].tolist() == [len(text) for text in texts]
+    assert batcher.encode("abc").tolist() == [3.0, 1.0]
+
+
+def test_encode_times_out():
+    model = FakeModel()
+    model.release.clear()
+    batcher = EmbeddingBatcher(model, max_wait_ms=0)
+    with pytest.raises(TimeoutError):
+        batcher.encode(["slow"], timeout_s=0.2)
+    model.release.set()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_dead_worker_is_restarted_and_its_batch_failed():
+    class DyingModel(FakeModel):
+        def encode(self, sentences, batch_size=32, normalize_embeddings=True):
+            if self.calls == 0:
+                self.calls += 1
+                raise SystemExit  # escapes the worker's exception handling
+            return super().encode(sentences, batch_size, normalize_embeddings)
+
+    batcher = EmbeddingBatcher(DyingModel(), max_wait_ms=0)
+    with pytest.raises(RuntimeError, match="worker stopped"):
+        batcher.encode(["first"], timeout_s=10)
+    assert batcher.encode(["second"], timeout_s=10)[:, 0].tolist() == [6.0]
+
+
+def test_model_errors_reach_the_caller():
+    class FailingModel(FakeModel):
+        def encode(self, sentences, batch_size=32, normalize_embeddings=True):
+            raise ValueError("boom")
+
+    batcher = EmbeddingBatcher(FailingModel(), max_wait_ms=0)
+    with pytest.raises(ValueError, match="boom"):
+        batcher.encode(["text"])
@@ -0,0 +1,76 @@
+"""Tests for response field selection and the stored full analysis"""
+
+from app.core.deadline import Deadline
+from app.helpers.field_selection import build_selected, merge_sections
+from app.services.ats_analyzer import get_ats_analyzer
+
+RESUME = """John Doe
+john@example.com | (555) 123-4567
+
+SUMMARY
+Backend engineer with 6 years of experience building Python services.
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp (2019 - Present)
+- Built REST APIs with Python, FastAPI and PostgreSQL serving 2M requests/day
+- Reduced deployment time by 60% with Docker and Kubernetes pipelines
+- Led a team of 4 engineers delivering a payments platform on AWS
+
+EDUCATION
+B.S. Computer Science, State University (2015)
+
+SKILLS
+Python, FastAPI, PostgreSQL, Docker, Kubernetes, AWS, Redis
+"""
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer experienced with Python, FastAPI, "
+    "PostgreSQL, Docker and Kubernetes to build scalable REST APIs on AWS."
+)
+
+
+def test_build_selected_can_skip_lazy_sections():
+    calls = []
+
+    def lazy() -> str:
+        calls.append("lazy")
+        return "value"
+
+    spec = {"score": 1, "lazy": lazy, "nested": {"plain": 2, "lazy": lazy}}
+
+    assert build_selected(spec, None, evaluate=False) == {
+        "score": 1,
+        "nested": {"plain": 2},
+    }
+    assert calls == []
+
+
+def test_merge_sections_merges_nested_dicts():
+    base = {"a": 1, "details": {"x": 1, "y": 2}}
+    extra = {"b": 2, "details": {"y": 3, "z": 4}}
+
+    assert merge_sections(base, extra) == {
+        "a": 1,
+        "b": 2,
+        "details": {"x": 1, "y": 3, "z": 4},
+    }
+
+
+def test_context_keeps_untrimmed_result():
+    context: dict = {}
+    parsed_resume = {"text": RESUME, "word_count": len(RESUME.split())}
+    # Too little time for the Gemini stages: local paths only
+    deadline = Deadline(2000)
+
+    result = get_ats_analyzer().analyze_resume_with_job_description(
+        parsed_resume, JOB_DESCRIPTION, {"ats_score"}, deadline, context
+    )
+
+    assert set(result) == {"ats_score"}
+    full_result = context["full_result"]
+    assert full_result["ats_score"] == result["ats_score"]
+    assert "missing_keywords" in full_result
+    assert "keyword_matches" in full_result
+    assert full_result["extraction_details"]["full_resume_text"] == RESUME
+    # Lazy sections are only computed when selected
+    assert "suggestions" not in full_result
@@ -0,0 +1,56 @@
+"""Tests for the job detector's Gemini latency budget"""
+
+import time
+
+import pytest
+
+from app.services import job_detector as job_detector_module
+from app.services.job_detector import job_detector
+
+
+@pytest.fixture
+def no_local_result(monkeypatch):
+    def fail(resume_text):
+        raise ValueError("no local match")
+
+    monkeypatch.setattr(job_detector_module, "is_gemini_available", lambda: True)
+    monkeypatch.setattr(job_detector, "_semantic_and_keyword_detection", fail)
+
+
+def test_slow_gemini_without_local_result_times_out(no_local_result, monkeypatch):
+    def slow(resume_text, *args):
+        time.sleep(0.5)
+        return "Data Scientist", 0.85
+
+    monkeypatch.setattr(job_detector, "_gemini_detection", slow)
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        job_detector.detect_job_type("resume", budget_ms=100)
+    assert time.perf_counter() - start < 0.4
+
+
+def test_no_budget_without_local_result_skips_gemini(no_local_result, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        job_detector, "_gemini_detection", lambda *args: calls.append(args)
+    )
+
+    with pytest.raises(ValueError, match="no local match"):
+        job_detector.detect_job_type("resume", budget_ms=0)
+    assert calls == []
+
+
+def test_expired_deadline_skips_queued_call(monkeypatch):
+    calls = []
+    monkeypatch.setattr(job_detector_module, "is_gemini_available", lambda: True)
+    monkeypatch.setattr(
+        job_detector, "_gemini_detection", lambda *args: calls.append(args)
+    )
+
+    result = job_detector._safe_gemini_detection(
+        "resume", job_detector_module.Deadline(0)
+    )
+
+    assert result == (None, 0.0)
+    assert calls == []
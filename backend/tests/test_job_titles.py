@@ -0,0 +1,109 @@
+"""Tests for the job title taxonomy and its nearest-neighbour index"""
+
+from typing import Any
+
+import numpy as np
+
+from app.services.job_titles import (
+    JobTitleIndex,
+    JobTitleTaxonomy,
+    job_titles_taxonomy,
+    strip_seniority,
+)
+
+DATA: dict[str, Any] = {
+    "version": "1",
+    "families": {
+        "engineering": {
+            "roles": {
+                "frontend": {
+                    "title": "Frontend Developer",
+                    "aliases": ["UI Developer"],
+                },
+                "backend": {"title": "Backend Developer", "aliases": []},
+            }
+        },
+        "data": {"roles": {"analyst": {"title": "Data Analyst", "aliases": []}}},
+    },
+}
+
+
+class FixedModel:
+    """Looks up a fixed vector per text, recording encode calls"""
+
+    def __init__(self, vectors: dict[str, list[float]]):
+        self.vectors = vectors
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.array([self.vectors[text] for text in texts], dtype=np.float32)
+
+
+VECTORS = {
+    "Frontend Developer": [1.0, 0.1, 0.0],
+    "UI Developer": [0.9, 0.2, 0.0],
+    "Backend Developer": [0.1, 1.0, 0.0],
+    "Data Analyst": [0.0, 0.0, 1.0],
+}
+
+
+def test_strip_seniority():
+    assert strip_seniority("senior frontend developer") == "frontend developer"
+    assert strip_seniority("software engineer ii") == "software engineer"
+    assert strip_seniority("lead") == "lead"
+
+
+def test_titles_resolve_to_canonical_roles():
+    taxonomy = JobTitleTaxonomy(DATA)
+
+    for title in ("Frontend Developer", "Sr. UI-Developer", "ui developer II"):
+        role = taxonomy.resolve(title)
+        assert role is not None and role.id == "engineering/frontend"
+    assert taxonomy.resolve("Astronaut") is None
+    assert len(taxonomy) == 3
+
+
+def test_bundled_taxonomy_resolves_aliases():
+    role = job_titles_taxonomy.resolve("Senior Front-End Engineer")
+    assert role is not None and role.id == "software_engineering/frontend_developer"
+
+
+def test_fingerprint_changes_with_the_titles():
+    edited = {
+        **DATA,
+        "families": {**DATA["families"], "ops": {"roles": {"sre": {"title": "SRE"}}}},
+    }
+    assert JobTitleTaxonomy(DATA).fingerprint() == JobTitleTaxonomy(DATA).fingerprint()
+    assert (
+        JobTitleTaxonomy(DATA).fingerprint() != JobTitleTaxonomy(edited).fingerprint()
+    )
+
+
+def test_nearest_role_after_family_probe():
+    taxonomy = JobTitleTaxonomy(DATA)
+    forms = [form for _, form in JobTitleIndex.index_forms(taxonomy)]
+    index = JobTitleIndex(
+        taxonomy, np.array([VECTORS[f] for f in forms]), probe_families=1
+    )
+
+    role, score = index.nearest(np.array([0.8, 0.3, 0.1]))
+    assert role.id == "engineering/frontend"
+    assert 0.9 < score <= 1.0
+    role, _ = index.nearest(np.array([0.1, 0.1, 2.0]))
+    assert role.id == "data/analyst"
+
+
+def test_build_caches_embeddings_per_fingerprint(tmp_path):
+    taxonomy = JobTitleTaxonomy(DATA)
+    cache = tmp_path / "titles.npz"
+    model = FixedModel(VECTORS)
+
+    first = JobTitleIndex.build(taxonomy, model, "model-a", cache_path=cache)
+    second = JobTitleIndex.build(taxonomy, model, "model-a", cache_path=cache)
+    JobTitleIndex.build(taxonomy, model, "model-b", cache_path=cache)
+
+    assert len(model.calls) == 2  # the second build read the cache
+    assert len(first) == len(second) == 4
+    query = np.array([0.0, 1.0, 0.0])
+    assert first.nearest(query)[0].id == second.nearest(query)[0].id
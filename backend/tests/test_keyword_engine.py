@@ -0,0 +1,45 @@
+"""Tests for the precompiled keyword engine"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from app.services.keyword_engine import keyword_engine
+
+BENCHMARK = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_keywords.py"
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """Reference copy of the per-call implementation kept by the benchmark"""
+    spec = importlib.util.spec_from_file_location("benchmark_keywords", BENCHMARK)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_engine_matches_reference_on_samples(reference):
+    for text in reference.load_texts().values():
+        assert keyword_engine.extract(text) == reference.legacy_extract_keywords(text)
+
+
+def test_engine_matches_reference_on_random_texts(reference):
+    for text in reference.random_texts(300):
+        assert keyword_engine.extract(text) == reference.legacy_extract_keywords(text)
+        mixed = text.title()
+        assert keyword_engine.extract(mixed) == reference.legacy_extract_keywords(mixed)
+
+
+def test_aliases_are_reported_under_canonical_names():
+    keywords = keyword_engine.extract("built services with nodejs and reactjs")
+    assert "node" in keywords
+    assert "react" in keywords
+    assert "nodejs" not in keywords
+
+
+def test_dotted_names_do_not_add_their_fragments():
+    keywords = keyword_engine.extract("frontend work in vue.js and node.js")
+    assert "vue" in keywords
+    assert "javascript" not in keywords
@@ -0,0 +1,110 @@
+"""Tests for the local (fast/hybrid) structured experience extraction"""
+
+import pytest
+
+from app.services.ats_analyzer import get_ats_analyzer
+from app.services.local_experience_extractor import local_experience_extractor
+from app.services.project_extractor import project_extractor
+from app.services.resume_extraction import resume_extractions
+
+RESUME = """Jane Doe
+jane@example.com | +91 98765 43210 | Gurugram, India
+
+SUMMARY
+Backend engineer building payment systems.
+
+EXPERIENCE
+Acme Corp, Gurugram                      Jan 2019 - Present
+Senior Engineer
+- Built payment APIs serving 2M users (Python, Kafka)
+- Reviewed designs for the platform team
+
+EDUCATION
+B.Tech Computer Science, Delhi University 2013 - 2017
+CGPA: 8.2/10
+
+SKILLS
+Languages: Python, Go
+Tools: Docker, Kubernetes
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_extractions():
+    resume_extractions.clear()
+    yield
+    resume_extractions.clear()
+
+
+def _local(text: str) -> dict:
+    return local_experience_extractor.extract(
+        text, get_ats_analyzer().categorize_resume(text)
+    )
+
+
+def test_fast_mode_extracts_the_schema_locally():
+    result = get_ats_analyzer().extract_structured_experience(RESUME, mode="fast")
+
+    assert result["source"] == "rule_based"
+    assert result["contact_info"]["full_name"] == "Jane Doe"
+    assert result["contact_info"]["email"] == "jane@example.com"
+    assert result["contact_info"]["portfolio"] == ""
+    assert result["summary"] == "Backend engineer building payment systems."
+
+    [job] = result["work_experience"]
+    assert job["company"] == "Acme Corp"
+    assert job["positions"][0]["title"] == "Senior Engineer"
+    assert job["current"]
+    assert job["achievements"] == ["Built payment APIs serving 2M users"]
+    assert job["skills_used"] == ["Python", "Kafka"]
+
+
+def test_degree_excludes_institution_and_dates():
+    result = _local(RESUME)
+
+    assert result["education"] == [
+        {
+            "degree": "B.Tech Computer Science",
+            "institution": "Delhi University",
+            "location": "",
+            "graduation_year": "2017",
+            "gpa": "8.2",
+            "relevant_coursework": [],
+        }
+    ]
+    assert result["extraction"]["confidence"]["education"] == 1.0
+
+
+def test_overlapping_degree_and_institution_lower_confidence():
+    # The institution cannot be split off a lowercase line
+    text = "Jane Doe\n\nEDUCATION\nmba, university of delhi 2019\n"
+
+    result = _local(text)
+
+    [entry] = result["education"]
+    assert entry["degree"] == entry["institution"] == "mba, university of delhi"
+    assert result["extraction"]["confidence"]["education"] == 0.5
+    assert "education" in local_experience_extractor.weak_groups(result)
+
+
+def test_hybrid_mode_sends_only_weak_groups_to_the_llm(monkeypatch):
+    text = RESUME.replace(
+        "B.Tech Computer Science, Delhi University 2013 - 2017",
+        "mba, university of delhi 2019",
+    )
+    calls = []
+    education = [{"degree": "MBA", "institution": "University of Delhi"}]
+
+    def extract_sections(resume_text, groups, deadline=None):
+        calls.append(groups)
+        return {"education": education}
+
+    monkeypatch.setattr(project_extractor, "extract_sections", extract_sections)
+
+    result = get_ats_analyzer().extract_structured_experience(text, mode="hybrid")
+
+    assert calls == [["education"]]
+    assert result["source"] == "hybrid"
+    assert result["extraction"]["ai_groups"] == ["education"]
+    assert result["education"] == education
+    assert result["work_experience"][0]["company"] == "Acme Corp"
@@ -0,0 +1,123 @@
+"""Tests for the isolated document parser pool (spawns worker processes)"""
+
+import os
+import signal
+import time
+
+import pytest
+
+from app.core.error_handling import DocumentParseError
+from app.core.metrics import metrics
+from app.utils.parser_pool import ParserPool
+
+pytestmark = pytest.mark.slow
+
+RESUME = b"Jane Doe\nBackend engineer with Python and AWS experience\n"
+
+
+def _counter(name: str) -> float:
+    return metrics.snapshot()["counters"].get(f"parser_pool.{name}", 0)
+
+
+def _wait_for_workers(pool: ParserPool, count: int, timeout_s: float = 30) -> None:
+    deadline = time.monotonic() + timeout_s
+    while pool.stats()["live_workers"] < count:
+        assert time.monotonic() < deadline, "parser workers did not start"
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**options) -> ParserPool:
+        pool = ParserPool(**{"workers": 1, "enabled": True, **options})
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def test_start_spawns_workers_ahead_of_jobs(make_pool):
+    pool = make_pool(workers=2)
+    pool.start()
+    _wait_for_workers(pool, 2)
+    spawned = _counter("spawned")
+
+    assert pool.parse(RESUME, "resume.txt")["word_count"] == 9
+    assert _counter("spawned") == spawned
+
+
+def test_busy_pool_fails_after_slot_timeout(make_pool):
+    pool = make_pool(slot_timeout_s=0.1)
+    held = pool._slots.get()
+    try:
+        start = time.perf_counter()
+        with pytest.raises(DocumentParseError) as error:
+            pool.parse(RESUME, "resume.txt")
+        assert error.value.error_code == "PARSER_BUSY"
+        assert time.perf_counter() - start < 1
+    finally:
+        pool._slots.put(held)
+
+
+def test_timeout_kills_and_replaces_worker(make_pool):
+    pool = make_pool()
+    pool.start()
+    _wait_for_workers(pool, 1)
+    [worker] = pool._live
+    kills = _counter("kills")
+
+    # A paused worker cannot answer within any timeout
+    os.kill(worker.process.pid, signal.SIGSTOP)
+    pool.timeout_s = 0.5
+    with pytest.raises(DocumentParseError) as error:
+        pool.parse(RESUME, "resume.txt")
+    assert error.value.error_code == "PARSE_TIMEOUT"
+    assert _counter("kills") == kills + 1
+    assert not worker.is_alive()
+
+    # Replaced in the background, then serves the next job
+    _wait_for_workers(pool, 1)
+    pool.timeout_s = 20.0
+    assert pool.parse(RESUME, "resume.txt")["word_count"] == 9
+
+
+def test_dead_worker_is_replaced_before_the_next_job(make_pool):
+    pool = make_pool()
+    assert pool.parse(RESUME, "resume.txt")["word_count"] == 9
+    [worker] = pool._live
+    worker.process.kill()
+    worker.process.join(timeout=5)
+    crashes = _counter("crashes")
+
+    assert pool.parse(RESUME, "resume.txt")["word_count"] == 9
+    assert _counter("crashes") == crashes + 1
+    assert worker not in pool._live
+
+
+def test_worker_crash_during_job_is_reported(make_pool):
+    pool = make_pool()
+    worker = pool._spawn(30)
+    worker.process.kill()
+    worker.process.join(timeout=5)
+
+    with pytest.raises(DocumentParseError) as error:
+        pool._run(worker, RESUME, "resume.txt", 5)
+    assert error.value.error_code == "PARSER_CRASHED"
+
+
+def test_memory_limit_kills_worker(make_pool):
+    pool = make_pool(memory_limit_mb=400)
+    pool.start()
+    _wait_for_workers(pool, 1)
+
+    # ~8M distinct word objects do not fit in the worker's address space
+    with pytest.raises(DocumentParseError) as error:
+        pool.parse(b"word " * 8_000_000, "huge.txt")
+    assert error.value.error_code == "MEMORY_LIMIT"
+
+    _wait_for_workers(pool, 1)
+    assert pool.parse(RESUME, "resume.txt")["word_count"] == 9
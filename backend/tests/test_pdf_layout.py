@@ -0,0 +1,130 @@
+"""Tests for the PDF layout analysis on synthetic get_text("dict") pages"""
+
+from app.services.ats_analyzer import _without_text_layout, get_ats_analyzer
+from app.utils.pdf_layout import PdfLayoutAnalysis
+
+WIDTH, HEIGHT = 612.0, 792.0
+SIZE = 10.0
+
+
+def _span(x0: float, y0: float, text: str, x1: float | None = None) -> dict:
+    if x1 is None:
+        x1 = x0 + len(text) * SIZE * 0.5
+    return {"bbox": (x0, y0, x1, y0 + SIZE), "size": SIZE, "text": text}
+
+
+def _line(*spans: dict) -> dict:
+    bbox = (
+        min(s["bbox"][0] for s in spans),
+        min(s["bbox"][1] for s in spans),
+        max(s["bbox"][2] for s in spans),
+        max(s["bbox"][3] for s in spans),
+    )
+    return {"bbox": bbox, "dir": (1, 0), "spans": list(spans)}
+
+
+def _page(*lines: dict) -> dict:
+    return {"width": WIDTH, "height": HEIGHT, "blocks": [{"lines": list(lines)}]}
+
+
+def _analyze(*pages: dict) -> dict:
+    analysis = PdfLayoutAnalysis()
+    for page in pages:
+        analysis.add_page(page)
+    return analysis.to_dict()
+
+
+def test_single_column_page():
+    lines = [_line(_span(50, 60 + i * 14, "Built services", x1=550)) for i in range(20)]
+
+    layout = _analyze(_page(*lines))
+
+    assert layout["columns"] == {"count": 1, "multi_column_pages": []}
+    assert layout["tables"]["count"] == 0
+
+
+def test_two_column_page():
+    # Separate text flows: the right column's rows sit between the left's
+    left = [_line(_span(50, 60 + i * 14, "Experience", x1=280)) for i in range(12)]
+    right = [_line(_span(330, 67 + i * 14, "Skills", x1=560)) for i in range(12)]
+
+    layout = _analyze(_page(*left, *right))
+
+    assert layout["columns"] == {"count": 2, "multi_column_pages": [1]}
+    assert layout["tables"]["count"] == 0
+
+
+def test_aligned_cells_are_a_table_not_columns():
+    rows = [
+        _line(_span(50, 60 + i * 14, f"Skill {i}"), _span(300, 60 + i * 14, "Level"))
+        for i in range(12)
+    ]
+
+    layout = _analyze(_page(*rows))
+
+    assert layout["columns"]["count"] == 1
+    assert layout["tables"] == {"count": 1, "rows": 12, "pages": [1]}
+
+
+def test_table_needs_enough_rows_for_its_cells():
+    def rows(cells: int, count: int, top: float) -> list[dict]:
+        return [
+            _line(*(_span(50 + c * 150, top + i * 14, "cell") for c in range(cells)))
+            for i in range(count)
+        ]
+
+    assert _analyze(_page(*rows(2, 3, 60)))["tables"]["count"] == 0
+    assert _analyze(_page(*rows(2, 4, 60)))["tables"]["count"] == 1
+    assert _analyze(_page(*rows(3, 3, 60)))["tables"]["count"] == 1
+
+
+def test_contact_details_in_header_zone():
+    page = _page(
+        _line(_span(50, 10, "jane@example.com | (555) 123-4567")),
+        _line(_span(50, 60, "Backend engineer")),
+    )
+    analysis = PdfLayoutAnalysis()
+    analysis.add_page(page)
+    layout = analysis.to_dict()
+
+    assert layout["header_zone"]["has_contact"]
+    assert layout["header_zone"]["lines"] == 1
+    assert not layout["footer_zone"]["has_contact"]
+    assert any("page header zone" in issue for issue in analysis.issues())
+
+
+def test_bullets_and_caps_are_counted():
+    page = _page(
+        _line(_span(50, 60, "EXPERIENCE")),
+        _line(_span(50, 74, "• Built payment APIs")),
+        _line(_span(50, 88, "-"), _span(60, 88, " Led a team")),
+        _line(_span(50, 102, "-5% cloud costs")),
+        # Symbol-font bullet of a Word export
+        _line(_span(50, 116, "\uf0b7 Python and AWS")),
+    )
+
+    layout = _analyze(page)
+
+    assert layout["bullets"]["counts"] == {"•": 2, "-": 1}
+    assert layout["capitalization"]["caps_words"] == 2  # EXPERIENCE, AWS
+    assert layout["capitalization"]["words"] == 16
+
+
+def test_reanalysis_counts_caps_on_the_edited_text():
+    text = "EXPERIENCE\n" + "Built payment APIs with python and go\n" * 10
+    layout = _analyze(_page(_line(_span(50, 60, "Built payment APIs"))))
+    layout["capitalization"]["caps_ratio"] = 0.5
+    parsed_resume = {"text": text, "formatting_analysis": {"layout": layout}}
+    analyzer = get_ats_analyzer()
+
+    def caps_warned(resume: dict) -> bool:
+        warnings = analyzer._analyze_ats_compatibility(resume)["warnings"]
+        return any("ALL CAPS" in warning for warning in warnings)
+
+    assert caps_warned(parsed_resume)
+    edited = _without_text_layout(parsed_resume)
+    assert set(edited["formatting_analysis"]["layout"]) >= {"columns", "header_zone"}
+    assert "capitalization" not in edited["formatting_analysis"]["layout"]
+    assert not caps_warned(edited)
+    # Upper-case words are counted before lowercasing on the text path too
+    assert caps_warned({"text": "SENIOR BACKEND ENGINEER at ACME"})
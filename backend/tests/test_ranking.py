@@ -0,0 +1,72 @@
+"""Tests for ranking one resume against several job descriptions"""
+
+import pytest
+
+from app.services import ats_analyzer as ats_analyzer_module
+from app.services.ats_analyzer import get_ats_analyzer
+
+RESUME = """Jane Doe
+jane@example.com | (555) 123-4567
+
+EXPERIENCE
+Backend Engineer, Acme Corp, 2019 - 2024
+- Built Python and Django services on PostgreSQL and Redis
+- Deployed them with Docker and Kubernetes on AWS
+
+SKILLS
+Python, Django, PostgreSQL, Redis, Docker, Kubernetes, AWS
+"""
+
+JOB_DESCRIPTIONS = [
+    {
+        "id": "frontend",
+        "title": "Frontend Engineer",
+        "description": "Frontend engineer with React, TypeScript, CSS and Figma",
+    },
+    {
+        "id": "backend",
+        "title": "Backend Engineer",
+        "description": "Backend engineer with Python, Django, PostgreSQL, "
+        "Redis, Docker and Kubernetes on AWS",
+    },
+]
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    def per_jd_classification(*args, **kwargs):
+        raise AssertionError("ranking classifies keywords once, locally")
+
+    analyzer = get_ats_analyzer()
+    monkeypatch.setattr(ats_analyzer_module, "is_gemini_available", lambda: True)
+    monkeypatch.setattr(analyzer, "_classify_technical_keywords", per_jd_classification)
+    monkeypatch.setattr(ats_analyzer_module, "is_learning_enabled", lambda: False)
+    return analyzer
+
+
+def _rank(analyzer, job_descriptions):
+    parsed_resume = {"text": RESUME, "word_count": len(RESUME.split())}
+    return analyzer.rank_resume_against_job_descriptions(
+        parsed_resume, job_descriptions
+    )
+
+
+def test_best_matching_job_description_ranks_first(analyzer):
+    rankings = _rank(analyzer, JOB_DESCRIPTIONS)
+
+    assert [r["id"] for r in rankings] == ["backend", "frontend"]
+    assert [r["rank"] for r in rankings] == [1, 2]
+    assert rankings[0]["ats_score"] > rankings[1]["ats_score"]
+    assert "react" in rankings[1]["missing_keywords"]
+    assert {"python", "django", "kubernetes"} <= set(rankings[0]["keyword_matches"])
+    assert set(rankings[0]["detailed_scores"]) == set(rankings[1]["detailed_scores"])
+
+
+def test_ranking_matches_single_job_description_scores(analyzer):
+    rankings = _rank(analyzer, JOB_DESCRIPTIONS)
+
+    for jd in JOB_DESCRIPTIONS:
+        (alone,) = _rank(analyzer, [jd])
+        (ranked,) = (r for r in rankings if r["id"] == jd["id"])
+        assert alone["ats_score"] == ranked["ats_score"]
+        assert alone["keyword_matches"] == ranked["keyword_matches"]
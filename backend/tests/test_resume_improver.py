@@ -0,0 +1,85 @@
+"""Tests for the concurrent AI checks of the improvement planner"""
+
+import threading
+import time
+
+import pytest
+
+from app.core.deadline import Deadline
+from app.services import resume_improver as resume_improver_module
+from app.services.resume_improver import AI_CHECKS, ResumeImprover
+
+RESUME = "Jane Doe\njane@example.com\n\nEXPERIENCE\n- Built payment APIs"
+VERDICT = {"found": True, "confidence": 90, "details": "ok", "quality": "good"}
+
+
+@pytest.fixture
+def improver():
+    improver = ResumeImprover()
+    improver.use_ai = True
+    return improver
+
+
+def _plan(improver, deadline):
+    analysis_result = {"extraction_details": {"full_resume_text": RESUME}}
+    return improver.generate_improvement_plan(analysis_result, {}, deadline=deadline)
+
+
+def test_ai_checks_run_concurrently(improver, monkeypatch):
+    running, peak = set(), []
+    lock = threading.Lock()
+
+    def check(resume_text, name, deadline=None):
+        with lock:
+            running.add(name)
+            peak.append(len(running))
+        time.sleep(0.2)
+        with lock:
+            running.discard(name)
+        return VERDICT
+
+    monkeypatch.setattr(improver, "_ai_analyze_resume_content", check)
+
+    start = time.perf_counter()
+    plan = _plan(improver, Deadline())
+
+    assert time.perf_counter() - start < 0.2 * len(AI_CHECKS)
+    assert max(peak) > 1
+    assert plan["analysis_method"] == "AI-powered"
+
+
+def test_checks_missing_the_budget_fall_back_and_are_bounded(improver, monkeypatch):
+    deadlines = []
+    release = threading.Event()
+
+    def slow_check(resume_text, name, deadline=None):
+        deadlines.append(deadline)
+        release.wait(0.5)
+        return VERDICT
+
+    monkeypatch.setattr(resume_improver_module, "IMPROVEMENT_AI_BUDGET_MS", 100)
+    monkeypatch.setattr(improver, "_ai_analyze_resume_content", slow_check)
+    deadline = Deadline()
+
+    start = time.perf_counter()
+    plan = _plan(improver, deadline)
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert elapsed < 0.4
+    assert plan["analysis_method"] == "Rule-based fallback"
+    assert {d["reason"] for d in deadline.degraded} == {"timeout"}
+    # Each check got the AI budget, not the request's, as its own deadline
+    assert deadlines and all(d.budget_ms <= 100 for d in deadlines)
+
+
+def test_check_after_its_deadline_makes_no_call(improver, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        resume_improver_module.gemini_breaker, "call", lambda *args: calls.append(args)
+    )
+
+    result = improver._ai_analyze_resume_content(RESUME, "contact_info", Deadline(0))
+
+    assert result is None
+    assert calls == []
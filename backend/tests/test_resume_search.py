@@ -0,0 +1,62 @@
+"""Tests for candidate search over stored resumes"""
+
+import hashlib
+
+import numpy as np
+
+from app.services.resume_search import ResumeSearch
+from app.services.semantic_matcher import semantic_matcher
+
+RESUME = """EXPERIENCE
+Search Engineer, Lookup Labs, 2018 - 2024
+- Built vector search over resumes with float16 memory maps
+- Ranked candidates for job descriptions in milliseconds
+
+SKILLS
+Python, NumPy, FastAPI, approximate nearest neighbour search
+"""
+
+
+class CountingModel:
+    """Deterministic embedding model that records the texts it encodes"""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        vectors = np.stack(
+            [
+                np.frombuffer(hashlib.sha256(t.encode()).digest()[:32], np.uint8)
+                for t in texts
+            ]
+        ).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_stored_resume_reuses_the_analysis_embeddings(tmp_path):
+    model = CountingModel()
+    semantic_matcher.match_many(model, RESUME, ["Python vector search engineer"])
+    analyzed = len(model.encoded)
+
+    search = ResumeSearch(tmp_path, mode="flat")
+    document_id = search.add_resume(model, RESUME, {"filename": "cv.pdf"})
+
+    assert document_id is not None
+    assert len(model.encoded) == analyzed
+    stored = search.get(document_id)
+    assert stored is not None and stored["metadata"]["filename"] == "cv.pdf"
+
+
+def test_search_finds_stored_resume(tmp_path):
+    model = CountingModel()
+    search = ResumeSearch(tmp_path, mode="flat")
+    document_id = search.add_resume(model, RESUME)
+    assert document_id is not None
+
+    [hit] = search.search(model, "Built vector search over resumes", top_k=5)
+
+    assert hit["document_id"] == document_id
+    assert hit["highlights"]
+    assert search.remove(document_id)
+    assert search.search(model, "Built vector search over resumes") == []
@@ -0,0 +1,123 @@
+"""Tests for the chunked semantic matcher"""
+
+import numpy as np
+
+from app.services.semantic_matcher import (
+    SemanticMatcher,
+    chunk_document,
+    estimate_tokens,
+    extract_requirements,
+    sample_evenly,
+)
+
+RESUME = """Jane Doe
+SUMMARY
+Backend engineer building payment systems for online retailers.
+EXPERIENCE
+- Built payment APIs in Python serving two million users.
+- Migrated the billing platform to Kubernetes on AWS.
+SKILLS: Python, Kubernetes, PostgreSQL, Kafka and Terraform
+"""
+
+JD = """Requirements
+- Five years building backend services in Python.
+- Experience running Kubernetes workloads on AWS.
+"""
+
+
+class WordModel:
+    """Bag-of-words embedding over a fixed vocabulary, recording its inputs"""
+
+    VOCABULARY = ("python", "kubernetes", "aws", "payment", "billing", "design")
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        vectors = np.array(
+            [
+                [1.0 + text.lower().count(word) for word in self.VOCABULARY]
+                for text in texts
+            ]
+        )
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_chunks_stay_within_their_section_and_budget():
+    chunks = chunk_document(RESUME, max_tokens=12)
+
+    assert {c["section"] for c in chunks} == {"summary", "experience", "skills"}
+    assert all(estimate_tokens(c["text"]) <= 12 + 1 for c in chunks)
+    experience = [c["text"] for c in chunks if c["section"] == "experience"]
+    assert experience == [
+        "Built payment APIs in Python serving two million users.",
+        "Migrated the billing platform to Kubernetes on AWS.",
+    ]
+    # Inline heading content is kept in its section
+    assert chunks[-1]["text"].startswith("Python, Kubernetes")
+
+
+def test_over_long_units_are_split_on_words():
+    text = "EXPERIENCE\n" + " ".join(f"word{i}" for i in range(40))
+
+    chunks = chunk_document(text, max_tokens=13)
+
+    assert len(chunks) > 1
+    assert " ".join(c["text"] for c in chunks).split() == text.split()[1:]
+
+
+def test_requirements_are_bullets_and_sentences():
+    assert extract_requirements(JD, max_tokens=128) == [
+        "Five years building backend services in Python.",
+        "Experience running Kubernetes workloads on AWS.",
+    ]
+
+
+def test_sample_evenly_keeps_order_and_both_ends():
+    items = list(range(10))
+    assert sample_evenly(items, 4) == [0, 3, 6, 9]
+    assert sample_evenly(items, 20) == items
+    assert sample_evenly(items, 0) == []
+
+
+def test_plan_samples_when_over_the_budget():
+    matcher = SemanticMatcher(chunk_tokens=12, min_chunks=1)
+    matcher._ms_per_text = 10.0
+
+    chunks, requirements, coverage = matcher.plan(RESUME, [JD], budget_ms=30)
+
+    assert coverage["sampled"]
+    assert coverage["chunks_encoded"] < coverage["chunks_total"]
+    assert len(chunks) + sum(len(r) for r in requirements) <= 3 + len(requirements)
+    assert all(requirements)
+
+
+def test_match_many_matches_each_job_description():
+    model = WordModel()
+    matcher = SemanticMatcher(chunk_tokens=12)
+    other_jd = "Requirements\n- Leads product design reviews with customers."
+
+    results = matcher.match_many(model, RESUME, [JD, other_jd])
+
+    assert [r["method"] for r in results] == ["chunked_embeddings"] * 2
+    assert results[0]["similarity_score"] > results[1]["similarity_score"]
+    [_, kubernetes] = results[0]["requirement_matches"]
+    assert kubernetes["matches"][0]["text"] == (
+        "Migrated the billing platform to Kubernetes on AWS."
+    )
+    alone = SemanticMatcher(chunk_tokens=12).match(WordModel(), RESUME, JD)
+    assert alone["similarity_score"] == results[0]["similarity_score"]
+    assert alone["requirement_matches"] == results[0]["requirement_matches"]
+
+
+def test_unchanged_texts_are_not_encoded_again():
+    model = WordModel()
+    matcher = SemanticMatcher(chunk_tokens=12)
+
+    matcher.match(model, RESUME, JD)
+    encoded = len(model.encoded)
+    edited = RESUME + "INTERESTS\nMentored two junior engineers on testing.\n"
+    matcher.match(model, edited, JD)
+
+    assert model.encoded[encoded:] == ["Mentored two junior engineers on testing."]
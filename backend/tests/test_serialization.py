@@ -0,0 +1,80 @@
+"""Tests for JSON/MessagePack response negotiation"""
+
+import json
+
+import msgpack
+import numpy as np
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core import serialization
+from app.core.serialization import (
+    encode_json,
+    encode_msgpack,
+    negotiated_response,
+    wants_msgpack,
+)
+
+PAYLOAD = {
+    "score": np.float32(0.5),
+    "ids": np.array([1, 2]),
+    "tags": ("python", "go"),
+    "name": "Jäne",
+}
+DECODED = {"score": 0.5, "ids": [1, 2], "tags": ["python", "go"], "name": "Jäne"}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/payload")
+    def payload(request: Request):
+        return negotiated_response(request, PAYLOAD, status_code=201)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/x-msgpack, application/json;q=0.5", True),
+        ("application/json, application/msgpack", False),
+        ("application/msgpack;q=0.4, */*;q=0.5", False),
+        ("application/msgpack;q=bad", False),
+    ],
+)
+def test_accept_negotiation(accept, expected):
+    assert wants_msgpack(accept) is expected
+
+
+def test_encoders_handle_numpy_and_tuples():
+    assert json.loads(encode_json(PAYLOAD)) == DECODED
+    assert msgpack.unpackb(encode_msgpack(PAYLOAD)) == DECODED
+
+
+def test_stdlib_json_fallback_matches(monkeypatch):
+    expected = encode_json(PAYLOAD)
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+    assert json.loads(encode_json(PAYLOAD)) == json.loads(expected)
+
+
+def test_unserializable_values_raise():
+    with pytest.raises(TypeError):
+        encode_json({"value": object()})
+
+
+def test_response_format_follows_accept(client):
+    response = client.get("/payload")
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "Accept"
+    assert response.json() == DECODED
+
+    response = client.get("/payload", headers={"Accept": "application/msgpack"})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == DECODED
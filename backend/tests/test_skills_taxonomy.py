@@ -0,0 +1,29 @@
+"""Tests for the shared skills taxonomy"""
+
+from app.services.document_index import DocumentIndex
+from app.services.skills_taxonomy import SkillsTaxonomy, skills_taxonomy
+
+
+def test_punctuation_variants_share_one_key():
+    for form in ("CI/CD", "ci-cd", "ci cd"):
+        assert skills_taxonomy.canonical(form) == "ci/cd"
+
+
+def test_bundled_aliases_resolve_to_canonical_skills():
+    assert skills_taxonomy.canonical("cicd") == "ci/cd"
+    assert skills_taxonomy.canonical("continuous integration") == "ci/cd"
+    assert skills_taxonomy.canonical("k8s") == "kubernetes"
+    assert skills_taxonomy.canonical("not a skill") is None
+
+
+def test_aliases_come_from_the_taxonomy_data():
+    taxonomy = SkillsTaxonomy(
+        {
+            "skills": {"ci/cd": {"aliases": ["cicd"]}, "docker": {}},
+            "categories": {"tools": {"technical": True, "skills": ["ci/cd", "docker"]}},
+        }
+    )
+    assert taxonomy.canonical("cicd") == "ci/cd"
+    assert taxonomy.is_technical("cicd")
+    index = DocumentIndex("Built CICD pipelines with Docker")
+    assert taxonomy.find_skills(index, "tools") == ["ci/cd", "docker"]
@@ -0,0 +1,78 @@
+"""Tests for caching of structured experience extraction results"""
+
+import pytest
+
+from app.services import ats_analyzer as ats_analyzer_module
+from app.services.ats_analyzer import get_ats_analyzer
+from app.services.project_extractor import project_extractor
+from app.services.resume_extraction import categorized_facet, resume_extractions
+
+
+@pytest.fixture
+def extractor_calls(monkeypatch):
+    calls = []
+    results: list[dict] = []
+
+    def extract(resume_text, deadline=None):
+        calls.append(resume_text)
+        return results.pop(0)
+
+    monkeypatch.setattr(project_extractor, "extract_structured_experience", extract)
+    return calls, results
+
+
+def _result(failed: list[str]) -> dict:
+    return {
+        "work_experience": [{"title": "Engineer"}],
+        "extraction": {"strategy": "sections", "failed_sections": failed},
+    }
+
+
+def test_partial_ai_result_is_not_cached(extractor_calls):
+    calls, results = extractor_calls
+    results.extend([_result(["projects"]), _result([])])
+    analyzer = get_ats_analyzer()
+    text = "partial extraction resume\nEXPERIENCE\nEngineer at Acme"
+
+    first = analyzer.extract_structured_experience(text, mode="ai")
+    second = analyzer.extract_structured_experience(text, mode="ai")
+
+    assert first["extraction"]["failed_sections"] == ["projects"]
+    assert second["extraction"]["failed_sections"] == []
+    assert len(calls) == 2
+
+
+def test_complete_ai_result_is_cached(extractor_calls):
+    calls, results = extractor_calls
+    results.append(_result([]))
+    analyzer = get_ats_analyzer()
+    text = "complete extraction resume\nEXPERIENCE\nEngineer at Acme"
+
+    analyzer.extract_structured_experience(text, mode="ai")
+    analyzer.extract_structured_experience(text, mode="ai")
+
+    assert len(calls) == 1
+
+
+def test_is_complete_extraction():
+    check = ats_analyzer_module._is_complete_extraction
+    assert check({"source": "ai", **_result([])}, "ai")
+    assert not check({"source": "ai", **_result(["skills"])}, "ai")
+    assert not check({"source": "rule_based"}, "ai")
+    assert not check(None, "ai")
+
+
+def test_categorization_is_cached_per_layout():
+    analyzer = get_ats_analyzer()
+    text = "layout categorization resume\nEXPERIENCE\n- Engineer at Acme"
+    layout = {"columns": {"count": 2, "multi_column_pages": [1]}}
+
+    with_layout = analyzer.categorize_resume(text, layout=layout)
+    text_only = analyzer.categorize_resume(text)
+
+    assert with_layout["formatting_analysis"]["structure"]["columns"] == 2
+    assert "columns" not in text_only["formatting_analysis"]["structure"]
+    assert analyzer.categorize_resume(text, layout=dict(layout)) is with_layout
+    extraction = resume_extractions.get(text)
+    assert extraction.peek(categorized_facet()) is text_only
+    assert extraction.peek_latest("categorized") is text_only
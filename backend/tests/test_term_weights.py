@@ -0,0 +1,69 @@
+"""Tests for the corpus term weight table"""
+
+import threading
+
+from app.services.keyword_engine import keyword_engine
+from app.services.term_weights import TermWeightTable
+
+
+def add(table: TermWeightTable, text: str) -> bool:
+    terms, length = keyword_engine.document_terms(text)
+    return table.add_document(text, terms, length)
+
+
+def test_weights_stay_uniform_below_the_minimum_corpus():
+    table = TermWeightTable(min_documents=3)
+    add(table, "python developer with django experience")
+    assert not table.ready
+    assert table.idf("python") == table.idf("kubernetes") == 1.0
+
+    text = "python python django django kubernetes kubernetes react react"
+    assert keyword_engine.extract(text, table) == keyword_engine.extract(text)
+
+
+def test_idf_applies_once_the_corpus_is_large_enough():
+    table = TermWeightTable(min_documents=3)
+    for i in range(3):
+        add(table, f"python engineer number{i}")
+    add(table, "kubernetes operator")
+    assert table.ready
+    assert table.idf("kubernetes") > table.idf("python")
+
+
+def test_repeated_documents_are_counted_once():
+    table = TermWeightTable()
+    assert add(table, "python developer")
+    assert not add(table, "python developer")
+    assert table.num_documents == 1
+
+
+def test_seen_documents_are_capped_oldest_first():
+    table = TermWeightTable(max_seen_documents=2)
+    for text in ("first doc", "second doc", "third doc"):
+        add(table, text)
+    assert len(table.seen_documents) == 2
+    # The oldest hash was forgotten, so the first document counts again
+    assert add(table, "first doc")
+    assert not add(table, "third doc")
+
+
+def test_concurrent_saves_leave_a_loadable_table(tmp_path):
+    path = tmp_path / "weights.json.gz"
+    table = TermWeightTable(path=path, save_every=1)
+
+    def worker(n: int):
+        for i in range(20):
+            add(table, f"document {n} {i} python")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    table.save()
+
+    loaded = TermWeightTable.load(path)
+    assert loaded.num_documents == 80
+    assert loaded.document_frequencies["python"] == 80
+    assert list(loaded.seen_documents) == list(table.seen_documents)
+    assert not list(tmp_path.glob("*.tmp"))
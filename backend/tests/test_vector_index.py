@@ -0,0 +1,114 @@
+"""Tests for the memory-mapped vector index"""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import candidates
+from app.services.vector_index import HEADER_FILE, VectorIndex
+
+DIM = 8
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[: len(values)] = values
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return VectorIndex.open(tmp_path, DIM, mode="flat")
+
+
+def test_negative_similarities_keep_their_order(index):
+    query = _unit(1.0)
+    index.add("far", np.stack([_unit(-1.0, 0.1)]))
+    index.add("near", np.stack([_unit(-1.0, 1.0)]))
+
+    results = index.search(query[None, :])
+
+    assert [key for key, _ in results] == ["near", "far"]
+    assert all(score < 0 for _, score in results)
+
+
+def test_search_documents_returns_row_scores(index):
+    index.add(
+        "a", np.stack([_unit(1.0), _unit(0.0, 1.0)]), payloads=[{"i": 0}, {"i": 1}]
+    )
+
+    [hit] = index.search_documents(_unit(0.0, 1.0)[None, :], top_k=1)
+
+    assert hit["key"] == "a"
+    assert hit["payloads"] == [{"i": 0}, {"i": 1}]
+    assert hit["row_scores"].shape == (1, 2)
+    assert int(hit["row_scores"].argmax()) == 1
+
+
+def test_compaction_survives_reopen(tmp_path):
+    index = VectorIndex.open(tmp_path, DIM, mode="flat")
+    for i in range(4):
+        index.add(f"doc{i}", np.stack([_unit(1.0, float(i))]), metadata={"i": i})
+    index.delete("doc0")
+    index.delete("doc1")
+    index.wait_for_compaction(timeout=10)
+
+    assert index.generation == 1
+    assert index.live_rows == index.rows == 2
+    expected = index.search(_unit(1.0, 3.0)[None, :])
+
+    reopened = VectorIndex.open(tmp_path, DIM, mode="flat")
+    assert reopened.search(_unit(1.0, 3.0)[None, :]) == expected
+    document = reopened.get("doc3")
+    assert document is not None and document["metadata"] == {"i": 3}
+    assert not (tmp_path / "vectors.npy").exists()
+
+
+def test_delete_compacts_in_background(index, monkeypatch):
+    calls = []
+    monkeypatch.setattr(index, "compact", lambda: calls.append(True))
+    for i in range(3):
+        index.add(f"doc{i}", np.stack([_unit(1.0, float(i))]))
+
+    assert index.delete("doc0")
+
+    index.wait_for_compaction(timeout=10)
+    assert calls == [True]
+
+
+def test_interrupted_compaction_keeps_old_index(tmp_path, monkeypatch):
+    index = VectorIndex.open(tmp_path, DIM, mode="flat")
+    for i in range(3):
+        index.add(f"doc{i}", np.stack([_unit(1.0, float(i))]))
+    index._remove_document("doc0")
+
+    def crash(generation=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(index, "_write_header", crash)
+    with pytest.raises(OSError):
+        index.compact()
+
+    header = json.loads((tmp_path / HEADER_FILE).read_text(encoding="utf-8"))
+    assert header.get("generation", 0) == 0
+
+    reopened = VectorIndex.open(tmp_path, DIM, mode="flat")
+    assert sorted(reopened.documents) == ["doc0", "doc1", "doc2"]
+    assert not list(tmp_path.glob("*.1.*"))
+
+
+def test_candidates_require_api_key(monkeypatch):
+    app = FastAPI()
+    app.include_router(candidates.router)
+    client = TestClient(app)
+
+    monkeypatch.delenv("CANDIDATES_API_KEY", raising=False)
+    assert client.get("/api/candidates/abc").status_code == 503
+
+    monkeypatch.setenv("CANDIDATES_API_KEY", "secret")
+    assert client.delete("/api/candidates/abc").status_code == 401
+    response = client.get("/api/candidates/abc", headers={"X-API-Key": "wrong"})
+    assert response.status_code == 401